@@ -1,9 +1,9 @@
 /*
  SMARTObjects.h
  SMARTFramework
-
- Created by Pascal Pfiffner on 8/6/12.
- Copyright (c) 2012 CHIP, Boston Children's Hospital. All rights reserved.
+ 
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -23,7 +23,7 @@
 #import <Foundation/Foundation.h>
 #import "SMART.h"
 
-@class SMRecord;
+@class SMRecord, SMSnapshot, SMStreamDecoder;
 @class RedlandNode, RedlandModel;
 
 
@@ -46,6 +46,7 @@
 
 
 + (id)newWithSubject:(RedlandNode *)aSubject inModel:(RedlandModel *)aModel;
++ (id)newWithSubject:(RedlandNode *)aSubject inModel:(RedlandModel *)aModel objects:(NSDictionary *)objects;
 + (id)newWithRDFXML:(NSString *)rdfString;
 
 - (id)initWithSubject:(RedlandNode *)aSubject inModel:(RedlandModel *)aModel;
@@ -53,5 +54,27 @@
 
 + (NSString *)rdfType;
 
+- (void)hydrateAllProperties;
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects;
+
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot;
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot;
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder;
+
+- (id)literalForPredicate:(RedlandNode *)predicate cache:(id __strong *)cache;
+- (void)setLiteral:(NSString *)literal forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache;
+- (NSArray *)literalsForPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache;
+- (void)setLiterals:(NSArray *)literals forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache;
+- (id)objectOfClass:(Class)itemClass forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache;
+- (void)setObject:(SMObject *)object forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache;
+- (NSArray *)objectsOfClass:(Class)itemClass forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache;
+- (void)setObjects:(NSArray *)objects forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache;
+
++ (NSNumber *)numberFromLiteral:(NSString *)literal;
++ (NSString *)literalFromNumber:(NSNumber *)number;
++ (NSDate *)dateFromLiteral:(NSString *)literal;
++ (NSString *)literalFromDate:(NSDate *)date;
++ (NSString *)literalFromDate:(NSDate *)date datatype:(NSString *)datatype;
+
 
 @end
@@ -21,6 +21,7 @@
  */
 
 #import "SMObject.h"
+#import "SMSnapshot.h"
 #import <Redland-ObjC.h>
 
 
@@ -45,6 +46,18 @@
 	return [[self alloc] initWithSubject:aSubject inModel:aModel];
 }
 
+/**
+ *  Returns the instance for the given subject from the objects dictionary if there is one of the receiver's class, a new instance otherwise.
+ */
++ (id)newWithSubject:(RedlandNode *)aSubject inModel:(RedlandModel *)aModel objects:(NSDictionary *)objects
+{
+	id existing = aSubject ? objects[aSubject] : nil;
+	if ([existing isKindOfClass:self]) {
+		return existing;
+	}
+	return [self newWithSubject:aSubject inModel:aModel];
+}
+
 /**
  *  Convenience allocator when allocating from RDF+XML.
  *  @attention Note that if RDF+XML parsing fails, this method will return nil (i.e. it will catch the exception thrown in "initWithRDFXML:").
@@ -186,4 +199,343 @@
 }
 
 
+
+#pragma mark - Hydration
+/**
+ *  Reads all properties of the receiver from the model at once.
+ *
+ *  Property getters read their value from the model lazily with one query each. This method reads all of them with a single query, which is faster if you
+ *  are going to access most of them anyway. Objects initialized from RDF+XML have no subject, they are hydrated from the first subject of the class'
+ *  rdf:type in their model.
+ */
+- (void)hydrateAllProperties
+{
+	RedlandNode *subject = _subject;
+	if (!subject && [[self class] rdfType]) {
+		RedlandNode *type = [RedlandNode nodeWithURIString:[[self class] rdfType]];
+		RedlandStatement *typed = [RedlandStatement statementWithSubject:nil predicate:[RedlandNode typeNode] object:type];
+		subject = [(RedlandStatement *)[[_inModel enumeratorOfStatementsLike:typed] nextObject] subject];
+	}
+	if (!subject || !_inModel) {
+		return;
+	}
+	
+	RedlandStatement *statement = [RedlandStatement statementWithSubject:subject predicate:nil object:nil];
+	RedlandStreamEnumerator *query = [_inModel enumeratorOfStatementsLike:statement];
+	[self hydrateFromStatements:query objects:nil];
+}
+
+/**
+ *  Fills the receiver's properties from the given statements about its subject.
+ *
+ *  Generated subclasses override this method, SMObject itself has no properties to fill.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, to be used for model properties; may be nil
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+}
+
+
+
+#pragma mark - Snapshots
+/**
+ *  Writes the receiver's properties to the snapshot.
+ *
+ *  Generated subclasses override this method, SMObject itself has no properties to write.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+}
+
+/**
+ *  Reads the receiver's properties from the snapshot, up to the end of the receiver's object.
+ *
+ *  Generated subclasses override this method, SMObject itself skips all properties.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	while ([snapshot readPropertyIndex] >= 0) {
+		[snapshot skipValue];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills the receiver's properties from the values a stream decoder read for its subject.
+ *
+ *  Generated subclasses override this method, SMObject itself has no properties to fill.
+ *  @param values A dictionary of { predicate URI: [values] } as read by the decoder
+ *  @param decoder The decoder, which turns the values into literals and objects
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+}
+
+
+
+#pragma mark - Property Accessors
+/**
+ *  The accessors of generated classes call these helpers with the predicate of the property and a pointer to the ivar caching its value.
+ *
+ *  Single values use NSNull in their cache as a placeholder for "already searched the graph and found nothing", the getters return nil in that case.
+ */
+- (RedlandStreamEnumerator *)enumeratorForPredicate:(RedlandNode *)predicate
+{
+	RedlandStatement *statement = [RedlandStatement statementWithSubject:_subject predicate:predicate object:nil];
+	return [_inModel enumeratorOfStatementsLike:statement];
+}
+
+/**
+ *  Returns the literal value of the first statement with the given predicate.
+ */
+- (id)literalForPredicate:(RedlandNode *)predicate cache:(id __strong *)cache
+{
+	if (!*cache) {
+		RedlandStatement *rslt = [[self enumeratorForPredicate:predicate] nextObject];
+		id value = [rslt.object literalValue];
+		*cache = value ? value : [NSNull null];
+	}
+	return ([NSNull null] == *cache) ? nil : *cache;
+}
+
+/**
+ *  Replaces the statement with the given predicate by one with the given literal.
+ */
+- (void)setLiteral:(NSString *)literal forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache
+{
+	if (literal != *cache) {
+		if (*cache) {
+			[_inModel removeStatementsLike:[RedlandStatement statementWithSubject:_subject predicate:predicate object:nil]];
+		}
+		
+		*cache = [literal copy];
+		
+		if (*cache) {
+			[_inModel addStatement:[RedlandStatement statementWithSubject:_subject predicate:predicate object:[*cache nodeValue]]];
+		}
+	}
+}
+
+/**
+ *  Returns the literal values of all statements with the given predicate.
+ */
+- (NSArray *)literalsForPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache
+{
+	if (!*cache) {
+		RedlandStreamEnumerator *query = [self enumeratorForPredicate:predicate];
+		NSMutableArray *arr = [NSMutableArray array];
+		RedlandStatement *rslt = nil;
+		while ((rslt = [query nextObject])) {
+			id newItem = [rslt.object literalValue];		// only works for NSString for now
+			if (newItem) {
+				[arr addObject:newItem];
+			}
+		}
+		*cache = [arr copy];
+	}
+	return *cache;
+}
+
+/**
+ *  Replaces all statements with the given predicate by one for each literal.
+ */
+- (void)setLiterals:(NSArray *)literals forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache
+{
+	if (literals != *cache) {
+		if (*cache) {
+			[_inModel removeStatementsLike:[RedlandStatement statementWithSubject:_subject predicate:predicate object:nil]];
+		}
+		
+		*cache = [literals copy];
+		
+		for (NSString *newItem in *cache) {
+			[_inModel addStatement:[RedlandStatement statementWithSubject:_subject predicate:predicate object:[newItem nodeValue]]];
+		}
+	}
+}
+
+/**
+ *  Returns an instance of the given class for the object of the first statement with the given predicate.
+ */
+- (id)objectOfClass:(Class)itemClass forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache
+{
+	if (!*cache) {
+		RedlandStatement *rslt = [[self enumeratorForPredicate:predicate] nextObject];
+		id obj = [itemClass newWithSubject:rslt.object inModel:_inModel];
+		*cache = obj ? obj : [NSNull null];
+	}
+	return ([NSNull null] == *cache) ? nil : *cache;
+}
+
+/**
+ *  Replaces the statement with the given predicate by one pointing to the given object, whose model is added as submodel.
+ */
+- (void)setObject:(SMObject *)object forPredicate:(RedlandNode *)predicate cache:(id __strong *)cache
+{
+	if (object != *cache) {
+		if (*cache && [NSNull null] != *cache) {
+			[_inModel removeSubmodel:[*cache model]];
+			[_inModel removeStatementsLike:[RedlandStatement statementWithSubject:_subject predicate:predicate object:nil]];
+		}
+		
+		*cache = object;
+		
+		if (object) {
+			[_inModel addStatement:[RedlandStatement statementWithSubject:_subject predicate:predicate object:object.subject]];
+			[_inModel addSubmodel:object.model];
+		}
+	}
+}
+
+/**
+ *  Returns instances of the given class for the objects of all statements with the given predicate.
+ */
+- (NSArray *)objectsOfClass:(Class)itemClass forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache
+{
+	if (!*cache) {
+		RedlandStreamEnumerator *query = [self enumeratorForPredicate:predicate];
+		NSMutableArray *arr = [NSMutableArray array];
+		RedlandStatement *rslt = nil;
+		while ((rslt = [query nextObject])) {
+			id newItem = [itemClass newWithSubject:rslt.object inModel:_inModel];
+			if (newItem) {
+				[arr addObject:newItem];
+			}
+		}
+		*cache = [arr copy];
+	}
+	return *cache;
+}
+
+/**
+ *  Replaces all statements with the given predicate by one pointing to each object, whose models are added as submodels.
+ */
+- (void)setObjects:(NSArray *)objects forPredicate:(RedlandNode *)predicate cache:(NSArray * __strong *)cache
+{
+	if (objects != *cache) {
+		if (*cache) {
+			for (SMObject *item in *cache) {
+				[_inModel removeSubmodel:item.model];
+			}
+			[_inModel removeStatementsLike:[RedlandStatement statementWithSubject:_subject predicate:predicate object:nil]];
+		}
+		
+		*cache = [objects copy];
+		
+		for (SMObject *item in *cache) {
+			[_inModel addStatement:[RedlandStatement statementWithSubject:_subject predicate:predicate object:item.subject]];
+			[_inModel addSubmodel:item.model];
+		}
+	}
+}
+
+
+
+#pragma mark - Typed Literals
+/**
+ *  The number formatter used for xsd:decimal and its relatives. Formatters must not be used from several threads at once, so every thread gets its own.
+ */
++ (NSNumberFormatter *)literalNumberFormatter
+{
+	NSMutableDictionary *perThread = [[NSThread currentThread] threadDictionary];
+	NSNumberFormatter *formatter = perThread[@"SMLiteralNumberFormatter"];
+	if (!formatter) {
+		formatter = [NSNumberFormatter new];
+		formatter.locale = [[NSLocale alloc] initWithLocaleIdentifier:@"en_US_POSIX"];
+		formatter.numberStyle = NSNumberFormatterDecimalStyle;
+		formatter.usesGroupingSeparator = NO;
+		formatter.maximumFractionDigits = 16;
+		perThread[@"SMLiteralNumberFormatter"] = formatter;
+	}
+	return formatter;
+}
+
+/**
+ *  The date formatters used for xsd:dateTime and xsd:date, tried in order; the first one writes xsd:dateTime, the last one xsd:date. Like the number
+ *  formatter, every thread gets its own.
+ */
++ (NSArray *)literalDateFormatters
+{
+	NSMutableDictionary *perThread = [[NSThread currentThread] threadDictionary];
+	NSArray *formatters = perThread[@"SMLiteralDateFormatters"];
+	if (!formatters) {
+		NSLocale *posix = [[NSLocale alloc] initWithLocaleIdentifier:@"en_US_POSIX"];
+		NSTimeZone *utc = [NSTimeZone timeZoneForSecondsFromGMT:0];
+		NSMutableArray *arr = [NSMutableArray array];
+		for (NSString *format in @[@"yyyy-MM-dd'T'HH:mm:ssZZZZZ", @"yyyy-MM-dd'T'HH:mm:ss.SSSZZZZZ", @"yyyy-MM-dd'T'HH:mm:ss", @"yyyy-MM-dd"]) {
+			NSDateFormatter *formatter = [NSDateFormatter new];
+			formatter.locale = posix;
+			formatter.timeZone = utc;
+			formatter.dateFormat = format;
+			[arr addObject:formatter];
+		}
+		formatters = [arr copy];
+		perThread[@"SMLiteralDateFormatters"] = formatters;
+	}
+	return formatters;
+}
+
+/**
+ *  Converts an xsd:decimal (or integer, double, ...) literal to a number.
+ *  @return The number, nil if the literal is not a number
+ */
++ (NSNumber *)numberFromLiteral:(NSString *)literal
+{
+	if ([literal length] < 1) {
+		return nil;
+	}
+	return [[self literalNumberFormatter] numberFromString:[literal stringByTrimmingCharactersInSet:[NSCharacterSet whitespaceCharacterSet]]];
+}
+
+/**
+ *  The literal representation of a number, as understood by "numberFromLiteral:".
+ */
++ (NSString *)literalFromNumber:(NSNumber *)number
+{
+	return number ? [[self literalNumberFormatter] stringFromNumber:number] : nil;
+}
+
+/**
+ *  Converts an xsd:dateTime or xsd:date literal to a date, times without a time zone are taken as UTC.
+ *  @return The date, nil if the literal cannot be read
+ */
++ (NSDate *)dateFromLiteral:(NSString *)literal
+{
+	if ([literal length] < 1) {
+		return nil;
+	}
+	for (NSDateFormatter *formatter in [self literalDateFormatters]) {
+		NSDate *date = [formatter dateFromString:literal];
+		if (date) {
+			return date;
+		}
+	}
+	return nil;
+}
+
+/**
+ *  The xsd:dateTime literal representation of a date, in UTC.
+ */
++ (NSString *)literalFromDate:(NSDate *)date
+{
+	return [self literalFromDate:date datatype:nil];
+}
+
+/**
+ *  The literal representation of a date for the given datatype, in UTC: only the day for xsd:date, xsd:dateTime for any other datatype.
+ */
++ (NSString *)literalFromDate:(NSDate *)date datatype:(NSString *)datatype
+{
+	if (!date) {
+		return nil;
+	}
+	NSArray *formatters = [self literalDateFormatters];
+	NSDateFormatter *formatter = [@"http://www.w3.org/2001/XMLSchema#date" isEqualToString:datatype] ? [formatters lastObject] : formatters[0];
+	return [formatter stringFromDate:date];
+}
+
+
 @end
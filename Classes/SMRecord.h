@@ -26,6 +26,7 @@
 @class SMServer;
 @class SMDemographics;
 @class SMScratchpadData;
+@class RedlandModel;
 
 
 /**
@@ -74,12 +75,24 @@
 /// The scratchpad document for this record - to get the data you will need to call "get:" on this first!
 @property (nonatomic, readonly, strong) SMScratchpadData *scratchpad;
 
+/// The model that prefetchCalls:callback: merges all objects into
+@property (nonatomic, readonly, strong) RedlandModel *model;
+
+/// If YES, responses to calls that don't collect into a model are decoded straight into objects without building a Redland model, which is a lot faster
+/// for large responses. The objects have all their properties filled but no model, so they can't be changed or serialized. Responses the decoder does not
+/// understand are parsed into a model as usual.
+@property (nonatomic, assign) BOOL decodesWithoutModel;
+
 
 - (id)initWithId:(NSString *)anId onServer:(SMServer *)aServer;
 
 /// @name Web Requests
 - (void)getDemographicsWithCallback:(SMCancelErrorBlock)callback;
 - (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath callback:(SMSuccessRetvalueBlock)callback;
+- (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters intoModel:(RedlandModel *)model callback:(SMSuccessRetvalueBlock)callback;
+- (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters pageSize:(NSUInteger)pageSize intoModel:(RedlandModel *)model pageCallback:(SMPageBlock)pageCallback callback:(SMSuccessRetvalueBlock)callback;
+
+- (void)prefetchCalls:(NSDictionary *)calls callback:(SMSuccessRetvalueBlock)callback;
 
 - (void)performMethod:(NSString *)aMethod withBody:(id)body orParameters:(NSArray *)parameters ofType:(NSString *)contentType httpMethod:(NSString *)httpMethod callback:(SMSuccessRetvalueBlock)callback;
 
@@ -24,6 +24,8 @@
 #import "SMRecord.h"
 #import "SMServer.h"
 #import "SMARTObjects.h"
+#import "SMObject+Registry.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
@@ -32,6 +34,11 @@
 
 @property (nonatomic, readwrite, strong) SMDemographics *demographics;
 @property (nonatomic, readwrite, strong) SMScratchpadData *scratchpad;
+@property (nonatomic, readwrite, strong) RedlandModel *model;
+
+- (NSDictionary *)parseObjectsOfClass:(Class)aClass fromRDF:(NSString *)rdf intoModel:(RedlandModel *)model error:(NSError * __autoreleasing *)error;
+- (NSDictionary *)objectsOfClass:(Class)aClass fromStatements:(NSEnumerator *)query inModel:(RedlandModel *)target addStatements:(BOOL)add;
+- (void)getPageAtOffset:(NSUInteger)offset ofClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters pageSize:(NSUInteger)pageSize intoModel:(RedlandModel *)model collected:(NSMutableArray *)collected pageCallback:(SMPageBlock)pageCallback callback:(SMSuccessRetvalueBlock)callback;
 
 @end
 
@@ -102,24 +109,53 @@
  *  @param callback A block to execute when the call has finished, passing a success flag and a user dictionary containing the fetched objects
  */
 - (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath callback:(SMSuccessRetvalueBlock)callback
+{
+	[self getObjectsOfClass:aClass from:aPath parameters:nil intoModel:nil callback:callback];
+}
+
+/**
+ *  Performs a GET request to the given path with the given parameters and tries to instantiate objects of the given class from the returned data.
+ *
+ *  If a model is given the returned statements are added to it and the objects live in that model, so the results of several calls can be
+ *  collected in one model. The model is returned in the user dictionary (key: SMARTResponseModelKey). Without a model and with "decodesWithoutModel"
+ *  set, the response is decoded without building a model if possible; the user dictionary then has no model.
+ *  @param aClass An SMDocument subclass that can represent objects returned from aPath
+ *  @param aPath The path to call on the server
+ *  @param parameters An array full of strings in the form "key=value", may be nil
+ *  @param model The model to add the returned statements to, nil to use a new model
+ *  @param callback A block to execute when the call has finished, passing a success flag and a user dictionary containing the fetched objects
+ */
+- (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters intoModel:(RedlandModel *)model callback:(SMSuccessRetvalueBlock)callback
 {
 	if (![aClass isSubclassOfClass:[SMObject class]]) {
 		NSString *errMessage = [NSString stringWithFormat:@"Class %@ is not a subclass of SMObject, it cannot be used with this method", NSStringFromClass(aClass)];
 		NSError *err = nil;
 		ERR(&err, errMessage, 0)
 		SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, NO, @{SMARTErrorKey: err})
+		return;
 	}
 	
 	// fetch
 	[self performMethod:aPath
 			   withBody:nil
-		   orParameters:nil
+		   orParameters:parameters
 				 ofType:nil
 			 httpMethod:@"GET"
 			   callback:^(BOOL success, NSDictionary * __autoreleasing userInfo) {
 				   if (success) {
 					   NSString *contentType = userInfo[SMARTResponseContentTypeKey];
 					   
+					   // decode without a model if we can, falling back to parsing below
+					   if (_decodesWithoutModel && !model) {
+						   NSArray *decoded = [SMStreamDecoder objectsOfClass:aClass fromData:userInfo[SMARTResponseDataKey] contentType:contentType];
+						   if (decoded) {
+							   NSMutableDictionary *usrInf = [userInfo mutableCopy];
+							   usrInf[SMARTResponseArrayKey] = decoded;
+							   SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, YES, usrInf)
+							   return;
+						   }
+					   }
+					   
 					   // if we get RDF-XML data back we parse it
 					   if ([contentType hasPrefix:@"application/rdf+xml"]) {
 						   NSData *rdfData = userInfo[SMARTResponseDataKey];
@@ -127,43 +163,18 @@
 						   if ([rdf length] > 0) {
 				//			   DLog(@"-->  GET  %@", aPath);
 				//			   DLog(@"==>  %@", rdf);
-							   RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
-							   RedlandURI *uri = [RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"];
-							   RedlandModel *model = [RedlandModel new];
-							   
-							   // parse RDF+XML
-							   @try {
-								   [parser parseString:rdf intoModel:model withBaseURI:uri];
-							   }
-							   @catch (NSException *exception) {
-								   NSString *errMessage = [NSString stringWithFormat:@"Failed to parse RDF: %@", [exception reason]];
-								   NSError *err = nil;
-								   ERR(&err, errMessage, 0)
+							   NSError *error = nil;
+							   NSDictionary *parsed = [self parseObjectsOfClass:aClass fromRDF:rdf intoModel:model error:&error];
+							   if (!parsed) {
 								   NSMutableDictionary *usrInf = [userInfo mutableCopy];
-								   usrInf[SMARTErrorKey] = err;
+								   usrInf[SMARTErrorKey] = error;
 								   SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, NO, usrInf)
 								   return;
 							   }
 							   
-							   // get the desired sub-models
-							   RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/1999/02/22-rdf-syntax-ns#type"];
-							   RedlandNode *object = [RedlandNode nodeWithURIString:[aClass rdfType]];
-							   RedlandStatement *statement = [RedlandStatement statementWithSubject:nil predicate:predicate object:object];
-							   RedlandStreamEnumerator *query = [model enumeratorOfStatementsLike:statement];
-							   
-							   // create our objects wrapping those sub-models
-							   NSMutableArray *array = [NSMutableArray array];
-							   RedlandStatement *rslt = nil;
-							   while ((rslt = [query nextObject])) {
-								   id item = [aClass newWithSubject:rslt.subject inModel:model];
-								   if (item) {
-									   [array addObject:item];
-								   }
-							   }
-							   
 							   // complete the user-info dictionary and call the callback
 							   NSMutableDictionary *usrInf = [userInfo mutableCopy];
-							   usrInf[SMARTResponseArrayKey] = array;
+							   [usrInf addEntriesFromDictionary:parsed];
 							   SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, YES, usrInf)
 							   return;
 						   }
@@ -199,6 +210,216 @@
 }
 
 
+/**
+ *  Fetches the objects of the given class from the given path page by page, adding every page to one model.
+ *
+ *  Pages are requested with "limit" and "offset" parameters until a page returns fewer than pageSize objects or the page callback returns NO.
+ *  All objects live in the shared model, which is returned in the final user dictionary (key: SMARTResponseModelKey).
+ *  @param aClass An SMDocument subclass that can represent objects returned from aPath
+ *  @param aPath The path to call on the server
+ *  @param parameters An array full of strings in the form "key=value" sent with every page, may be nil
+ *  @param pageSize The number of objects per page, 0 fetches all objects in one page
+ *  @param model The model to add all pages to, nil to use a new model
+ *  @param pageCallback A block to execute for every page with the page's objects, may be nil
+ *  @param callback A block to execute when all pages have been fetched, passing a success flag and a user dictionary containing the objects of
+ *  all pages
+ */
+- (void)getObjectsOfClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters pageSize:(NSUInteger)pageSize intoModel:(RedlandModel *)model pageCallback:(SMPageBlock)pageCallback callback:(SMSuccessRetvalueBlock)callback
+{
+	[self getPageAtOffset:0 ofClass:aClass from:aPath parameters:parameters pageSize:pageSize intoModel:(model ? model : [RedlandModel new]) collected:[NSMutableArray array] pageCallback:pageCallback callback:callback];
+}
+
+- (void)getPageAtOffset:(NSUInteger)offset ofClass:(Class)aClass from:(NSString *)aPath parameters:(NSArray *)parameters pageSize:(NSUInteger)pageSize intoModel:(RedlandModel *)model collected:(NSMutableArray *)collected pageCallback:(SMPageBlock)pageCallback callback:(SMSuccessRetvalueBlock)callback
+{
+	NSMutableArray *pageParameters = parameters ? [parameters mutableCopy] : [NSMutableArray array];
+	if (pageSize > 0) {
+		[pageParameters addObject:[NSString stringWithFormat:@"limit=%lu", (unsigned long)pageSize]];
+		[pageParameters addObject:[NSString stringWithFormat:@"offset=%lu", (unsigned long)offset]];
+	}
+	
+	[self getObjectsOfClass:aClass from:aPath parameters:pageParameters intoModel:model callback:^(BOOL success, NSDictionary * __autoreleasing userInfo) {
+		if (!success) {
+			SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, NO, userInfo)
+			return;
+		}
+		
+		NSArray *items = userInfo[SMARTResponseArrayKey];
+		[collected addObjectsFromArray:items];
+		BOOL goOn = pageCallback ? pageCallback(items, userInfo) : YES;
+		
+		// next page or done
+		if (goOn && pageSize > 0 && [items count] >= pageSize) {
+			[self getPageAtOffset:(offset + [items count]) ofClass:aClass from:aPath parameters:parameters pageSize:pageSize intoModel:model collected:collected pageCallback:pageCallback callback:callback];
+		}
+		else {
+			NSMutableDictionary *usrInf = [userInfo mutableCopy];
+			usrInf[SMARTResponseArrayKey] = [collected copy];
+			usrInf[SMARTResponseModelKey] = model;
+			SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, YES, usrInf)
+		}
+	}];
+}
+
+
+/**
+ *  Fetches the given calls concurrently and merges all returned objects into the record's model.
+ *
+ *  At most "maxConcurrentCalls" of our server's calls are in flight at once. All Redland models share one Redland world which must not be used from
+ *  several threads at once, so responses are read with SMStreamDecoder, which uses no Redland, on a background queue, and their statements are merged
+ *  into the record's model on the main thread, like everything else that uses Redland. RDF+XML the decoder does not understand is parsed on the main
+ *  thread instead. The callback is called once all calls have finished; don't use the record's model before.
+ *  @param calls A dictionary of calls, keyed by a name, with an array holding the SMObject subclass of the returned objects and the path to call
+ *  @param callback A block to execute when all calls have finished, passing a success flag, which is NO if any call failed, and a user dictionary
+ *  containing the objects of every call (key: SMARTResponseCallsKey) and the record's model (key: SMARTResponseModelKey)
+ */
+- (void)prefetchCalls:(NSDictionary *)calls callback:(SMSuccessRetvalueBlock)callback
+{
+	if (!_server) {
+		NSString *errStr = [NSString stringWithFormat:@"Fatal Error: I have no server! %@", self];
+		SUCCESS_RETVAL_CALLBACK_OR_LOG_ERR_STRING(callback, errStr, 2000)
+		return;
+	}
+	
+	RedlandModel *model = self.model;
+	NSMutableDictionary *results = [NSMutableDictionary dictionaryWithCapacity:[calls count]];
+	if ([calls count] < 1) {
+		SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, YES, (@{SMARTResponseCallsKey: results, SMARTResponseModelKey: model}))
+		return;
+	}
+	
+	__block NSUInteger pending = [calls count];
+	__block NSError *firstError = nil;
+	__block BOOL allSucceeded = YES;
+	
+	[calls enumerateKeysAndObjectsUsingBlock:^(NSString *name, NSArray *call, BOOL *stop) {
+		Class aClass = call[0];
+		SMServerCall *serverCall = [SMServerCall new];
+		serverCall.method = call[1];
+		serverCall.HTTPMethod = @"GET";
+		serverCall.concurrent = YES;
+		serverCall.myCallback = ^(BOOL success, NSDictionary * __autoreleasing userInfo) {
+			NSString *contentType = userInfo[SMARTResponseContentTypeKey];
+			NSData *data = success ? userInfo[SMARTResponseDataKey] : nil;
+			NSError *callError = userInfo[SMARTErrorKey];
+			
+			// read the response in the background...
+			dispatch_async(dispatch_get_global_queue(DISPATCH_QUEUE_PRIORITY_DEFAULT, 0), ^{
+				SMStreamDecoder *decoder = data ? [SMStreamDecoder decoderWithData:data contentType:contentType] : nil;
+				
+				// ...and merge it into the model on the main thread, parsing RDF+XML the decoder did not understand there
+				dispatch_async(dispatch_get_main_queue(), ^{
+					NSError *error = callError;
+					NSDictionary *parsed = nil;
+					if (decoder) {
+						parsed = [self objectsOfClass:aClass fromStatements:[[decoder statements] objectEnumerator] inModel:model addStatements:YES];
+					}
+					else if (data && [contentType hasPrefix:@"application/rdf+xml"]) {
+						NSString *rdf = [[NSString alloc] initWithData:data encoding:NSUTF8StringEncoding];
+						parsed = [self parseObjectsOfClass:aClass fromRDF:rdf intoModel:model error:&error];
+					}
+					else if (success) {
+						NSString *errMessage = [NSString stringWithFormat:@"Only RDF+XML and flat or expanded JSON-LD can be prefetched, %@ returned \"%@\"", name, contentType];
+						ERR(&error, errMessage, 0)
+					}
+					
+					// collect
+					results[name] = parsed ? parsed[SMARTResponseArrayKey] : @[];
+					if (!parsed) {
+						allSucceeded = NO;
+						if (!firstError) {
+							firstError = error;
+						}
+					}
+					
+					if (0 == --pending) {
+						NSMutableDictionary *usrInf = [NSMutableDictionary dictionaryWithObjectsAndKeys:results, SMARTResponseCallsKey, model, SMARTResponseModelKey, nil];
+						if (firstError) {
+							usrInf[SMARTErrorKey] = firstError;
+						}
+						SUCCESS_RETVAL_CALLBACK_OR_LOG_USER_INFO(callback, allSucceeded, usrInf)
+					}
+				});
+			});
+		};
+		
+		[_server performCall:serverCall];
+	}];
+}
+
+
+/**
+ *  Parses RDF+XML and instantiates the objects of the given class it describes.
+ *
+ *  If a model is given the parsed statements are added to it and the objects live in that model, otherwise they live in a new model. This does not touch
+ *  any state of the receiver; like all use of Redland it must happen on the main thread.
+ *  @param aClass An SMDocument subclass that can represent the objects
+ *  @param rdf The RDF+XML string to parse
+ *  @param model The model to add the statements to, nil to use a new model
+ *  @param error An error pointer, set if parsing fails
+ *  @return A dictionary containing the objects (key: SMARTResponseArrayKey) and the model they live in (key: SMARTResponseModelKey), nil on failure
+ */
+- (NSDictionary *)parseObjectsOfClass:(Class)aClass fromRDF:(NSString *)rdf intoModel:(RedlandModel *)model error:(NSError * __autoreleasing *)error
+{
+	RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
+	RedlandURI *uri = [RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"];
+	RedlandModel *parsed = [RedlandModel new];
+	
+	// parse RDF+XML
+	@try {
+		[parser parseString:rdf intoModel:parsed withBaseURI:uri];
+	}
+	@catch (NSException *exception) {
+		NSString *errMessage = [NSString stringWithFormat:@"Failed to parse RDF: %@", [exception reason]];
+		ERR(error, errMessage, 0)
+		return nil;
+	}
+	
+	RedlandStatement *all = [RedlandStatement statementWithSubject:nil predicate:nil object:nil];
+	return [self objectsOfClass:aClass fromStatements:[parsed enumeratorOfStatementsLike:all] inModel:(model ? model : parsed) addStatements:(nil != model)];
+}
+
+/**
+ *  Instantiates the objects of the given class among the subjects of the statements. Like all use of Redland this must happen on the main thread.
+ *  @param aClass An SMDocument subclass that can represent the objects
+ *  @param query An enumerator of RedlandStatement instances
+ *  @param target The model the objects live in
+ *  @param add Whether the statements must be added to the model, NO if they came from it
+ *  @return A dictionary containing the objects (key: SMARTResponseArrayKey) and the model they live in (key: SMARTResponseModelKey)
+ */
+- (NSDictionary *)objectsOfClass:(Class)aClass fromStatements:(NSEnumerator *)query inModel:(RedlandModel *)target addStatements:(BOOL)add
+{
+	// walk the statements once, moving them to the target model and noting the subjects of the desired type
+	RedlandNode *typeNode = [RedlandNode typeNode];
+	RedlandNode *classNode = [RedlandNode nodeWithURIString:[aClass rdfType]];
+	NSMutableArray *statements = [NSMutableArray array];
+	NSMutableArray *subjects = [NSMutableArray array];
+	NSMutableSet *seen = [NSMutableSet set];
+	RedlandStatement *rslt = nil;
+	while ((rslt = [query nextObject])) {
+		[statements addObject:rslt];
+		if (add) {
+			[target addStatement:rslt];
+		}
+		if ([typeNode isEqual:rslt.predicate] && [classNode isEqual:rslt.object] && ![seen containsObject:rslt.subject]) {
+			[seen addObject:rslt.subject];
+			[subjects addObject:rslt.subject];
+		}
+	}
+	
+	// build all objects of the response in one pass and pick ours
+	NSDictionary *objects = [SMObject objectsFromStatements:[statements objectEnumerator] inModel:target];
+	NSMutableArray *array = [NSMutableArray arrayWithCapacity:[subjects count]];
+	for (RedlandNode *subject in subjects) {
+		id item = [objects[subject] isKindOfClass:aClass] ? objects[subject] : [aClass newWithSubject:subject inModel:target objects:objects];
+		if (item) {
+			[array addObject:item];
+		}
+	}
+	
+	return @{SMARTResponseArrayKey: array, SMARTResponseModelKey: target};
+}
+
+
 /**
  *  The basic method to perform REST methods on the server with App credentials.
  *
@@ -259,6 +480,17 @@
 	return _name;
 }
 
+/**
+ *  The model that prefetched objects are merged into, created on first access.
+ */
+- (RedlandModel *)model
+{
+	if (!_model) {
+		self.model = [RedlandModel new];
+	}
+	return _model;
+}
+
 - (void)setScratchpad:(SMScratchpadData *)scratchpad
 {
 	if (scratchpad != _scratchpad) {
@@ -148,6 +148,10 @@
 - (SMRecord *)recordWithId:(NSString *)recordId;
 
 
+/// How many concurrent calls, like those of SMRecord's prefetchCalls:callback:, may be in flight at once; 4 by default
+@property (nonatomic, assign) NSUInteger maxConcurrentCalls;
+
+
 /// @name Allocator
 + (id)serverWithDelegate:(id<SMARTServerDelegate>)aDelegate;
 
@@ -41,6 +41,7 @@
 @property (nonatomic, strong) NSMutableArray *callQueue;						//< Calls are queued instead of performed in parallel to avoid getting inconsistent results
 @property (nonatomic, strong) NSMutableArray *suspendedCalls;					//< Calls that were dequeued, we need to hold on to them to not deallocate them
 @property (nonatomic, strong) SMServerCall *currentCall;						//< Only one call at a time, this is the current one
+@property (nonatomic, strong) NSMutableArray *concurrentCalls;					//< Calls flagged "concurrent" run alongside each other, but never alongside the current call
 
 @property (nonatomic, strong) SMLoginViewController *loginVC;					//< A handle to the currently shown login view controller
 @property (nonatomic, strong) NSTimer *stillContactingTimer;					//< A timer that shows a message if contacting the server takes too long
@@ -49,6 +50,8 @@
 - (void)_presentLoginScreenAtURL:(NSURL *)loginURL;
 
 - (MPOAuthAPI *)getOAuthOutError:(NSError * __autoreleasing *)error;
+- (BOOL)mayPerformCall:(SMServerCall *)aCall;
+- (void)cancelConcurrentCalls;
 
 @end
 
@@ -62,6 +65,8 @@ NSString *const SMARTResponseContentTypeKey = @"SMARTResponseContentType";
 NSString *const SMARTResponseDataKey = @"SMARTResponseData";
 NSString *const SMARTResponseArrayKey = @"SMARTResponseArray";
 NSString *const SMARTResponseImageKey = @"SMARTResponseImage";
+NSString *const SMARTResponseModelKey = @"SMARTResponseModel";
+NSString *const SMARTResponseCallsKey = @"SMARTResponseCalls";
 
 NSString *const SMARTInternalScheme = @"smart-app";
 NSString *const SMARTOAuthRecordIDKey = @"smart_record_id";
@@ -108,6 +113,8 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 		
 		self.callQueue = [NSMutableArray arrayWithCapacity:2];
 		self.suspendedCalls = [NSMutableArray arrayWithCapacity:2];
+		self.concurrentCalls = [NSMutableArray arrayWithCapacity:4];
+		self.maxConcurrentCalls = 4;
 	}
 	return self;
 }
@@ -249,6 +256,9 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
  */
 - (void)selectRecord:(SMCancelErrorBlock)callback
 {
+	// calls in flight were signed for the record we are leaving
+	[self cancelConcurrentCalls];
+	
 	// dequeue current call
 	if (_currentCall) {
 		[self suspendCall:_currentCall];
@@ -332,6 +342,7 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 		CANCEL_ERROR_CALLBACK_OR_LOG_ERR_STRING(callback, NO, errorStr)
 		return;
 	}
+	[self cancelConcurrentCalls];
 	[self suspendCall:_currentCall];
 	
 	// construct the call
@@ -618,12 +629,15 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 	[_suspendedCalls removeObject:aCall];
 	
 	// there already is a call in progress
-	if (aCall != _currentCall && [_currentCall hasBeenFired]) {
-		[_callQueue addObject:aCall];
+	if (![self mayPerformCall:aCall]) {
+		if (![_callQueue containsObject:aCall]) {
+			[_callQueue addObject:aCall];
+		}
 		return;
 	}
 	
-	// assure our OAuthAPI is correctly setup
+	// assure our OAuthAPI is correctly setup; the call needs its server first so that aborting it lets us know it finished
+	aCall.server = self;
 	NSError *error = nil;
 	if (!aCall.oauth) {
 		aCall.oauth = [self getOAuthOutError:&error];
@@ -633,13 +647,35 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 		return;
 	}
 	
-	// setup and fire
-	aCall.server = self;
-	self.currentCall = aCall;
+	// concurrent calls leave the queue when they start, there can be several of them
+	if (aCall.concurrent) {
+		[_callQueue removeObject:aCall];
+		[_concurrentCalls addObject:aCall];
+	}
+	else {
+		self.currentCall = aCall;
+	}
 	
 	[aCall fire];
 }
 
+/**
+ *  Whether the call can be fired now.
+ *
+ *  Concurrent calls may run alongside each other, up to maxConcurrentCalls, all other calls only run when no other call is in progress.
+ *  @param aCall The call that wants to be performed
+ */
+- (BOOL)mayPerformCall:(SMServerCall *)aCall
+{
+	if (aCall != _currentCall && [_currentCall hasBeenFired]) {
+		return NO;
+	}
+	if (aCall.concurrent) {
+		return ([_concurrentCalls containsObject:aCall] || [_concurrentCalls count] < MAX(1, _maxConcurrentCalls));
+	}
+	return ([_concurrentCalls count] < 1);
+}
+
 /**
  *  Callback to let us know a call has finished.
  *
@@ -649,21 +685,20 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 - (void)callDidFinish:(SMServerCall *)aCall
 {
 	[_callQueue removeObject:aCall];
+	[_concurrentCalls removeObject:aCall];
 	if (aCall == _currentCall) {
 		self.currentCall = nil;
 	}
 	
-	// move on
-	SMServerCall *nextCall = nil;
+	// move on, starting the concurrent calls that follow the next call as long as they may run
 	if ([_callQueue count] > 0) {
-		nextCall = _callQueue[0];
+		[self performCall:_callQueue[0]];
+		while ([_callQueue count] > 0 && [_callQueue[0] concurrent] && [self mayPerformCall:_callQueue[0]]) {
+			[self performCall:_callQueue[0]];
+		}
 	}
 	else if ([_suspendedCalls count] > 0) {
-		nextCall = _suspendedCalls[0];
-	}
-	
-	if (nextCall) {
-		[self performCall:nextCall];
+		[self performCall:_suspendedCalls[0]];
 	}
 }
 
@@ -679,12 +714,25 @@ NSString *const SMARTRecordUserInfoKey = @"SMARTRecordUserInfoKey";
 {
 	[_suspendedCalls addObject:aCall];
 	[_callQueue removeObject:aCall];
+	[_concurrentCalls removeObject:aCall];
 	
 	if (aCall == _currentCall) {
 		self.currentCall = nil;
 	}
 }
 
+/**
+ *  Cancels all concurrent calls in flight.
+ *
+ *  Used before authenticating or selecting a record, which replaces the credentials these calls were signed with. Their callbacks are called as cancelled.
+ */
+- (void)cancelConcurrentCalls
+{
+	for (SMServerCall *call in [_concurrentCalls copy]) {
+		[call cancel];
+	}
+}
+
 /**
  *  Callback when the call is stuck at user authorization
  *  @param authURL The URL that the call wants to authorize against
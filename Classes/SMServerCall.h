@@ -42,6 +42,7 @@
 @property (nonatomic, strong) NSArray *parameters;						//< An array with @"key=value" strings to be passed to the server, overridden by "body"
 @property (nonatomic, strong) MPOAuthAPI *oauth;						//< The call will retain a copy of the oauth instance
 @property (nonatomic, assign) BOOL finishIfAuthenticated;				//< If YES the call is merely a proxy to the OAuth authentication call
+@property (nonatomic, assign) BOOL concurrent;							//< If YES the call may run alongside other concurrent calls, up to the server's "maxConcurrentCalls"
 @property (nonatomic, copy) SMSuccessRetvalueBlock myCallback;			//< The callback after finishing our call
 @property (nonatomic, readonly, assign) BOOL hasBeenFired;				//< As the name suggests, tells us whether it has been sent on the journey
 
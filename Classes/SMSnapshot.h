@@ -0,0 +1,58 @@
+/*
+ SMSnapshot.h
+ SMARTFramework
+ 
+ Copyright (c) 2026 CHIP, Boston Children's Hospital. All rights reserved.
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import <Foundation/Foundation.h>
+#import "SMART.h"
+
+@class SMObject;
+
+
+/**
+ *  Saves a graph of SMART objects to a compact binary snapshot and restores it without parsing RDF or building a Redland model.
+ *
+ *  Objects are written with the index of their class in the generated class table and their properties by index, model objects are nested inline and
+ *  objects and strings that appear more than once are written once and then referenced. A snapshot carries the hash of the generated schema and can only
+ *  be read by a framework generated from the same ontology. Restored objects have all their properties filled but are not backed by a model.
+ */
+@interface SMSnapshot : NSObject
+
+/// @name Saving and Restoring
++ (NSData *)dataWithObjects:(NSArray *)objects;
++ (NSArray *)objectsWithData:(NSData *)data error:(NSError * __autoreleasing *)error;
++ (BOOL)writeObjects:(NSArray *)objects toFile:(NSString *)path error:(NSError * __autoreleasing *)error;
++ (NSArray *)objectsWithContentsOfFile:(NSString *)path error:(NSError * __autoreleasing *)error;
+
+/// @name Writing Properties (used by the generated classes)
+- (void)writeString:(NSString *)string forProperty:(NSUInteger)idx;
+- (void)writeStrings:(NSArray *)strings forProperty:(NSUInteger)idx;
+- (void)writeObject:(SMObject *)object forProperty:(NSUInteger)idx;
+- (void)writeObjects:(NSArray *)objects forProperty:(NSUInteger)idx;
+
+/// @name Reading Properties (used by the generated classes)
+- (NSInteger)readPropertyIndex;
+- (NSString *)readString;
+- (NSArray *)readStrings;
+- (id)readObject;
+- (NSArray *)readObjects;
+- (void)skipValue;
+
+
+@end
@@ -0,0 +1,526 @@
+/*
+ SMSnapshot.m
+ SMARTFramework
+ 
+ Copyright (c) 2026 CHIP, Boston Children's Hospital. All rights reserved.
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import "SMSnapshot.h"
+#import "SMObject.h"
+#import "SMObject+Registry.h"
+#import <Redland-ObjC.h>
+
+static const uint8_t SMSnapshotMagic[4] = {'S', 'M', 'S', 'N'};
+static const uint8_t SMSnapshotFormatVersion = 1;
+static NSString *const SMSnapshotInvalidException = @"SMSnapshotInvalidException";
+
+/// The tags that precede every value
+typedef NS_ENUM(uint8_t, SMSnapshotTag) {
+	SMSnapshotTagNil = 0,
+	SMSnapshotTagString,					///< A string not seen before, followed by its UTF-8 byte length and bytes
+	SMSnapshotTagStringReference,			///< The index of a string seen before
+	SMSnapshotTagStrings,					///< The number of strings, followed by that many tagged strings
+	SMSnapshotTagObject,					///< An object not seen before, followed by its class index, subject and properties
+	SMSnapshotTagObjectReference,			///< The index of an object seen before
+	SMSnapshotTagObjects,					///< The number of objects, followed by that many tagged objects
+};
+
+/// How the subject of an object is written, after its class index
+typedef NS_ENUM(uint8_t, SMSnapshotSubject) {
+	SMSnapshotSubjectURI = 0,				///< A tagged string with the URI
+	SMSnapshotSubjectBlank,					///< A tagged string with the blank node ID
+	SMSnapshotSubjectNone,					///< Nothing, the object has no subject
+};
+
+
+@interface SMSnapshot () {
+	NSMutableData *data;					///< The bytes written so far
+	NSMutableDictionary *stringIndexes;		///< { string: index } of the strings written so far
+	NSMapTable *objectIndexes;				///< { object: index } of the objects written so far, by pointer
+	
+	NSData *source;							///< The snapshot being read
+	const uint8_t *bytes;
+	NSUInteger length;
+	NSUInteger position;
+	NSMutableArray *strings;				///< The strings read so far, in order of appearance
+	NSMutableArray *objects;				///< The objects read so far, in order of appearance
+}
+
+@end
+
+
+@implementation SMSnapshot
+
+
+#pragma mark - Saving and Restoring
+/**
+ *  Returns a snapshot of the given objects and all objects they reach through model properties.
+ *
+ *  Properties that have not been read yet are read from the objects' models first.
+ */
++ (NSData *)dataWithObjects:(NSArray *)objects
+{
+	SMSnapshot *snapshot = [self new];
+	snapshot->data = [NSMutableData dataWithCapacity:4096];
+	snapshot->stringIndexes = [NSMutableDictionary dictionary];
+	snapshot->objectIndexes = [NSMapTable mapTableWithKeyOptions:(NSPointerFunctionsStrongMemory | NSPointerFunctionsObjectPointerPersonality)
+													valueOptions:NSPointerFunctionsStrongMemory];
+	
+	[snapshot->data appendBytes:SMSnapshotMagic length:sizeof(SMSnapshotMagic)];
+	[snapshot->data appendBytes:&SMSnapshotFormatVersion length:1];
+	[snapshot writeRawString:[SMObject snapshotSchemaHash]];
+	[snapshot writeVarint:[objects count]];
+	for (SMObject *object in objects) {
+		[snapshot writeObjectValue:object];
+	}
+	
+	return snapshot->data;
+}
+
+/**
+ *  Restores the objects saved with "dataWithObjects:".
+ *
+ *  Like parsing RDF this creates Redland nodes, so it must not run alongside other Redland work on another thread.
+ *  @param data The snapshot
+ *  @param error An error pointer, filled if the data is not a snapshot or was written with classes generated from another ontology
+ *  @return The saved objects in their original order, nil on error
+ */
++ (NSArray *)objectsWithData:(NSData *)data error:(NSError * __autoreleasing *)error
+{
+	SMSnapshot *snapshot = [self new];
+	snapshot->source = data;
+	snapshot->bytes = [data bytes];
+	snapshot->length = [data length];
+	snapshot->strings = [NSMutableArray array];
+	snapshot->objects = [NSMutableArray array];
+	
+	@try {
+		if (snapshot->length < sizeof(SMSnapshotMagic) + 1
+			|| 0 != memcmp(snapshot->bytes, SMSnapshotMagic, sizeof(SMSnapshotMagic))
+			|| SMSnapshotFormatVersion != snapshot->bytes[sizeof(SMSnapshotMagic)]) {
+			ERR(error, @"Not a snapshot, or written by another version of the framework", 3000)
+			return nil;
+		}
+		snapshot->position = sizeof(SMSnapshotMagic) + 1;
+		
+		if (![[snapshot readRawString] isEqualToString:[SMObject snapshotSchemaHash]]) {
+			ERR(error, @"The snapshot was written with classes generated from another ontology", 3001)
+			return nil;
+		}
+		
+		NSUInteger count = [snapshot readCount];
+		NSMutableArray *roots = [NSMutableArray arrayWithCapacity:count];
+		for (NSUInteger i = 0; i < count; i++) {
+			id object = [snapshot readObject];
+			if (object) {
+				[roots addObject:object];
+			}
+		}
+		return roots;
+	}
+	@catch (NSException *exception) {
+		if (![SMSnapshotInvalidException isEqualToString:[exception name]]) {
+			@throw;
+		}
+		ERR(error, [exception reason], 3000)
+	}
+	
+	return nil;
+}
+
+/**
+ *  Writes a snapshot of the given objects atomically to the file at the given path.
+ */
++ (BOOL)writeObjects:(NSArray *)objects toFile:(NSString *)path error:(NSError * __autoreleasing *)error
+{
+	return [[self dataWithObjects:objects] writeToFile:path options:NSDataWritingAtomic error:error];
+}
+
+/**
+ *  Restores the objects from the snapshot file at the given path, which is memory mapped if possible.
+ */
++ (NSArray *)objectsWithContentsOfFile:(NSString *)path error:(NSError * __autoreleasing *)error
+{
+	NSData *data = [NSData dataWithContentsOfFile:path options:NSDataReadingMappedIfSafe error:error];
+	return data ? [self objectsWithData:data error:error] : nil;
+}
+
+
+
+#pragma mark - Writing Properties
+/**
+ *  Writes a literal property, nothing if the string is nil.
+ */
+- (void)writeString:(NSString *)string forProperty:(NSUInteger)idx
+{
+	if ([string isKindOfClass:[NSString class]]) {
+		[self writeVarint:idx + 1];
+		[self writeStringValue:string];
+	}
+}
+
+/**
+ *  Writes a literal property with multiple values, nothing if there are none.
+ */
+- (void)writeStrings:(NSArray *)strings forProperty:(NSUInteger)idx
+{
+	if ([strings count] > 0) {
+		[self writeVarint:idx + 1];
+		[self writeByte:SMSnapshotTagStrings];
+		[self writeVarint:[strings count]];
+		for (NSString *string in strings) {
+			[self writeStringValue:string];
+		}
+	}
+}
+
+/**
+ *  Writes a model property, the object is nested unless it has been written before.
+ */
+- (void)writeObject:(SMObject *)object forProperty:(NSUInteger)idx
+{
+	if ([object isKindOfClass:[SMObject class]]) {
+		[self writeVarint:idx + 1];
+		[self writeObjectValue:object];
+	}
+}
+
+/**
+ *  Writes a model property with multiple values, nothing if there are none.
+ */
+- (void)writeObjects:(NSArray *)objects forProperty:(NSUInteger)idx
+{
+	if ([objects count] > 0) {
+		[self writeVarint:idx + 1];
+		[self writeByte:SMSnapshotTagObjects];
+		[self writeVarint:[objects count]];
+		for (SMObject *object in objects) {
+			[self writeObjectValue:object];
+		}
+	}
+}
+
+
+
+#pragma mark - Reading Properties
+/**
+ *  Returns the index of the next property of the object being read, -1 at the end of the object.
+ */
+- (NSInteger)readPropertyIndex
+{
+	NSUInteger value = [self readVarint];
+	return (value > 0) ? (NSInteger)(value - 1) : -1;
+}
+
+- (NSString *)readString
+{
+	uint8_t tag = [self readByte];
+	return (SMSnapshotTagNil == tag) ? nil : [self readStringValueWithTag:tag];
+}
+
+- (NSArray *)readStrings
+{
+	uint8_t tag = [self readByte];
+	if (SMSnapshotTagNil == tag) {
+		return @[];
+	}
+	if (SMSnapshotTagStrings != tag) {
+		[self raiseInvalid:@"Expected a list of strings"];
+	}
+	
+	NSUInteger count = [self readCount];
+	NSMutableArray *arr = [NSMutableArray arrayWithCapacity:count];
+	for (NSUInteger i = 0; i < count; i++) {
+		NSString *string = [self readString];
+		if (string) {
+			[arr addObject:string];
+		}
+	}
+	return [arr copy];
+}
+
+- (id)readObject
+{
+	uint8_t tag = [self readByte];
+	return (SMSnapshotTagNil == tag) ? nil : [self readObjectValueWithTag:tag];
+}
+
+- (NSArray *)readObjects
+{
+	uint8_t tag = [self readByte];
+	if (SMSnapshotTagNil == tag) {
+		return @[];
+	}
+	if (SMSnapshotTagObjects != tag) {
+		[self raiseInvalid:@"Expected a list of objects"];
+	}
+	
+	NSUInteger count = [self readCount];
+	NSMutableArray *arr = [NSMutableArray arrayWithCapacity:count];
+	for (NSUInteger i = 0; i < count; i++) {
+		id object = [self readObject];
+		if (object) {
+			[arr addObject:object];
+		}
+	}
+	return [arr copy];
+}
+
+/**
+ *  Reads and drops the next value; strings and objects in it are still remembered since later values may refer to them.
+ */
+- (void)skipValue
+{
+	uint8_t tag = [self readByte];
+	switch (tag) {
+		case SMSnapshotTagNil:
+			break;
+		case SMSnapshotTagString:
+		case SMSnapshotTagStringReference:
+			[self readStringValueWithTag:tag];
+			break;
+		case SMSnapshotTagObject:
+		case SMSnapshotTagObjectReference:
+			[self readObjectValueWithTag:tag];
+			break;
+		case SMSnapshotTagStrings:
+		case SMSnapshotTagObjects: {
+			NSUInteger count = [self readCount];
+			for (NSUInteger i = 0; i < count; i++) {
+				[self skipValue];
+			}
+			break;
+		}
+		default:
+			[self raiseInvalid:[NSString stringWithFormat:@"Unknown value tag %d", tag]];
+	}
+}
+
+
+
+#pragma mark - Values
+- (void)writeStringValue:(NSString *)string
+{
+	NSNumber *existing = stringIndexes[string];
+	if (existing) {
+		[self writeByte:SMSnapshotTagStringReference];
+		[self writeVarint:[existing unsignedIntegerValue]];
+	}
+	else {
+		stringIndexes[string] = @([stringIndexes count]);
+		[self writeByte:SMSnapshotTagString];
+		[self writeRawString:string];
+	}
+}
+
+- (NSString *)readStringValueWithTag:(uint8_t)tag
+{
+	if (SMSnapshotTagStringReference == tag) {
+		NSUInteger idx = [self readVarint];
+		if (idx >= [strings count]) {
+			[self raiseInvalid:@"Reference to an unknown string"];
+		}
+		return strings[idx];
+	}
+	if (SMSnapshotTagString != tag) {
+		[self raiseInvalid:@"Expected a string"];
+	}
+	
+	NSString *string = [self readRawString];
+	[strings addObject:string];
+	return string;
+}
+
+/**
+ *  Writes the object with its class index, subject and properties, or a reference if it has been written before. Objects whose class has no index, which
+ *  are only instances of classes not generated from the ontology, are written as nil.
+ */
+- (void)writeObjectValue:(SMObject *)object
+{
+	NSNumber *classIndex = object ? [[self class] classIndexes][[object class]] : nil;
+	if (!classIndex) {
+		[self writeByte:SMSnapshotTagNil];
+		return;
+	}
+	
+	NSNumber *existing = [objectIndexes objectForKey:object];
+	if (existing) {
+		[self writeByte:SMSnapshotTagObjectReference];
+		[self writeVarint:[existing unsignedIntegerValue]];
+		return;
+	}
+	[objectIndexes setObject:@([objectIndexes count]) forKey:object];
+	
+	[self writeByte:SMSnapshotTagObject];
+	[self writeVarint:[classIndex unsignedIntegerValue]];
+	if (!object.subject) {
+		[self writeByte:SMSnapshotSubjectNone];			// objects created from RDF+XML
+	}
+	else if ([object.subject isBlank]) {
+		[self writeByte:SMSnapshotSubjectBlank];
+		[self writeStringValue:[object.subject blankID]];
+	}
+	else {
+		[self writeByte:SMSnapshotSubjectURI];
+		[self writeStringValue:[[object.subject URIValue] stringValue]];
+	}
+	[object encodeWithSnapshot:self];
+	[self writeVarint:0];
+}
+
+- (id)readObjectValueWithTag:(uint8_t)tag
+{
+	if (SMSnapshotTagObjectReference == tag) {
+		NSUInteger idx = [self readVarint];
+		if (idx >= [objects count]) {
+			[self raiseInvalid:@"Reference to an unknown object"];
+		}
+		return objects[idx];
+	}
+	if (SMSnapshotTagObject != tag) {
+		[self raiseInvalid:@"Expected an object"];
+	}
+	
+	NSArray *classes = [SMObject snapshotClasses];
+	NSUInteger classIndex = [self readVarint];
+	if (classIndex >= [classes count]) {
+		[self raiseInvalid:@"Unknown class index"];
+	}
+	SMObject *object = nil;
+	uint8_t kind = [self readByte];
+	if (SMSnapshotSubjectNone == kind) {
+		object = [classes[classIndex] newWithRDFXML:nil];
+	}
+	else {
+		NSString *identifier = [self readString];
+		RedlandNode *subject = (SMSnapshotSubjectBlank == kind) ? [RedlandNode nodeWithBlankID:identifier] : [RedlandNode nodeWithURIString:identifier];
+		object = [classes[classIndex] newWithSubject:subject inModel:nil];
+	}
+	if (!object) {
+		[self raiseInvalid:@"Failed to restore an object"];
+	}
+	
+	// remember the object before reading its properties, they may refer back to it
+	[objects addObject:object];
+	[object decodeWithSnapshot:self];
+	return object;
+}
+
+/**
+ *  The index of every generated class in the class table, built once.
+ */
++ (NSDictionary *)classIndexes
+{
+	static NSDictionary *indexes = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		NSMutableDictionary *dict = [NSMutableDictionary dictionary];
+		[[SMObject snapshotClasses] enumerateObjectsUsingBlock:^(id aClass, NSUInteger idx, BOOL *stop) {
+			dict[(id<NSCopying>)aClass] = @(idx);
+		}];
+		indexes = [dict copy];
+	});
+	return indexes;
+}
+
+
+
+#pragma mark - Encoding
+- (void)writeByte:(uint8_t)byte
+{
+	[data appendBytes:&byte length:1];
+}
+
+/**
+ *  Writes an unsigned integer in 7 bit groups, least significant first, the high bit set on all but the last byte.
+ */
+- (void)writeVarint:(NSUInteger)value
+{
+	uint8_t buffer[10];
+	NSUInteger len = 0;
+	do {
+		uint8_t byte = value & 0x7f;
+		value >>= 7;
+		buffer[len++] = byte | (value ? 0x80 : 0);
+	} while (value);
+	[data appendBytes:buffer length:len];
+}
+
+- (void)writeRawString:(NSString *)string
+{
+	NSUInteger len = [string lengthOfBytesUsingEncoding:NSUTF8StringEncoding];
+	[self writeVarint:len];
+	[data appendBytes:[string UTF8String] length:len];
+}
+
+- (uint8_t)readByte
+{
+	if (position >= length) {
+		[self raiseInvalid:@"Unexpected end of the snapshot"];
+	}
+	return bytes[position++];
+}
+
+- (NSUInteger)readVarint
+{
+	NSUInteger value = 0;
+	NSUInteger shift = 0;
+	uint8_t byte = 0;
+	do {
+		if (shift >= sizeof(NSUInteger) * 8) {
+			[self raiseInvalid:@"Number too large"];
+		}
+		byte = [self readByte];
+		value |= (NSUInteger)(byte & 0x7f) << shift;
+		shift += 7;
+	} while (byte & 0x80);
+	return value;
+}
+
+/**
+ *  Reads the number of items of a list, which cannot be more than the bytes left since every item takes at least one.
+ */
+- (NSUInteger)readCount
+{
+	NSUInteger count = [self readVarint];
+	if (count > length - position) {
+		[self raiseInvalid:@"List longer than the snapshot"];
+	}
+	return count;
+}
+
+- (NSString *)readRawString
+{
+	NSUInteger len = [self readVarint];
+	if (len > length - position) {
+		[self raiseInvalid:@"String longer than the snapshot"];
+	}
+	NSString *string = [[NSString alloc] initWithBytes:(bytes + position) length:len encoding:NSUTF8StringEncoding];
+	if (!string) {
+		[self raiseInvalid:@"Invalid UTF-8 string"];
+	}
+	position += len;
+	return string;
+}
+
+- (void)raiseInvalid:(NSString *)reason
+{
+	[NSException raise:SMSnapshotInvalidException format:@"Invalid snapshot at byte %lu: %@", (unsigned long)position, reason];
+}
+
+
+@end
@@ -0,0 +1,56 @@
+/*
+ SMStreamDecoder.h
+ SMARTFramework
+ 
+ Copyright (c) 2026 CHIP, Boston Children's Hospital. All rights reserved.
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import <Foundation/Foundation.h>
+#import "SMART.h"
+
+
+/**
+ *  Decodes SMART objects straight from an RDF+XML or JSON-LD response without building a Redland model.
+ *
+ *  The document is read in one pass into the values of every node, keyed by predicate URI, then the generated classes take the values of their properties
+ *  from there. Documents using RDF+XML features the decoder does not understand are rejected so the caller can parse them into a model instead. Decoded
+ *  objects have all their properties filled but are not backed by a model, like objects restored from a snapshot.
+ *
+ *  Reading a document into a decoder uses no Redland and can happen on a background thread; the statements of a decoder can then be merged into a model
+ *  on the main thread, which keeps reading the document off the main thread.
+ */
+@interface SMStreamDecoder : NSObject
+
+/// @name Decoding
++ (NSArray *)objectsOfClass:(Class)aClass fromData:(NSData *)data contentType:(NSString *)contentType;
++ (NSArray *)objectsOfClass:(Class)aClass fromRDF:(NSData *)rdf;
++ (NSArray *)objectsOfClass:(Class)aClass fromJSON:(NSData *)json;
+
+/// @name Reading and Merging into a Model
++ (id)decoderWithData:(NSData *)data contentType:(NSString *)contentType;
++ (id)decoderWithRDF:(NSData *)rdf;
++ (id)decoderWithJSON:(NSData *)json;
+- (NSArray *)statements;
+
+/// @name Reading Values (used by the generated classes)
+- (NSString *)stringFrom:(NSArray *)values;
+- (NSArray *)stringsFrom:(NSArray *)values;
+- (id)objectOfClass:(Class)itemClass from:(NSArray *)values;
+- (NSArray *)objectsOfClass:(Class)itemClass from:(NSArray *)values;
+
+
+@end
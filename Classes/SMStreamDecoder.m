@@ -0,0 +1,722 @@
+/*
+ SMStreamDecoder.m
+ SMARTFramework
+ 
+ Copyright (c) 2026 CHIP, Boston Children's Hospital. All rights reserved.
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import "SMStreamDecoder.h"
+#import "SMObject.h"
+#import "SMObject+Registry.h"
+#import <Redland-ObjC.h>
+
+static NSString *const SMStreamDecoderRDFNamespace = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#";
+static NSString *const SMStreamDecoderXMLNamespace = @"http://www.w3.org/XML/1998/namespace";
+static NSString *const SMStreamDecoderTypePredicate = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#type";
+static NSString *const SMStreamDecoderRDFElement = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#RDF";
+static NSString *const SMStreamDecoderDescriptionElement = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#Description";
+static NSString *const SMStreamDecoderListElement = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#li";
+static NSString *const SMStreamDecoderAboutAttribute = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#about";
+static NSString *const SMStreamDecoderNodeIDAttribute = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#nodeID";
+static NSString *const SMStreamDecoderResourceAttribute = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#resource";
+static NSString *const SMStreamDecoderParseTypeAttribute = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#parseType";
+static NSString *const SMStreamDecoderDatatypeAttribute = @"http://www.w3.org/1999/02/22-rdf-syntax-ns#datatype";
+
+
+/**
+ *  A value referring to a node, by the node's key in the decoder's node table.
+ */
+@interface SMStreamDecoderReference : NSObject
+
+@property (nonatomic, copy) NSString *key;
+
+@end
+
+@implementation SMStreamDecoderReference
+
+@end
+
+
+@interface SMStreamDecoder () <NSXMLParserDelegate> {
+	NSMutableDictionary *nodes;				///< { node key: { predicate URI: [NSString or SMStreamDecoderReference] } }
+	NSMutableArray *nodeKeys;				///< The node keys in order of appearance
+	NSMutableArray *triples;				///< [node key, predicate URI, value, datatype URI or NSNull, language or NSNull] for every value in document order
+	NSMutableDictionary *subjects;			///< { node key: RedlandNode } of the subjects created so far
+	NSMutableDictionary *modelNodes;		///< { node key: RedlandNode } of the nodes created for statements so far
+	NSMutableDictionary *instances;			///< { node key: [SMObject] } of the objects decoded so far
+	NSUInteger anonymousNodes;
+	
+	NSMutableDictionary *prefixes;			///< { prefix: [namespace URI] } while reading RDF+XML, the innermost mapping last
+	NSMutableArray *elements;				///< For every open element: NSNull for rdf:RDF, the key of a node element or a dictionary for a property element
+	NSMutableArray *languages;				///< For every open element the xml:lang in scope, NSNull if there is none
+	NSMutableString *text;					///< The characters read since the last property element started
+	BOOL unsupported;
+}
+
+@end
+
+
+@implementation SMStreamDecoder
+
+
+- (id)init
+{
+	if ((self = [super init])) {
+		nodes = [NSMutableDictionary dictionary];
+		nodeKeys = [NSMutableArray array];
+		triples = [NSMutableArray array];
+		subjects = [NSMutableDictionary dictionary];
+		modelNodes = [NSMutableDictionary dictionary];
+		instances = [NSMutableDictionary dictionary];
+		prefixes = [NSMutableDictionary dictionary];
+		elements = [NSMutableArray array];
+		languages = [NSMutableArray array];
+		text = [NSMutableString string];
+	}
+	return self;
+}
+
+
+
+#pragma mark - Decoding
+/**
+ *  Decodes the objects of the given class from a response with the given Content-Type.
+ *  @return The objects, nil if the content type or the shape of the document is not supported and the response should be parsed into a model instead
+ */
++ (NSArray *)objectsOfClass:(Class)aClass fromData:(NSData *)data contentType:(NSString *)contentType
+{
+	if (![aClass isSubclassOfClass:[SMObject class]] || ![aClass rdfType]) {
+		return nil;
+	}
+	return [[self decoderWithData:data contentType:contentType] decodedObjectsOfClass:aClass];
+}
+
+/**
+ *  Decodes the objects of the given class from RDF+XML, see decoderWithRDF: for the documents that are understood.
+ *
+ *  Like parsing RDF this creates Redland nodes, so it must not run alongside other Redland work on another thread.
+ */
++ (NSArray *)objectsOfClass:(Class)aClass fromRDF:(NSData *)rdf
+{
+	if (![aClass isSubclassOfClass:[SMObject class]] || ![aClass rdfType]) {
+		return nil;
+	}
+	return [[self decoderWithRDF:rdf] decodedObjectsOfClass:aClass];
+}
+
+/**
+ *  Decodes the objects of the given class from JSON-LD, see decoderWithJSON: for the documents that are understood.
+ */
++ (NSArray *)objectsOfClass:(Class)aClass fromJSON:(NSData *)json
+{
+	if (![aClass isSubclassOfClass:[SMObject class]] || ![aClass rdfType]) {
+		return nil;
+	}
+	return [[self decoderWithJSON:json] decodedObjectsOfClass:aClass];
+}
+
+/**
+ *  Reads a response with the given Content-Type into a new decoder.
+ *
+ *  Reading uses no Redland, so unlike decoding objects or statements from the returned decoder it can run on any thread.
+ *  @return The decoder, nil if the content type or the shape of the document is not supported and the response should be parsed into a model instead
+ */
++ (id)decoderWithData:(NSData *)data contentType:(NSString *)contentType
+{
+	if ([contentType hasPrefix:@"application/rdf+xml"]) {
+		return [self decoderWithRDF:data];
+	}
+	if ([contentType hasPrefix:@"application/ld+json"] || [contentType hasPrefix:@"application/json"]) {
+		return [self decoderWithJSON:data];
+	}
+	return nil;
+}
+
+/**
+ *  Reads RDF+XML into a new decoder.
+ *
+ *  The striped syntax with rdf:about, rdf:nodeID, rdf:resource, rdf:datatype, rdf:parseType="Resource", xml:lang and property attributes is understood,
+ *  documents using rdf:ID, rdf:li, other parse types or relative URIs return nil.
+ */
++ (id)decoderWithRDF:(NSData *)rdf
+{
+	if ([rdf length] < 1) {
+		return nil;
+	}
+	
+	SMStreamDecoder *decoder = [self new];
+	NSXMLParser *parser = [[NSXMLParser alloc] initWithData:rdf];
+	parser.delegate = decoder;
+	parser.shouldProcessNamespaces = YES;
+	parser.shouldReportNamespacePrefixes = YES;
+	if (![parser parse] || decoder->unsupported) {
+		return nil;
+	}
+	return decoder;
+}
+
+/**
+ *  Reads flat or expanded JSON-LD, an array of node objects or an object with "@graph", into a new decoder.
+ *
+ *  Properties must be keyed by their full predicate URI, documents with a "@context" or using "@list" return nil.
+ */
++ (id)decoderWithJSON:(NSData *)json
+{
+	if ([json length] < 1) {
+		return nil;
+	}
+	
+	id document = [NSJSONSerialization JSONObjectWithData:json options:0 error:nil];
+	if ([document isKindOfClass:[NSDictionary class]]) {
+		if (document[@"@context"]) {
+			return nil;
+		}
+		document = document[@"@graph"] ? document[@"@graph"] : @[document];
+	}
+	if (![document isKindOfClass:[NSArray class]]) {
+		return nil;
+	}
+	
+	SMStreamDecoder *decoder = [self new];
+	for (id node in document) {
+		if (![decoder readJSONNode:node]) {
+			return nil;
+		}
+	}
+	return decoder;
+}
+
+/**
+ *  Returns an instance of the given class for every node of its rdf:type, in document order.
+ */
+- (NSArray *)decodedObjectsOfClass:(Class)aClass
+{
+	NSString *rdfType = [aClass rdfType];
+	NSMutableArray *array = [NSMutableArray array];
+	for (NSString *key in nodeKeys) {
+		for (id type in nodes[key][SMStreamDecoderTypePredicate]) {
+			if ([type isKindOfClass:[SMStreamDecoderReference class]] && [rdfType isEqualToString:[(SMStreamDecoderReference *)type key]]) {
+				id item = [self objectOfClass:aClass forKey:key];
+				if (item) {
+					[array addObject:item];
+				}
+				break;
+			}
+		}
+	}
+	return array;
+}
+
+
+
+#pragma mark - Reading Values
+/**
+ *  Returns the first literal of the values of a property.
+ */
+- (NSString *)stringFrom:(NSArray *)values
+{
+	for (id value in values) {
+		if ([value isKindOfClass:[NSString class]]) {
+			return value;
+		}
+	}
+	return nil;
+}
+
+- (NSArray *)stringsFrom:(NSArray *)values
+{
+	NSMutableArray *arr = [NSMutableArray arrayWithCapacity:[values count]];
+	for (id value in values) {
+		if ([value isKindOfClass:[NSString class]]) {
+			[arr addObject:value];
+		}
+	}
+	return [arr copy];
+}
+
+/**
+ *  Returns the object for the first node the values of a property refer to.
+ */
+- (id)objectOfClass:(Class)itemClass from:(NSArray *)values
+{
+	for (id value in values) {
+		if ([value isKindOfClass:[SMStreamDecoderReference class]]) {
+			return [self objectOfClass:itemClass forKey:[(SMStreamDecoderReference *)value key]];
+		}
+	}
+	return nil;
+}
+
+- (NSArray *)objectsOfClass:(Class)itemClass from:(NSArray *)values
+{
+	NSMutableArray *arr = [NSMutableArray arrayWithCapacity:[values count]];
+	for (id value in values) {
+		if ([value isKindOfClass:[SMStreamDecoderReference class]]) {
+			id newItem = [self objectOfClass:itemClass forKey:[(SMStreamDecoderReference *)value key]];
+			if (newItem) {
+				[arr addObject:newItem];
+			}
+		}
+	}
+	return [arr copy];
+}
+
+
+
+#pragma mark - Objects
+/**
+ *  Returns the object of the given class for a node, decoding it if there is none yet.
+ *
+ *  Like the objects of a model, a node gets the class of its rdf:type if that is a subclass of the requested class. New objects are remembered before
+ *  their properties are filled so that nodes referring to each other end up with the same instances.
+ */
+- (id)objectOfClass:(Class)itemClass forKey:(NSString *)key
+{
+	NSMutableArray *existing = instances[key];
+	for (SMObject *object in existing) {
+		if ([object isKindOfClass:itemClass]) {
+			return object;
+		}
+	}
+	
+	Class useClass = itemClass;
+	for (id type in nodes[key][SMStreamDecoderTypePredicate]) {
+		Class typeClass = [type isKindOfClass:[SMStreamDecoderReference class]] ? [SMObject classForRDFType:[(SMStreamDecoderReference *)type key]] : nil;
+		if (typeClass) {
+			if ([typeClass isSubclassOfClass:itemClass]) {
+				useClass = typeClass;
+			}
+			break;
+		}
+	}
+	
+	SMObject *object = [useClass newWithSubject:[self subjectForKey:key] inModel:nil];
+	if (!object) {
+		return nil;
+	}
+	if (!existing) {
+		existing = [NSMutableArray arrayWithCapacity:1];
+		instances[key] = existing;
+	}
+	[existing addObject:object];
+	[object takeDecodedValues:nodes[key] decoder:self];
+	
+	return object;
+}
+
+/**
+ *  Returns a statement for every value of the document, in document order, to merge the document into a model.
+ *
+ *  Blank nodes get new IDs, so node IDs that documents merged into one model happen to share do not join their nodes. Like decoding objects this creates
+ *  Redland nodes and must not run alongside other Redland work on another thread.
+ */
+- (NSArray *)statements
+{
+	NSMutableArray *statements = [NSMutableArray arrayWithCapacity:[triples count]];
+	for (NSArray *triple in triples) {
+		RedlandNode *object = nil;
+		id value = triple[2];
+		if ([value isKindOfClass:[SMStreamDecoderReference class]]) {
+			object = [self modelNodeForKey:[(SMStreamDecoderReference *)value key]];
+		}
+		else {
+			RedlandURI *datatype = [triple[3] isKindOfClass:[NSString class]] ? [RedlandURI URIWithString:triple[3]] : nil;
+			NSString *language = (!datatype && [triple[4] isKindOfClass:[NSString class]]) ? triple[4] : nil;
+			object = [RedlandNode nodeWithLiteral:value language:language type:datatype];
+		}
+		RedlandNode *predicate = [RedlandNode nodeWithURIString:triple[1]];
+		[statements addObject:[RedlandStatement statementWithSubject:[self modelNodeForKey:triple[0]] predicate:predicate object:object]];
+	}
+	return statements;
+}
+
+- (RedlandNode *)modelNodeForKey:(NSString *)key
+{
+	RedlandNode *node = modelNodes[key];
+	if (!node) {
+		node = [key hasPrefix:@"_:"] ? [RedlandNode nodeWithBlankID:nil] : [RedlandNode nodeWithURIString:key];
+		modelNodes[key] = node;
+	}
+	return node;
+}
+
+- (RedlandNode *)subjectForKey:(NSString *)key
+{
+	RedlandNode *subject = subjects[key];
+	if (!subject) {
+		if ([key hasPrefix:@"_:#"]) {
+			subject = [RedlandNode nodeWithBlankID:nil];
+		}
+		else if ([key hasPrefix:@"_:"]) {
+			subject = [RedlandNode nodeWithBlankID:[key substringFromIndex:2]];
+		}
+		else {
+			subject = [RedlandNode nodeWithURIString:key];
+		}
+		subjects[key] = subject;
+	}
+	return subject;
+}
+
+
+
+#pragma mark - Node Table
+/**
+ *  Returns the values of the node with the given key, adding the node if it is new.
+ */
+- (NSMutableDictionary *)valuesOfNode:(NSString *)key
+{
+	NSMutableDictionary *values = nodes[key];
+	if (!values) {
+		values = [NSMutableDictionary dictionary];
+		nodes[key] = values;
+		[nodeKeys addObject:key];
+	}
+	return values;
+}
+
+- (void)addValue:(id)value forPredicate:(NSString *)predicate toNode:(NSString *)key
+{
+	[self addValue:value forPredicate:predicate toNode:key datatype:nil language:nil];
+}
+
+/**
+ *  Adds a value to a node; literals may have a datatype or a language, which only the statements keep.
+ */
+- (void)addValue:(id)value forPredicate:(NSString *)predicate toNode:(NSString *)key datatype:(NSString *)datatype language:(NSString *)language
+{
+	[triples addObject:@[key, predicate, value, (datatype ? datatype : [NSNull null]), (language ? language : [NSNull null])]];
+	
+	NSMutableDictionary *values = [self valuesOfNode:key];
+	NSMutableArray *existing = values[predicate];
+	if (existing) {
+		[existing addObject:value];
+	}
+	else {
+		values[predicate] = [NSMutableArray arrayWithObject:value];
+	}
+}
+
+- (SMStreamDecoderReference *)referenceTo:(NSString *)key
+{
+	SMStreamDecoderReference *reference = [SMStreamDecoderReference new];
+	reference.key = key;
+	return reference;
+}
+
+/**
+ *  A key for a node without URI or node ID, "#" cannot appear in node IDs so these never clash with those.
+ */
+- (NSString *)anonymousKey
+{
+	return [NSString stringWithFormat:@"_:#%lu", (unsigned long)++anonymousNodes];
+}
+
+/**
+ *  Node keys are absolute URIs or "_:" followed by a node ID; relative URIs would need to be resolved against a base, which we leave to the RDF parser.
+ */
+- (BOOL)isNodeKey:(id)key
+{
+	return [key isKindOfClass:[NSString class]] && NSNotFound != [key rangeOfString:@":"].location;
+}
+
+
+
+#pragma mark - JSON-LD
+/**
+ *  Adds the JSON-LD node object and the node objects nested in it to the node table.
+ *  @return The key of the node, nil if it is not a node object the decoder understands
+ */
+- (NSString *)readJSONNode:(id)node
+{
+	if (![node isKindOfClass:[NSDictionary class]]) {
+		return nil;
+	}
+	
+	id identifier = node[@"@id"];
+	if (identifier && ![self isNodeKey:identifier]) {
+		return nil;
+	}
+	NSString *key = identifier ? identifier : [self anonymousKey];
+	[self valuesOfNode:key];
+	
+	for (NSString *predicate in node) {
+		if ([@"@id" isEqualToString:predicate]) {
+			continue;
+		}
+		
+		id value = node[predicate];
+		NSArray *values = [value isKindOfClass:[NSArray class]] ? value : @[value];
+		if ([@"@type" isEqualToString:predicate]) {
+			for (id type in values) {
+				if (![self isNodeKey:type]) {
+					return nil;
+				}
+				[self addValue:[self referenceTo:type] forPredicate:SMStreamDecoderTypePredicate toNode:key];
+			}
+		}
+		else if ([predicate hasPrefix:@"@"] || ![self isNodeKey:predicate]) {
+			return nil;
+		}
+		else {
+			for (id item in values) {
+				id decoded = [self JSONValue:item];
+				if (!decoded) {
+					return nil;
+				}
+				BOOL literal = [item isKindOfClass:[NSDictionary class]] && item[@"@value"];
+				NSString *datatype = (literal && [item[@"@type"] isKindOfClass:[NSString class]]) ? item[@"@type"] : nil;
+				NSString *language = (literal && [item[@"@language"] isKindOfClass:[NSString class]]) ? item[@"@language"] : nil;
+				[self addValue:decoded forPredicate:predicate toNode:key datatype:datatype language:language];
+			}
+		}
+	}
+	return key;
+}
+
+/**
+ *  Returns the literal or the reference to the node for a JSON-LD value, nil if it is not a value the decoder understands.
+ */
+- (id)JSONValue:(id)value
+{
+	if ([value isKindOfClass:[NSString class]]) {
+		return value;
+	}
+	if ([value isKindOfClass:[NSNumber class]]) {
+		if ((__bridge CFBooleanRef)value == kCFBooleanTrue || (__bridge CFBooleanRef)value == kCFBooleanFalse) {
+			return [value boolValue] ? @"true" : @"false";
+		}
+		return [value stringValue];
+	}
+	if ([value isKindOfClass:[NSDictionary class]]) {
+		id literal = value[@"@value"];
+		if (literal) {
+			return [literal isKindOfClass:[NSDictionary class]] ? nil : [self JSONValue:literal];
+		}
+		if (1 == [value count] && [self isNodeKey:value[@"@id"]]) {
+			return [self referenceTo:value[@"@id"]];
+		}
+		if (value[@"@list"] || value[@"@set"]) {
+			return nil;
+		}
+		NSString *key = [self readJSONNode:value];
+		return key ? [self referenceTo:key] : nil;
+	}
+	return nil;
+}
+
+
+
+#pragma mark - RDF+XML
+- (void)parser:(NSXMLParser *)parser didStartMappingPrefix:(NSString *)prefix toURI:(NSString *)namespaceURI
+{
+	NSMutableArray *mappings = prefixes[prefix];
+	if (!mappings) {
+		mappings = [NSMutableArray arrayWithCapacity:1];
+		prefixes[prefix] = mappings;
+	}
+	[mappings addObject:namespaceURI];
+}
+
+- (void)parser:(NSXMLParser *)parser didEndMappingPrefix:(NSString *)prefix
+{
+	[prefixes[prefix] removeLastObject];
+}
+
+/**
+ *  Returns the URI of a prefixed attribute name, nil for unprefixed names and namespace declarations.
+ */
+- (NSString *)URIOfAttribute:(NSString *)qualifiedName
+{
+	NSRange colon = [qualifiedName rangeOfString:@":"];
+	if (NSNotFound == colon.location) {
+		return nil;
+	}
+	NSString *prefix = [qualifiedName substringToIndex:colon.location];
+	NSString *namespaceURI = [@"xml" isEqualToString:prefix] ? SMStreamDecoderXMLNamespace : [prefixes[prefix] lastObject];
+	return namespaceURI ? [namespaceURI stringByAppendingString:[qualifiedName substringFromIndex:colon.location + 1]] : nil;
+}
+
+- (void)parser:(NSXMLParser *)parser didStartElement:(NSString *)elementName namespaceURI:(NSString *)namespaceURI qualifiedName:(NSString *)qName attributes:(NSDictionary *)attributeDict
+{
+	NSString *uri = [(namespaceURI ? namespaceURI : @"") stringByAppendingString:elementName];
+	id parent = [elements lastObject];
+	
+	// xml:lang applies to the element and everything in it, an empty one removes the language
+	NSString *language = attributeDict[@"xml:lang"];
+	if (language) {
+		[languages addObject:([language length] > 0 ? language : [NSNull null])];
+	}
+	else {
+		[languages addObject:([languages lastObject] ? [languages lastObject] : [NSNull null])];
+	}
+	
+	// the element is a property of the enclosing node element, or of the node a property element with rdf:parseType="Resource" describes
+	NSString *subject = nil;
+	if ([parent isKindOfClass:[NSString class]]) {
+		subject = parent;
+	}
+	else if ([parent isKindOfClass:[NSDictionary class]] && [parent[@"resource"] boolValue]) {
+		subject = parent[@"object"];
+	}
+	
+	if (subject) {
+		[self startPropertyElement:uri ofNode:subject attributes:attributeDict];
+	}
+	else if (!parent && [SMStreamDecoderRDFElement isEqualToString:uri]) {
+		[elements addObject:[NSNull null]];
+	}
+	else {
+		[self startNodeElement:uri inProperty:([parent isKindOfClass:[NSDictionary class]] ? parent : nil) attributes:attributeDict];
+	}
+	
+	if (unsupported) {
+		[parser abortParsing];
+	}
+}
+
+- (void)startNodeElement:(NSString *)uri inProperty:(NSMutableDictionary *)property attributes:(NSDictionary *)attributeDict
+{
+	NSString *key = nil;
+	NSMutableDictionary *literals = [NSMutableDictionary dictionary];
+	NSMutableArray *types = [NSMutableArray array];
+	if (![uri isEqualToString:SMStreamDecoderDescriptionElement]) {
+		[types addObject:uri];
+	}
+	
+	for (NSString *name in attributeDict) {
+		NSString *attribute = [self URIOfAttribute:name];
+		NSString *value = attributeDict[name];
+		if ([attribute hasPrefix:SMStreamDecoderXMLNamespace] || [name hasPrefix:@"xmlns"]) {
+			continue;
+		}
+		if ([attribute isEqualToString:SMStreamDecoderAboutAttribute] && [self isNodeKey:value]) {
+			key = value;
+		}
+		else if ([attribute isEqualToString:SMStreamDecoderNodeIDAttribute]) {
+			key = [@"_:" stringByAppendingString:value];
+		}
+		else if ([attribute isEqualToString:SMStreamDecoderTypePredicate] && [self isNodeKey:value]) {
+			[types addObject:value];
+		}
+		else if (attribute && ![attribute hasPrefix:SMStreamDecoderRDFNamespace]) {
+			literals[attribute] = value;
+		}
+		else {
+			unsupported = YES;				// rdf:ID, relative URIs and unprefixed attributes
+			return;
+		}
+	}
+	
+	// a node element nested in a property element is the property's value
+	if (!key) {
+		key = [self anonymousKey];
+	}
+	if (property) {
+		if (property[@"object"] || [[text stringByTrimmingCharactersInSet:[NSCharacterSet whitespaceAndNewlineCharacterSet]] length] > 0) {
+			unsupported = YES;
+			return;
+		}
+		property[@"object"] = key;
+		[self addValue:[self referenceTo:key] forPredicate:property[@"predicate"] toNode:property[@"subject"]];
+	}
+	
+	[self valuesOfNode:key];
+	for (NSString *type in types) {
+		[self addValue:[self referenceTo:type] forPredicate:SMStreamDecoderTypePredicate toNode:key];
+	}
+	NSString *language = [[languages lastObject] isKindOfClass:[NSString class]] ? [languages lastObject] : nil;
+	for (NSString *predicate in literals) {
+		[self addValue:literals[predicate] forPredicate:predicate toNode:key datatype:nil language:language];
+	}
+	[elements addObject:key];
+}
+
+- (void)startPropertyElement:(NSString *)uri ofNode:(NSString *)subject attributes:(NSDictionary *)attributeDict
+{
+	if ([uri isEqualToString:SMStreamDecoderListElement]) {
+		unsupported = YES;
+		return;
+	}
+	
+	NSMutableDictionary *property = [NSMutableDictionary dictionaryWithObjectsAndKeys:subject, @"subject", uri, @"predicate", nil];
+	for (NSString *name in attributeDict) {
+		NSString *attribute = [self URIOfAttribute:name];
+		NSString *value = attributeDict[name];
+		if ([attribute hasPrefix:SMStreamDecoderXMLNamespace] || [name hasPrefix:@"xmlns"]) {
+			continue;
+		}
+		if ([attribute isEqualToString:SMStreamDecoderResourceAttribute] && [self isNodeKey:value]) {
+			property[@"object"] = value;
+		}
+		else if ([attribute isEqualToString:SMStreamDecoderNodeIDAttribute]) {
+			property[@"object"] = [@"_:" stringByAppendingString:value];
+		}
+		else if ([attribute isEqualToString:SMStreamDecoderParseTypeAttribute] && [@"Resource" isEqualToString:value]) {
+			property[@"object"] = [self anonymousKey];
+			property[@"resource"] = @YES;
+			[self valuesOfNode:property[@"object"]];
+		}
+		else if ([attribute isEqualToString:SMStreamDecoderDatatypeAttribute] && [self isNodeKey:value]) {
+			property[@"datatype"] = value;
+		}
+		else {
+			unsupported = YES;				// rdf:ID, other parse types, relative URIs and property attributes
+			return;
+		}
+	}
+	
+	if (property[@"object"]) {
+		[self addValue:[self referenceTo:property[@"object"]] forPredicate:uri toNode:subject];
+	}
+	[text setString:@""];
+	[elements addObject:property];
+}
+
+- (void)parser:(NSXMLParser *)parser didEndElement:(NSString *)elementName namespaceURI:(NSString *)namespaceURI qualifiedName:(NSString *)qName
+{
+	id element = [elements lastObject];
+	[elements removeLastObject];
+	NSString *language = [[languages lastObject] isKindOfClass:[NSString class]] ? [languages lastObject] : nil;
+	[languages removeLastObject];
+	
+	// a property element without a node is a literal
+	if ([element isKindOfClass:[NSDictionary class]] && !element[@"object"]) {
+		[self addValue:[text copy] forPredicate:element[@"predicate"] toNode:element[@"subject"] datatype:element[@"datatype"] language:language];
+	}
+}
+
+- (void)parser:(NSXMLParser *)parser foundCharacters:(NSString *)string
+{
+	[text appendString:string];
+}
+
+- (void)parser:(NSXMLParser *)parser foundCDATA:(NSData *)CDATABlock
+{
+	NSString *string = [[NSString alloc] initWithData:CDATABlock encoding:NSUTF8StringEncoding];
+	if (string) {
+		[text appendString:string];
+	}
+}
+
+- (void)parser:(NSXMLParser *)parser parseErrorOccurred:(NSError *)parseError
+{
+	unsupported = YES;
+}
+
+
+@end
@@ -2,8 +2,8 @@
  SMAddress.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMAddress.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMAddress, indexed like its sorted properties
+static RedlandNode *SMAddressPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMAddressPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMAddressLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMAddressPredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#country-name"];
+		SMAddressPredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#extended-address"];
+		SMAddressPredicates[2] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#locality"];
+		SMAddressPredicates[3] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#postal-code"];
+		SMAddressPredicates[4] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#region"];
+		SMAddressPredicates[5] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#street-address"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMAddressPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMAddressPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMAddressPredicate(NSUInteger idx)
+{
+	SMAddressLoadPredicates();
+	return SMAddressPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMAddressPredicateIndex(RedlandNode *predicate)
+{
+	SMAddressLoadPredicates();
+	NSNumber *idx = SMAddressPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMAddress
 
 
@@ -34,186 +84,251 @@
 
 - (NSString *)countryName
 {
-	if (!_countryName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#country-name"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_countryName = [rslt.object literalValue];
-	}
-	return _countryName;
+	return [self literalForPredicate:SMAddressPredicate(0) cache:(id __strong *)&_countryName];
 }
 
 - (void)setCountryName:(NSString *)countryName
 {
-	if (countryName != _countryName) {
-		RedlandNode *predicate = (countryName || _countryName) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#country-name"] : nil;
-		if (_countryName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_countryName = [countryName copy];
-		
-		if (_countryName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_countryName nodeValue]]];
-		}
-	}
+	[self setLiteral:countryName forPredicate:SMAddressPredicate(0) cache:(id __strong *)&_countryName];
 }
 
 @synthesize extendedAddress = _extendedAddress;
 
 - (NSString *)extendedAddress
 {
-	if (!_extendedAddress) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#extended-address"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_extendedAddress = [rslt.object literalValue];
-	}
-	return _extendedAddress;
+	return [self literalForPredicate:SMAddressPredicate(1) cache:(id __strong *)&_extendedAddress];
 }
 
 - (void)setExtendedAddress:(NSString *)extendedAddress
 {
-	if (extendedAddress != _extendedAddress) {
-		RedlandNode *predicate = (extendedAddress || _extendedAddress) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#extended-address"] : nil;
-		if (_extendedAddress) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_extendedAddress = [extendedAddress copy];
-		
-		if (_extendedAddress) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_extendedAddress nodeValue]]];
-		}
-	}
+	[self setLiteral:extendedAddress forPredicate:SMAddressPredicate(1) cache:(id __strong *)&_extendedAddress];
 }
 
 @synthesize locality = _locality;
 
 - (NSString *)locality
 {
-	if (!_locality) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#locality"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_locality = [rslt.object literalValue];
-	}
-	return _locality;
+	return [self literalForPredicate:SMAddressPredicate(2) cache:(id __strong *)&_locality];
 }
 
 - (void)setLocality:(NSString *)locality
 {
-	if (locality != _locality) {
-		RedlandNode *predicate = (locality || _locality) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#locality"] : nil;
-		if (_locality) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_locality = [locality copy];
-		
-		if (_locality) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_locality nodeValue]]];
-		}
-	}
+	[self setLiteral:locality forPredicate:SMAddressPredicate(2) cache:(id __strong *)&_locality];
 }
 
 @synthesize postalCode = _postalCode;
 
 - (NSString *)postalCode
 {
-	if (!_postalCode) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#postal-code"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_postalCode = [rslt.object literalValue];
-	}
-	return _postalCode;
+	return [self literalForPredicate:SMAddressPredicate(3) cache:(id __strong *)&_postalCode];
 }
 
 - (void)setPostalCode:(NSString *)postalCode
 {
-	if (postalCode != _postalCode) {
-		RedlandNode *predicate = (postalCode || _postalCode) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#postal-code"] : nil;
-		if (_postalCode) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_postalCode = [postalCode copy];
-		
-		if (_postalCode) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_postalCode nodeValue]]];
-		}
-	}
+	[self setLiteral:postalCode forPredicate:SMAddressPredicate(3) cache:(id __strong *)&_postalCode];
 }
 
 @synthesize region = _region;
 
 - (NSString *)region
 {
-	if (!_region) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#region"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_region = [rslt.object literalValue];
-	}
-	return _region;
+	return [self literalForPredicate:SMAddressPredicate(4) cache:(id __strong *)&_region];
 }
 
 - (void)setRegion:(NSString *)region
 {
-	if (region != _region) {
-		RedlandNode *predicate = (region || _region) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#region"] : nil;
-		if (_region) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_region = [region copy];
-		
-		if (_region) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_region nodeValue]]];
-		}
-	}
+	[self setLiteral:region forPredicate:SMAddressPredicate(4) cache:(id __strong *)&_region];
 }
 
 @synthesize streetAddress = _streetAddress;
 
 - (NSString *)streetAddress
 {
-	if (!_streetAddress) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#street-address"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_streetAddress = [rslt.object literalValue];
-	}
-	return _streetAddress;
+	return [self literalForPredicate:SMAddressPredicate(5) cache:(id __strong *)&_streetAddress];
 }
 
 - (void)setStreetAddress:(NSString *)streetAddress
 {
-	if (streetAddress != _streetAddress) {
-		RedlandNode *predicate = (streetAddress || _streetAddress) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#street-address"] : nil;
-		if (_streetAddress) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:streetAddress forPredicate:SMAddressPredicate(5) cache:(id __strong *)&_streetAddress];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *countryName = nil;
+	NSString *extendedAddress = nil;
+	NSString *locality = nil;
+	NSString *postalCode = nil;
+	NSString *region = nil;
+	NSString *streetAddress = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMAddressPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!countryName) {
+					countryName = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!extendedAddress) {
+					extendedAddress = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!locality) {
+					locality = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!postalCode) {
+					postalCode = [rslt.object literalValue];
+				}
+				break;
+			case 4:
+				if (!region) {
+					region = [rslt.object literalValue];
+				}
+				break;
+			case 5:
+				if (!streetAddress) {
+					streetAddress = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_streetAddress = [streetAddress copy];
-		
-		if (_streetAddress) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_streetAddress nodeValue]]];
+	}
+	
+	if (!_countryName) {
+		_countryName = countryName ? countryName : (id)[NSNull null];
+	}
+	if (!_extendedAddress) {
+		_extendedAddress = extendedAddress ? extendedAddress : (id)[NSNull null];
+	}
+	if (!_locality) {
+		_locality = locality ? locality : (id)[NSNull null];
+	}
+	if (!_postalCode) {
+		_postalCode = postalCode ? postalCode : (id)[NSNull null];
+	}
+	if (!_region) {
+		_region = region ? region : (id)[NSNull null];
+	}
+	if (!_streetAddress) {
+		_streetAddress = streetAddress ? streetAddress : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeString:self.countryName forProperty:0];
+	[snapshot writeString:self.extendedAddress forProperty:1];
+	[snapshot writeString:self.locality forProperty:2];
+	[snapshot writeString:self.postalCode forProperty:3];
+	[snapshot writeString:self.region forProperty:4];
+	[snapshot writeString:self.streetAddress forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_countryName = [snapshot readString];
+				break;
+			case 1:
+				_extendedAddress = [snapshot readString];
+				break;
+			case 2:
+				_locality = [snapshot readString];
+				break;
+			case 3:
+				_postalCode = [snapshot readString];
+				break;
+			case 4:
+				_region = [snapshot readString];
+				break;
+			case 5:
+				_streetAddress = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_countryName) {
+		_countryName = (id)[NSNull null];
+	}
+	if (!_extendedAddress) {
+		_extendedAddress = (id)[NSNull null];
+	}
+	if (!_locality) {
+		_locality = (id)[NSNull null];
+	}
+	if (!_postalCode) {
+		_postalCode = (id)[NSNull null];
+	}
+	if (!_region) {
+		_region = (id)[NSNull null];
+	}
+	if (!_streetAddress) {
+		_streetAddress = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_countryName = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#country-name"]];
+	_extendedAddress = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#extended-address"]];
+	_locality = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#locality"]];
+	_postalCode = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#postal-code"]];
+	_region = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#region"]];
+	_streetAddress = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#street-address"]];
+	
+	if (!_countryName) {
+		_countryName = (id)[NSNull null];
+	}
+	if (!_extendedAddress) {
+		_extendedAddress = (id)[NSNull null];
+	}
+	if (!_locality) {
+		_locality = (id)[NSNull null];
+	}
+	if (!_postalCode) {
+		_postalCode = (id)[NSNull null];
+	}
+	if (!_region) {
+		_region = (id)[NSNull null];
+	}
+	if (!_streetAddress) {
+		_streetAddress = (id)[NSNull null];
+	}
 }
 
 
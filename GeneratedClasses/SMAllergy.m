@@ -2,8 +2,8 @@
  SMAllergy.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,63 @@
 
 #import "SMAllergy.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMAllergy, indexed like its sorted properties
+static RedlandNode *SMAllergyPredicates[9];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMAllergyPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMAllergyLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMAllergyPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergicReaction"];
+		SMAllergyPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMAllergyPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#category"];
+		SMAllergyPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugAllergen"];
+		SMAllergyPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugClassAllergen"];
+		SMAllergyPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
+		SMAllergyPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#otherAllergen"];
+		SMAllergyPredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#severity"];
+		SMAllergyPredicates[8] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:9];
+		for (NSUInteger i = 0; i < 9; i++) {
+			indexes[[[SMAllergyPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMAllergyPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMAllergyPredicate(NSUInteger idx)
+{
+	SMAllergyLoadPredicates();
+	return SMAllergyPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMAllergyPredicateIndex(RedlandNode *predicate)
+{
+	SMAllergyLoadPredicates();
+	NSNumber *idx = SMAllergyPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMAllergy
 
 
@@ -34,363 +87,347 @@
 
 - (SMCodedValue *)allergicReaction
 {
-	if (!_allergicReaction) {
-		
-		// get the "allergicReaction" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergicReaction"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_allergicReaction = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _allergicReaction) {
-		return nil;
-	}
-	
-	return _allergicReaction;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(0) cache:(id __strong *)&_allergicReaction];
 }
 
 - (void)setAllergicReaction:(SMCodedValue *)allergicReaction
 {
-	if (allergicReaction != _allergicReaction) {
-		RedlandNode *predicate = (allergicReaction || _allergicReaction) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergicReaction"] : nil;
-		if (_allergicReaction) {
-			[self.inModel removeSubmodel:_allergicReaction.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_allergicReaction = allergicReaction;
-		
-		if (_allergicReaction) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_allergicReaction.subject]];
-			[self.inModel addSubmodel:_allergicReaction.model];
-		}
-	}
+	[self setObject:allergicReaction forPredicate:SMAllergyPredicate(0) cache:(id __strong *)&_allergicReaction];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMAllergyPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMAllergyPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize category = _category;
 
 - (SMCodedValue *)category
 {
-	if (!_category) {
-		
-		// get the "category" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#category"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_category = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _category) {
-		return nil;
-	}
-	
-	return _category;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(2) cache:(id __strong *)&_category];
 }
 
 - (void)setCategory:(SMCodedValue *)category
 {
-	if (category != _category) {
-		RedlandNode *predicate = (category || _category) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#category"] : nil;
-		if (_category) {
-			[self.inModel removeSubmodel:_category.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_category = category;
-		
-		if (_category) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_category.subject]];
-			[self.inModel addSubmodel:_category.model];
-		}
-	}
+	[self setObject:category forPredicate:SMAllergyPredicate(2) cache:(id __strong *)&_category];
 }
 
 @synthesize drugAllergen = _drugAllergen;
 
 - (SMCodedValue *)drugAllergen
 {
-	if (!_drugAllergen) {
-		
-		// get the "drugAllergen" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugAllergen"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_drugAllergen = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _drugAllergen) {
-		return nil;
-	}
-	
-	return _drugAllergen;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(3) cache:(id __strong *)&_drugAllergen];
 }
 
 - (void)setDrugAllergen:(SMCodedValue *)drugAllergen
 {
-	if (drugAllergen != _drugAllergen) {
-		RedlandNode *predicate = (drugAllergen || _drugAllergen) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugAllergen"] : nil;
-		if (_drugAllergen) {
-			[self.inModel removeSubmodel:_drugAllergen.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_drugAllergen = drugAllergen;
-		
-		if (_drugAllergen) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_drugAllergen.subject]];
-			[self.inModel addSubmodel:_drugAllergen.model];
-		}
-	}
+	[self setObject:drugAllergen forPredicate:SMAllergyPredicate(3) cache:(id __strong *)&_drugAllergen];
 }
 
 @synthesize drugClassAllergen = _drugClassAllergen;
 
 - (SMCodedValue *)drugClassAllergen
 {
-	if (!_drugClassAllergen) {
-		
-		// get the "drugClassAllergen" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugClassAllergen"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_drugClassAllergen = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _drugClassAllergen) {
-		return nil;
-	}
-	
-	return _drugClassAllergen;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(4) cache:(id __strong *)&_drugClassAllergen];
 }
 
 - (void)setDrugClassAllergen:(SMCodedValue *)drugClassAllergen
 {
-	if (drugClassAllergen != _drugClassAllergen) {
-		RedlandNode *predicate = (drugClassAllergen || _drugClassAllergen) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugClassAllergen"] : nil;
-		if (_drugClassAllergen) {
-			[self.inModel removeSubmodel:_drugClassAllergen.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_drugClassAllergen = drugClassAllergen;
-		
-		if (_drugClassAllergen) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_drugClassAllergen.subject]];
-			[self.inModel addSubmodel:_drugClassAllergen.model];
-		}
-	}
+	[self setObject:drugClassAllergen forPredicate:SMAllergyPredicate(4) cache:(id __strong *)&_drugClassAllergen];
 }
 
 @synthesize endDate = _endDate;
 
 - (NSString *)endDate
 {
-	if (!_endDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_endDate = [rslt.object literalValue];
-	}
-	return _endDate;
+	return [self literalForPredicate:SMAllergyPredicate(5) cache:(id __strong *)&_endDate];
 }
 
 - (void)setEndDate:(NSString *)endDate
 {
-	if (endDate != _endDate) {
-		RedlandNode *predicate = (endDate || _endDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"] : nil;
-		if (_endDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_endDate = [endDate copy];
-		
-		if (_endDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_endDate nodeValue]]];
-		}
-	}
+	[self setLiteral:endDate forPredicate:SMAllergyPredicate(5) cache:(id __strong *)&_endDate];
 }
 
 @synthesize otherAllergen = _otherAllergen;
 
 - (SMCodedValue *)otherAllergen
 {
-	if (!_otherAllergen) {
-		
-		// get the "otherAllergen" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#otherAllergen"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_otherAllergen = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _otherAllergen) {
-		return nil;
-	}
-	
-	return _otherAllergen;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(6) cache:(id __strong *)&_otherAllergen];
 }
 
 - (void)setOtherAllergen:(SMCodedValue *)otherAllergen
 {
-	if (otherAllergen != _otherAllergen) {
-		RedlandNode *predicate = (otherAllergen || _otherAllergen) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#otherAllergen"] : nil;
-		if (_otherAllergen) {
-			[self.inModel removeSubmodel:_otherAllergen.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_otherAllergen = otherAllergen;
-		
-		if (_otherAllergen) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_otherAllergen.subject]];
-			[self.inModel addSubmodel:_otherAllergen.model];
-		}
-	}
+	[self setObject:otherAllergen forPredicate:SMAllergyPredicate(6) cache:(id __strong *)&_otherAllergen];
 }
 
 @synthesize severity = _severity;
 
 - (SMCodedValue *)severity
 {
-	if (!_severity) {
-		
-		// get the "severity" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#severity"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_severity = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _severity) {
-		return nil;
-	}
-	
-	return _severity;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyPredicate(7) cache:(id __strong *)&_severity];
 }
 
 - (void)setSeverity:(SMCodedValue *)severity
 {
-	if (severity != _severity) {
-		RedlandNode *predicate = (severity || _severity) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#severity"] : nil;
-		if (_severity) {
-			[self.inModel removeSubmodel:_severity.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_severity = severity;
-		
-		if (_severity) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_severity.subject]];
-			[self.inModel addSubmodel:_severity.model];
-		}
-	}
+	[self setObject:severity forPredicate:SMAllergyPredicate(7) cache:(id __strong *)&_severity];
 }
 
 @synthesize startDate = _startDate;
 
 - (NSString *)startDate
 {
-	if (!_startDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_startDate = [rslt.object literalValue];
-	}
-	return _startDate;
+	return [self literalForPredicate:SMAllergyPredicate(8) cache:(id __strong *)&_startDate];
 }
 
 - (void)setStartDate:(NSString *)startDate
 {
-	if (startDate != _startDate) {
-		RedlandNode *predicate = (startDate || _startDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"] : nil;
-		if (_startDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:startDate forPredicate:SMAllergyPredicate(8) cache:(id __strong *)&_startDate];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *allergicReaction = nil;
+	SMMedicalRecord *belongsTo = nil;
+	SMCodedValue *category = nil;
+	SMCodedValue *drugAllergen = nil;
+	SMCodedValue *drugClassAllergen = nil;
+	NSString *endDate = nil;
+	SMCodedValue *otherAllergen = nil;
+	SMCodedValue *severity = nil;
+	NSString *startDate = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMAllergyPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!allergicReaction) {
+					allergicReaction = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!category) {
+					category = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 3:
+				if (!drugAllergen) {
+					drugAllergen = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4:
+				if (!drugClassAllergen) {
+					drugClassAllergen = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!endDate) {
+					endDate = [rslt.object literalValue];
+				}
+				break;
+			case 6:
+				if (!otherAllergen) {
+					otherAllergen = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 7:
+				if (!severity) {
+					severity = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 8:
+				if (!startDate) {
+					startDate = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_startDate = [startDate copy];
-		
-		if (_startDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_startDate nodeValue]]];
+	}
+	
+	if (!_allergicReaction) {
+		_allergicReaction = allergicReaction ? allergicReaction : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_category) {
+		_category = category ? category : (id)[NSNull null];
+	}
+	if (!_drugAllergen) {
+		_drugAllergen = drugAllergen ? drugAllergen : (id)[NSNull null];
+	}
+	if (!_drugClassAllergen) {
+		_drugClassAllergen = drugClassAllergen ? drugClassAllergen : (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = endDate ? endDate : (id)[NSNull null];
+	}
+	if (!_otherAllergen) {
+		_otherAllergen = otherAllergen ? otherAllergen : (id)[NSNull null];
+	}
+	if (!_severity) {
+		_severity = severity ? severity : (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = startDate ? startDate : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.allergicReaction forProperty:0];
+	[snapshot writeObject:self.belongsTo forProperty:1];
+	[snapshot writeObject:self.category forProperty:2];
+	[snapshot writeObject:self.drugAllergen forProperty:3];
+	[snapshot writeObject:self.drugClassAllergen forProperty:4];
+	[snapshot writeString:self.endDate forProperty:5];
+	[snapshot writeObject:self.otherAllergen forProperty:6];
+	[snapshot writeObject:self.severity forProperty:7];
+	[snapshot writeString:self.startDate forProperty:8];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_allergicReaction = [snapshot readObject];
+				break;
+			case 1:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 2:
+				_category = [snapshot readObject];
+				break;
+			case 3:
+				_drugAllergen = [snapshot readObject];
+				break;
+			case 4:
+				_drugClassAllergen = [snapshot readObject];
+				break;
+			case 5:
+				_endDate = [snapshot readString];
+				break;
+			case 6:
+				_otherAllergen = [snapshot readObject];
+				break;
+			case 7:
+				_severity = [snapshot readObject];
+				break;
+			case 8:
+				_startDate = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_allergicReaction) {
+		_allergicReaction = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_category) {
+		_category = (id)[NSNull null];
+	}
+	if (!_drugAllergen) {
+		_drugAllergen = (id)[NSNull null];
+	}
+	if (!_drugClassAllergen) {
+		_drugClassAllergen = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_otherAllergen) {
+		_otherAllergen = (id)[NSNull null];
+	}
+	if (!_severity) {
+		_severity = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_allergicReaction = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#allergicReaction"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_category = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#category"]];
+	_drugAllergen = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#drugAllergen"]];
+	_drugClassAllergen = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#drugClassAllergen"]];
+	_endDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#endDate"]];
+	_otherAllergen = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#otherAllergen"]];
+	_severity = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#severity"]];
+	_startDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#startDate"]];
+	
+	if (!_allergicReaction) {
+		_allergicReaction = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_category) {
+		_category = (id)[NSNull null];
+	}
+	if (!_drugAllergen) {
+		_drugAllergen = (id)[NSNull null];
+	}
+	if (!_drugClassAllergen) {
+		_drugClassAllergen = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_otherAllergen) {
+		_otherAllergen = (id)[NSNull null];
+	}
+	if (!_severity) {
+		_severity = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
 }
 
 
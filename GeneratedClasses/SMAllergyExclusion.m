@@ -2,8 +2,8 @@
  SMAllergyExclusion.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMAllergyExclusion.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMAllergyExclusion, indexed like its sorted properties
+static RedlandNode *SMAllergyExclusionPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMAllergyExclusionPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMAllergyExclusionLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMAllergyExclusionPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergyExclusionName"];
+		SMAllergyExclusionPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMAllergyExclusionPredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMAllergyExclusionPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMAllergyExclusionPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMAllergyExclusionPredicate(NSUInteger idx)
+{
+	SMAllergyExclusionLoadPredicates();
+	return SMAllergyExclusionPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMAllergyExclusionPredicateIndex(RedlandNode *predicate)
+{
+	SMAllergyExclusionLoadPredicates();
+	NSNumber *idx = SMAllergyExclusionPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMAllergyExclusion
 
 
@@ -34,117 +81,155 @@
 
 - (SMCodedValue *)allergyExclusionName
 {
-	if (!_allergyExclusionName) {
-		
-		// get the "allergyExclusionName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergyExclusionName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_allergyExclusionName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _allergyExclusionName) {
-		return nil;
-	}
-	
-	return _allergyExclusionName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMAllergyExclusionPredicate(0) cache:(id __strong *)&_allergyExclusionName];
 }
 
 - (void)setAllergyExclusionName:(SMCodedValue *)allergyExclusionName
 {
-	if (allergyExclusionName != _allergyExclusionName) {
-		RedlandNode *predicate = (allergyExclusionName || _allergyExclusionName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#allergyExclusionName"] : nil;
-		if (_allergyExclusionName) {
-			[self.inModel removeSubmodel:_allergyExclusionName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_allergyExclusionName = allergyExclusionName;
-		
-		if (_allergyExclusionName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_allergyExclusionName.subject]];
-			[self.inModel addSubmodel:_allergyExclusionName.model];
-		}
-	}
+	[self setObject:allergyExclusionName forPredicate:SMAllergyExclusionPredicate(0) cache:(id __strong *)&_allergyExclusionName];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMAllergyExclusionPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMAllergyExclusionPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMAllergyExclusionPredicate(2) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:date forPredicate:SMAllergyExclusionPredicate(2) cache:(id __strong *)&_date];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *allergyExclusionName = nil;
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMAllergyExclusionPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!allergyExclusionName) {
+					allergyExclusionName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
+	}
+	
+	if (!_allergyExclusionName) {
+		_allergyExclusionName = allergyExclusionName ? allergyExclusionName : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.allergyExclusionName forProperty:0];
+	[snapshot writeObject:self.belongsTo forProperty:1];
+	[snapshot writeString:self.date forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_allergyExclusionName = [snapshot readObject];
+				break;
+			case 1:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 2:
+				_date = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_allergyExclusionName) {
+		_allergyExclusionName = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_allergyExclusionName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#allergyExclusionName"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	
+	if (!_allergyExclusionName) {
+		_allergyExclusionName = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
 }
 
 
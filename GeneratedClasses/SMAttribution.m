@@ -2,8 +2,8 @@
  SMAttribution.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMAttribution.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMAttribution, indexed like its sorted properties
+static RedlandNode *SMAttributionPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMAttributionPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMAttributionLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMAttributionPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
+		SMAttributionPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#participant"];
+		SMAttributionPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMAttributionPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMAttributionPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMAttributionPredicate(NSUInteger idx)
+{
+	SMAttributionLoadPredicates();
+	return SMAttributionPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMAttributionPredicateIndex(RedlandNode *predicate)
+{
+	SMAttributionLoadPredicates();
+	NSNumber *idx = SMAttributionPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMAttribution
 
 
@@ -34,105 +81,155 @@
 
 - (NSString *)endDate
 {
-	if (!_endDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_endDate = [rslt.object literalValue];
-	}
-	return _endDate;
+	return [self literalForPredicate:SMAttributionPredicate(0) cache:(id __strong *)&_endDate];
 }
 
 - (void)setEndDate:(NSString *)endDate
 {
-	if (endDate != _endDate) {
-		RedlandNode *predicate = (endDate || _endDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"] : nil;
-		if (_endDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_endDate = [endDate copy];
-		
-		if (_endDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_endDate nodeValue]]];
-		}
-	}
+	[self setLiteral:endDate forPredicate:SMAttributionPredicate(0) cache:(id __strong *)&_endDate];
 }
 
 @synthesize participant = _participant;
 
 - (SMParticipant *)participant
 {
-	if (!_participant) {
-		
-		// get the "participant" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#participant"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMParticipant *obj = [SMParticipant newWithSubject:rslt.object inModel:self.inModel];
-		_participant = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _participant) {
-		return nil;
-	}
-	
-	return _participant;
+	return [self objectOfClass:[SMParticipant class] forPredicate:SMAttributionPredicate(1) cache:(id __strong *)&_participant];
 }
 
 - (void)setParticipant:(SMParticipant *)participant
 {
-	if (participant != _participant) {
-		RedlandNode *predicate = (participant || _participant) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#participant"] : nil;
-		if (_participant) {
-			[self.inModel removeSubmodel:_participant.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_participant = participant;
-		
-		if (_participant) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_participant.subject]];
-			[self.inModel addSubmodel:_participant.model];
-		}
-	}
+	[self setObject:participant forPredicate:SMAttributionPredicate(1) cache:(id __strong *)&_participant];
 }
 
 @synthesize startDate = _startDate;
 
 - (NSString *)startDate
 {
-	if (!_startDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_startDate = [rslt.object literalValue];
-	}
-	return _startDate;
+	return [self literalForPredicate:SMAttributionPredicate(2) cache:(id __strong *)&_startDate];
 }
 
 - (void)setStartDate:(NSString *)startDate
 {
-	if (startDate != _startDate) {
-		RedlandNode *predicate = (startDate || _startDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"] : nil;
-		if (_startDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:startDate forPredicate:SMAttributionPredicate(2) cache:(id __strong *)&_startDate];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *endDate = nil;
+	SMParticipant *participant = nil;
+	NSString *startDate = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMAttributionPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!endDate) {
+					endDate = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!participant) {
+					participant = [SMParticipant newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!startDate) {
+					startDate = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_startDate = [startDate copy];
-		
-		if (_startDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_startDate nodeValue]]];
+	}
+	
+	if (!_endDate) {
+		_endDate = endDate ? endDate : (id)[NSNull null];
+	}
+	if (!_participant) {
+		_participant = participant ? participant : (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = startDate ? startDate : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeString:self.endDate forProperty:0];
+	[snapshot writeObject:self.participant forProperty:1];
+	[snapshot writeString:self.startDate forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_endDate = [snapshot readString];
+				break;
+			case 1:
+				_participant = [snapshot readObject];
+				break;
+			case 2:
+				_startDate = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_participant) {
+		_participant = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_endDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#endDate"]];
+	_participant = [decoder objectOfClass:[SMParticipant class] from:values[@"http://smartplatforms.org/terms#participant"]];
+	_startDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#startDate"]];
+	
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_participant) {
+		_participant = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
 }
 
 
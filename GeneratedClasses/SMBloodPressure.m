@@ -2,8 +2,8 @@
  SMBloodPressure.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,59 @@
 
 #import "SMBloodPressure.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMBloodPressure, indexed like its sorted properties
+static RedlandNode *SMBloodPressurePredicates[5];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMBloodPressurePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMBloodPressureLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMBloodPressurePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyPosition"];
+		SMBloodPressurePredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodySite"];
+		SMBloodPressurePredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#diastolic"];
+		SMBloodPressurePredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#method"];
+		SMBloodPressurePredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#systolic"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:5];
+		for (NSUInteger i = 0; i < 5; i++) {
+			indexes[[[SMBloodPressurePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMBloodPressurePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMBloodPressurePredicate(NSUInteger idx)
+{
+	SMBloodPressureLoadPredicates();
+	return SMBloodPressurePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMBloodPressurePredicateIndex(RedlandNode *predicate)
+{
+	SMBloodPressureLoadPredicates();
+	NSNumber *idx = SMBloodPressurePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMBloodPressure
 
 
@@ -34,215 +83,219 @@
 
 - (SMCodedValue *)bodyPosition
 {
-	if (!_bodyPosition) {
-		
-		// get the "bodyPosition" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyPosition"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_bodyPosition = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _bodyPosition) {
-		return nil;
-	}
-	
-	return _bodyPosition;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMBloodPressurePredicate(0) cache:(id __strong *)&_bodyPosition];
 }
 
 - (void)setBodyPosition:(SMCodedValue *)bodyPosition
 {
-	if (bodyPosition != _bodyPosition) {
-		RedlandNode *predicate = (bodyPosition || _bodyPosition) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyPosition"] : nil;
-		if (_bodyPosition) {
-			[self.inModel removeSubmodel:_bodyPosition.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bodyPosition = bodyPosition;
-		
-		if (_bodyPosition) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_bodyPosition.subject]];
-			[self.inModel addSubmodel:_bodyPosition.model];
-		}
-	}
+	[self setObject:bodyPosition forPredicate:SMBloodPressurePredicate(0) cache:(id __strong *)&_bodyPosition];
 }
 
 @synthesize bodySite = _bodySite;
 
 - (SMCodedValue *)bodySite
 {
-	if (!_bodySite) {
-		
-		// get the "bodySite" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodySite"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_bodySite = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _bodySite) {
-		return nil;
-	}
-	
-	return _bodySite;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMBloodPressurePredicate(1) cache:(id __strong *)&_bodySite];
 }
 
 - (void)setBodySite:(SMCodedValue *)bodySite
 {
-	if (bodySite != _bodySite) {
-		RedlandNode *predicate = (bodySite || _bodySite) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodySite"] : nil;
-		if (_bodySite) {
-			[self.inModel removeSubmodel:_bodySite.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bodySite = bodySite;
-		
-		if (_bodySite) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_bodySite.subject]];
-			[self.inModel addSubmodel:_bodySite.model];
-		}
-	}
+	[self setObject:bodySite forPredicate:SMBloodPressurePredicate(1) cache:(id __strong *)&_bodySite];
 }
 
 @synthesize diastolic = _diastolic;
 
 - (SMVitalSign *)diastolic
 {
-	if (!_diastolic) {
-		
-		// get the "diastolic" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#diastolic"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_diastolic = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _diastolic) {
-		return nil;
-	}
-	
-	return _diastolic;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMBloodPressurePredicate(2) cache:(id __strong *)&_diastolic];
 }
 
 - (void)setDiastolic:(SMVitalSign *)diastolic
 {
-	if (diastolic != _diastolic) {
-		RedlandNode *predicate = (diastolic || _diastolic) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#diastolic"] : nil;
-		if (_diastolic) {
-			[self.inModel removeSubmodel:_diastolic.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_diastolic = diastolic;
-		
-		if (_diastolic) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_diastolic.subject]];
-			[self.inModel addSubmodel:_diastolic.model];
-		}
-	}
+	[self setObject:diastolic forPredicate:SMBloodPressurePredicate(2) cache:(id __strong *)&_diastolic];
 }
 
 @synthesize method = _method;
 
 - (SMCodedValue *)method
 {
-	if (!_method) {
-		
-		// get the "method" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#method"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_method = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _method) {
-		return nil;
-	}
-	
-	return _method;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMBloodPressurePredicate(3) cache:(id __strong *)&_method];
 }
 
 - (void)setMethod:(SMCodedValue *)method
 {
-	if (method != _method) {
-		RedlandNode *predicate = (method || _method) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#method"] : nil;
-		if (_method) {
-			[self.inModel removeSubmodel:_method.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_method = method;
-		
-		if (_method) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_method.subject]];
-			[self.inModel addSubmodel:_method.model];
-		}
-	}
+	[self setObject:method forPredicate:SMBloodPressurePredicate(3) cache:(id __strong *)&_method];
 }
 
 @synthesize systolic = _systolic;
 
 - (SMVitalSign *)systolic
 {
-	if (!_systolic) {
-		
-		// get the "systolic" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#systolic"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_systolic = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMBloodPressurePredicate(4) cache:(id __strong *)&_systolic];
+}
+
+- (void)setSystolic:(SMVitalSign *)systolic
+{
+	[self setObject:systolic forPredicate:SMBloodPressurePredicate(4) cache:(id __strong *)&_systolic];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *bodyPosition = nil;
+	SMCodedValue *bodySite = nil;
+	SMVitalSign *diastolic = nil;
+	SMCodedValue *method = nil;
+	SMVitalSign *systolic = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _systolic) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMBloodPressurePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!bodyPosition) {
+					bodyPosition = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!bodySite) {
+					bodySite = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!diastolic) {
+					diastolic = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 3:
+				if (!method) {
+					method = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4:
+				if (!systolic) {
+					systolic = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _systolic;
+	if (!_bodyPosition) {
+		_bodyPosition = bodyPosition ? bodyPosition : (id)[NSNull null];
+	}
+	if (!_bodySite) {
+		_bodySite = bodySite ? bodySite : (id)[NSNull null];
+	}
+	if (!_diastolic) {
+		_diastolic = diastolic ? diastolic : (id)[NSNull null];
+	}
+	if (!_method) {
+		_method = method ? method : (id)[NSNull null];
+	}
+	if (!_systolic) {
+		_systolic = systolic ? systolic : (id)[NSNull null];
+	}
 }
 
-- (void)setSystolic:(SMVitalSign *)systolic
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (systolic != _systolic) {
-		RedlandNode *predicate = (systolic || _systolic) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#systolic"] : nil;
-		if (_systolic) {
-			[self.inModel removeSubmodel:_systolic.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_systolic = systolic;
-		
-		if (_systolic) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_systolic.subject]];
-			[self.inModel addSubmodel:_systolic.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.bodyPosition forProperty:0];
+	[snapshot writeObject:self.bodySite forProperty:1];
+	[snapshot writeObject:self.diastolic forProperty:2];
+	[snapshot writeObject:self.method forProperty:3];
+	[snapshot writeObject:self.systolic forProperty:4];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_bodyPosition = [snapshot readObject];
+				break;
+			case 1:
+				_bodySite = [snapshot readObject];
+				break;
+			case 2:
+				_diastolic = [snapshot readObject];
+				break;
+			case 3:
+				_method = [snapshot readObject];
+				break;
+			case 4:
+				_systolic = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_bodyPosition) {
+		_bodyPosition = (id)[NSNull null];
+	}
+	if (!_bodySite) {
+		_bodySite = (id)[NSNull null];
+	}
+	if (!_diastolic) {
+		_diastolic = (id)[NSNull null];
+	}
+	if (!_method) {
+		_method = (id)[NSNull null];
+	}
+	if (!_systolic) {
+		_systolic = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_bodyPosition = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#bodyPosition"]];
+	_bodySite = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#bodySite"]];
+	_diastolic = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#diastolic"]];
+	_method = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#method"]];
+	_systolic = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#systolic"]];
+	
+	if (!_bodyPosition) {
+		_bodyPosition = (id)[NSNull null];
+	}
+	if (!_bodySite) {
+		_bodySite = (id)[NSNull null];
+	}
+	if (!_diastolic) {
+		_diastolic = (id)[NSNull null];
+	}
+	if (!_method) {
+		_method = (id)[NSNull null];
+	}
+	if (!_systolic) {
+		_systolic = (id)[NSNull null];
+	}
 }
 
 
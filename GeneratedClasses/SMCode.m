@@ -2,8 +2,8 @@
  SMCode.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMCode.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMCode, indexed like its sorted properties
+static RedlandNode *SMCodePredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMCodePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMCodeLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMCodePredicates[0] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/identifier"];
+		SMCodePredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#system"];
+		SMCodePredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMCodePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMCodePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMCodePredicate(NSUInteger idx)
+{
+	SMCodeLoadPredicates();
+	return SMCodePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMCodePredicateIndex(RedlandNode *predicate)
+{
+	SMCodeLoadPredicates();
+	NSNumber *idx = SMCodePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMCode
 
 
@@ -34,93 +81,155 @@
 
 - (NSString *)identifier
 {
-	if (!_identifier) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/identifier"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_identifier = [rslt.object literalValue];
-	}
-	return _identifier;
+	return [self literalForPredicate:SMCodePredicate(0) cache:(id __strong *)&_identifier];
 }
 
 - (void)setIdentifier:(NSString *)identifier
 {
-	if (identifier != _identifier) {
-		RedlandNode *predicate = (identifier || _identifier) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/identifier"] : nil;
-		if (_identifier) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_identifier = [identifier copy];
-		
-		if (_identifier) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_identifier nodeValue]]];
-		}
-	}
+	[self setLiteral:identifier forPredicate:SMCodePredicate(0) cache:(id __strong *)&_identifier];
 }
 
 @synthesize system = _system;
 
 - (NSString *)system
 {
-	if (!_system) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#system"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_system = [rslt.object literalValue];
-	}
-	return _system;
+	return [self literalForPredicate:SMCodePredicate(1) cache:(id __strong *)&_system];
 }
 
 - (void)setSystem:(NSString *)system
 {
-	if (system != _system) {
-		RedlandNode *predicate = (system || _system) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#system"] : nil;
-		if (_system) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_system = [system copy];
-		
-		if (_system) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_system nodeValue]]];
-		}
-	}
+	[self setLiteral:system forPredicate:SMCodePredicate(1) cache:(id __strong *)&_system];
 }
 
 @synthesize title = _title;
 
 - (NSString *)title
 {
-	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
-	}
-	return _title;
+	return [self literalForPredicate:SMCodePredicate(2) cache:(id __strong *)&_title];
 }
 
 - (void)setTitle:(NSString *)title
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:title forPredicate:SMCodePredicate(2) cache:(id __strong *)&_title];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *identifier = nil;
+	NSString *system = nil;
+	NSString *title = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMCodePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!identifier) {
+					identifier = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!system) {
+					system = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
+	}
+	
+	if (!_identifier) {
+		_identifier = identifier ? identifier : (id)[NSNull null];
+	}
+	if (!_system) {
+		_system = system ? system : (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeString:self.identifier forProperty:0];
+	[snapshot writeString:self.system forProperty:1];
+	[snapshot writeString:self.title forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_identifier = [snapshot readString];
+				break;
+			case 1:
+				_system = [snapshot readString];
+				break;
+			case 2:
+				_title = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_identifier) {
+		_identifier = (id)[NSNull null];
+	}
+	if (!_system) {
+		_system = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_identifier = [decoder stringFrom:values[@"http://purl.org/dc/terms/identifier"]];
+	_system = [decoder stringFrom:values[@"http://smartplatforms.org/terms#system"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	
+	if (!_identifier) {
+		_identifier = (id)[NSNull null];
+	}
+	if (!_system) {
+		_system = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMCodeProvenance.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMCodeProvenance.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMCodeProvenance, indexed like its sorted properties
+static RedlandNode *SMCodeProvenancePredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMCodeProvenancePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMCodeProvenanceLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMCodeProvenancePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#sourceCode"];
+		SMCodeProvenancePredicates[1] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		SMCodeProvenancePredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#translationFidelity"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMCodeProvenancePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMCodeProvenancePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMCodeProvenancePredicate(NSUInteger idx)
+{
+	SMCodeProvenanceLoadPredicates();
+	return SMCodeProvenancePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMCodeProvenancePredicateIndex(RedlandNode *predicate)
+{
+	SMCodeProvenanceLoadPredicates();
+	NSNumber *idx = SMCodeProvenancePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMCodeProvenance
 
 
@@ -34,105 +81,155 @@
 
 - (NSString *)sourceCode
 {
-	if (!_sourceCode) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#sourceCode"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_sourceCode = [rslt.object literalValue];
-	}
-	return _sourceCode;
+	return [self literalForPredicate:SMCodeProvenancePredicate(0) cache:(id __strong *)&_sourceCode];
 }
 
 - (void)setSourceCode:(NSString *)sourceCode
 {
-	if (sourceCode != _sourceCode) {
-		RedlandNode *predicate = (sourceCode || _sourceCode) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#sourceCode"] : nil;
-		if (_sourceCode) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_sourceCode = [sourceCode copy];
-		
-		if (_sourceCode) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_sourceCode nodeValue]]];
-		}
-	}
+	[self setLiteral:sourceCode forPredicate:SMCodeProvenancePredicate(0) cache:(id __strong *)&_sourceCode];
 }
 
 @synthesize title = _title;
 
 - (NSString *)title
 {
-	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
-	}
-	return _title;
+	return [self literalForPredicate:SMCodeProvenancePredicate(1) cache:(id __strong *)&_title];
 }
 
 - (void)setTitle:(NSString *)title
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
-		}
-	}
+	[self setLiteral:title forPredicate:SMCodeProvenancePredicate(1) cache:(id __strong *)&_title];
 }
 
 @synthesize translationFidelity = _translationFidelity;
 
 - (SMCodedValue *)translationFidelity
 {
-	if (!_translationFidelity) {
-		
-		// get the "translationFidelity" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#translationFidelity"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_translationFidelity = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMCodeProvenancePredicate(2) cache:(id __strong *)&_translationFidelity];
+}
+
+- (void)setTranslationFidelity:(SMCodedValue *)translationFidelity
+{
+	[self setObject:translationFidelity forPredicate:SMCodeProvenancePredicate(2) cache:(id __strong *)&_translationFidelity];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *sourceCode = nil;
+	NSString *title = nil;
+	SMCodedValue *translationFidelity = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _translationFidelity) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMCodeProvenancePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!sourceCode) {
+					sourceCode = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!translationFidelity) {
+					translationFidelity = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _translationFidelity;
+	if (!_sourceCode) {
+		_sourceCode = sourceCode ? sourceCode : (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
+	}
+	if (!_translationFidelity) {
+		_translationFidelity = translationFidelity ? translationFidelity : (id)[NSNull null];
+	}
 }
 
-- (void)setTranslationFidelity:(SMCodedValue *)translationFidelity
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (translationFidelity != _translationFidelity) {
-		RedlandNode *predicate = (translationFidelity || _translationFidelity) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#translationFidelity"] : nil;
-		if (_translationFidelity) {
-			[self.inModel removeSubmodel:_translationFidelity.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_translationFidelity = translationFidelity;
-		
-		if (_translationFidelity) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_translationFidelity.subject]];
-			[self.inModel addSubmodel:_translationFidelity.model];
+	[self hydrateAllProperties];
+	[snapshot writeString:self.sourceCode forProperty:0];
+	[snapshot writeString:self.title forProperty:1];
+	[snapshot writeObject:self.translationFidelity forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_sourceCode = [snapshot readString];
+				break;
+			case 1:
+				_title = [snapshot readString];
+				break;
+			case 2:
+				_translationFidelity = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_sourceCode) {
+		_sourceCode = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
+	if (!_translationFidelity) {
+		_translationFidelity = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_sourceCode = [decoder stringFrom:values[@"http://smartplatforms.org/terms#sourceCode"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	_translationFidelity = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#translationFidelity"]];
+	
+	if (!_sourceCode) {
+		_sourceCode = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
+	if (!_translationFidelity) {
+		_translationFidelity = (id)[NSNull null];
+	}
 }
 
 
@@ -0,0 +1,40 @@
+/*
+ SMCodedValue+CodeSystems.h
+ SMARTFramework
+ 
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import "SMCodedValue.h"
+#import "SMART.h"
+
+
+/**
+ *  A category on SMCodedValue, generated from the SMART ontology.
+ */
+@interface SMCodedValue(CodeSystems)
+
++ (BOOL)isValidCode:(NSString *)code;
++ (BOOL)isValidCode:(NSString *)code inSystem:(NSString *)system;
++ (NSString *)titleForCode:(NSString *)code;
++ (NSString *)titleForCode:(NSString *)code inSystem:(NSString *)system;
++ (NSArray *)codeSystems;
+- (BOOL)hasValidCodeInSystem:(NSString *)system;
+
+
+@end
@@ -0,0 +1,165 @@
+/*
+ SMCodedValue+CodeSystems.m
+ SMARTFramework
+ 
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import "SMCodedValue+CodeSystems.h"
+#import "SMARTObjects.h"
+
+#import <Redland-ObjC.h>
+
+
+/// The code systems that define valid values, sorted
+static NSString *const SMCodedValueSystems[1] = {
+	@"http://smartplatforms.org/terms/codes/TranslationFidelity",
+};
+
+/// Where the codes of every system start in SMCodedValueCodes, the last entry is the number of codes
+static const NSUInteger SMCodedValueSystemStarts[1 + 1] = { 0, 3 };
+
+/// The valid codes, grouped by system and sorted within every system
+static NSString *const SMCodedValueCodes[3] = {
+	@"http://smartplatforms.org/terms/codes/TranslationFidelity#automated",
+	@"http://smartplatforms.org/terms/codes/TranslationFidelity#unmappable",
+	@"http://smartplatforms.org/terms/codes/TranslationFidelity#verified",
+};
+
+/// The titles of the codes in SMCodedValueCodes
+static NSString *const SMCodedValueTitles[3] = {
+	@"Automated",
+	@"Unmappable",
+	@"Verified",
+};
+
+/// The indexes of all codes in SMCodedValueCodes, sorted by code
+static const NSUInteger SMCodedValueCodeOrder[3] = { 0, 1, 2 };
+
+/**
+ *  Returns the index of the system in SMCodedValueSystems, NSNotFound if it defines no valid values.
+ */
+static NSUInteger SMCodedValueSystemIndex(NSString *system)
+{
+	NSUInteger low = 0;
+	NSUInteger high = 1;
+	while (low < high) {
+		NSUInteger mid = (low + high) / 2;
+		NSComparisonResult result = [system compare:SMCodedValueSystems[mid] options:NSLiteralSearch];
+		if (NSOrderedSame == result) {
+			return mid;
+		}
+		if (NSOrderedAscending == result) {
+			high = mid;
+		}
+		else {
+			low = mid + 1;
+		}
+	}
+	return NSNotFound;
+}
+
+/**
+ *  Returns the index of the code in SMCodedValueCodes, NSNotFound if it is not there. Searches the codes from "low" to "high" directly, or all of them
+ *  through SMCodedValueCodeOrder if "ordered" is YES.
+ */
+static NSUInteger SMCodedValueCodeIndex(NSString *code, NSUInteger low, NSUInteger high, BOOL ordered)
+{
+	while (low < high) {
+		NSUInteger mid = (low + high) / 2;
+		NSUInteger idx = ordered ? SMCodedValueCodeOrder[mid] : mid;
+		NSComparisonResult result = [code compare:SMCodedValueCodes[idx] options:NSLiteralSearch];
+		if (NSOrderedSame == result) {
+			return idx;
+		}
+		if (NSOrderedAscending == result) {
+			high = mid;
+		}
+		else {
+			low = mid + 1;
+		}
+	}
+	return NSNotFound;
+}
+
+
+@implementation SMCodedValue(CodeSystems)
+
+
+#pragma mark - Synthesized Methods
+/**
+ *  Returns YES if the code is a valid value of any code system of the ontology. Looks the code up in a static table, which needs no setup and
+ *  allocates nothing.
+ *  @param code The URI of the code
+ */
++ (BOOL)isValidCode:(NSString *)code
+{
+	return nil != [self titleForCode:code];
+}
+
+/**
+ *  Returns YES if the code is a valid value of the given code system.
+ *  @param code The URI of the code
+ *  @param system The URI of the code system, for example "http://smartplatforms.org/terms/codes/TranslationFidelity"
+ */
++ (BOOL)isValidCode:(NSString *)code inSystem:(NSString *)system
+{
+	return nil != [self titleForCode:code inSystem:system];
+}
+
+/**
+ *  Returns the title the ontology gives the code, nil if it is not a valid value of any code system.
+ */
++ (NSString *)titleForCode:(NSString *)code
+{
+	NSUInteger idx = code ? SMCodedValueCodeIndex(code, 0, 3, YES) : NSNotFound;
+	return (NSNotFound == idx) ? nil : SMCodedValueTitles[idx];
+}
+
+/**
+ *  Returns the title the ontology gives the code, nil if it is not a valid value of the given code system.
+ */
++ (NSString *)titleForCode:(NSString *)code inSystem:(NSString *)system
+{
+	NSUInteger sys = system ? SMCodedValueSystemIndex(system) : NSNotFound;
+	if (!code || NSNotFound == sys) {
+		return nil;
+	}
+	NSUInteger idx = SMCodedValueCodeIndex(code, SMCodedValueSystemStarts[sys], SMCodedValueSystemStarts[sys + 1], NO);
+	return (NSNotFound == idx) ? nil : SMCodedValueTitles[idx];
+}
+
+/**
+ *  Returns the URIs of the code systems that define valid values.
+ */
++ (NSArray *)codeSystems
+{
+	return [NSArray arrayWithObjects:SMCodedValueSystems count:1];
+}
+
+/**
+ *  Returns YES if the receiver is a valid value of the given code system, which it is if its subject or the subject of its code is one.
+ */
+- (BOOL)hasValidCodeInSystem:(NSString *)system
+{
+	return [[self class] isValidCode:[[self.subject URIValue] stringValue] inSystem:system]
+		|| [[self class] isValidCode:[[self.code.subject URIValue] stringValue] inSystem:system];
+}
+
+
+@end
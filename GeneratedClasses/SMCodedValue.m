@@ -2,8 +2,8 @@
  SMCodedValue.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMCodedValue.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMCodedValue, indexed like its sorted properties
+static RedlandNode *SMCodedValuePredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMCodedValuePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMCodedValueLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMCodedValuePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#code"];
+		SMCodedValuePredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"];
+		SMCodedValuePredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMCodedValuePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMCodedValuePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMCodedValuePredicate(NSUInteger idx)
+{
+	SMCodedValueLoadPredicates();
+	return SMCodedValuePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMCodedValuePredicateIndex(RedlandNode *predicate)
+{
+	SMCodedValueLoadPredicates();
+	NSNumber *idx = SMCodedValuePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMCodedValue
 
 
@@ -34,122 +81,156 @@
 
 - (SMCode *)code
 {
-	if (!_code) {
-		
-		// get the "code" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#code"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCode *obj = [SMCode newWithSubject:rslt.object inModel:self.inModel];
-		_code = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _code) {
-		return nil;
-	}
-	
-	return _code;
+	return [self objectOfClass:[SMCode class] forPredicate:SMCodedValuePredicate(0) cache:(id __strong *)&_code];
 }
 
 - (void)setCode:(SMCode *)code
 {
-	if (code != _code) {
-		RedlandNode *predicate = (code || _code) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#code"] : nil;
-		if (_code) {
-			[self.inModel removeSubmodel:_code.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_code = code;
-		
-		if (_code) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_code.subject]];
-			[self.inModel addSubmodel:_code.model];
-		}
-	}
+	[self setObject:code forPredicate:SMCodedValuePredicate(0) cache:(id __strong *)&_code];
 }
 
 @synthesize provenance = _provenance;
 
 - (NSArray *)provenance
 {
-	if (!_provenance) {
-		
-		// get the "provenance" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCodeProvenance *newItem = [SMCodeProvenance newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_provenance = [arr copy];
-	}
-	return _provenance;
+	return [self objectsOfClass:[SMCodeProvenance class] forPredicate:SMCodedValuePredicate(1) cache:&_provenance];
 }
 
 - (void)setProvenance:(NSArray *)provenance
 {
-	if (provenance != _provenance) {
-		RedlandNode *predicate = (provenance || _provenance) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"] : nil;
-		if (_provenance) {
-			for (SMCodeProvenance *item in _provenance) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:provenance forPredicate:SMCodedValuePredicate(1) cache:&_provenance];
+}
+
+@synthesize title = _title;
+
+- (NSString *)title
+{
+	return [self literalForPredicate:SMCodedValuePredicate(2) cache:(id __strong *)&_title];
+}
+
+- (void)setTitle:(NSString *)title
+{
+	[self setLiteral:title forPredicate:SMCodedValuePredicate(2) cache:(id __strong *)&_title];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCode *code = nil;
+	NSMutableArray *provenance = _provenance ? nil : [NSMutableArray array];
+	NSString *title = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMCodedValuePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!code) {
+					code = [SMCode newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1: {
+				SMCodeProvenance *newItem = [SMCodeProvenance newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[provenance addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			case 2:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_code) {
+		_code = code ? code : (id)[NSNull null];
+	}
+	if (!_provenance) {
 		_provenance = [provenance copy];
-		
-		if (_provenance) {
-			for (SMCodeProvenance *item in _provenance) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
 	}
 }
 
-@synthesize title = _title;
 
-- (NSString *)title
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.code forProperty:0];
+	[snapshot writeObjects:self.provenance forProperty:1];
+	[snapshot writeString:self.title forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
 {
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_code = [snapshot readObject];
+				break;
+			case 1:
+				_provenance = [snapshot readObjects];
+				break;
+			case 2:
+				_title = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
+		}
+	}
+	
+	if (!_code) {
+		_code = (id)[NSNull null];
+	}
+	if (!_provenance) {
+		_provenance = @[];
+	}
 	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
+		_title = (id)[NSNull null];
 	}
-	return _title;
 }
 
-- (void)setTitle:(NSString *)title
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
-		}
+	_code = [decoder objectOfClass:[SMCode class] from:values[@"http://smartplatforms.org/terms#code"]];
+	_provenance = [decoder objectsOfClass:[SMCodeProvenance class] from:values[@"http://smartplatforms.org/terms#provenance"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	
+	if (!_code) {
+		_code = (id)[NSNull null];
+	}
+	if (!_provenance) {
+		_provenance = @[];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
 	}
 }
 
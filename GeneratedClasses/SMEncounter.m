@@ -2,8 +2,8 @@
  SMEncounter.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMEncounter.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMEncounter, indexed like its sorted properties
+static RedlandNode *SMEncounterPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMEncounterPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMEncounterLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMEncounterPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMEncounterPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounterType"];
+		SMEncounterPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
+		SMEncounterPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#facility"];
+		SMEncounterPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
+		SMEncounterPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMEncounterPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMEncounterPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMEncounterPredicate(NSUInteger idx)
+{
+	SMEncounterLoadPredicates();
+	return SMEncounterPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMEncounterPredicateIndex(RedlandNode *predicate)
+{
+	SMEncounterLoadPredicates();
+	NSNumber *idx = SMEncounterPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMEncounter
 
 
@@ -34,234 +84,251 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMEncounterPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMEncounterPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize encounterType = _encounterType;
 
 - (SMCodedValue *)encounterType
 {
-	if (!_encounterType) {
-		
-		// get the "encounterType" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounterType"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_encounterType = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _encounterType) {
-		return nil;
-	}
-	
-	return _encounterType;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMEncounterPredicate(1) cache:(id __strong *)&_encounterType];
 }
 
 - (void)setEncounterType:(SMCodedValue *)encounterType
 {
-	if (encounterType != _encounterType) {
-		RedlandNode *predicate = (encounterType || _encounterType) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounterType"] : nil;
-		if (_encounterType) {
-			[self.inModel removeSubmodel:_encounterType.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_encounterType = encounterType;
-		
-		if (_encounterType) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_encounterType.subject]];
-			[self.inModel addSubmodel:_encounterType.model];
-		}
-	}
+	[self setObject:encounterType forPredicate:SMEncounterPredicate(1) cache:(id __strong *)&_encounterType];
 }
 
 @synthesize endDate = _endDate;
 
 - (NSString *)endDate
 {
-	if (!_endDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_endDate = [rslt.object literalValue];
-	}
-	return _endDate;
+	return [self literalForPredicate:SMEncounterPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 - (void)setEndDate:(NSString *)endDate
 {
-	if (endDate != _endDate) {
-		RedlandNode *predicate = (endDate || _endDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"] : nil;
-		if (_endDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_endDate = [endDate copy];
-		
-		if (_endDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_endDate nodeValue]]];
-		}
-	}
+	[self setLiteral:endDate forPredicate:SMEncounterPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 @synthesize facility = _facility;
 
 - (SMOrganization *)facility
 {
-	if (!_facility) {
-		
-		// get the "facility" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#facility"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMOrganization *obj = [SMOrganization newWithSubject:rslt.object inModel:self.inModel];
-		_facility = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _facility) {
-		return nil;
-	}
-	
-	return _facility;
+	return [self objectOfClass:[SMOrganization class] forPredicate:SMEncounterPredicate(3) cache:(id __strong *)&_facility];
 }
 
 - (void)setFacility:(SMOrganization *)facility
 {
-	if (facility != _facility) {
-		RedlandNode *predicate = (facility || _facility) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#facility"] : nil;
-		if (_facility) {
-			[self.inModel removeSubmodel:_facility.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_facility = facility;
-		
-		if (_facility) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_facility.subject]];
-			[self.inModel addSubmodel:_facility.model];
-		}
-	}
+	[self setObject:facility forPredicate:SMEncounterPredicate(3) cache:(id __strong *)&_facility];
 }
 
 @synthesize provider = _provider;
 
 - (SMProvider *)provider
 {
-	if (!_provider) {
-		
-		// get the "provider" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMProvider *obj = [SMProvider newWithSubject:rslt.object inModel:self.inModel];
-		_provider = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _provider) {
-		return nil;
-	}
-	
-	return _provider;
+	return [self objectOfClass:[SMProvider class] forPredicate:SMEncounterPredicate(4) cache:(id __strong *)&_provider];
 }
 
 - (void)setProvider:(SMProvider *)provider
 {
-	if (provider != _provider) {
-		RedlandNode *predicate = (provider || _provider) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"] : nil;
-		if (_provider) {
-			[self.inModel removeSubmodel:_provider.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_provider = provider;
-		
-		if (_provider) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_provider.subject]];
-			[self.inModel addSubmodel:_provider.model];
-		}
-	}
+	[self setObject:provider forPredicate:SMEncounterPredicate(4) cache:(id __strong *)&_provider];
 }
 
 @synthesize startDate = _startDate;
 
 - (NSString *)startDate
 {
-	if (!_startDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_startDate = [rslt.object literalValue];
-	}
-	return _startDate;
+	return [self literalForPredicate:SMEncounterPredicate(5) cache:(id __strong *)&_startDate];
 }
 
 - (void)setStartDate:(NSString *)startDate
 {
-	if (startDate != _startDate) {
-		RedlandNode *predicate = (startDate || _startDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"] : nil;
-		if (_startDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:startDate forPredicate:SMEncounterPredicate(5) cache:(id __strong *)&_startDate];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	SMCodedValue *encounterType = nil;
+	NSString *endDate = nil;
+	SMOrganization *facility = nil;
+	SMProvider *provider = nil;
+	NSString *startDate = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMEncounterPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!encounterType) {
+					encounterType = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!endDate) {
+					endDate = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!facility) {
+					facility = [SMOrganization newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4:
+				if (!provider) {
+					provider = [SMProvider newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!startDate) {
+					startDate = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_startDate = [startDate copy];
-		
-		if (_startDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_startDate nodeValue]]];
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_encounterType) {
+		_encounterType = encounterType ? encounterType : (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = endDate ? endDate : (id)[NSNull null];
+	}
+	if (!_facility) {
+		_facility = facility ? facility : (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = provider ? provider : (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = startDate ? startDate : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeObject:self.encounterType forProperty:1];
+	[snapshot writeString:self.endDate forProperty:2];
+	[snapshot writeObject:self.facility forProperty:3];
+	[snapshot writeObject:self.provider forProperty:4];
+	[snapshot writeString:self.startDate forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_encounterType = [snapshot readObject];
+				break;
+			case 2:
+				_endDate = [snapshot readString];
+				break;
+			case 3:
+				_facility = [snapshot readObject];
+				break;
+			case 4:
+				_provider = [snapshot readObject];
+				break;
+			case 5:
+				_startDate = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_encounterType) {
+		_encounterType = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_facility) {
+		_facility = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_encounterType = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#encounterType"]];
+	_endDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#endDate"]];
+	_facility = [decoder objectOfClass:[SMOrganization class] from:values[@"http://smartplatforms.org/terms#facility"]];
+	_provider = [decoder objectOfClass:[SMProvider class] from:values[@"http://smartplatforms.org/terms#provider"]];
+	_startDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#startDate"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_encounterType) {
+		_encounterType = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_facility) {
+		_facility = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
 }
 
 
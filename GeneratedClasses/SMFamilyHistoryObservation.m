@@ -2,8 +2,8 @@
  SMFamilyHistoryObservation.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMFamilyHistoryObservation.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMFamilyHistoryObservation, indexed like its sorted properties
+static RedlandNode *SMFamilyHistoryObservationPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMFamilyHistoryObservationPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMFamilyHistoryObservationLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMFamilyHistoryObservationPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#aboutRelative"];
+		SMFamilyHistoryObservationPredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
+		SMFamilyHistoryObservationPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMFamilyHistoryObservationPredicates[3] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
+		SMFamilyHistoryObservationPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasProblem"];
+		SMFamilyHistoryObservationPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMFamilyHistoryObservationPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMFamilyHistoryObservationPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMFamilyHistoryObservationPredicate(NSUInteger idx)
+{
+	SMFamilyHistoryObservationLoadPredicates();
+	return SMFamilyHistoryObservationPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMFamilyHistoryObservationPredicateIndex(RedlandNode *predicate)
+{
+	SMFamilyHistoryObservationLoadPredicates();
+	NSNumber *idx = SMFamilyHistoryObservationPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMFamilyHistoryObservation
 
 
@@ -34,239 +84,252 @@
 
 - (SMCodedValue *)aboutRelative
 {
-	if (!_aboutRelative) {
-		
-		// get the "aboutRelative" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#aboutRelative"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_aboutRelative = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _aboutRelative) {
-		return nil;
-	}
-	
-	return _aboutRelative;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMFamilyHistoryObservationPredicate(0) cache:(id __strong *)&_aboutRelative];
 }
 
 - (void)setAboutRelative:(SMCodedValue *)aboutRelative
 {
-	if (aboutRelative != _aboutRelative) {
-		RedlandNode *predicate = (aboutRelative || _aboutRelative) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#aboutRelative"] : nil;
-		if (_aboutRelative) {
-			[self.inModel removeSubmodel:_aboutRelative.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_aboutRelative = aboutRelative;
-		
-		if (_aboutRelative) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_aboutRelative.subject]];
-			[self.inModel addSubmodel:_aboutRelative.model];
-		}
-	}
+	[self setObject:aboutRelative forPredicate:SMFamilyHistoryObservationPredicate(0) cache:(id __strong *)&_aboutRelative];
 }
 
 @synthesize bday = _bday;
 
 - (NSString *)bday
 {
-	if (!_bday) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_bday = [rslt.object literalValue];
-	}
-	return _bday;
+	return [self literalForPredicate:SMFamilyHistoryObservationPredicate(1) cache:(id __strong *)&_bday];
 }
 
 - (void)setBday:(NSString *)bday
 {
-	if (bday != _bday) {
-		RedlandNode *predicate = (bday || _bday) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"] : nil;
-		if (_bday) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bday = [bday copy];
-		
-		if (_bday) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_bday nodeValue]]];
-		}
-	}
+	[self setLiteral:bday forPredicate:SMFamilyHistoryObservationPredicate(1) cache:(id __strong *)&_bday];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMFamilyHistoryObservationPredicate(2) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMFamilyHistoryObservationPredicate(2) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize deathdate = _deathdate;
 
 - (NSString *)deathdate
 {
-	if (!_deathdate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_deathdate = [rslt.object literalValue];
-	}
-	return _deathdate;
+	return [self literalForPredicate:SMFamilyHistoryObservationPredicate(3) cache:(id __strong *)&_deathdate];
 }
 
 - (void)setDeathdate:(NSString *)deathdate
 {
-	if (deathdate != _deathdate) {
-		RedlandNode *predicate = (deathdate || _deathdate) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"] : nil;
-		if (_deathdate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_deathdate = [deathdate copy];
-		
-		if (_deathdate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_deathdate nodeValue]]];
-		}
-	}
+	[self setLiteral:deathdate forPredicate:SMFamilyHistoryObservationPredicate(3) cache:(id __strong *)&_deathdate];
 }
 
 @synthesize hasProblem = _hasProblem;
 
 - (NSArray *)hasProblem
 {
-	if (!_hasProblem) {
-		
-		// get the "hasProblem" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasProblem"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_hasProblem = [arr copy];
-	}
-	return _hasProblem;
+	return [self objectsOfClass:[SMCodedValue class] forPredicate:SMFamilyHistoryObservationPredicate(4) cache:&_hasProblem];
 }
 
 - (void)setHasProblem:(NSArray *)hasProblem
 {
-	if (hasProblem != _hasProblem) {
-		RedlandNode *predicate = (hasProblem || _hasProblem) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasProblem"] : nil;
-		if (_hasProblem) {
-			for (SMCodedValue *item in _hasProblem) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:hasProblem forPredicate:SMFamilyHistoryObservationPredicate(4) cache:&_hasProblem];
+}
+
+@synthesize height = _height;
+
+- (SMVitalSign *)height
+{
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMFamilyHistoryObservationPredicate(5) cache:(id __strong *)&_height];
+}
+
+- (void)setHeight:(SMVitalSign *)height
+{
+	[self setObject:height forPredicate:SMFamilyHistoryObservationPredicate(5) cache:(id __strong *)&_height];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *aboutRelative = nil;
+	NSString *bday = nil;
+	SMMedicalRecord *belongsTo = nil;
+	NSString *deathdate = nil;
+	NSMutableArray *hasProblem = _hasProblem ? nil : [NSMutableArray array];
+	SMVitalSign *height = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMFamilyHistoryObservationPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!aboutRelative) {
+					aboutRelative = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!bday) {
+					bday = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 3:
+				if (!deathdate) {
+					deathdate = [rslt.object literalValue];
+				}
+				break;
+			case 4: {
+				SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[hasProblem addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			case 5:
+				if (!height) {
+					height = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_aboutRelative) {
+		_aboutRelative = aboutRelative ? aboutRelative : (id)[NSNull null];
+	}
+	if (!_bday) {
+		_bday = bday ? bday : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = deathdate ? deathdate : (id)[NSNull null];
+	}
+	if (!_hasProblem) {
 		_hasProblem = [hasProblem copy];
-		
-		if (_hasProblem) {
-			for (SMCodedValue *item in _hasProblem) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
+	}
+	if (!_height) {
+		_height = height ? height : (id)[NSNull null];
 	}
 }
 
-@synthesize height = _height;
 
-- (SMVitalSign *)height
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (!_height) {
-		
-		// get the "height" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_height = obj ? obj : (id)[NSNull null];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.aboutRelative forProperty:0];
+	[snapshot writeString:self.bday forProperty:1];
+	[snapshot writeObject:self.belongsTo forProperty:2];
+	[snapshot writeString:self.deathdate forProperty:3];
+	[snapshot writeObjects:self.hasProblem forProperty:4];
+	[snapshot writeObject:self.height forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_aboutRelative = [snapshot readObject];
+				break;
+			case 1:
+				_bday = [snapshot readString];
+				break;
+			case 2:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 3:
+				_deathdate = [snapshot readString];
+				break;
+			case 4:
+				_hasProblem = [snapshot readObjects];
+				break;
+			case 5:
+				_height = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
+		}
 	}
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _height) {
-		return nil;
+	if (!_aboutRelative) {
+		_aboutRelative = (id)[NSNull null];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_hasProblem) {
+		_hasProblem = @[];
+	}
+	if (!_height) {
+		_height = (id)[NSNull null];
 	}
-	
-	return _height;
 }
 
-- (void)setHeight:(SMVitalSign *)height
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
 {
-	if (height != _height) {
-		RedlandNode *predicate = (height || _height) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"] : nil;
-		if (_height) {
-			[self.inModel removeSubmodel:_height.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_height = height;
-		
-		if (_height) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_height.subject]];
-			[self.inModel addSubmodel:_height.model];
-		}
+	_aboutRelative = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#aboutRelative"]];
+	_bday = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#bday"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_deathdate = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#deathdate"]];
+	_hasProblem = [decoder objectsOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#hasProblem"]];
+	_height = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#height"]];
+	
+	if (!_aboutRelative) {
+		_aboutRelative = (id)[NSNull null];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_hasProblem) {
+		_hasProblem = @[];
+	}
+	if (!_height) {
+		_height = (id)[NSNull null];
 	}
 }
 
@@ -2,8 +2,8 @@
  SMFulfillment.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,62 @@
 
 #import "SMFulfillment.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMFulfillment, indexed like its sorted properties
+static RedlandNode *SMFulfillmentPredicates[8];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMFulfillmentPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMFulfillmentLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMFulfillmentPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMFulfillmentPredicates[1] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMFulfillmentPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dispenseDaysSupply"];
+		SMFulfillmentPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#medication"];
+		SMFulfillmentPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pbm"];
+		SMFulfillmentPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pharmacy"];
+		SMFulfillmentPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
+		SMFulfillmentPredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantityDispensed"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:8];
+		for (NSUInteger i = 0; i < 8; i++) {
+			indexes[[[SMFulfillmentPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMFulfillmentPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMFulfillmentPredicate(NSUInteger idx)
+{
+	SMFulfillmentLoadPredicates();
+	return SMFulfillmentPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMFulfillmentPredicateIndex(RedlandNode *predicate)
+{
+	SMFulfillmentLoadPredicates();
+	NSNumber *idx = SMFulfillmentPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMFulfillment
 
 
@@ -34,308 +86,315 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMFulfillmentPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMFulfillmentPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMFulfillmentPredicate(1) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMFulfillmentPredicate(1) cache:(id __strong *)&_date];
 }
 
 @synthesize dispenseDaysSupply = _dispenseDaysSupply;
 
 - (NSString *)dispenseDaysSupply
 {
-	if (!_dispenseDaysSupply) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dispenseDaysSupply"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_dispenseDaysSupply = [rslt.object literalValue];
-	}
-	return _dispenseDaysSupply;
+	return [self literalForPredicate:SMFulfillmentPredicate(2) cache:(id __strong *)&_dispenseDaysSupply];
 }
 
 - (void)setDispenseDaysSupply:(NSString *)dispenseDaysSupply
 {
-	if (dispenseDaysSupply != _dispenseDaysSupply) {
-		RedlandNode *predicate = (dispenseDaysSupply || _dispenseDaysSupply) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dispenseDaysSupply"] : nil;
-		if (_dispenseDaysSupply) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_dispenseDaysSupply = [dispenseDaysSupply copy];
-		
-		if (_dispenseDaysSupply) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_dispenseDaysSupply nodeValue]]];
-		}
-	}
+	[self setLiteral:dispenseDaysSupply forPredicate:SMFulfillmentPredicate(2) cache:(id __strong *)&_dispenseDaysSupply];
 }
 
 @synthesize medication = _medication;
 
 - (SMMedication *)medication
 {
-	if (!_medication) {
-		
-		// get the "medication" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#medication"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedication *obj = [SMMedication newWithSubject:rslt.object inModel:self.inModel];
-		_medication = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _medication) {
-		return nil;
-	}
-	
-	return _medication;
+	return [self objectOfClass:[SMMedication class] forPredicate:SMFulfillmentPredicate(3) cache:(id __strong *)&_medication];
 }
 
 - (void)setMedication:(SMMedication *)medication
 {
-	if (medication != _medication) {
-		RedlandNode *predicate = (medication || _medication) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#medication"] : nil;
-		if (_medication) {
-			[self.inModel removeSubmodel:_medication.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_medication = medication;
-		
-		if (_medication) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_medication.subject]];
-			[self.inModel addSubmodel:_medication.model];
-		}
-	}
+	[self setObject:medication forPredicate:SMFulfillmentPredicate(3) cache:(id __strong *)&_medication];
 }
 
 @synthesize pbm = _pbm;
 
 - (NSString *)pbm
 {
-	if (!_pbm) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pbm"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_pbm = [rslt.object literalValue];
-	}
-	return _pbm;
+	return [self literalForPredicate:SMFulfillmentPredicate(4) cache:(id __strong *)&_pbm];
 }
 
 - (void)setPbm:(NSString *)pbm
 {
-	if (pbm != _pbm) {
-		RedlandNode *predicate = (pbm || _pbm) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pbm"] : nil;
-		if (_pbm) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_pbm = [pbm copy];
-		
-		if (_pbm) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_pbm nodeValue]]];
-		}
-	}
+	[self setLiteral:pbm forPredicate:SMFulfillmentPredicate(4) cache:(id __strong *)&_pbm];
 }
 
 @synthesize pharmacy = _pharmacy;
 
 - (SMPharmacy *)pharmacy
 {
-	if (!_pharmacy) {
-		
-		// get the "pharmacy" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pharmacy"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMPharmacy *obj = [SMPharmacy newWithSubject:rslt.object inModel:self.inModel];
-		_pharmacy = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _pharmacy) {
-		return nil;
-	}
-	
-	return _pharmacy;
+	return [self objectOfClass:[SMPharmacy class] forPredicate:SMFulfillmentPredicate(5) cache:(id __strong *)&_pharmacy];
 }
 
 - (void)setPharmacy:(SMPharmacy *)pharmacy
 {
-	if (pharmacy != _pharmacy) {
-		RedlandNode *predicate = (pharmacy || _pharmacy) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#pharmacy"] : nil;
-		if (_pharmacy) {
-			[self.inModel removeSubmodel:_pharmacy.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_pharmacy = pharmacy;
-		
-		if (_pharmacy) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_pharmacy.subject]];
-			[self.inModel addSubmodel:_pharmacy.model];
-		}
-	}
+	[self setObject:pharmacy forPredicate:SMFulfillmentPredicate(5) cache:(id __strong *)&_pharmacy];
 }
 
 @synthesize provider = _provider;
 
 - (SMProvider *)provider
 {
-	if (!_provider) {
-		
-		// get the "provider" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMProvider *obj = [SMProvider newWithSubject:rslt.object inModel:self.inModel];
-		_provider = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _provider) {
-		return nil;
-	}
-	
-	return _provider;
+	return [self objectOfClass:[SMProvider class] forPredicate:SMFulfillmentPredicate(6) cache:(id __strong *)&_provider];
 }
 
 - (void)setProvider:(SMProvider *)provider
 {
-	if (provider != _provider) {
-		RedlandNode *predicate = (provider || _provider) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"] : nil;
-		if (_provider) {
-			[self.inModel removeSubmodel:_provider.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_provider = provider;
-		
-		if (_provider) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_provider.subject]];
-			[self.inModel addSubmodel:_provider.model];
-		}
-	}
+	[self setObject:provider forPredicate:SMFulfillmentPredicate(6) cache:(id __strong *)&_provider];
 }
 
 @synthesize quantityDispensed = _quantityDispensed;
 
 - (SMValueAndUnit *)quantityDispensed
 {
-	if (!_quantityDispensed) {
-		
-		// get the "quantityDispensed" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantityDispensed"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_quantityDispensed = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMFulfillmentPredicate(7) cache:(id __strong *)&_quantityDispensed];
+}
+
+- (void)setQuantityDispensed:(SMValueAndUnit *)quantityDispensed
+{
+	[self setObject:quantityDispensed forPredicate:SMFulfillmentPredicate(7) cache:(id __strong *)&_quantityDispensed];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	NSString *dispenseDaysSupply = nil;
+	SMMedication *medication = nil;
+	NSString *pbm = nil;
+	SMPharmacy *pharmacy = nil;
+	SMProvider *provider = nil;
+	SMValueAndUnit *quantityDispensed = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _quantityDispensed) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMFulfillmentPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!dispenseDaysSupply) {
+					dispenseDaysSupply = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!medication) {
+					medication = [SMMedication newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4:
+				if (!pbm) {
+					pbm = [rslt.object literalValue];
+				}
+				break;
+			case 5:
+				if (!pharmacy) {
+					pharmacy = [SMPharmacy newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 6:
+				if (!provider) {
+					provider = [SMProvider newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 7:
+				if (!quantityDispensed) {
+					quantityDispensed = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _quantityDispensed;
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_dispenseDaysSupply) {
+		_dispenseDaysSupply = dispenseDaysSupply ? dispenseDaysSupply : (id)[NSNull null];
+	}
+	if (!_medication) {
+		_medication = medication ? medication : (id)[NSNull null];
+	}
+	if (!_pbm) {
+		_pbm = pbm ? pbm : (id)[NSNull null];
+	}
+	if (!_pharmacy) {
+		_pharmacy = pharmacy ? pharmacy : (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = provider ? provider : (id)[NSNull null];
+	}
+	if (!_quantityDispensed) {
+		_quantityDispensed = quantityDispensed ? quantityDispensed : (id)[NSNull null];
+	}
 }
 
-- (void)setQuantityDispensed:(SMValueAndUnit *)quantityDispensed
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (quantityDispensed != _quantityDispensed) {
-		RedlandNode *predicate = (quantityDispensed || _quantityDispensed) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantityDispensed"] : nil;
-		if (_quantityDispensed) {
-			[self.inModel removeSubmodel:_quantityDispensed.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_quantityDispensed = quantityDispensed;
-		
-		if (_quantityDispensed) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_quantityDispensed.subject]];
-			[self.inModel addSubmodel:_quantityDispensed.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeString:self.date forProperty:1];
+	[snapshot writeString:self.dispenseDaysSupply forProperty:2];
+	[snapshot writeObject:self.medication forProperty:3];
+	[snapshot writeString:self.pbm forProperty:4];
+	[snapshot writeObject:self.pharmacy forProperty:5];
+	[snapshot writeObject:self.provider forProperty:6];
+	[snapshot writeObject:self.quantityDispensed forProperty:7];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_date = [snapshot readString];
+				break;
+			case 2:
+				_dispenseDaysSupply = [snapshot readString];
+				break;
+			case 3:
+				_medication = [snapshot readObject];
+				break;
+			case 4:
+				_pbm = [snapshot readString];
+				break;
+			case 5:
+				_pharmacy = [snapshot readObject];
+				break;
+			case 6:
+				_provider = [snapshot readObject];
+				break;
+			case 7:
+				_quantityDispensed = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_dispenseDaysSupply) {
+		_dispenseDaysSupply = (id)[NSNull null];
+	}
+	if (!_medication) {
+		_medication = (id)[NSNull null];
+	}
+	if (!_pbm) {
+		_pbm = (id)[NSNull null];
+	}
+	if (!_pharmacy) {
+		_pharmacy = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_quantityDispensed) {
+		_quantityDispensed = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_dispenseDaysSupply = [decoder stringFrom:values[@"http://smartplatforms.org/terms#dispenseDaysSupply"]];
+	_medication = [decoder objectOfClass:[SMMedication class] from:values[@"http://smartplatforms.org/terms#medication"]];
+	_pbm = [decoder stringFrom:values[@"http://smartplatforms.org/terms#pbm"]];
+	_pharmacy = [decoder objectOfClass:[SMPharmacy class] from:values[@"http://smartplatforms.org/terms#pharmacy"]];
+	_provider = [decoder objectOfClass:[SMProvider class] from:values[@"http://smartplatforms.org/terms#provider"]];
+	_quantityDispensed = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#quantityDispensed"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_dispenseDaysSupply) {
+		_dispenseDaysSupply = (id)[NSNull null];
+	}
+	if (!_medication) {
+		_medication = (id)[NSNull null];
+	}
+	if (!_pbm) {
+		_pbm = (id)[NSNull null];
+	}
+	if (!_pharmacy) {
+		_pharmacy = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_quantityDispensed) {
+		_quantityDispensed = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMHash.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,56 @@
 
 #import "SMHash.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMHash, indexed like its sorted properties
+static RedlandNode *SMHashPredicates[2];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMHashPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMHashLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMHashPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#algorithm"];
+		SMHashPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:2];
+		for (NSUInteger i = 0; i < 2; i++) {
+			indexes[[[SMHashPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMHashPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMHashPredicate(NSUInteger idx)
+{
+	SMHashLoadPredicates();
+	return SMHashPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMHashPredicateIndex(RedlandNode *predicate)
+{
+	SMHashLoadPredicates();
+	NSNumber *idx = SMHashPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMHash
 
 
@@ -34,62 +80,123 @@
 
 - (NSString *)algorithm
 {
-	if (!_algorithm) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#algorithm"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_algorithm = [rslt.object literalValue];
-	}
-	return _algorithm;
+	return [self literalForPredicate:SMHashPredicate(0) cache:(id __strong *)&_algorithm];
 }
 
 - (void)setAlgorithm:(NSString *)algorithm
 {
-	if (algorithm != _algorithm) {
-		RedlandNode *predicate = (algorithm || _algorithm) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#algorithm"] : nil;
-		if (_algorithm) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_algorithm = [algorithm copy];
-		
-		if (_algorithm) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_algorithm nodeValue]]];
-		}
-	}
+	[self setLiteral:algorithm forPredicate:SMHashPredicate(0) cache:(id __strong *)&_algorithm];
 }
 
 @synthesize value = _value;
 
 - (NSString *)value
 {
-	if (!_value) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_value = [rslt.object literalValue];
-	}
-	return _value;
+	return [self literalForPredicate:SMHashPredicate(1) cache:(id __strong *)&_value];
 }
 
 - (void)setValue:(NSString *)value
 {
-	if (value != _value) {
-		RedlandNode *predicate = (value || _value) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"] : nil;
-		if (_value) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:value forPredicate:SMHashPredicate(1) cache:(id __strong *)&_value];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *algorithm = nil;
+	NSString *value = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMHashPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!algorithm) {
+					algorithm = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!value) {
+					value = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_value = [value copy];
-		
-		if (_value) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_value nodeValue]]];
+	}
+	
+	if (!_algorithm) {
+		_algorithm = algorithm ? algorithm : (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = value ? value : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeString:self.algorithm forProperty:0];
+	[snapshot writeString:self.value forProperty:1];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_algorithm = [snapshot readString];
+				break;
+			case 1:
+				_value = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_algorithm) {
+		_algorithm = (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_algorithm = [decoder stringFrom:values[@"http://smartplatforms.org/terms#algorithm"]];
+	_value = [decoder stringFrom:values[@"http://smartplatforms.org/terms#value"]];
+	
+	if (!_algorithm) {
+		_algorithm = (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMImagesList.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,6 +22,8 @@
 
 #import "SMImagesList.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
@@ -2,8 +2,8 @@
  SMImagingStudy.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMImagingStudy.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMImagingStudy, indexed like its sorted properties
+static RedlandNode *SMImagingStudyPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMImagingStudyPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMImagingStudyLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMImagingStudyPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"];
+		SMImagingStudyPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMImagingStudyPredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMImagingStudyPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"];
+		SMImagingStudyPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#series"];
+		SMImagingStudyPredicates[5] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMImagingStudyPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMImagingStudyPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMImagingStudyPredicate(NSUInteger idx)
+{
+	SMImagingStudyLoadPredicates();
+	return SMImagingStudyPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMImagingStudyPredicateIndex(RedlandNode *predicate)
+{
+	SMImagingStudyLoadPredicates();
+	NSNumber *idx = SMImagingStudyPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMImagingStudy
 
 
@@ -34,233 +84,254 @@
 
 - (NSString *)accessionNumber
 {
-	if (!_accessionNumber) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_accessionNumber = [rslt.object literalValue];
-	}
-	return _accessionNumber;
+	return [self literalForPredicate:SMImagingStudyPredicate(0) cache:(id __strong *)&_accessionNumber];
 }
 
 - (void)setAccessionNumber:(NSString *)accessionNumber
 {
-	if (accessionNumber != _accessionNumber) {
-		RedlandNode *predicate = (accessionNumber || _accessionNumber) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"] : nil;
-		if (_accessionNumber) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_accessionNumber = [accessionNumber copy];
-		
-		if (_accessionNumber) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_accessionNumber nodeValue]]];
-		}
-	}
+	[self setLiteral:accessionNumber forPredicate:SMImagingStudyPredicate(0) cache:(id __strong *)&_accessionNumber];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMImagingStudyPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMImagingStudyPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMImagingStudyPredicate(2) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMImagingStudyPredicate(2) cache:(id __strong *)&_date];
 }
 
 @synthesize modality = _modality;
 
 - (NSArray *)modality
 {
-	if (!_modality) {
-		
-		// get the "modality" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_modality = [arr copy];
-	}
-	return _modality;
+	return [self objectsOfClass:[SMCodedValue class] forPredicate:SMImagingStudyPredicate(3) cache:&_modality];
 }
 
 - (void)setModality:(NSArray *)modality
 {
-	if (modality != _modality) {
-		RedlandNode *predicate = (modality || _modality) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"] : nil;
-		if (_modality) {
-			for (SMCodedValue *item in _modality) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_modality = [modality copy];
-		
-		if (_modality) {
-			for (SMCodedValue *item in _modality) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:modality forPredicate:SMImagingStudyPredicate(3) cache:&_modality];
 }
 
 @synthesize series = _series;
 
 - (NSArray *)series
 {
-	if (!_series) {
-		
-		// get the "series" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#series"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMSeries *newItem = [SMSeries newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_series = [arr copy];
-	}
-	return _series;
+	return [self objectsOfClass:[SMSeries class] forPredicate:SMImagingStudyPredicate(4) cache:&_series];
 }
 
 - (void)setSeries:(NSArray *)series
 {
-	if (series != _series) {
-		RedlandNode *predicate = (series || _series) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#series"] : nil;
-		if (_series) {
-			for (SMSeries *item in _series) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:series forPredicate:SMImagingStudyPredicate(4) cache:&_series];
+}
+
+@synthesize title = _title;
+
+- (NSString *)title
+{
+	return [self literalForPredicate:SMImagingStudyPredicate(5) cache:(id __strong *)&_title];
+}
+
+- (void)setTitle:(NSString *)title
+{
+	[self setLiteral:title forPredicate:SMImagingStudyPredicate(5) cache:(id __strong *)&_title];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *accessionNumber = nil;
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	NSMutableArray *modality = _modality ? nil : [NSMutableArray array];
+	NSMutableArray *series = _series ? nil : [NSMutableArray array];
+	NSString *title = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMImagingStudyPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!accessionNumber) {
+					accessionNumber = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 3: {
+				SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[modality addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_series = [series copy];
-		
-		if (_series) {
-			for (SMSeries *item in _series) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
+			case 4: {
+				SMSeries *newItem = [SMSeries newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[series addObject:newItem];
+				}
+				break;
 			}
+			case 5:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
 	}
+	
+	if (!_accessionNumber) {
+		_accessionNumber = accessionNumber ? accessionNumber : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_modality) {
+		_modality = [modality copy];
+	}
+	if (!_series) {
+		_series = [series copy];
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
+	}
 }
 
-@synthesize title = _title;
 
-- (NSString *)title
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
+	[self hydrateAllProperties];
+	[snapshot writeString:self.accessionNumber forProperty:0];
+	[snapshot writeObject:self.belongsTo forProperty:1];
+	[snapshot writeString:self.date forProperty:2];
+	[snapshot writeObjects:self.modality forProperty:3];
+	[snapshot writeObjects:self.series forProperty:4];
+	[snapshot writeString:self.title forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_accessionNumber = [snapshot readString];
+				break;
+			case 1:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 2:
+				_date = [snapshot readString];
+				break;
+			case 3:
+				_modality = [snapshot readObjects];
+				break;
+			case 4:
+				_series = [snapshot readObjects];
+				break;
+			case 5:
+				_title = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
+		}
+	}
+	
+	if (!_accessionNumber) {
+		_accessionNumber = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_modality) {
+		_modality = @[];
+	}
+	if (!_series) {
+		_series = @[];
+	}
 	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
+		_title = (id)[NSNull null];
 	}
-	return _title;
 }
 
-- (void)setTitle:(NSString *)title
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
-		}
+	_accessionNumber = [decoder stringFrom:values[@"http://smartplatforms.org/terms#accessionNumber"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_modality = [decoder objectsOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#modality"]];
+	_series = [decoder objectsOfClass:[SMSeries class] from:values[@"http://smartplatforms.org/terms#series"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	
+	if (!_accessionNumber) {
+		_accessionNumber = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_modality) {
+		_modality = @[];
+	}
+	if (!_series) {
+		_series = @[];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
 	}
 }
 
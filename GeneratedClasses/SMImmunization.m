@@ -2,8 +2,8 @@
  SMImmunization.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMImmunization.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMImmunization, indexed like its sorted properties
+static RedlandNode *SMImmunizationPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMImmunizationPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMImmunizationLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMImmunizationPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#administrationStatus"];
+		SMImmunizationPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMImmunizationPredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMImmunizationPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productClass"];
+		SMImmunizationPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productName"];
+		SMImmunizationPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#refusalReason"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMImmunizationPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMImmunizationPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMImmunizationPredicate(NSUInteger idx)
+{
+	SMImmunizationLoadPredicates();
+	return SMImmunizationPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMImmunizationPredicateIndex(RedlandNode *predicate)
+{
+	SMImmunizationLoadPredicates();
+	NSNumber *idx = SMImmunizationPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMImmunization
 
 
@@ -34,252 +84,253 @@
 
 - (SMCodedValue *)administrationStatus
 {
-	if (!_administrationStatus) {
-		
-		// get the "administrationStatus" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#administrationStatus"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_administrationStatus = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _administrationStatus) {
-		return nil;
-	}
-	
-	return _administrationStatus;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMImmunizationPredicate(0) cache:(id __strong *)&_administrationStatus];
 }
 
 - (void)setAdministrationStatus:(SMCodedValue *)administrationStatus
 {
-	if (administrationStatus != _administrationStatus) {
-		RedlandNode *predicate = (administrationStatus || _administrationStatus) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#administrationStatus"] : nil;
-		if (_administrationStatus) {
-			[self.inModel removeSubmodel:_administrationStatus.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_administrationStatus = administrationStatus;
-		
-		if (_administrationStatus) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_administrationStatus.subject]];
-			[self.inModel addSubmodel:_administrationStatus.model];
-		}
-	}
+	[self setObject:administrationStatus forPredicate:SMImmunizationPredicate(0) cache:(id __strong *)&_administrationStatus];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMImmunizationPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMImmunizationPredicate(1) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMImmunizationPredicate(2) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMImmunizationPredicate(2) cache:(id __strong *)&_date];
 }
 
 @synthesize productClass = _productClass;
 
 - (NSArray *)productClass
 {
-	if (!_productClass) {
-		
-		// get the "productClass" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productClass"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_productClass = [arr copy];
-	}
-	return _productClass;
+	return [self objectsOfClass:[SMCodedValue class] forPredicate:SMImmunizationPredicate(3) cache:&_productClass];
 }
 
 - (void)setProductClass:(NSArray *)productClass
 {
-	if (productClass != _productClass) {
-		RedlandNode *predicate = (productClass || _productClass) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productClass"] : nil;
-		if (_productClass) {
-			for (SMCodedValue *item in _productClass) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_productClass = [productClass copy];
-		
-		if (_productClass) {
-			for (SMCodedValue *item in _productClass) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:productClass forPredicate:SMImmunizationPredicate(3) cache:&_productClass];
 }
 
 @synthesize productName = _productName;
 
 - (SMCodedValue *)productName
 {
-	if (!_productName) {
-		
-		// get the "productName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_productName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _productName) {
-		return nil;
-	}
-	
-	return _productName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMImmunizationPredicate(4) cache:(id __strong *)&_productName];
 }
 
 - (void)setProductName:(SMCodedValue *)productName
 {
-	if (productName != _productName) {
-		RedlandNode *predicate = (productName || _productName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#productName"] : nil;
-		if (_productName) {
-			[self.inModel removeSubmodel:_productName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_productName = productName;
-		
-		if (_productName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_productName.subject]];
-			[self.inModel addSubmodel:_productName.model];
-		}
-	}
+	[self setObject:productName forPredicate:SMImmunizationPredicate(4) cache:(id __strong *)&_productName];
 }
 
 @synthesize refusalReason = _refusalReason;
 
 - (SMCodedValue *)refusalReason
 {
-	if (!_refusalReason) {
-		
-		// get the "refusalReason" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#refusalReason"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_refusalReason = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMImmunizationPredicate(5) cache:(id __strong *)&_refusalReason];
+}
+
+- (void)setRefusalReason:(SMCodedValue *)refusalReason
+{
+	[self setObject:refusalReason forPredicate:SMImmunizationPredicate(5) cache:(id __strong *)&_refusalReason];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *administrationStatus = nil;
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	NSMutableArray *productClass = _productClass ? nil : [NSMutableArray array];
+	SMCodedValue *productName = nil;
+	SMCodedValue *refusalReason = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _refusalReason) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMImmunizationPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!administrationStatus) {
+					administrationStatus = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 3: {
+				SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[productClass addObject:newItem];
+				}
+				break;
+			}
+			case 4:
+				if (!productName) {
+					productName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!refusalReason) {
+					refusalReason = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _refusalReason;
+	if (!_administrationStatus) {
+		_administrationStatus = administrationStatus ? administrationStatus : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_productClass) {
+		_productClass = [productClass copy];
+	}
+	if (!_productName) {
+		_productName = productName ? productName : (id)[NSNull null];
+	}
+	if (!_refusalReason) {
+		_refusalReason = refusalReason ? refusalReason : (id)[NSNull null];
+	}
 }
 
-- (void)setRefusalReason:(SMCodedValue *)refusalReason
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (refusalReason != _refusalReason) {
-		RedlandNode *predicate = (refusalReason || _refusalReason) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#refusalReason"] : nil;
-		if (_refusalReason) {
-			[self.inModel removeSubmodel:_refusalReason.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_refusalReason = refusalReason;
-		
-		if (_refusalReason) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_refusalReason.subject]];
-			[self.inModel addSubmodel:_refusalReason.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.administrationStatus forProperty:0];
+	[snapshot writeObject:self.belongsTo forProperty:1];
+	[snapshot writeString:self.date forProperty:2];
+	[snapshot writeObjects:self.productClass forProperty:3];
+	[snapshot writeObject:self.productName forProperty:4];
+	[snapshot writeObject:self.refusalReason forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_administrationStatus = [snapshot readObject];
+				break;
+			case 1:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 2:
+				_date = [snapshot readString];
+				break;
+			case 3:
+				_productClass = [snapshot readObjects];
+				break;
+			case 4:
+				_productName = [snapshot readObject];
+				break;
+			case 5:
+				_refusalReason = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_administrationStatus) {
+		_administrationStatus = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_productClass) {
+		_productClass = @[];
+	}
+	if (!_productName) {
+		_productName = (id)[NSNull null];
+	}
+	if (!_refusalReason) {
+		_refusalReason = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_administrationStatus = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#administrationStatus"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_productClass = [decoder objectsOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#productClass"]];
+	_productName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#productName"]];
+	_refusalReason = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#refusalReason"]];
+	
+	if (!_administrationStatus) {
+		_administrationStatus = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_productClass) {
+		_productClass = @[];
+	}
+	if (!_productName) {
+		_productName = (id)[NSNull null];
+	}
+	if (!_refusalReason) {
+		_refusalReason = (id)[NSNull null];
+	}
 }
 
 
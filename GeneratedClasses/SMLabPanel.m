@@ -2,8 +2,8 @@
  SMLabPanel.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMLabPanel.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMLabPanel, indexed like its sorted properties
+static RedlandNode *SMLabPanelPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMLabPanelPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMLabPanelLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMLabPanelPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMLabPanelPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"];
+		SMLabPanelPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labResult"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMLabPanelPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMLabPanelPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMLabPanelPredicate(NSUInteger idx)
+{
+	SMLabPanelLoadPredicates();
+	return SMLabPanelPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMLabPanelPredicateIndex(RedlandNode *predicate)
+{
+	SMLabPanelLoadPredicates();
+	NSNumber *idx = SMLabPanelPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMLabPanel
 
 
@@ -34,135 +81,157 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMLabPanelPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMLabPanelPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize labName = _labName;
 
 - (SMCodedValue *)labName
 {
-	if (!_labName) {
-		
-		// get the "labName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_labName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _labName) {
-		return nil;
-	}
-	
-	return _labName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMLabPanelPredicate(1) cache:(id __strong *)&_labName];
 }
 
 - (void)setLabName:(SMCodedValue *)labName
 {
-	if (labName != _labName) {
-		RedlandNode *predicate = (labName || _labName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"] : nil;
-		if (_labName) {
-			[self.inModel removeSubmodel:_labName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_labName = labName;
-		
-		if (_labName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_labName.subject]];
-			[self.inModel addSubmodel:_labName.model];
-		}
-	}
+	[self setObject:labName forPredicate:SMLabPanelPredicate(1) cache:(id __strong *)&_labName];
 }
 
 @synthesize labResult = _labResult;
 
 - (NSArray *)labResult
 {
-	if (!_labResult) {
-		
-		// get the "labResult" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labResult"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMLabResult *newItem = [SMLabResult newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_labResult = [arr copy];
-	}
-	return _labResult;
+	return [self objectsOfClass:[SMLabResult class] forPredicate:SMLabPanelPredicate(2) cache:&_labResult];
 }
 
 - (void)setLabResult:(NSArray *)labResult
 {
-	if (labResult != _labResult) {
-		RedlandNode *predicate = (labResult || _labResult) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labResult"] : nil;
-		if (_labResult) {
-			for (SMLabResult *item in _labResult) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:labResult forPredicate:SMLabPanelPredicate(2) cache:&_labResult];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	SMCodedValue *labName = nil;
+	NSMutableArray *labResult = _labResult ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMLabPanelPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!labName) {
+					labName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2: {
+				SMLabResult *newItem = [SMLabResult newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[labResult addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = labName ? labName : (id)[NSNull null];
+	}
+	if (!_labResult) {
 		_labResult = [labResult copy];
-		
-		if (_labResult) {
-			for (SMLabResult *item in _labResult) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeObject:self.labName forProperty:1];
+	[snapshot writeObjects:self.labResult forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_labName = [snapshot readObject];
+				break;
+			case 2:
+				_labResult = [snapshot readObjects];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = (id)[NSNull null];
+	}
+	if (!_labResult) {
+		_labResult = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_labName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#labName"]];
+	_labResult = [decoder objectsOfClass:[SMLabResult class] from:values[@"http://smartplatforms.org/terms#labResult"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = (id)[NSNull null];
+	}
+	if (!_labResult) {
+		_labResult = @[];
+	}
 }
 
 
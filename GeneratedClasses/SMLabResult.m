@@ -2,8 +2,8 @@
  SMLabResult.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,63 @@
 
 #import "SMLabResult.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMLabResult, indexed like its sorted properties
+static RedlandNode *SMLabResultPredicates[9];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMLabResultPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMLabResultLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMLabResultPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#abnormalInterpretation"];
+		SMLabResultPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"];
+		SMLabResultPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMLabResultPredicates[3] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMLabResultPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"];
+		SMLabResultPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labStatus"];
+		SMLabResultPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#narrativeResult"];
+		SMLabResultPredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
+		SMLabResultPredicates[8] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantitativeResult"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:9];
+		for (NSUInteger i = 0; i < 9; i++) {
+			indexes[[[SMLabResultPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMLabResultPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMLabResultPredicate(NSUInteger idx)
+{
+	SMLabResultLoadPredicates();
+	return SMLabResultPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMLabResultPredicateIndex(RedlandNode *predicate)
+{
+	SMLabResultLoadPredicates();
+	NSNumber *idx = SMLabResultPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMLabResult
 
 
@@ -34,351 +87,347 @@
 
 - (SMCodedValue *)abnormalInterpretation
 {
-	if (!_abnormalInterpretation) {
-		
-		// get the "abnormalInterpretation" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#abnormalInterpretation"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_abnormalInterpretation = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _abnormalInterpretation) {
-		return nil;
-	}
-	
-	return _abnormalInterpretation;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMLabResultPredicate(0) cache:(id __strong *)&_abnormalInterpretation];
 }
 
 - (void)setAbnormalInterpretation:(SMCodedValue *)abnormalInterpretation
 {
-	if (abnormalInterpretation != _abnormalInterpretation) {
-		RedlandNode *predicate = (abnormalInterpretation || _abnormalInterpretation) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#abnormalInterpretation"] : nil;
-		if (_abnormalInterpretation) {
-			[self.inModel removeSubmodel:_abnormalInterpretation.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_abnormalInterpretation = abnormalInterpretation;
-		
-		if (_abnormalInterpretation) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_abnormalInterpretation.subject]];
-			[self.inModel addSubmodel:_abnormalInterpretation.model];
-		}
-	}
+	[self setObject:abnormalInterpretation forPredicate:SMLabResultPredicate(0) cache:(id __strong *)&_abnormalInterpretation];
 }
 
 @synthesize accessionNumber = _accessionNumber;
 
 - (NSString *)accessionNumber
 {
-	if (!_accessionNumber) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_accessionNumber = [rslt.object literalValue];
-	}
-	return _accessionNumber;
+	return [self literalForPredicate:SMLabResultPredicate(1) cache:(id __strong *)&_accessionNumber];
 }
 
 - (void)setAccessionNumber:(NSString *)accessionNumber
 {
-	if (accessionNumber != _accessionNumber) {
-		RedlandNode *predicate = (accessionNumber || _accessionNumber) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#accessionNumber"] : nil;
-		if (_accessionNumber) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_accessionNumber = [accessionNumber copy];
-		
-		if (_accessionNumber) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_accessionNumber nodeValue]]];
-		}
-	}
+	[self setLiteral:accessionNumber forPredicate:SMLabResultPredicate(1) cache:(id __strong *)&_accessionNumber];
 }
 
 @synthesize belongsTo = _belongsTo;
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMLabResultPredicate(2) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMLabResultPredicate(2) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMLabResultPredicate(3) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMLabResultPredicate(3) cache:(id __strong *)&_date];
 }
 
 @synthesize labName = _labName;
 
 - (SMCodedValue *)labName
 {
-	if (!_labName) {
-		
-		// get the "labName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_labName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _labName) {
-		return nil;
-	}
-	
-	return _labName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMLabResultPredicate(4) cache:(id __strong *)&_labName];
 }
 
 - (void)setLabName:(SMCodedValue *)labName
 {
-	if (labName != _labName) {
-		RedlandNode *predicate = (labName || _labName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labName"] : nil;
-		if (_labName) {
-			[self.inModel removeSubmodel:_labName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_labName = labName;
-		
-		if (_labName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_labName.subject]];
-			[self.inModel addSubmodel:_labName.model];
-		}
-	}
+	[self setObject:labName forPredicate:SMLabResultPredicate(4) cache:(id __strong *)&_labName];
 }
 
 @synthesize labStatus = _labStatus;
 
 - (SMCodedValue *)labStatus
 {
-	if (!_labStatus) {
-		
-		// get the "labStatus" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labStatus"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_labStatus = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _labStatus) {
-		return nil;
-	}
-	
-	return _labStatus;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMLabResultPredicate(5) cache:(id __strong *)&_labStatus];
 }
 
 - (void)setLabStatus:(SMCodedValue *)labStatus
 {
-	if (labStatus != _labStatus) {
-		RedlandNode *predicate = (labStatus || _labStatus) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#labStatus"] : nil;
-		if (_labStatus) {
-			[self.inModel removeSubmodel:_labStatus.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_labStatus = labStatus;
-		
-		if (_labStatus) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_labStatus.subject]];
-			[self.inModel addSubmodel:_labStatus.model];
-		}
-	}
+	[self setObject:labStatus forPredicate:SMLabResultPredicate(5) cache:(id __strong *)&_labStatus];
 }
 
 @synthesize narrativeResult = _narrativeResult;
 
 - (SMNarrativeResult *)narrativeResult
 {
-	if (!_narrativeResult) {
-		
-		// get the "narrativeResult" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#narrativeResult"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMNarrativeResult *obj = [SMNarrativeResult newWithSubject:rslt.object inModel:self.inModel];
-		_narrativeResult = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _narrativeResult) {
-		return nil;
-	}
-	
-	return _narrativeResult;
+	return [self objectOfClass:[SMNarrativeResult class] forPredicate:SMLabResultPredicate(6) cache:(id __strong *)&_narrativeResult];
 }
 
 - (void)setNarrativeResult:(SMNarrativeResult *)narrativeResult
 {
-	if (narrativeResult != _narrativeResult) {
-		RedlandNode *predicate = (narrativeResult || _narrativeResult) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#narrativeResult"] : nil;
-		if (_narrativeResult) {
-			[self.inModel removeSubmodel:_narrativeResult.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_narrativeResult = narrativeResult;
-		
-		if (_narrativeResult) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_narrativeResult.subject]];
-			[self.inModel addSubmodel:_narrativeResult.model];
-		}
-	}
+	[self setObject:narrativeResult forPredicate:SMLabResultPredicate(6) cache:(id __strong *)&_narrativeResult];
 }
 
 @synthesize notes = _notes;
 
 - (NSString *)notes
 {
-	if (!_notes) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_notes = [rslt.object literalValue];
-	}
-	return _notes;
+	return [self literalForPredicate:SMLabResultPredicate(7) cache:(id __strong *)&_notes];
 }
 
 - (void)setNotes:(NSString *)notes
 {
-	if (notes != _notes) {
-		RedlandNode *predicate = (notes || _notes) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"] : nil;
-		if (_notes) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_notes = [notes copy];
-		
-		if (_notes) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_notes nodeValue]]];
-		}
-	}
+	[self setLiteral:notes forPredicate:SMLabResultPredicate(7) cache:(id __strong *)&_notes];
 }
 
 @synthesize quantitativeResult = _quantitativeResult;
 
 - (SMQuantitativeResult *)quantitativeResult
 {
-	if (!_quantitativeResult) {
-		
-		// get the "quantitativeResult" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantitativeResult"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMQuantitativeResult *obj = [SMQuantitativeResult newWithSubject:rslt.object inModel:self.inModel];
-		_quantitativeResult = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMQuantitativeResult class] forPredicate:SMLabResultPredicate(8) cache:(id __strong *)&_quantitativeResult];
+}
+
+- (void)setQuantitativeResult:(SMQuantitativeResult *)quantitativeResult
+{
+	[self setObject:quantitativeResult forPredicate:SMLabResultPredicate(8) cache:(id __strong *)&_quantitativeResult];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMCodedValue *abnormalInterpretation = nil;
+	NSString *accessionNumber = nil;
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	SMCodedValue *labName = nil;
+	SMCodedValue *labStatus = nil;
+	SMNarrativeResult *narrativeResult = nil;
+	NSString *notes = nil;
+	SMQuantitativeResult *quantitativeResult = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _quantitativeResult) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMLabResultPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!abnormalInterpretation) {
+					abnormalInterpretation = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!accessionNumber) {
+					accessionNumber = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 3:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 4:
+				if (!labName) {
+					labName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!labStatus) {
+					labStatus = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 6:
+				if (!narrativeResult) {
+					narrativeResult = [SMNarrativeResult newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 7:
+				if (!notes) {
+					notes = [rslt.object literalValue];
+				}
+				break;
+			case 8:
+				if (!quantitativeResult) {
+					quantitativeResult = [SMQuantitativeResult newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _quantitativeResult;
+	if (!_abnormalInterpretation) {
+		_abnormalInterpretation = abnormalInterpretation ? abnormalInterpretation : (id)[NSNull null];
+	}
+	if (!_accessionNumber) {
+		_accessionNumber = accessionNumber ? accessionNumber : (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = labName ? labName : (id)[NSNull null];
+	}
+	if (!_labStatus) {
+		_labStatus = labStatus ? labStatus : (id)[NSNull null];
+	}
+	if (!_narrativeResult) {
+		_narrativeResult = narrativeResult ? narrativeResult : (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = notes ? notes : (id)[NSNull null];
+	}
+	if (!_quantitativeResult) {
+		_quantitativeResult = quantitativeResult ? quantitativeResult : (id)[NSNull null];
+	}
 }
 
-- (void)setQuantitativeResult:(SMQuantitativeResult *)quantitativeResult
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (quantitativeResult != _quantitativeResult) {
-		RedlandNode *predicate = (quantitativeResult || _quantitativeResult) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantitativeResult"] : nil;
-		if (_quantitativeResult) {
-			[self.inModel removeSubmodel:_quantitativeResult.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_quantitativeResult = quantitativeResult;
-		
-		if (_quantitativeResult) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_quantitativeResult.subject]];
-			[self.inModel addSubmodel:_quantitativeResult.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.abnormalInterpretation forProperty:0];
+	[snapshot writeString:self.accessionNumber forProperty:1];
+	[snapshot writeObject:self.belongsTo forProperty:2];
+	[snapshot writeString:self.date forProperty:3];
+	[snapshot writeObject:self.labName forProperty:4];
+	[snapshot writeObject:self.labStatus forProperty:5];
+	[snapshot writeObject:self.narrativeResult forProperty:6];
+	[snapshot writeString:self.notes forProperty:7];
+	[snapshot writeObject:self.quantitativeResult forProperty:8];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_abnormalInterpretation = [snapshot readObject];
+				break;
+			case 1:
+				_accessionNumber = [snapshot readString];
+				break;
+			case 2:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 3:
+				_date = [snapshot readString];
+				break;
+			case 4:
+				_labName = [snapshot readObject];
+				break;
+			case 5:
+				_labStatus = [snapshot readObject];
+				break;
+			case 6:
+				_narrativeResult = [snapshot readObject];
+				break;
+			case 7:
+				_notes = [snapshot readString];
+				break;
+			case 8:
+				_quantitativeResult = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_abnormalInterpretation) {
+		_abnormalInterpretation = (id)[NSNull null];
+	}
+	if (!_accessionNumber) {
+		_accessionNumber = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = (id)[NSNull null];
+	}
+	if (!_labStatus) {
+		_labStatus = (id)[NSNull null];
+	}
+	if (!_narrativeResult) {
+		_narrativeResult = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_quantitativeResult) {
+		_quantitativeResult = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_abnormalInterpretation = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#abnormalInterpretation"]];
+	_accessionNumber = [decoder stringFrom:values[@"http://smartplatforms.org/terms#accessionNumber"]];
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_labName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#labName"]];
+	_labStatus = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#labStatus"]];
+	_narrativeResult = [decoder objectOfClass:[SMNarrativeResult class] from:values[@"http://smartplatforms.org/terms#narrativeResult"]];
+	_notes = [decoder stringFrom:values[@"http://smartplatforms.org/terms#notes"]];
+	_quantitativeResult = [decoder objectOfClass:[SMQuantitativeResult class] from:values[@"http://smartplatforms.org/terms#quantitativeResult"]];
+	
+	if (!_abnormalInterpretation) {
+		_abnormalInterpretation = (id)[NSNull null];
+	}
+	if (!_accessionNumber) {
+		_accessionNumber = (id)[NSNull null];
+	}
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_labName) {
+		_labName = (id)[NSNull null];
+	}
+	if (!_labStatus) {
+		_labStatus = (id)[NSNull null];
+	}
+	if (!_narrativeResult) {
+		_narrativeResult = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_quantitativeResult) {
+		_quantitativeResult = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMMediaTypeOrExtent.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,55 @@
 
 #import "SMMediaTypeOrExtent.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMMediaTypeOrExtent, indexed like its sorted properties
+static RedlandNode *SMMediaTypeOrExtentPredicates[1];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMMediaTypeOrExtentPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMMediaTypeOrExtentLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMMediaTypeOrExtentPredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2000/01/rdf-schema#label"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:1];
+		for (NSUInteger i = 0; i < 1; i++) {
+			indexes[[[SMMediaTypeOrExtentPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMMediaTypeOrExtentPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMMediaTypeOrExtentPredicate(NSUInteger idx)
+{
+	SMMediaTypeOrExtentLoadPredicates();
+	return SMMediaTypeOrExtentPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMMediaTypeOrExtentPredicateIndex(RedlandNode *predicate)
+{
+	SMMediaTypeOrExtentLoadPredicates();
+	NSNumber *idx = SMMediaTypeOrExtentPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMMediaTypeOrExtent
 
 
@@ -34,31 +79,91 @@
 
 - (NSString *)label
 {
-	if (!_label) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2000/01/rdf-schema#label"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_label = [rslt.object literalValue];
-	}
-	return _label;
+	return [self literalForPredicate:SMMediaTypeOrExtentPredicate(0) cache:(id __strong *)&_label];
 }
 
 - (void)setLabel:(NSString *)label
 {
-	if (label != _label) {
-		RedlandNode *predicate = (label || _label) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2000/01/rdf-schema#label"] : nil;
-		if (_label) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:label forPredicate:SMMediaTypeOrExtentPredicate(0) cache:(id __strong *)&_label];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *label = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMMediaTypeOrExtentPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!label) {
+					label = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_label = [label copy];
-		
-		if (_label) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_label nodeValue]]];
+	}
+	
+	if (!_label) {
+		_label = label ? label : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeString:self.label forProperty:0];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_label = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_label) {
+		_label = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_label = [decoder stringFrom:values[@"http://www.w3.org/2000/01/rdf-schema#label"]];
+	
+	if (!_label) {
+		_label = (id)[NSNull null];
+	}
 }
 
 
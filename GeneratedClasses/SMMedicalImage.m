@@ -2,8 +2,8 @@
  SMMedicalImage.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,67 @@
 
 #import "SMMedicalImage.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMMedicalImage, indexed like its sorted properties
+static RedlandNode *SMMedicalImagePredicates[13];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMMedicalImagePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMMedicalImageLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMMedicalImagePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMMedicalImagePredicates[1] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMMedicalImagePredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomImageUID"];
+		SMMedicalImagePredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomSeriesUID"];
+		SMMedicalImagePredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomStudyUID"];
+		SMMedicalImagePredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#documentType"];
+		SMMedicalImagePredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileName"];
+		SMMedicalImagePredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileSize"];
+		SMMedicalImagePredicates[8] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/format"];
+		SMMedicalImagePredicates[9] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#imagingStudy"];
+		SMMedicalImagePredicates[10] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
+		SMMedicalImagePredicates[11] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#resource"];
+		SMMedicalImagePredicates[12] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:13];
+		for (NSUInteger i = 0; i < 13; i++) {
+			indexes[[[SMMedicalImagePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMMedicalImagePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMMedicalImagePredicate(NSUInteger idx)
+{
+	SMMedicalImageLoadPredicates();
+	return SMMedicalImagePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMMedicalImagePredicateIndex(RedlandNode *predicate)
+{
+	SMMedicalImageLoadPredicates();
+	NSNumber *idx = SMMedicalImagePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMMedicalImage
 
 
@@ -34,504 +91,480 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMMedicalImagePredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMMedicalImagePredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMMedicalImagePredicate(1) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMMedicalImagePredicate(1) cache:(id __strong *)&_date];
 }
 
 @synthesize dicomImageUID = _dicomImageUID;
 
 - (NSString *)dicomImageUID
 {
-	if (!_dicomImageUID) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomImageUID"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_dicomImageUID = [rslt.object literalValue];
-	}
-	return _dicomImageUID;
+	return [self literalForPredicate:SMMedicalImagePredicate(2) cache:(id __strong *)&_dicomImageUID];
 }
 
 - (void)setDicomImageUID:(NSString *)dicomImageUID
 {
-	if (dicomImageUID != _dicomImageUID) {
-		RedlandNode *predicate = (dicomImageUID || _dicomImageUID) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomImageUID"] : nil;
-		if (_dicomImageUID) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_dicomImageUID = [dicomImageUID copy];
-		
-		if (_dicomImageUID) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_dicomImageUID nodeValue]]];
-		}
-	}
+	[self setLiteral:dicomImageUID forPredicate:SMMedicalImagePredicate(2) cache:(id __strong *)&_dicomImageUID];
 }
 
 @synthesize dicomSeriesUID = _dicomSeriesUID;
 
 - (NSString *)dicomSeriesUID
 {
-	if (!_dicomSeriesUID) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomSeriesUID"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_dicomSeriesUID = [rslt.object literalValue];
-	}
-	return _dicomSeriesUID;
+	return [self literalForPredicate:SMMedicalImagePredicate(3) cache:(id __strong *)&_dicomSeriesUID];
 }
 
 - (void)setDicomSeriesUID:(NSString *)dicomSeriesUID
 {
-	if (dicomSeriesUID != _dicomSeriesUID) {
-		RedlandNode *predicate = (dicomSeriesUID || _dicomSeriesUID) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomSeriesUID"] : nil;
-		if (_dicomSeriesUID) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_dicomSeriesUID = [dicomSeriesUID copy];
-		
-		if (_dicomSeriesUID) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_dicomSeriesUID nodeValue]]];
-		}
-	}
+	[self setLiteral:dicomSeriesUID forPredicate:SMMedicalImagePredicate(3) cache:(id __strong *)&_dicomSeriesUID];
 }
 
 @synthesize dicomStudyUID = _dicomStudyUID;
 
 - (NSString *)dicomStudyUID
 {
-	if (!_dicomStudyUID) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomStudyUID"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_dicomStudyUID = [rslt.object literalValue];
-	}
-	return _dicomStudyUID;
+	return [self literalForPredicate:SMMedicalImagePredicate(4) cache:(id __strong *)&_dicomStudyUID];
 }
 
 - (void)setDicomStudyUID:(NSString *)dicomStudyUID
 {
-	if (dicomStudyUID != _dicomStudyUID) {
-		RedlandNode *predicate = (dicomStudyUID || _dicomStudyUID) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#dicomStudyUID"] : nil;
-		if (_dicomStudyUID) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_dicomStudyUID = [dicomStudyUID copy];
-		
-		if (_dicomStudyUID) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_dicomStudyUID nodeValue]]];
-		}
-	}
+	[self setLiteral:dicomStudyUID forPredicate:SMMedicalImagePredicate(4) cache:(id __strong *)&_dicomStudyUID];
 }
 
 @synthesize documentType = _documentType;
 
 - (NSArray *)documentType
 {
-	if (!_documentType) {
-		
-		// get the "documentType" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#documentType"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_documentType = [arr copy];
-	}
-	return _documentType;
+	return [self objectsOfClass:[SMCodedValue class] forPredicate:SMMedicalImagePredicate(5) cache:&_documentType];
 }
 
 - (void)setDocumentType:(NSArray *)documentType
 {
-	if (documentType != _documentType) {
-		RedlandNode *predicate = (documentType || _documentType) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#documentType"] : nil;
-		if (_documentType) {
-			for (SMCodedValue *item in _documentType) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_documentType = [documentType copy];
-		
-		if (_documentType) {
-			for (SMCodedValue *item in _documentType) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:documentType forPredicate:SMMedicalImagePredicate(5) cache:&_documentType];
 }
 
 @synthesize fileName = _fileName;
 
 - (NSString *)fileName
 {
-	if (!_fileName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_fileName = [rslt.object literalValue];
-	}
-	return _fileName;
+	return [self literalForPredicate:SMMedicalImagePredicate(6) cache:(id __strong *)&_fileName];
 }
 
 - (void)setFileName:(NSString *)fileName
 {
-	if (fileName != _fileName) {
-		RedlandNode *predicate = (fileName || _fileName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileName"] : nil;
-		if (_fileName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_fileName = [fileName copy];
-		
-		if (_fileName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_fileName nodeValue]]];
-		}
-	}
+	[self setLiteral:fileName forPredicate:SMMedicalImagePredicate(6) cache:(id __strong *)&_fileName];
 }
 
 @synthesize fileSize = _fileSize;
 
 - (SMValueAndUnit *)fileSize
 {
-	if (!_fileSize) {
-		
-		// get the "fileSize" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileSize"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_fileSize = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _fileSize) {
-		return nil;
-	}
-	
-	return _fileSize;
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMMedicalImagePredicate(7) cache:(id __strong *)&_fileSize];
 }
 
 - (void)setFileSize:(SMValueAndUnit *)fileSize
 {
-	if (fileSize != _fileSize) {
-		RedlandNode *predicate = (fileSize || _fileSize) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fileSize"] : nil;
-		if (_fileSize) {
-			[self.inModel removeSubmodel:_fileSize.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_fileSize = fileSize;
-		
-		if (_fileSize) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_fileSize.subject]];
-			[self.inModel addSubmodel:_fileSize.model];
-		}
-	}
+	[self setObject:fileSize forPredicate:SMMedicalImagePredicate(7) cache:(id __strong *)&_fileSize];
 }
 
 @synthesize format = _format;
 
 - (SMMediaTypeOrExtent *)format
 {
-	if (!_format) {
-		
-		// get the "format" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/format"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMediaTypeOrExtent *obj = [SMMediaTypeOrExtent newWithSubject:rslt.object inModel:self.inModel];
-		_format = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _format) {
-		return nil;
-	}
-	
-	return _format;
+	return [self objectOfClass:[SMMediaTypeOrExtent class] forPredicate:SMMedicalImagePredicate(8) cache:(id __strong *)&_format];
 }
 
 - (void)setFormat:(SMMediaTypeOrExtent *)format
 {
-	if (format != _format) {
-		RedlandNode *predicate = (format || _format) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/format"] : nil;
-		if (_format) {
-			[self.inModel removeSubmodel:_format.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_format = format;
-		
-		if (_format) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_format.subject]];
-			[self.inModel addSubmodel:_format.model];
-		}
-	}
+	[self setObject:format forPredicate:SMMedicalImagePredicate(8) cache:(id __strong *)&_format];
 }
 
 @synthesize imagingStudy = _imagingStudy;
 
 - (NSArray *)imagingStudy
 {
-	if (!_imagingStudy) {
-		
-		// get the "imagingStudy" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#imagingStudy"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMImagingStudy *newItem = [SMImagingStudy newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_imagingStudy = [arr copy];
-	}
-	return _imagingStudy;
+	return [self objectsOfClass:[SMImagingStudy class] forPredicate:SMMedicalImagePredicate(9) cache:&_imagingStudy];
 }
 
 - (void)setImagingStudy:(NSArray *)imagingStudy
 {
-	if (imagingStudy != _imagingStudy) {
-		RedlandNode *predicate = (imagingStudy || _imagingStudy) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#imagingStudy"] : nil;
-		if (_imagingStudy) {
-			for (SMImagingStudy *item in _imagingStudy) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_imagingStudy = [imagingStudy copy];
-		
-		if (_imagingStudy) {
-			for (SMImagingStudy *item in _imagingStudy) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:imagingStudy forPredicate:SMMedicalImagePredicate(9) cache:&_imagingStudy];
 }
 
 @synthesize provider = _provider;
 
 - (SMProvider *)provider
 {
-	if (!_provider) {
-		
-		// get the "provider" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMProvider *obj = [SMProvider newWithSubject:rslt.object inModel:self.inModel];
-		_provider = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _provider) {
-		return nil;
-	}
-	
-	return _provider;
+	return [self objectOfClass:[SMProvider class] forPredicate:SMMedicalImagePredicate(10) cache:(id __strong *)&_provider];
 }
 
 - (void)setProvider:(SMProvider *)provider
 {
-	if (provider != _provider) {
-		RedlandNode *predicate = (provider || _provider) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"] : nil;
-		if (_provider) {
-			[self.inModel removeSubmodel:_provider.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_provider = provider;
-		
-		if (_provider) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_provider.subject]];
-			[self.inModel addSubmodel:_provider.model];
-		}
-	}
+	[self setObject:provider forPredicate:SMMedicalImagePredicate(10) cache:(id __strong *)&_provider];
 }
 
 @synthesize resource = _resource;
 
 - (NSArray *)resource
 {
-	if (!_resource) {
-		
-		// get the "resource" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#resource"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMResource *newItem = [SMResource newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_resource = [arr copy];
-	}
-	return _resource;
+	return [self objectsOfClass:[SMResource class] forPredicate:SMMedicalImagePredicate(11) cache:&_resource];
 }
 
 - (void)setResource:(NSArray *)resource
 {
-	if (resource != _resource) {
-		RedlandNode *predicate = (resource || _resource) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#resource"] : nil;
-		if (_resource) {
-			for (SMResource *item in _resource) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:resource forPredicate:SMMedicalImagePredicate(11) cache:&_resource];
+}
+
+@synthesize title = _title;
+
+- (NSString *)title
+{
+	return [self literalForPredicate:SMMedicalImagePredicate(12) cache:(id __strong *)&_title];
+}
+
+- (void)setTitle:(NSString *)title
+{
+	[self setLiteral:title forPredicate:SMMedicalImagePredicate(12) cache:(id __strong *)&_title];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	NSString *dicomImageUID = nil;
+	NSString *dicomSeriesUID = nil;
+	NSString *dicomStudyUID = nil;
+	NSMutableArray *documentType = _documentType ? nil : [NSMutableArray array];
+	NSString *fileName = nil;
+	SMValueAndUnit *fileSize = nil;
+	SMMediaTypeOrExtent *format = nil;
+	NSMutableArray *imagingStudy = _imagingStudy ? nil : [NSMutableArray array];
+	SMProvider *provider = nil;
+	NSMutableArray *resource = _resource ? nil : [NSMutableArray array];
+	NSString *title = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMMedicalImagePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!dicomImageUID) {
+					dicomImageUID = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!dicomSeriesUID) {
+					dicomSeriesUID = [rslt.object literalValue];
+				}
+				break;
+			case 4:
+				if (!dicomStudyUID) {
+					dicomStudyUID = [rslt.object literalValue];
+				}
+				break;
+			case 5: {
+				SMCodedValue *newItem = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[documentType addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_resource = [resource copy];
-		
-		if (_resource) {
-			for (SMResource *item in _resource) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
+			case 6:
+				if (!fileName) {
+					fileName = [rslt.object literalValue];
+				}
+				break;
+			case 7:
+				if (!fileSize) {
+					fileSize = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 8:
+				if (!format) {
+					format = [SMMediaTypeOrExtent newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 9: {
+				SMImagingStudy *newItem = [SMImagingStudy newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[imagingStudy addObject:newItem];
+				}
+				break;
 			}
+			case 10:
+				if (!provider) {
+					provider = [SMProvider newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 11: {
+				SMResource *newItem = [SMResource newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[resource addObject:newItem];
+				}
+				break;
+			}
+			case 12:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_dicomImageUID) {
+		_dicomImageUID = dicomImageUID ? dicomImageUID : (id)[NSNull null];
+	}
+	if (!_dicomSeriesUID) {
+		_dicomSeriesUID = dicomSeriesUID ? dicomSeriesUID : (id)[NSNull null];
+	}
+	if (!_dicomStudyUID) {
+		_dicomStudyUID = dicomStudyUID ? dicomStudyUID : (id)[NSNull null];
+	}
+	if (!_documentType) {
+		_documentType = [documentType copy];
+	}
+	if (!_fileName) {
+		_fileName = fileName ? fileName : (id)[NSNull null];
+	}
+	if (!_fileSize) {
+		_fileSize = fileSize ? fileSize : (id)[NSNull null];
+	}
+	if (!_format) {
+		_format = format ? format : (id)[NSNull null];
+	}
+	if (!_imagingStudy) {
+		_imagingStudy = [imagingStudy copy];
+	}
+	if (!_provider) {
+		_provider = provider ? provider : (id)[NSNull null];
+	}
+	if (!_resource) {
+		_resource = [resource copy];
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
+	}
 }
 
-@synthesize title = _title;
 
-- (NSString *)title
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeString:self.date forProperty:1];
+	[snapshot writeString:self.dicomImageUID forProperty:2];
+	[snapshot writeString:self.dicomSeriesUID forProperty:3];
+	[snapshot writeString:self.dicomStudyUID forProperty:4];
+	[snapshot writeObjects:self.documentType forProperty:5];
+	[snapshot writeString:self.fileName forProperty:6];
+	[snapshot writeObject:self.fileSize forProperty:7];
+	[snapshot writeObject:self.format forProperty:8];
+	[snapshot writeObjects:self.imagingStudy forProperty:9];
+	[snapshot writeObject:self.provider forProperty:10];
+	[snapshot writeObjects:self.resource forProperty:11];
+	[snapshot writeString:self.title forProperty:12];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
 {
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_date = [snapshot readString];
+				break;
+			case 2:
+				_dicomImageUID = [snapshot readString];
+				break;
+			case 3:
+				_dicomSeriesUID = [snapshot readString];
+				break;
+			case 4:
+				_dicomStudyUID = [snapshot readString];
+				break;
+			case 5:
+				_documentType = [snapshot readObjects];
+				break;
+			case 6:
+				_fileName = [snapshot readString];
+				break;
+			case 7:
+				_fileSize = [snapshot readObject];
+				break;
+			case 8:
+				_format = [snapshot readObject];
+				break;
+			case 9:
+				_imagingStudy = [snapshot readObjects];
+				break;
+			case 10:
+				_provider = [snapshot readObject];
+				break;
+			case 11:
+				_resource = [snapshot readObjects];
+				break;
+			case 12:
+				_title = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
+		}
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_dicomImageUID) {
+		_dicomImageUID = (id)[NSNull null];
+	}
+	if (!_dicomSeriesUID) {
+		_dicomSeriesUID = (id)[NSNull null];
+	}
+	if (!_dicomStudyUID) {
+		_dicomStudyUID = (id)[NSNull null];
+	}
+	if (!_documentType) {
+		_documentType = @[];
+	}
+	if (!_fileName) {
+		_fileName = (id)[NSNull null];
+	}
+	if (!_fileSize) {
+		_fileSize = (id)[NSNull null];
+	}
+	if (!_format) {
+		_format = (id)[NSNull null];
+	}
+	if (!_imagingStudy) {
+		_imagingStudy = @[];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_resource) {
+		_resource = @[];
+	}
 	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
+		_title = (id)[NSNull null];
 	}
-	return _title;
 }
 
-- (void)setTitle:(NSString *)title
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
-		}
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_dicomImageUID = [decoder stringFrom:values[@"http://smartplatforms.org/terms#dicomImageUID"]];
+	_dicomSeriesUID = [decoder stringFrom:values[@"http://smartplatforms.org/terms#dicomSeriesUID"]];
+	_dicomStudyUID = [decoder stringFrom:values[@"http://smartplatforms.org/terms#dicomStudyUID"]];
+	_documentType = [decoder objectsOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#documentType"]];
+	_fileName = [decoder stringFrom:values[@"http://smartplatforms.org/terms#fileName"]];
+	_fileSize = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#fileSize"]];
+	_format = [decoder objectOfClass:[SMMediaTypeOrExtent class] from:values[@"http://purl.org/dc/terms/format"]];
+	_imagingStudy = [decoder objectsOfClass:[SMImagingStudy class] from:values[@"http://smartplatforms.org/terms#imagingStudy"]];
+	_provider = [decoder objectOfClass:[SMProvider class] from:values[@"http://smartplatforms.org/terms#provider"]];
+	_resource = [decoder objectsOfClass:[SMResource class] from:values[@"http://smartplatforms.org/terms#resource"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_dicomImageUID) {
+		_dicomImageUID = (id)[NSNull null];
+	}
+	if (!_dicomSeriesUID) {
+		_dicomSeriesUID = (id)[NSNull null];
+	}
+	if (!_dicomStudyUID) {
+		_dicomStudyUID = (id)[NSNull null];
+	}
+	if (!_documentType) {
+		_documentType = @[];
+	}
+	if (!_fileName) {
+		_fileName = (id)[NSNull null];
+	}
+	if (!_fileSize) {
+		_fileSize = (id)[NSNull null];
+	}
+	if (!_format) {
+		_format = (id)[NSNull null];
+	}
+	if (!_imagingStudy) {
+		_imagingStudy = @[];
+	}
+	if (!_provider) {
+		_provider = (id)[NSNull null];
+	}
+	if (!_resource) {
+		_resource = @[];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
 	}
 }
 
@@ -2,8 +2,8 @@
  SMMedicalRecord.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,55 @@
 
 #import "SMMedicalRecord.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMMedicalRecord, indexed like its sorted properties
+static RedlandNode *SMMedicalRecordPredicates[1];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMMedicalRecordPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMMedicalRecordLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMMedicalRecordPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasStatement"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:1];
+		for (NSUInteger i = 0; i < 1; i++) {
+			indexes[[[SMMedicalRecordPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMMedicalRecordPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMMedicalRecordPredicate(NSUInteger idx)
+{
+	SMMedicalRecordLoadPredicates();
+	return SMMedicalRecordPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMMedicalRecordPredicateIndex(RedlandNode *predicate)
+{
+	SMMedicalRecordLoadPredicates();
+	NSNumber *idx = SMMedicalRecordPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMMedicalRecord
 
 
@@ -34,49 +79,93 @@
 
 - (NSArray *)hasStatement
 {
-	if (!_hasStatement) {
-		
-		// get the "hasStatement" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasStatement"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMSMARTStatement *newItem = [SMSMARTStatement newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_hasStatement = [arr copy];
-	}
-	return _hasStatement;
+	return [self objectsOfClass:[SMSMARTStatement class] forPredicate:SMMedicalRecordPredicate(0) cache:&_hasStatement];
 }
 
 - (void)setHasStatement:(NSArray *)hasStatement
 {
-	if (hasStatement != _hasStatement) {
-		RedlandNode *predicate = (hasStatement || _hasStatement) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hasStatement"] : nil;
-		if (_hasStatement) {
-			for (SMSMARTStatement *item in _hasStatement) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:hasStatement forPredicate:SMMedicalRecordPredicate(0) cache:&_hasStatement];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSMutableArray *hasStatement = _hasStatement ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMMedicalRecordPredicateIndex(rslt.predicate)) {
+			case 0: {
+				SMSMARTStatement *newItem = [SMSMARTStatement newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[hasStatement addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_hasStatement) {
 		_hasStatement = [hasStatement copy];
-		
-		if (_hasStatement) {
-			for (SMSMARTStatement *item in _hasStatement) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObjects:self.hasStatement forProperty:0];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_hasStatement = [snapshot readObjects];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_hasStatement) {
+		_hasStatement = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_hasStatement = [decoder objectsOfClass:[SMSMARTStatement class] from:values[@"http://smartplatforms.org/terms#hasStatement"]];
+	
+	if (!_hasStatement) {
+		_hasStatement = @[];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMMedication.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,63 @@
 
 #import "SMMedication.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMMedication, indexed like its sorted properties
+static RedlandNode *SMMedicationPredicates[9];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMMedicationPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMMedicationLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMMedicationPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMMedicationPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugName"];
+		SMMedicationPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
+		SMMedicationPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#frequency"];
+		SMMedicationPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fulfillment"];
+		SMMedicationPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#instructions"];
+		SMMedicationPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"];
+		SMMedicationPredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantity"];
+		SMMedicationPredicates[8] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:9];
+		for (NSUInteger i = 0; i < 9; i++) {
+			indexes[[[SMMedicationPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMMedicationPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMMedicationPredicate(NSUInteger idx)
+{
+	SMMedicationLoadPredicates();
+	return SMMedicationPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMMedicationPredicateIndex(RedlandNode *predicate)
+{
+	SMMedicationLoadPredicates();
+	NSNumber *idx = SMMedicationPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMMedication
 
 
@@ -34,363 +87,351 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMMedicationPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMMedicationPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize drugName = _drugName;
 
 - (SMCodedValue *)drugName
 {
-	if (!_drugName) {
-		
-		// get the "drugName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_drugName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _drugName) {
-		return nil;
-	}
-	
-	return _drugName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMMedicationPredicate(1) cache:(id __strong *)&_drugName];
 }
 
 - (void)setDrugName:(SMCodedValue *)drugName
 {
-	if (drugName != _drugName) {
-		RedlandNode *predicate = (drugName || _drugName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#drugName"] : nil;
-		if (_drugName) {
-			[self.inModel removeSubmodel:_drugName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_drugName = drugName;
-		
-		if (_drugName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_drugName.subject]];
-			[self.inModel addSubmodel:_drugName.model];
-		}
-	}
+	[self setObject:drugName forPredicate:SMMedicationPredicate(1) cache:(id __strong *)&_drugName];
 }
 
 @synthesize endDate = _endDate;
 
 - (NSString *)endDate
 {
-	if (!_endDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_endDate = [rslt.object literalValue];
-	}
-	return _endDate;
+	return [self literalForPredicate:SMMedicationPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 - (void)setEndDate:(NSString *)endDate
 {
-	if (endDate != _endDate) {
-		RedlandNode *predicate = (endDate || _endDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"] : nil;
-		if (_endDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_endDate = [endDate copy];
-		
-		if (_endDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_endDate nodeValue]]];
-		}
-	}
+	[self setLiteral:endDate forPredicate:SMMedicationPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 @synthesize frequency = _frequency;
 
 - (SMValueAndUnit *)frequency
 {
-	if (!_frequency) {
-		
-		// get the "frequency" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#frequency"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_frequency = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _frequency) {
-		return nil;
-	}
-	
-	return _frequency;
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMMedicationPredicate(3) cache:(id __strong *)&_frequency];
 }
 
 - (void)setFrequency:(SMValueAndUnit *)frequency
 {
-	if (frequency != _frequency) {
-		RedlandNode *predicate = (frequency || _frequency) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#frequency"] : nil;
-		if (_frequency) {
-			[self.inModel removeSubmodel:_frequency.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_frequency = frequency;
-		
-		if (_frequency) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_frequency.subject]];
-			[self.inModel addSubmodel:_frequency.model];
-		}
-	}
+	[self setObject:frequency forPredicate:SMMedicationPredicate(3) cache:(id __strong *)&_frequency];
 }
 
 @synthesize fulfillment = _fulfillment;
 
 - (NSArray *)fulfillment
 {
-	if (!_fulfillment) {
-		
-		// get the "fulfillment" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fulfillment"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMFulfillment *newItem = [SMFulfillment newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_fulfillment = [arr copy];
-	}
-	return _fulfillment;
+	return [self objectsOfClass:[SMFulfillment class] forPredicate:SMMedicationPredicate(4) cache:&_fulfillment];
 }
 
 - (void)setFulfillment:(NSArray *)fulfillment
 {
-	if (fulfillment != _fulfillment) {
-		RedlandNode *predicate = (fulfillment || _fulfillment) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#fulfillment"] : nil;
-		if (_fulfillment) {
-			for (SMFulfillment *item in _fulfillment) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_fulfillment = [fulfillment copy];
-		
-		if (_fulfillment) {
-			for (SMFulfillment *item in _fulfillment) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:fulfillment forPredicate:SMMedicationPredicate(4) cache:&_fulfillment];
 }
 
 @synthesize instructions = _instructions;
 
 - (NSString *)instructions
 {
-	if (!_instructions) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#instructions"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_instructions = [rslt.object literalValue];
-	}
-	return _instructions;
+	return [self literalForPredicate:SMMedicationPredicate(5) cache:(id __strong *)&_instructions];
 }
 
 - (void)setInstructions:(NSString *)instructions
 {
-	if (instructions != _instructions) {
-		RedlandNode *predicate = (instructions || _instructions) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#instructions"] : nil;
-		if (_instructions) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_instructions = [instructions copy];
-		
-		if (_instructions) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_instructions nodeValue]]];
-		}
-	}
+	[self setLiteral:instructions forPredicate:SMMedicationPredicate(5) cache:(id __strong *)&_instructions];
 }
 
 @synthesize provenance = _provenance;
 
 - (NSArray *)provenance
 {
-	if (!_provenance) {
-		
-		// get the "provenance" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMCode *newItem = [SMCode newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_provenance = [arr copy];
-	}
-	return _provenance;
+	return [self objectsOfClass:[SMCode class] forPredicate:SMMedicationPredicate(6) cache:&_provenance];
 }
 
 - (void)setProvenance:(NSArray *)provenance
 {
-	if (provenance != _provenance) {
-		RedlandNode *predicate = (provenance || _provenance) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provenance"] : nil;
-		if (_provenance) {
-			for (SMCode *item in _provenance) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_provenance = [provenance copy];
-		
-		if (_provenance) {
-			for (SMCode *item in _provenance) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:provenance forPredicate:SMMedicationPredicate(6) cache:&_provenance];
 }
 
 @synthesize quantity = _quantity;
 
 - (SMValueAndUnit *)quantity
 {
-	if (!_quantity) {
-		
-		// get the "quantity" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantity"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_quantity = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _quantity) {
-		return nil;
-	}
-	
-	return _quantity;
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMMedicationPredicate(7) cache:(id __strong *)&_quantity];
 }
 
 - (void)setQuantity:(SMValueAndUnit *)quantity
 {
-	if (quantity != _quantity) {
-		RedlandNode *predicate = (quantity || _quantity) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#quantity"] : nil;
-		if (_quantity) {
-			[self.inModel removeSubmodel:_quantity.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_quantity = quantity;
-		
-		if (_quantity) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_quantity.subject]];
-			[self.inModel addSubmodel:_quantity.model];
-		}
-	}
+	[self setObject:quantity forPredicate:SMMedicationPredicate(7) cache:(id __strong *)&_quantity];
 }
 
 @synthesize startDate = _startDate;
 
 - (NSString *)startDate
 {
-	if (!_startDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_startDate = [rslt.object literalValue];
-	}
-	return _startDate;
+	return [self literalForPredicate:SMMedicationPredicate(8) cache:(id __strong *)&_startDate];
 }
 
 - (void)setStartDate:(NSString *)startDate
 {
-	if (startDate != _startDate) {
-		RedlandNode *predicate = (startDate || _startDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"] : nil;
-		if (_startDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:startDate forPredicate:SMMedicationPredicate(8) cache:(id __strong *)&_startDate];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	SMCodedValue *drugName = nil;
+	NSString *endDate = nil;
+	SMValueAndUnit *frequency = nil;
+	NSMutableArray *fulfillment = _fulfillment ? nil : [NSMutableArray array];
+	NSString *instructions = nil;
+	NSMutableArray *provenance = _provenance ? nil : [NSMutableArray array];
+	SMValueAndUnit *quantity = nil;
+	NSString *startDate = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMMedicationPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!drugName) {
+					drugName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!endDate) {
+					endDate = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!frequency) {
+					frequency = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4: {
+				SMFulfillment *newItem = [SMFulfillment newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[fulfillment addObject:newItem];
+				}
+				break;
+			}
+			case 5:
+				if (!instructions) {
+					instructions = [rslt.object literalValue];
+				}
+				break;
+			case 6: {
+				SMCode *newItem = [SMCode newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[provenance addObject:newItem];
+				}
+				break;
+			}
+			case 7:
+				if (!quantity) {
+					quantity = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 8:
+				if (!startDate) {
+					startDate = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_startDate = [startDate copy];
-		
-		if (_startDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_startDate nodeValue]]];
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_drugName) {
+		_drugName = drugName ? drugName : (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = endDate ? endDate : (id)[NSNull null];
+	}
+	if (!_frequency) {
+		_frequency = frequency ? frequency : (id)[NSNull null];
+	}
+	if (!_fulfillment) {
+		_fulfillment = [fulfillment copy];
+	}
+	if (!_instructions) {
+		_instructions = instructions ? instructions : (id)[NSNull null];
+	}
+	if (!_provenance) {
+		_provenance = [provenance copy];
+	}
+	if (!_quantity) {
+		_quantity = quantity ? quantity : (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = startDate ? startDate : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeObject:self.drugName forProperty:1];
+	[snapshot writeString:self.endDate forProperty:2];
+	[snapshot writeObject:self.frequency forProperty:3];
+	[snapshot writeObjects:self.fulfillment forProperty:4];
+	[snapshot writeString:self.instructions forProperty:5];
+	[snapshot writeObjects:self.provenance forProperty:6];
+	[snapshot writeObject:self.quantity forProperty:7];
+	[snapshot writeString:self.startDate forProperty:8];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_drugName = [snapshot readObject];
+				break;
+			case 2:
+				_endDate = [snapshot readString];
+				break;
+			case 3:
+				_frequency = [snapshot readObject];
+				break;
+			case 4:
+				_fulfillment = [snapshot readObjects];
+				break;
+			case 5:
+				_instructions = [snapshot readString];
+				break;
+			case 6:
+				_provenance = [snapshot readObjects];
+				break;
+			case 7:
+				_quantity = [snapshot readObject];
+				break;
+			case 8:
+				_startDate = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_drugName) {
+		_drugName = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_frequency) {
+		_frequency = (id)[NSNull null];
+	}
+	if (!_fulfillment) {
+		_fulfillment = @[];
+	}
+	if (!_instructions) {
+		_instructions = (id)[NSNull null];
+	}
+	if (!_provenance) {
+		_provenance = @[];
+	}
+	if (!_quantity) {
+		_quantity = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_drugName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#drugName"]];
+	_endDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#endDate"]];
+	_frequency = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#frequency"]];
+	_fulfillment = [decoder objectsOfClass:[SMFulfillment class] from:values[@"http://smartplatforms.org/terms#fulfillment"]];
+	_instructions = [decoder stringFrom:values[@"http://smartplatforms.org/terms#instructions"]];
+	_provenance = [decoder objectsOfClass:[SMCode class] from:values[@"http://smartplatforms.org/terms#provenance"]];
+	_quantity = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#quantity"]];
+	_startDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#startDate"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_drugName) {
+		_drugName = (id)[NSNull null];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_frequency) {
+		_frequency = (id)[NSNull null];
+	}
+	if (!_fulfillment) {
+		_fulfillment = @[];
+	}
+	if (!_instructions) {
+		_instructions = (id)[NSNull null];
+	}
+	if (!_provenance) {
+		_provenance = @[];
+	}
+	if (!_quantity) {
+		_quantity = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
 }
 
 
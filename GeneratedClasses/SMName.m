@@ -2,8 +2,8 @@
  SMName.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,59 @@
 
 #import "SMName.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMName, indexed like its sorted properties
+static RedlandNode *SMNamePredicates[5];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMNamePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMNameLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMNamePredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#additional-name"];
+		SMNamePredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#family-name"];
+		SMNamePredicates[2] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#given-name"];
+		SMNamePredicates[3] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-prefix"];
+		SMNamePredicates[4] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-suffix"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:5];
+		for (NSUInteger i = 0; i < 5; i++) {
+			indexes[[[SMNamePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMNamePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMNamePredicate(NSUInteger idx)
+{
+	SMNameLoadPredicates();
+	return SMNamePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMNamePredicateIndex(RedlandNode *predicate)
+{
+	SMNameLoadPredicates();
+	NSNumber *idx = SMNamePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMName
 
 
@@ -34,185 +83,225 @@
 
 - (NSArray *)additionalName
 {
-	if (!_additionalName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#additional-name"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			NSString *newItem = [rslt.object literalValue];		// only works for NSString for now
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_additionalName = [arr copy];
-	}
-	return _additionalName;
+	return [self literalsForPredicate:SMNamePredicate(0) cache:&_additionalName];
 }
 
 - (void)setAdditionalName:(NSArray *)additionalName
 {
-	if (additionalName != _additionalName) {
-		RedlandNode *predicate = (additionalName || _additionalName) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#additional-name"] : nil;
-		if (_additionalName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_additionalName = [additionalName copy];
-		
-		if (_additionalName) {
-			for (NSString *newItem in _additionalName) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[newItem nodeValue]]];
-			}
-		}
-	}
+	[self setLiterals:additionalName forPredicate:SMNamePredicate(0) cache:&_additionalName];
 }
 
 @synthesize familyName = _familyName;
 
 - (NSString *)familyName
 {
-	if (!_familyName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#family-name"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_familyName = [rslt.object literalValue];
-	}
-	return _familyName;
+	return [self literalForPredicate:SMNamePredicate(1) cache:(id __strong *)&_familyName];
 }
 
 - (void)setFamilyName:(NSString *)familyName
 {
-	if (familyName != _familyName) {
-		RedlandNode *predicate = (familyName || _familyName) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#family-name"] : nil;
-		if (_familyName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_familyName = [familyName copy];
-		
-		if (_familyName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_familyName nodeValue]]];
-		}
-	}
+	[self setLiteral:familyName forPredicate:SMNamePredicate(1) cache:(id __strong *)&_familyName];
 }
 
 @synthesize givenName = _givenName;
 
 - (NSString *)givenName
 {
-	if (!_givenName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#given-name"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_givenName = [rslt.object literalValue];
-	}
-	return _givenName;
+	return [self literalForPredicate:SMNamePredicate(2) cache:(id __strong *)&_givenName];
 }
 
 - (void)setGivenName:(NSString *)givenName
 {
-	if (givenName != _givenName) {
-		RedlandNode *predicate = (givenName || _givenName) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#given-name"] : nil;
-		if (_givenName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_givenName = [givenName copy];
-		
-		if (_givenName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_givenName nodeValue]]];
-		}
-	}
+	[self setLiteral:givenName forPredicate:SMNamePredicate(2) cache:(id __strong *)&_givenName];
 }
 
 @synthesize honorificPrefix = _honorificPrefix;
 
 - (NSArray *)honorificPrefix
 {
-	if (!_honorificPrefix) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-prefix"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			NSString *newItem = [rslt.object literalValue];		// only works for NSString for now
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_honorificPrefix = [arr copy];
-	}
-	return _honorificPrefix;
+	return [self literalsForPredicate:SMNamePredicate(3) cache:&_honorificPrefix];
 }
 
 - (void)setHonorificPrefix:(NSArray *)honorificPrefix
 {
-	if (honorificPrefix != _honorificPrefix) {
-		RedlandNode *predicate = (honorificPrefix || _honorificPrefix) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-prefix"] : nil;
-		if (_honorificPrefix) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_honorificPrefix = [honorificPrefix copy];
-		
-		if (_honorificPrefix) {
-			for (NSString *newItem in _honorificPrefix) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[newItem nodeValue]]];
-			}
-		}
-	}
+	[self setLiterals:honorificPrefix forPredicate:SMNamePredicate(3) cache:&_honorificPrefix];
 }
 
 @synthesize honorificSuffix = _honorificSuffix;
 
 - (NSArray *)honorificSuffix
 {
-	if (!_honorificSuffix) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-suffix"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			NSString *newItem = [rslt.object literalValue];		// only works for NSString for now
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_honorificSuffix = [arr copy];
-	}
-	return _honorificSuffix;
+	return [self literalsForPredicate:SMNamePredicate(4) cache:&_honorificSuffix];
 }
 
 - (void)setHonorificSuffix:(NSArray *)honorificSuffix
 {
-	if (honorificSuffix != _honorificSuffix) {
-		RedlandNode *predicate = (honorificSuffix || _honorificSuffix) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#honorific-suffix"] : nil;
-		if (_honorificSuffix) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiterals:honorificSuffix forPredicate:SMNamePredicate(4) cache:&_honorificSuffix];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSMutableArray *additionalName = _additionalName ? nil : [NSMutableArray array];
+	NSString *familyName = nil;
+	NSString *givenName = nil;
+	NSMutableArray *honorificPrefix = _honorificPrefix ? nil : [NSMutableArray array];
+	NSMutableArray *honorificSuffix = _honorificSuffix ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMNamePredicateIndex(rslt.predicate)) {
+			case 0: {
+				NSString *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[additionalName addObject:newItem];
+				}
+				break;
+			}
+			case 1:
+				if (!familyName) {
+					familyName = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!givenName) {
+					givenName = [rslt.object literalValue];
+				}
+				break;
+			case 3: {
+				NSString *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[honorificPrefix addObject:newItem];
+				}
+				break;
+			}
+			case 4: {
+				NSString *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[honorificSuffix addObject:newItem];
+				}
+				break;
+			}
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_additionalName) {
+		_additionalName = [additionalName copy];
+	}
+	if (!_familyName) {
+		_familyName = familyName ? familyName : (id)[NSNull null];
+	}
+	if (!_givenName) {
+		_givenName = givenName ? givenName : (id)[NSNull null];
+	}
+	if (!_honorificPrefix) {
+		_honorificPrefix = [honorificPrefix copy];
+	}
+	if (!_honorificSuffix) {
 		_honorificSuffix = [honorificSuffix copy];
-		
-		if (_honorificSuffix) {
-			for (NSString *newItem in _honorificSuffix) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[newItem nodeValue]]];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeStrings:self.additionalName forProperty:0];
+	[snapshot writeString:self.familyName forProperty:1];
+	[snapshot writeString:self.givenName forProperty:2];
+	[snapshot writeStrings:self.honorificPrefix forProperty:3];
+	[snapshot writeStrings:self.honorificSuffix forProperty:4];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_additionalName = [snapshot readStrings];
+				break;
+			case 1:
+				_familyName = [snapshot readString];
+				break;
+			case 2:
+				_givenName = [snapshot readString];
+				break;
+			case 3:
+				_honorificPrefix = [snapshot readStrings];
+				break;
+			case 4:
+				_honorificSuffix = [snapshot readStrings];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_additionalName) {
+		_additionalName = @[];
+	}
+	if (!_familyName) {
+		_familyName = (id)[NSNull null];
+	}
+	if (!_givenName) {
+		_givenName = (id)[NSNull null];
+	}
+	if (!_honorificPrefix) {
+		_honorificPrefix = @[];
+	}
+	if (!_honorificSuffix) {
+		_honorificSuffix = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_additionalName = [decoder stringsFrom:values[@"http://www.w3.org/2006/vcard/ns#additional-name"]];
+	_familyName = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#family-name"]];
+	_givenName = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#given-name"]];
+	_honorificPrefix = [decoder stringsFrom:values[@"http://www.w3.org/2006/vcard/ns#honorific-prefix"]];
+	_honorificSuffix = [decoder stringsFrom:values[@"http://www.w3.org/2006/vcard/ns#honorific-suffix"]];
+	
+	if (!_additionalName) {
+		_additionalName = @[];
+	}
+	if (!_familyName) {
+		_familyName = (id)[NSNull null];
+	}
+	if (!_givenName) {
+		_givenName = (id)[NSNull null];
+	}
+	if (!_honorificPrefix) {
+		_honorificPrefix = @[];
+	}
+	if (!_honorificSuffix) {
+		_honorificSuffix = @[];
+	}
 }
 
 
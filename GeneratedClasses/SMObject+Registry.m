@@ -0,0 +1,224 @@
+/*
+ SMObject+Registry.m
+ SMARTFramework
+ 
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+#import "SMObject+Registry.h"
+#import "SMARTObjects.h"
+
+#import <Redland-ObjC.h>
+
+
+@implementation SMObject(Registry)
+
+
+#pragma mark - Synthesized Methods
+/**
+ *  Returns the generated class that represents objects of the given rdf:type, nil if there is none.
+ */
++ (Class)classForRDFType:(NSString *)rdfType
+{
+	static NSDictionary *registry = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		registry = @{
+			@"http://purl.org/dc/terms/MediaTypeOrExtent": [SMMediaTypeOrExtent class],
+			@"http://smartplatforms.org/terms#Allergy": [SMAllergy class],
+			@"http://smartplatforms.org/terms#AllergyExclusion": [SMAllergyExclusion class],
+			@"http://smartplatforms.org/terms#Attribution": [SMAttribution class],
+			@"http://smartplatforms.org/terms#BloodPressure": [SMBloodPressure class],
+			@"http://smartplatforms.org/terms#ClinicalNote": [SMClinicalNote class],
+			@"http://smartplatforms.org/terms#Code": [SMCode class],
+			@"http://smartplatforms.org/terms#CodeProvenance": [SMCodeProvenance class],
+			@"http://smartplatforms.org/terms#CodedValue": [SMCodedValue class],
+			@"http://smartplatforms.org/terms#Content": [SMContent class],
+			@"http://smartplatforms.org/terms#DataType": [SMDataType class],
+			@"http://smartplatforms.org/terms#Demographics": [SMDemographics class],
+			@"http://smartplatforms.org/terms#Document": [SMDocument class],
+			@"http://smartplatforms.org/terms#Encounter": [SMEncounter class],
+			@"http://smartplatforms.org/terms#FamilyHistory": [SMFamilyHistoryObservation class],
+			@"http://smartplatforms.org/terms#Fulfillment": [SMFulfillment class],
+			@"http://smartplatforms.org/terms#Hash": [SMHash class],
+			@"http://smartplatforms.org/terms#ImagesList": [SMImagesList class],
+			@"http://smartplatforms.org/terms#ImagingStudy": [SMImagingStudy class],
+			@"http://smartplatforms.org/terms#Immunization": [SMImmunization class],
+			@"http://smartplatforms.org/terms#LabPanel": [SMLabPanel class],
+			@"http://smartplatforms.org/terms#LabResult": [SMLabResult class],
+			@"http://smartplatforms.org/terms#MedicalImage": [SMMedicalImage class],
+			@"http://smartplatforms.org/terms#MedicalRecord": [SMMedicalRecord class],
+			@"http://smartplatforms.org/terms#Medication": [SMMedication class],
+			@"http://smartplatforms.org/terms#NarrativeResult": [SMNarrativeResult class],
+			@"http://smartplatforms.org/terms#Organization": [SMOrganization class],
+			@"http://smartplatforms.org/terms#Panel": [SMPanel class],
+			@"http://smartplatforms.org/terms#Participant": [SMParticipant class],
+			@"http://smartplatforms.org/terms#Person": [SMPerson class],
+			@"http://smartplatforms.org/terms#Pharmacy": [SMPharmacy class],
+			@"http://smartplatforms.org/terms#Photograph": [SMPhotograph class],
+			@"http://smartplatforms.org/terms#Problem": [SMProblem class],
+			@"http://smartplatforms.org/terms#Procedure": [SMProcedure class],
+			@"http://smartplatforms.org/terms#Provider": [SMProvider class],
+			@"http://smartplatforms.org/terms#QuantitativeResult": [SMQuantitativeResult class],
+			@"http://smartplatforms.org/terms#Resource": [SMResource class],
+			@"http://smartplatforms.org/terms#Series": [SMSeries class],
+			@"http://smartplatforms.org/terms#SocialHistory": [SMSocialHistory class],
+			@"http://smartplatforms.org/terms#Statement": [SMSMARTStatement class],
+			@"http://smartplatforms.org/terms#User": [SMUser class],
+			@"http://smartplatforms.org/terms#ValueAndUnit": [SMValueAndUnit class],
+			@"http://smartplatforms.org/terms#ValueRange": [SMValueRange class],
+			@"http://smartplatforms.org/terms#ValueRatio": [SMValueRatio class],
+			@"http://smartplatforms.org/terms#VitalSign": [SMVitalSign class],
+			@"http://smartplatforms.org/terms#VitalSignSet": [SMVitalSignSet class],
+			@"http://www.w3.org/2006/vcard/ns#Address": [SMAddress class],
+			@"http://www.w3.org/2006/vcard/ns#Name": [SMName class],
+			@"http://www.w3.org/2006/vcard/ns#Tel": [SMTel class],
+			@"http://www.w3.org/2006/vcard/ns#VCard": [SMVCard class],
+		};
+	});
+	return rdfType ? registry[rdfType] : nil;
+}
+
+/**
+ *  Instantiates every subject in the model whose rdf:type has a generated class, walking the model's statements only once.
+ *
+ *  All properties of the instances are filled from the statements right away, model properties point to the instances of their
+ *  subjects in the returned dictionary.
+ *  @param model The model to read
+ *  @return A dictionary of SMObject instances, keyed by their subject node
+ */
++ (NSDictionary *)objectsInModel:(RedlandModel *)model
+{
+	RedlandStatement *all = [RedlandStatement statementWithSubject:nil predicate:nil object:nil];
+	return [self objectsFromStatements:[model enumeratorOfStatementsLike:all] inModel:model];
+}
+
+/**
+ *  Instantiates every subject of the given statements whose rdf:type has a generated class, like objectsInModel: but only for a
+ *  part of the model, for example the statements of one page that have just been added to it.
+ *  @param statements An enumerator of RedlandStatement instances, all of them must be part of the model
+ *  @param model The model the instances live in
+ *  @return A dictionary of SMObject instances, keyed by their subject node
+ */
++ (NSDictionary *)objectsFromStatements:(NSEnumerator *)statements inModel:(RedlandModel *)model
+{
+	RedlandNode *typeNode = [RedlandNode typeNode];
+	NSMutableDictionary *grouped = [NSMutableDictionary dictionary];
+	NSMutableDictionary *objects = [NSMutableDictionary dictionary];
+	
+	// group statements by subject and instantiate typed subjects
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		NSMutableArray *about = grouped[rslt.subject];
+		if (!about) {
+			about = [NSMutableArray array];
+			grouped[rslt.subject] = about;
+		}
+		[about addObject:rslt];
+		
+		if (!objects[rslt.subject] && [typeNode isEqual:rslt.predicate]) {
+			Class itemClass = [self classForRDFType:[[rslt.object URIValue] stringValue]];
+			SMObject *item = [itemClass newWithSubject:rslt.subject inModel:model];
+			if (item) {
+				objects[rslt.subject] = item;
+			}
+		}
+	}
+	
+	// wire up the instances
+	[objects enumerateKeysAndObjectsUsingBlock:^(RedlandNode *subject, SMObject *item, BOOL *stop) {
+		[item hydrateFromStatements:[grouped[subject] objectEnumerator] objects:objects];
+	}];
+	
+	return objects;
+}
+
+/**
+ *  Returns the generated classes in the order snapshots refer to them by index.
+ */
++ (NSArray *)snapshotClasses
+{
+	static NSArray *classes = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		classes = @[
+			[SMMediaTypeOrExtent class],
+			[SMAllergy class],
+			[SMAllergyExclusion class],
+			[SMAttribution class],
+			[SMBloodPressure class],
+			[SMClinicalNote class],
+			[SMCode class],
+			[SMCodeProvenance class],
+			[SMCodedValue class],
+			[SMContent class],
+			[SMDataType class],
+			[SMDemographics class],
+			[SMDocument class],
+			[SMEncounter class],
+			[SMFamilyHistoryObservation class],
+			[SMFulfillment class],
+			[SMHash class],
+			[SMImagesList class],
+			[SMImagingStudy class],
+			[SMImmunization class],
+			[SMLabPanel class],
+			[SMLabResult class],
+			[SMMedicalImage class],
+			[SMMedicalRecord class],
+			[SMMedication class],
+			[SMNarrativeResult class],
+			[SMOrganization class],
+			[SMPanel class],
+			[SMParticipant class],
+			[SMPerson class],
+			[SMPharmacy class],
+			[SMPhotograph class],
+			[SMProblem class],
+			[SMProcedure class],
+			[SMProvider class],
+			[SMQuantitativeResult class],
+			[SMResource class],
+			[SMSeries class],
+			[SMSocialHistory class],
+			[SMSMARTStatement class],
+			[SMUser class],
+			[SMValueAndUnit class],
+			[SMValueRange class],
+			[SMValueRatio class],
+			[SMVitalSign class],
+			[SMVitalSignSet class],
+			[SMAddress class],
+			[SMName class],
+			[SMTel class],
+			[SMVCard class],
+		];
+	});
+	return classes;
+}
+
+/**
+ *  Returns a hash over the generated classes and their properties, snapshots are only read by classes with the same hash.
+ */
++ (NSString *)snapshotSchemaHash
+{
+	return @"f3291837b97231bfb76c5c0ebb0a02fdaecfce43";
+}
+
+
+@end
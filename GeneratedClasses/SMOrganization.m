@@ -2,8 +2,8 @@
  SMOrganization.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,56 @@
 
 #import "SMOrganization.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMOrganization, indexed like its sorted properties
+static RedlandNode *SMOrganizationPredicates[2];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMOrganizationPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMOrganizationLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMOrganizationPredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
+		SMOrganizationPredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#organization-name"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:2];
+		for (NSUInteger i = 0; i < 2; i++) {
+			indexes[[[SMOrganizationPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMOrganizationPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMOrganizationPredicate(NSUInteger idx)
+{
+	SMOrganizationLoadPredicates();
+	return SMOrganizationPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMOrganizationPredicateIndex(RedlandNode *predicate)
+{
+	SMOrganizationLoadPredicates();
+	NSNumber *idx = SMOrganizationPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMOrganization
 
 
@@ -34,74 +80,123 @@
 
 - (SMAddress *)adr
 {
-	if (!_adr) {
-		
-		// get the "adr" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMAddress *obj = [SMAddress newWithSubject:rslt.object inModel:self.inModel];
-		_adr = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _adr) {
-		return nil;
-	}
-	
-	return _adr;
+	return [self objectOfClass:[SMAddress class] forPredicate:SMOrganizationPredicate(0) cache:(id __strong *)&_adr];
 }
 
 - (void)setAdr:(SMAddress *)adr
 {
-	if (adr != _adr) {
-		RedlandNode *predicate = (adr || _adr) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"] : nil;
-		if (_adr) {
-			[self.inModel removeSubmodel:_adr.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_adr = adr;
-		
-		if (_adr) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_adr.subject]];
-			[self.inModel addSubmodel:_adr.model];
-		}
-	}
+	[self setObject:adr forPredicate:SMOrganizationPredicate(0) cache:(id __strong *)&_adr];
 }
 
 @synthesize organizationName = _organizationName;
 
 - (NSString *)organizationName
 {
-	if (!_organizationName) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#organization-name"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_organizationName = [rslt.object literalValue];
-	}
-	return _organizationName;
+	return [self literalForPredicate:SMOrganizationPredicate(1) cache:(id __strong *)&_organizationName];
 }
 
 - (void)setOrganizationName:(NSString *)organizationName
 {
-	if (organizationName != _organizationName) {
-		RedlandNode *predicate = (organizationName || _organizationName) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#organization-name"] : nil;
-		if (_organizationName) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:organizationName forPredicate:SMOrganizationPredicate(1) cache:(id __strong *)&_organizationName];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMAddress *adr = nil;
+	NSString *organizationName = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMOrganizationPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!adr) {
+					adr = [SMAddress newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!organizationName) {
+					organizationName = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_organizationName = [organizationName copy];
-		
-		if (_organizationName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_organizationName nodeValue]]];
+	}
+	
+	if (!_adr) {
+		_adr = adr ? adr : (id)[NSNull null];
+	}
+	if (!_organizationName) {
+		_organizationName = organizationName ? organizationName : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.adr forProperty:0];
+	[snapshot writeString:self.organizationName forProperty:1];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_adr = [snapshot readObject];
+				break;
+			case 1:
+				_organizationName = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_adr) {
+		_adr = (id)[NSNull null];
+	}
+	if (!_organizationName) {
+		_organizationName = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_adr = [decoder objectOfClass:[SMAddress class] from:values[@"http://www.w3.org/2006/vcard/ns#adr"]];
+	_organizationName = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#organization-name"]];
+	
+	if (!_adr) {
+		_adr = (id)[NSNull null];
+	}
+	if (!_organizationName) {
+		_organizationName = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMParticipant.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMParticipant.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMParticipant, indexed like its sorted properties
+static RedlandNode *SMParticipantPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMParticipantPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMParticipantLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMParticipantPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#organization"];
+		SMParticipantPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#person"];
+		SMParticipantPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#role"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMParticipantPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMParticipantPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMParticipantPredicate(NSUInteger idx)
+{
+	SMParticipantLoadPredicates();
+	return SMParticipantPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMParticipantPredicateIndex(RedlandNode *predicate)
+{
+	SMParticipantLoadPredicates();
+	NSNumber *idx = SMParticipantPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMParticipant
 
 
@@ -34,117 +81,155 @@
 
 - (SMOrganization *)organization
 {
-	if (!_organization) {
-		
-		// get the "organization" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#organization"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMOrganization *obj = [SMOrganization newWithSubject:rslt.object inModel:self.inModel];
-		_organization = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _organization) {
-		return nil;
-	}
-	
-	return _organization;
+	return [self objectOfClass:[SMOrganization class] forPredicate:SMParticipantPredicate(0) cache:(id __strong *)&_organization];
 }
 
 - (void)setOrganization:(SMOrganization *)organization
 {
-	if (organization != _organization) {
-		RedlandNode *predicate = (organization || _organization) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#organization"] : nil;
-		if (_organization) {
-			[self.inModel removeSubmodel:_organization.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_organization = organization;
-		
-		if (_organization) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_organization.subject]];
-			[self.inModel addSubmodel:_organization.model];
-		}
-	}
+	[self setObject:organization forPredicate:SMParticipantPredicate(0) cache:(id __strong *)&_organization];
 }
 
 @synthesize person = _person;
 
 - (SMPerson *)person
 {
-	if (!_person) {
-		
-		// get the "person" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#person"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMPerson *obj = [SMPerson newWithSubject:rslt.object inModel:self.inModel];
-		_person = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _person) {
-		return nil;
-	}
-	
-	return _person;
+	return [self objectOfClass:[SMPerson class] forPredicate:SMParticipantPredicate(1) cache:(id __strong *)&_person];
 }
 
 - (void)setPerson:(SMPerson *)person
 {
-	if (person != _person) {
-		RedlandNode *predicate = (person || _person) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#person"] : nil;
-		if (_person) {
-			[self.inModel removeSubmodel:_person.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_person = person;
-		
-		if (_person) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_person.subject]];
-			[self.inModel addSubmodel:_person.model];
-		}
-	}
+	[self setObject:person forPredicate:SMParticipantPredicate(1) cache:(id __strong *)&_person];
 }
 
 @synthesize role = _role;
 
 - (NSString *)role
 {
-	if (!_role) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#role"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_role = [rslt.object literalValue];
-	}
-	return _role;
+	return [self literalForPredicate:SMParticipantPredicate(2) cache:(id __strong *)&_role];
 }
 
 - (void)setRole:(NSString *)role
 {
-	if (role != _role) {
-		RedlandNode *predicate = (role || _role) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#role"] : nil;
-		if (_role) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:role forPredicate:SMParticipantPredicate(2) cache:(id __strong *)&_role];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMOrganization *organization = nil;
+	SMPerson *person = nil;
+	NSString *role = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMParticipantPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!organization) {
+					organization = [SMOrganization newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!person) {
+					person = [SMPerson newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!role) {
+					role = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_role = [role copy];
-		
-		if (_role) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_role nodeValue]]];
+	}
+	
+	if (!_organization) {
+		_organization = organization ? organization : (id)[NSNull null];
+	}
+	if (!_person) {
+		_person = person ? person : (id)[NSNull null];
+	}
+	if (!_role) {
+		_role = role ? role : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.organization forProperty:0];
+	[snapshot writeObject:self.person forProperty:1];
+	[snapshot writeString:self.role forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_organization = [snapshot readObject];
+				break;
+			case 1:
+				_person = [snapshot readObject];
+				break;
+			case 2:
+				_role = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_organization) {
+		_organization = (id)[NSNull null];
+	}
+	if (!_person) {
+		_person = (id)[NSNull null];
+	}
+	if (!_role) {
+		_role = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_organization = [decoder objectOfClass:[SMOrganization class] from:values[@"http://smartplatforms.org/terms#organization"]];
+	_person = [decoder objectOfClass:[SMPerson class] from:values[@"http://smartplatforms.org/terms#person"]];
+	_role = [decoder stringFrom:values[@"http://smartplatforms.org/terms#role"]];
+	
+	if (!_organization) {
+		_organization = (id)[NSNull null];
+	}
+	if (!_person) {
+		_person = (id)[NSNull null];
+	}
+	if (!_role) {
+		_role = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMProblem.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,61 @@
 
 #import "SMProblem.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMProblem, indexed like its sorted properties
+static RedlandNode *SMProblemPredicates[7];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMProblemPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMProblemLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMProblemPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMProblemPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounters"];
+		SMProblemPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
+		SMProblemPredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
+		SMProblemPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemName"];
+		SMProblemPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemStatus"];
+		SMProblemPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:7];
+		for (NSUInteger i = 0; i < 7; i++) {
+			indexes[[[SMProblemPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMProblemPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMProblemPredicate(NSUInteger idx)
+{
+	SMProblemLoadPredicates();
+	return SMProblemPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMProblemPredicateIndex(RedlandNode *predicate)
+{
+	SMProblemLoadPredicates();
+	NSNumber *idx = SMProblemPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMProblem
 
 
@@ -34,271 +85,285 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMProblemPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMProblemPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize encounters = _encounters;
 
 - (NSArray *)encounters
 {
-	if (!_encounters) {
-		
-		// get the "encounters" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounters"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMEncounter *newItem = [SMEncounter newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_encounters = [arr copy];
-	}
-	return _encounters;
+	return [self objectsOfClass:[SMEncounter class] forPredicate:SMProblemPredicate(1) cache:&_encounters];
 }
 
 - (void)setEncounters:(NSArray *)encounters
 {
-	if (encounters != _encounters) {
-		RedlandNode *predicate = (encounters || _encounters) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounters"] : nil;
-		if (_encounters) {
-			for (SMEncounter *item in _encounters) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_encounters = [encounters copy];
-		
-		if (_encounters) {
-			for (SMEncounter *item in _encounters) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:encounters forPredicate:SMProblemPredicate(1) cache:&_encounters];
 }
 
 @synthesize endDate = _endDate;
 
 - (NSString *)endDate
 {
-	if (!_endDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_endDate = [rslt.object literalValue];
-	}
-	return _endDate;
+	return [self literalForPredicate:SMProblemPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 - (void)setEndDate:(NSString *)endDate
 {
-	if (endDate != _endDate) {
-		RedlandNode *predicate = (endDate || _endDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#endDate"] : nil;
-		if (_endDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_endDate = [endDate copy];
-		
-		if (_endDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_endDate nodeValue]]];
-		}
-	}
+	[self setLiteral:endDate forPredicate:SMProblemPredicate(2) cache:(id __strong *)&_endDate];
 }
 
 @synthesize notes = _notes;
 
 - (NSString *)notes
 {
-	if (!_notes) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_notes = [rslt.object literalValue];
-	}
-	return _notes;
+	return [self literalForPredicate:SMProblemPredicate(3) cache:(id __strong *)&_notes];
 }
 
 - (void)setNotes:(NSString *)notes
 {
-	if (notes != _notes) {
-		RedlandNode *predicate = (notes || _notes) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"] : nil;
-		if (_notes) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_notes = [notes copy];
-		
-		if (_notes) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_notes nodeValue]]];
-		}
-	}
+	[self setLiteral:notes forPredicate:SMProblemPredicate(3) cache:(id __strong *)&_notes];
 }
 
 @synthesize problemName = _problemName;
 
 - (SMCodedValue *)problemName
 {
-	if (!_problemName) {
-		
-		// get the "problemName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_problemName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _problemName) {
-		return nil;
-	}
-	
-	return _problemName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMProblemPredicate(4) cache:(id __strong *)&_problemName];
 }
 
 - (void)setProblemName:(SMCodedValue *)problemName
 {
-	if (problemName != _problemName) {
-		RedlandNode *predicate = (problemName || _problemName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemName"] : nil;
-		if (_problemName) {
-			[self.inModel removeSubmodel:_problemName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_problemName = problemName;
-		
-		if (_problemName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_problemName.subject]];
-			[self.inModel addSubmodel:_problemName.model];
-		}
-	}
+	[self setObject:problemName forPredicate:SMProblemPredicate(4) cache:(id __strong *)&_problemName];
 }
 
 @synthesize problemStatus = _problemStatus;
 
 - (SMCodedValue *)problemStatus
 {
-	if (!_problemStatus) {
-		
-		// get the "problemStatus" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemStatus"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_problemStatus = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _problemStatus) {
-		return nil;
-	}
-	
-	return _problemStatus;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMProblemPredicate(5) cache:(id __strong *)&_problemStatus];
 }
 
 - (void)setProblemStatus:(SMCodedValue *)problemStatus
 {
-	if (problemStatus != _problemStatus) {
-		RedlandNode *predicate = (problemStatus || _problemStatus) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#problemStatus"] : nil;
-		if (_problemStatus) {
-			[self.inModel removeSubmodel:_problemStatus.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_problemStatus = problemStatus;
-		
-		if (_problemStatus) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_problemStatus.subject]];
-			[self.inModel addSubmodel:_problemStatus.model];
-		}
-	}
+	[self setObject:problemStatus forPredicate:SMProblemPredicate(5) cache:(id __strong *)&_problemStatus];
 }
 
 @synthesize startDate = _startDate;
 
 - (NSString *)startDate
 {
-	if (!_startDate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_startDate = [rslt.object literalValue];
-	}
-	return _startDate;
+	return [self literalForPredicate:SMProblemPredicate(6) cache:(id __strong *)&_startDate];
 }
 
 - (void)setStartDate:(NSString *)startDate
 {
-	if (startDate != _startDate) {
-		RedlandNode *predicate = (startDate || _startDate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#startDate"] : nil;
-		if (_startDate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:startDate forPredicate:SMProblemPredicate(6) cache:(id __strong *)&_startDate];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	NSMutableArray *encounters = _encounters ? nil : [NSMutableArray array];
+	NSString *endDate = nil;
+	NSString *notes = nil;
+	SMCodedValue *problemName = nil;
+	SMCodedValue *problemStatus = nil;
+	NSString *startDate = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMProblemPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1: {
+				SMEncounter *newItem = [SMEncounter newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[encounters addObject:newItem];
+				}
+				break;
+			}
+			case 2:
+				if (!endDate) {
+					endDate = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!notes) {
+					notes = [rslt.object literalValue];
+				}
+				break;
+			case 4:
+				if (!problemName) {
+					problemName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!problemStatus) {
+					problemStatus = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 6:
+				if (!startDate) {
+					startDate = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_startDate = [startDate copy];
-		
-		if (_startDate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_startDate nodeValue]]];
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_encounters) {
+		_encounters = [encounters copy];
+	}
+	if (!_endDate) {
+		_endDate = endDate ? endDate : (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = notes ? notes : (id)[NSNull null];
+	}
+	if (!_problemName) {
+		_problemName = problemName ? problemName : (id)[NSNull null];
+	}
+	if (!_problemStatus) {
+		_problemStatus = problemStatus ? problemStatus : (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = startDate ? startDate : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeObjects:self.encounters forProperty:1];
+	[snapshot writeString:self.endDate forProperty:2];
+	[snapshot writeString:self.notes forProperty:3];
+	[snapshot writeObject:self.problemName forProperty:4];
+	[snapshot writeObject:self.problemStatus forProperty:5];
+	[snapshot writeString:self.startDate forProperty:6];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_encounters = [snapshot readObjects];
+				break;
+			case 2:
+				_endDate = [snapshot readString];
+				break;
+			case 3:
+				_notes = [snapshot readString];
+				break;
+			case 4:
+				_problemName = [snapshot readObject];
+				break;
+			case 5:
+				_problemStatus = [snapshot readObject];
+				break;
+			case 6:
+				_startDate = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_encounters) {
+		_encounters = @[];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_problemName) {
+		_problemName = (id)[NSNull null];
+	}
+	if (!_problemStatus) {
+		_problemStatus = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_encounters = [decoder objectsOfClass:[SMEncounter class] from:values[@"http://smartplatforms.org/terms#encounters"]];
+	_endDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#endDate"]];
+	_notes = [decoder stringFrom:values[@"http://smartplatforms.org/terms#notes"]];
+	_problemName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#problemName"]];
+	_problemStatus = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#problemStatus"]];
+	_startDate = [decoder stringFrom:values[@"http://smartplatforms.org/terms#startDate"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_encounters) {
+		_encounters = @[];
+	}
+	if (!_endDate) {
+		_endDate = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_problemName) {
+		_problemName = (id)[NSNull null];
+	}
+	if (!_problemStatus) {
+		_problemStatus = (id)[NSNull null];
+	}
+	if (!_startDate) {
+		_startDate = (id)[NSNull null];
+	}
 }
 
 
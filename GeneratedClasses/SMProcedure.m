@@ -2,8 +2,8 @@
  SMProcedure.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMProcedure.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMProcedure, indexed like its sorted properties
+static RedlandNode *SMProcedurePredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMProcedurePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMProcedureLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMProcedurePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMProcedurePredicates[1] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMProcedurePredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
+		SMProcedurePredicates[3] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureName"];
+		SMProcedurePredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureStatus"];
+		SMProcedurePredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMProcedurePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMProcedurePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMProcedurePredicate(NSUInteger idx)
+{
+	SMProcedureLoadPredicates();
+	return SMProcedurePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMProcedurePredicateIndex(RedlandNode *predicate)
+{
+	SMProcedureLoadPredicates();
+	NSNumber *idx = SMProcedurePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMProcedure
 
 
@@ -34,240 +84,253 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMProcedurePredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMProcedurePredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMProcedurePredicate(1) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMProcedurePredicate(1) cache:(id __strong *)&_date];
 }
 
 @synthesize notes = _notes;
 
 - (NSString *)notes
 {
-	if (!_notes) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_notes = [rslt.object literalValue];
-	}
-	return _notes;
+	return [self literalForPredicate:SMProcedurePredicate(2) cache:(id __strong *)&_notes];
 }
 
 - (void)setNotes:(NSString *)notes
 {
-	if (notes != _notes) {
-		RedlandNode *predicate = (notes || _notes) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#notes"] : nil;
-		if (_notes) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_notes = [notes copy];
-		
-		if (_notes) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_notes nodeValue]]];
-		}
-	}
+	[self setLiteral:notes forPredicate:SMProcedurePredicate(2) cache:(id __strong *)&_notes];
 }
 
 @synthesize procedureName = _procedureName;
 
 - (SMCodedValue *)procedureName
 {
-	if (!_procedureName) {
-		
-		// get the "procedureName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_procedureName = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _procedureName) {
-		return nil;
-	}
-	
-	return _procedureName;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMProcedurePredicate(3) cache:(id __strong *)&_procedureName];
 }
 
 - (void)setProcedureName:(SMCodedValue *)procedureName
 {
-	if (procedureName != _procedureName) {
-		RedlandNode *predicate = (procedureName || _procedureName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureName"] : nil;
-		if (_procedureName) {
-			[self.inModel removeSubmodel:_procedureName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_procedureName = procedureName;
-		
-		if (_procedureName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_procedureName.subject]];
-			[self.inModel addSubmodel:_procedureName.model];
-		}
-	}
+	[self setObject:procedureName forPredicate:SMProcedurePredicate(3) cache:(id __strong *)&_procedureName];
 }
 
 @synthesize procedureStatus = _procedureStatus;
 
 - (SMCodedValue *)procedureStatus
 {
-	if (!_procedureStatus) {
-		
-		// get the "procedureStatus" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureStatus"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_procedureStatus = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _procedureStatus) {
-		return nil;
-	}
-	
-	return _procedureStatus;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMProcedurePredicate(4) cache:(id __strong *)&_procedureStatus];
 }
 
 - (void)setProcedureStatus:(SMCodedValue *)procedureStatus
 {
-	if (procedureStatus != _procedureStatus) {
-		RedlandNode *predicate = (procedureStatus || _procedureStatus) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#procedureStatus"] : nil;
-		if (_procedureStatus) {
-			[self.inModel removeSubmodel:_procedureStatus.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_procedureStatus = procedureStatus;
-		
-		if (_procedureStatus) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_procedureStatus.subject]];
-			[self.inModel addSubmodel:_procedureStatus.model];
-		}
-	}
+	[self setObject:procedureStatus forPredicate:SMProcedurePredicate(4) cache:(id __strong *)&_procedureStatus];
 }
 
 @synthesize provider = _provider;
 
 - (NSArray *)provider
 {
-	if (!_provider) {
-		
-		// get the "provider" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMProvider *newItem = [SMProvider newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_provider = [arr copy];
-	}
-	return _provider;
+	return [self objectsOfClass:[SMProvider class] forPredicate:SMProcedurePredicate(5) cache:&_provider];
 }
 
 - (void)setProvider:(NSArray *)provider
 {
-	if (provider != _provider) {
-		RedlandNode *predicate = (provider || _provider) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#provider"] : nil;
-		if (_provider) {
-			for (SMProvider *item in _provider) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:provider forPredicate:SMProcedurePredicate(5) cache:&_provider];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	NSString *date = nil;
+	NSString *notes = nil;
+	SMCodedValue *procedureName = nil;
+	SMCodedValue *procedureStatus = nil;
+	NSMutableArray *provider = _provider ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMProcedurePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!notes) {
+					notes = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!procedureName) {
+					procedureName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 4:
+				if (!procedureStatus) {
+					procedureStatus = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5: {
+				SMProvider *newItem = [SMProvider newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[provider addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = notes ? notes : (id)[NSNull null];
+	}
+	if (!_procedureName) {
+		_procedureName = procedureName ? procedureName : (id)[NSNull null];
+	}
+	if (!_procedureStatus) {
+		_procedureStatus = procedureStatus ? procedureStatus : (id)[NSNull null];
+	}
+	if (!_provider) {
 		_provider = [provider copy];
-		
-		if (_provider) {
-			for (SMProvider *item in _provider) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeString:self.date forProperty:1];
+	[snapshot writeString:self.notes forProperty:2];
+	[snapshot writeObject:self.procedureName forProperty:3];
+	[snapshot writeObject:self.procedureStatus forProperty:4];
+	[snapshot writeObjects:self.provider forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_date = [snapshot readString];
+				break;
+			case 2:
+				_notes = [snapshot readString];
+				break;
+			case 3:
+				_procedureName = [snapshot readObject];
+				break;
+			case 4:
+				_procedureStatus = [snapshot readObject];
+				break;
+			case 5:
+				_provider = [snapshot readObjects];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_procedureName) {
+		_procedureName = (id)[NSNull null];
+	}
+	if (!_procedureStatus) {
+		_procedureStatus = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_notes = [decoder stringFrom:values[@"http://smartplatforms.org/terms#notes"]];
+	_procedureName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#procedureName"]];
+	_procedureStatus = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#procedureStatus"]];
+	_provider = [decoder objectsOfClass:[SMProvider class] from:values[@"http://smartplatforms.org/terms#provider"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_notes) {
+		_notes = (id)[NSNull null];
+	}
+	if (!_procedureName) {
+		_procedureName = (id)[NSNull null];
+	}
+	if (!_procedureStatus) {
+		_procedureStatus = (id)[NSNull null];
+	}
+	if (!_provider) {
+		_provider = @[];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMProvider.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,66 @@
 
 #import "SMProvider.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMProvider, indexed like its sorted properties
+static RedlandNode *SMProviderPredicates[12];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMProviderPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMProviderLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMProviderPredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
+		SMProviderPredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
+		SMProviderPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#deaNumber"];
+		SMProviderPredicates[3] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
+		SMProviderPredicates[4] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"];
+		SMProviderPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#ethnicity"];
+		SMProviderPredicates[6] = [RedlandNode nodeWithURIString:@"http://xmlns.com/foaf/0.1/gender"];
+		SMProviderPredicates[7] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"];
+		SMProviderPredicates[8] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#npiNumber"];
+		SMProviderPredicates[9] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#preferredLanguage"];
+		SMProviderPredicates[10] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#race"];
+		SMProviderPredicates[11] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:12];
+		for (NSUInteger i = 0; i < 12; i++) {
+			indexes[[[SMProviderPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMProviderPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMProviderPredicate(NSUInteger idx)
+{
+	SMProviderLoadPredicates();
+	return SMProviderPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMProviderPredicateIndex(RedlandNode *predicate)
+{
+	SMProviderLoadPredicates();
+	NSNumber *idx = SMProviderPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMProvider
 
 
@@ -34,430 +90,449 @@
 
 - (NSArray *)adr
 {
-	if (!_adr) {
-		
-		// get the "adr" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMAddress *newItem = [SMAddress newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_adr = [arr copy];
-	}
-	return _adr;
+	return [self objectsOfClass:[SMAddress class] forPredicate:SMProviderPredicate(0) cache:&_adr];
 }
 
 - (void)setAdr:(NSArray *)adr
 {
-	if (adr != _adr) {
-		RedlandNode *predicate = (adr || _adr) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"] : nil;
-		if (_adr) {
-			for (SMAddress *item in _adr) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_adr = [adr copy];
-		
-		if (_adr) {
-			for (SMAddress *item in _adr) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:adr forPredicate:SMProviderPredicate(0) cache:&_adr];
 }
 
 @synthesize bday = _bday;
 
 - (NSString *)bday
 {
-	if (!_bday) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_bday = [rslt.object literalValue];
-	}
-	return _bday;
+	return [self literalForPredicate:SMProviderPredicate(1) cache:(id __strong *)&_bday];
 }
 
 - (void)setBday:(NSString *)bday
 {
-	if (bday != _bday) {
-		RedlandNode *predicate = (bday || _bday) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"] : nil;
-		if (_bday) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bday = [bday copy];
-		
-		if (_bday) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_bday nodeValue]]];
-		}
-	}
+	[self setLiteral:bday forPredicate:SMProviderPredicate(1) cache:(id __strong *)&_bday];
 }
 
 @synthesize deaNumber = _deaNumber;
 
 - (NSString *)deaNumber
 {
-	if (!_deaNumber) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#deaNumber"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_deaNumber = [rslt.object literalValue];
-	}
-	return _deaNumber;
+	return [self literalForPredicate:SMProviderPredicate(2) cache:(id __strong *)&_deaNumber];
 }
 
 - (void)setDeaNumber:(NSString *)deaNumber
 {
-	if (deaNumber != _deaNumber) {
-		RedlandNode *predicate = (deaNumber || _deaNumber) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#deaNumber"] : nil;
-		if (_deaNumber) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_deaNumber = [deaNumber copy];
-		
-		if (_deaNumber) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_deaNumber nodeValue]]];
-		}
-	}
+	[self setLiteral:deaNumber forPredicate:SMProviderPredicate(2) cache:(id __strong *)&_deaNumber];
 }
 
 @synthesize deathdate = _deathdate;
 
 - (NSString *)deathdate
 {
-	if (!_deathdate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_deathdate = [rslt.object literalValue];
-	}
-	return _deathdate;
+	return [self literalForPredicate:SMProviderPredicate(3) cache:(id __strong *)&_deathdate];
 }
 
 - (void)setDeathdate:(NSString *)deathdate
 {
-	if (deathdate != _deathdate) {
-		RedlandNode *predicate = (deathdate || _deathdate) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"] : nil;
-		if (_deathdate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_deathdate = [deathdate copy];
-		
-		if (_deathdate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_deathdate nodeValue]]];
-		}
-	}
+	[self setLiteral:deathdate forPredicate:SMProviderPredicate(3) cache:(id __strong *)&_deathdate];
 }
 
 @synthesize email = _email;
 
 - (NSArray *)email
 {
-	if (!_email) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			NSString *newItem = [rslt.object literalValue];		// only works for NSString for now
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_email = [arr copy];
-	}
-	return _email;
+	return [self literalsForPredicate:SMProviderPredicate(4) cache:&_email];
 }
 
 - (void)setEmail:(NSArray *)email
 {
-	if (email != _email) {
-		RedlandNode *predicate = (email || _email) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"] : nil;
-		if (_email) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_email = [email copy];
-		
-		if (_email) {
-			for (NSString *newItem in _email) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[newItem nodeValue]]];
-			}
-		}
-	}
+	[self setLiterals:email forPredicate:SMProviderPredicate(4) cache:&_email];
 }
 
 @synthesize ethnicity = _ethnicity;
 
 - (NSString *)ethnicity
 {
-	if (!_ethnicity) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#ethnicity"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_ethnicity = [rslt.object literalValue];
-	}
-	return _ethnicity;
+	return [self literalForPredicate:SMProviderPredicate(5) cache:(id __strong *)&_ethnicity];
 }
 
 - (void)setEthnicity:(NSString *)ethnicity
 {
-	if (ethnicity != _ethnicity) {
-		RedlandNode *predicate = (ethnicity || _ethnicity) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#ethnicity"] : nil;
-		if (_ethnicity) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_ethnicity = [ethnicity copy];
-		
-		if (_ethnicity) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_ethnicity nodeValue]]];
-		}
-	}
+	[self setLiteral:ethnicity forPredicate:SMProviderPredicate(5) cache:(id __strong *)&_ethnicity];
 }
 
 @synthesize gender = _gender;
 
 - (NSString *)gender
 {
-	if (!_gender) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://xmlns.com/foaf/0.1/gender"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_gender = [rslt.object literalValue];
-	}
-	return _gender;
+	return [self literalForPredicate:SMProviderPredicate(6) cache:(id __strong *)&_gender];
 }
 
 - (void)setGender:(NSString *)gender
 {
-	if (gender != _gender) {
-		RedlandNode *predicate = (gender || _gender) ? [RedlandNode nodeWithURIString:@"http://xmlns.com/foaf/0.1/gender"] : nil;
-		if (_gender) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_gender = [gender copy];
-		
-		if (_gender) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_gender nodeValue]]];
-		}
-	}
+	[self setLiteral:gender forPredicate:SMProviderPredicate(6) cache:(id __strong *)&_gender];
 }
 
 @synthesize n = _n;
 
 - (SMName *)n
 {
-	if (!_n) {
-		
-		// get the "n" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMName *obj = [SMName newWithSubject:rslt.object inModel:self.inModel];
-		_n = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _n) {
-		return nil;
-	}
-	
-	return _n;
+	return [self objectOfClass:[SMName class] forPredicate:SMProviderPredicate(7) cache:(id __strong *)&_n];
 }
 
 - (void)setN:(SMName *)n
 {
-	if (n != _n) {
-		RedlandNode *predicate = (n || _n) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"] : nil;
-		if (_n) {
-			[self.inModel removeSubmodel:_n.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_n = n;
-		
-		if (_n) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_n.subject]];
-			[self.inModel addSubmodel:_n.model];
-		}
-	}
+	[self setObject:n forPredicate:SMProviderPredicate(7) cache:(id __strong *)&_n];
 }
 
 @synthesize npiNumber = _npiNumber;
 
 - (NSString *)npiNumber
 {
-	if (!_npiNumber) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#npiNumber"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_npiNumber = [rslt.object literalValue];
-	}
-	return _npiNumber;
+	return [self literalForPredicate:SMProviderPredicate(8) cache:(id __strong *)&_npiNumber];
 }
 
 - (void)setNpiNumber:(NSString *)npiNumber
 {
-	if (npiNumber != _npiNumber) {
-		RedlandNode *predicate = (npiNumber || _npiNumber) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#npiNumber"] : nil;
-		if (_npiNumber) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_npiNumber = [npiNumber copy];
-		
-		if (_npiNumber) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_npiNumber nodeValue]]];
-		}
-	}
+	[self setLiteral:npiNumber forPredicate:SMProviderPredicate(8) cache:(id __strong *)&_npiNumber];
 }
 
 @synthesize preferredLanguage = _preferredLanguage;
 
 - (NSString *)preferredLanguage
 {
-	if (!_preferredLanguage) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#preferredLanguage"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_preferredLanguage = [rslt.object literalValue];
-	}
-	return _preferredLanguage;
+	return [self literalForPredicate:SMProviderPredicate(9) cache:(id __strong *)&_preferredLanguage];
 }
 
 - (void)setPreferredLanguage:(NSString *)preferredLanguage
 {
-	if (preferredLanguage != _preferredLanguage) {
-		RedlandNode *predicate = (preferredLanguage || _preferredLanguage) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#preferredLanguage"] : nil;
-		if (_preferredLanguage) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_preferredLanguage = [preferredLanguage copy];
-		
-		if (_preferredLanguage) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_preferredLanguage nodeValue]]];
-		}
-	}
+	[self setLiteral:preferredLanguage forPredicate:SMProviderPredicate(9) cache:(id __strong *)&_preferredLanguage];
 }
 
 @synthesize race = _race;
 
 - (NSString *)race
 {
-	if (!_race) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#race"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_race = [rslt.object literalValue];
-	}
-	return _race;
+	return [self literalForPredicate:SMProviderPredicate(10) cache:(id __strong *)&_race];
 }
 
 - (void)setRace:(NSString *)race
 {
-	if (race != _race) {
-		RedlandNode *predicate = (race || _race) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#race"] : nil;
-		if (_race) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_race = [race copy];
-		
-		if (_race) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_race nodeValue]]];
-		}
-	}
+	[self setLiteral:race forPredicate:SMProviderPredicate(10) cache:(id __strong *)&_race];
 }
 
 @synthesize tel = _tel;
 
 - (NSArray *)tel
 {
-	if (!_tel) {
-		
-		// get the "tel" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMTel *newItem = [SMTel newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_tel = [arr copy];
-	}
-	return _tel;
+	return [self objectsOfClass:[SMTel class] forPredicate:SMProviderPredicate(11) cache:&_tel];
 }
 
 - (void)setTel:(NSArray *)tel
 {
-	if (tel != _tel) {
-		RedlandNode *predicate = (tel || _tel) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"] : nil;
-		if (_tel) {
-			for (SMTel *item in _tel) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:tel forPredicate:SMProviderPredicate(11) cache:&_tel];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSMutableArray *adr = _adr ? nil : [NSMutableArray array];
+	NSString *bday = nil;
+	NSString *deaNumber = nil;
+	NSString *deathdate = nil;
+	NSMutableArray *email = _email ? nil : [NSMutableArray array];
+	NSString *ethnicity = nil;
+	NSString *gender = nil;
+	SMName *n = nil;
+	NSString *npiNumber = nil;
+	NSString *preferredLanguage = nil;
+	NSString *race = nil;
+	NSMutableArray *tel = _tel ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMProviderPredicateIndex(rslt.predicate)) {
+			case 0: {
+				SMAddress *newItem = [SMAddress newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[adr addObject:newItem];
+				}
+				break;
+			}
+			case 1:
+				if (!bday) {
+					bday = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!deaNumber) {
+					deaNumber = [rslt.object literalValue];
+				}
+				break;
+			case 3:
+				if (!deathdate) {
+					deathdate = [rslt.object literalValue];
+				}
+				break;
+			case 4: {
+				NSString *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[email addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			case 5:
+				if (!ethnicity) {
+					ethnicity = [rslt.object literalValue];
+				}
+				break;
+			case 6:
+				if (!gender) {
+					gender = [rslt.object literalValue];
+				}
+				break;
+			case 7:
+				if (!n) {
+					n = [SMName newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 8:
+				if (!npiNumber) {
+					npiNumber = [rslt.object literalValue];
+				}
+				break;
+			case 9:
+				if (!preferredLanguage) {
+					preferredLanguage = [rslt.object literalValue];
+				}
+				break;
+			case 10:
+				if (!race) {
+					race = [rslt.object literalValue];
+				}
+				break;
+			case 11: {
+				SMTel *newItem = [SMTel newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[tel addObject:newItem];
+				}
+				break;
+			}
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_adr) {
+		_adr = [adr copy];
+	}
+	if (!_bday) {
+		_bday = bday ? bday : (id)[NSNull null];
+	}
+	if (!_deaNumber) {
+		_deaNumber = deaNumber ? deaNumber : (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = deathdate ? deathdate : (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = [email copy];
+	}
+	if (!_ethnicity) {
+		_ethnicity = ethnicity ? ethnicity : (id)[NSNull null];
+	}
+	if (!_gender) {
+		_gender = gender ? gender : (id)[NSNull null];
+	}
+	if (!_n) {
+		_n = n ? n : (id)[NSNull null];
+	}
+	if (!_npiNumber) {
+		_npiNumber = npiNumber ? npiNumber : (id)[NSNull null];
+	}
+	if (!_preferredLanguage) {
+		_preferredLanguage = preferredLanguage ? preferredLanguage : (id)[NSNull null];
+	}
+	if (!_race) {
+		_race = race ? race : (id)[NSNull null];
+	}
+	if (!_tel) {
 		_tel = [tel copy];
-		
-		if (_tel) {
-			for (SMTel *item in _tel) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObjects:self.adr forProperty:0];
+	[snapshot writeString:self.bday forProperty:1];
+	[snapshot writeString:self.deaNumber forProperty:2];
+	[snapshot writeString:self.deathdate forProperty:3];
+	[snapshot writeStrings:self.email forProperty:4];
+	[snapshot writeString:self.ethnicity forProperty:5];
+	[snapshot writeString:self.gender forProperty:6];
+	[snapshot writeObject:self.n forProperty:7];
+	[snapshot writeString:self.npiNumber forProperty:8];
+	[snapshot writeString:self.preferredLanguage forProperty:9];
+	[snapshot writeString:self.race forProperty:10];
+	[snapshot writeObjects:self.tel forProperty:11];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_adr = [snapshot readObjects];
+				break;
+			case 1:
+				_bday = [snapshot readString];
+				break;
+			case 2:
+				_deaNumber = [snapshot readString];
+				break;
+			case 3:
+				_deathdate = [snapshot readString];
+				break;
+			case 4:
+				_email = [snapshot readStrings];
+				break;
+			case 5:
+				_ethnicity = [snapshot readString];
+				break;
+			case 6:
+				_gender = [snapshot readString];
+				break;
+			case 7:
+				_n = [snapshot readObject];
+				break;
+			case 8:
+				_npiNumber = [snapshot readString];
+				break;
+			case 9:
+				_preferredLanguage = [snapshot readString];
+				break;
+			case 10:
+				_race = [snapshot readString];
+				break;
+			case 11:
+				_tel = [snapshot readObjects];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_adr) {
+		_adr = @[];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_deaNumber) {
+		_deaNumber = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = @[];
+	}
+	if (!_ethnicity) {
+		_ethnicity = (id)[NSNull null];
+	}
+	if (!_gender) {
+		_gender = (id)[NSNull null];
+	}
+	if (!_n) {
+		_n = (id)[NSNull null];
+	}
+	if (!_npiNumber) {
+		_npiNumber = (id)[NSNull null];
+	}
+	if (!_preferredLanguage) {
+		_preferredLanguage = (id)[NSNull null];
+	}
+	if (!_race) {
+		_race = (id)[NSNull null];
+	}
+	if (!_tel) {
+		_tel = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_adr = [decoder objectsOfClass:[SMAddress class] from:values[@"http://www.w3.org/2006/vcard/ns#adr"]];
+	_bday = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#bday"]];
+	_deaNumber = [decoder stringFrom:values[@"http://smartplatforms.org/terms#deaNumber"]];
+	_deathdate = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#deathdate"]];
+	_email = [decoder stringsFrom:values[@"http://www.w3.org/2006/vcard/ns#email"]];
+	_ethnicity = [decoder stringFrom:values[@"http://smartplatforms.org/terms#ethnicity"]];
+	_gender = [decoder stringFrom:values[@"http://xmlns.com/foaf/0.1/gender"]];
+	_n = [decoder objectOfClass:[SMName class] from:values[@"http://www.w3.org/2006/vcard/ns#n"]];
+	_npiNumber = [decoder stringFrom:values[@"http://smartplatforms.org/terms#npiNumber"]];
+	_preferredLanguage = [decoder stringFrom:values[@"http://smartplatforms.org/terms#preferredLanguage"]];
+	_race = [decoder stringFrom:values[@"http://smartplatforms.org/terms#race"]];
+	_tel = [decoder objectsOfClass:[SMTel class] from:values[@"http://www.w3.org/2006/vcard/ns#tel"]];
+	
+	if (!_adr) {
+		_adr = @[];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_deaNumber) {
+		_deaNumber = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = @[];
+	}
+	if (!_ethnicity) {
+		_ethnicity = (id)[NSNull null];
+	}
+	if (!_gender) {
+		_gender = (id)[NSNull null];
+	}
+	if (!_n) {
+		_n = (id)[NSNull null];
+	}
+	if (!_npiNumber) {
+		_npiNumber = (id)[NSNull null];
+	}
+	if (!_preferredLanguage) {
+		_preferredLanguage = (id)[NSNull null];
+	}
+	if (!_race) {
+		_race = (id)[NSNull null];
+	}
+	if (!_tel) {
+		_tel = @[];
+	}
 }
 
 
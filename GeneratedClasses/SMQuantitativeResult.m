@@ -2,8 +2,8 @@
  SMQuantitativeResult.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMQuantitativeResult.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMQuantitativeResult, indexed like its sorted properties
+static RedlandNode *SMQuantitativeResultPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMQuantitativeResultPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMQuantitativeResultLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMQuantitativeResultPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#nonCriticalRange"];
+		SMQuantitativeResultPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#normalRange"];
+		SMQuantitativeResultPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#valueAndUnit"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMQuantitativeResultPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMQuantitativeResultPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMQuantitativeResultPredicate(NSUInteger idx)
+{
+	SMQuantitativeResultLoadPredicates();
+	return SMQuantitativeResultPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMQuantitativeResultPredicateIndex(RedlandNode *predicate)
+{
+	SMQuantitativeResultLoadPredicates();
+	NSNumber *idx = SMQuantitativeResultPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMQuantitativeResult
 
 
@@ -34,129 +81,155 @@
 
 - (SMValueRange *)nonCriticalRange
 {
-	if (!_nonCriticalRange) {
-		
-		// get the "nonCriticalRange" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#nonCriticalRange"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueRange *obj = [SMValueRange newWithSubject:rslt.object inModel:self.inModel];
-		_nonCriticalRange = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _nonCriticalRange) {
-		return nil;
-	}
-	
-	return _nonCriticalRange;
+	return [self objectOfClass:[SMValueRange class] forPredicate:SMQuantitativeResultPredicate(0) cache:(id __strong *)&_nonCriticalRange];
 }
 
 - (void)setNonCriticalRange:(SMValueRange *)nonCriticalRange
 {
-	if (nonCriticalRange != _nonCriticalRange) {
-		RedlandNode *predicate = (nonCriticalRange || _nonCriticalRange) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#nonCriticalRange"] : nil;
-		if (_nonCriticalRange) {
-			[self.inModel removeSubmodel:_nonCriticalRange.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_nonCriticalRange = nonCriticalRange;
-		
-		if (_nonCriticalRange) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_nonCriticalRange.subject]];
-			[self.inModel addSubmodel:_nonCriticalRange.model];
-		}
-	}
+	[self setObject:nonCriticalRange forPredicate:SMQuantitativeResultPredicate(0) cache:(id __strong *)&_nonCriticalRange];
 }
 
 @synthesize normalRange = _normalRange;
 
 - (SMValueRange *)normalRange
 {
-	if (!_normalRange) {
-		
-		// get the "normalRange" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#normalRange"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueRange *obj = [SMValueRange newWithSubject:rslt.object inModel:self.inModel];
-		_normalRange = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _normalRange) {
-		return nil;
-	}
-	
-	return _normalRange;
+	return [self objectOfClass:[SMValueRange class] forPredicate:SMQuantitativeResultPredicate(1) cache:(id __strong *)&_normalRange];
 }
 
 - (void)setNormalRange:(SMValueRange *)normalRange
 {
-	if (normalRange != _normalRange) {
-		RedlandNode *predicate = (normalRange || _normalRange) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#normalRange"] : nil;
-		if (_normalRange) {
-			[self.inModel removeSubmodel:_normalRange.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_normalRange = normalRange;
-		
-		if (_normalRange) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_normalRange.subject]];
-			[self.inModel addSubmodel:_normalRange.model];
-		}
-	}
+	[self setObject:normalRange forPredicate:SMQuantitativeResultPredicate(1) cache:(id __strong *)&_normalRange];
 }
 
 @synthesize valueAndUnit = _valueAndUnit;
 
 - (SMValueAndUnit *)valueAndUnit
 {
-	if (!_valueAndUnit) {
-		
-		// get the "valueAndUnit" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#valueAndUnit"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_valueAndUnit = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMQuantitativeResultPredicate(2) cache:(id __strong *)&_valueAndUnit];
+}
+
+- (void)setValueAndUnit:(SMValueAndUnit *)valueAndUnit
+{
+	[self setObject:valueAndUnit forPredicate:SMQuantitativeResultPredicate(2) cache:(id __strong *)&_valueAndUnit];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMValueRange *nonCriticalRange = nil;
+	SMValueRange *normalRange = nil;
+	SMValueAndUnit *valueAndUnit = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _valueAndUnit) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMQuantitativeResultPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!nonCriticalRange) {
+					nonCriticalRange = [SMValueRange newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!normalRange) {
+					normalRange = [SMValueRange newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!valueAndUnit) {
+					valueAndUnit = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _valueAndUnit;
+	if (!_nonCriticalRange) {
+		_nonCriticalRange = nonCriticalRange ? nonCriticalRange : (id)[NSNull null];
+	}
+	if (!_normalRange) {
+		_normalRange = normalRange ? normalRange : (id)[NSNull null];
+	}
+	if (!_valueAndUnit) {
+		_valueAndUnit = valueAndUnit ? valueAndUnit : (id)[NSNull null];
+	}
 }
 
-- (void)setValueAndUnit:(SMValueAndUnit *)valueAndUnit
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (valueAndUnit != _valueAndUnit) {
-		RedlandNode *predicate = (valueAndUnit || _valueAndUnit) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#valueAndUnit"] : nil;
-		if (_valueAndUnit) {
-			[self.inModel removeSubmodel:_valueAndUnit.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_valueAndUnit = valueAndUnit;
-		
-		if (_valueAndUnit) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_valueAndUnit.subject]];
-			[self.inModel addSubmodel:_valueAndUnit.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.nonCriticalRange forProperty:0];
+	[snapshot writeObject:self.normalRange forProperty:1];
+	[snapshot writeObject:self.valueAndUnit forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_nonCriticalRange = [snapshot readObject];
+				break;
+			case 1:
+				_normalRange = [snapshot readObject];
+				break;
+			case 2:
+				_valueAndUnit = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_nonCriticalRange) {
+		_nonCriticalRange = (id)[NSNull null];
+	}
+	if (!_normalRange) {
+		_normalRange = (id)[NSNull null];
+	}
+	if (!_valueAndUnit) {
+		_valueAndUnit = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_nonCriticalRange = [decoder objectOfClass:[SMValueRange class] from:values[@"http://smartplatforms.org/terms#nonCriticalRange"]];
+	_normalRange = [decoder objectOfClass:[SMValueRange class] from:values[@"http://smartplatforms.org/terms#normalRange"]];
+	_valueAndUnit = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#valueAndUnit"]];
+	
+	if (!_nonCriticalRange) {
+		_nonCriticalRange = (id)[NSNull null];
+	}
+	if (!_normalRange) {
+		_normalRange = (id)[NSNull null];
+	}
+	if (!_valueAndUnit) {
+		_valueAndUnit = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMRecord+Calls.h
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -29,6 +29,7 @@
  */
 @interface SMRecord(Calls)
 
+- (NSDictionary *)prefetchableCalls;
 - (void)getAllergies:(SMSuccessRetvalueBlock)callback;
 - (void)getClinicalNotes:(SMSuccessRetvalueBlock)callback;
 - (void)getDemographics:(SMSuccessRetvalueBlock)callback;
@@ -48,6 +49,7 @@
 - (void)getProcedures:(SMSuccessRetvalueBlock)callback;
 - (void)getSocialHistory:(SMSuccessRetvalueBlock)callback;
 - (void)getVitalSignSets:(SMSuccessRetvalueBlock)callback;
+- (void)prefetch:(NSArray *)callNames callback:(SMSuccessRetvalueBlock)callback;
 
 
 @end
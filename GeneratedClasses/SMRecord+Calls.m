@@ -2,8 +2,8 @@
  SMRecord+Calls.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -23,11 +23,37 @@
 #import "SMRecord+Calls.h"
 #import "SMARTObjects.h"
 
+#import <Redland-ObjC.h>
+
 
 @implementation SMRecord(Calls)
 
 
 #pragma mark - Synthesized Methods
+/**
+ *  Fetches the given record calls concurrently and merges their objects into the record's model, see prefetchCalls:callback:.
+ *
+ *  Use this instead of calling several getters one after another, for example when a record is opened.
+ *  @param callNames The original names of the calls to prefetch, like "get_allergies", nil to prefetch all calls
+ *  @param callback A SMSuccessRetvalueBlock block that will have a success flag and a user info dictionary containing the objects of every call
+ *  (key: SMARTResponseCallsKey) and the record's model (key: SMARTResponseModelKey).
+ */
+- (void)prefetch:(NSArray *)callNames callback:(SMSuccessRetvalueBlock)callback
+{
+	NSDictionary *known = [self prefetchableCalls];
+	NSMutableDictionary *calls = [NSMutableDictionary dictionaryWithCapacity:[known count]];
+	for (NSString *name in (callNames ? callNames : [known allKeys])) {
+		if (!known[name]) {
+			NSString *errStr = [NSString stringWithFormat:@"There is no record call named \"%@\" to prefetch", name];
+			SUCCESS_RETVAL_CALLBACK_OR_LOG_ERR_STRING(callback, errStr, 0)
+			return;
+		}
+		calls[name] = known[name];
+	}
+	
+	[self prefetchCalls:calls callback:callback];
+}
+
 /**
  *  Get Demographics for a patient.
  *
@@ -275,5 +301,33 @@
 	[self getObjectsOfClass:[SMMedicalImage class] from:path callback:callback];
 }
 
+/**
+ *  The record calls prefetch:callback: can fire, keyed by their original name, in the form prefetchCalls:callback: expects.
+ */
+- (NSDictionary *)prefetchableCalls
+{
+	return @{
+		@"get_allergies": @[[SMAllergy class], [NSString stringWithFormat:@"/records/%@/allergies/", self.record_id]],
+		@"get_clinical_notes": @[[SMClinicalNote class], [NSString stringWithFormat:@"/records/%@/clinical_notes/", self.record_id]],
+		@"get_demographics": @[[SMDemographics class], [NSString stringWithFormat:@"/records/%@/demographics", self.record_id]],
+		@"get_documents": @[[SMDocument class], [NSString stringWithFormat:@"/records/%@/documents/", self.record_id]],
+		@"get_encounters": @[[SMEncounter class], [NSString stringWithFormat:@"/records/%@/encounters/", self.record_id]],
+		@"get_family_history_observations": @[[SMFamilyHistoryObservation class], [NSString stringWithFormat:@"/records/%@/family_history/", self.record_id]],
+		@"get_fulfillments": @[[SMFulfillment class], [NSString stringWithFormat:@"/records/%@/fulfillments/", self.record_id]],
+		@"get_imaging_studies": @[[SMImagingStudy class], [NSString stringWithFormat:@"/records/%@/imaging_studies/", self.record_id]],
+		@"get_immunizations": @[[SMImmunization class], [NSString stringWithFormat:@"/records/%@/immunizations/", self.record_id]],
+		@"get_lab_panel": @[[SMLabPanel class], [NSString stringWithFormat:@"/records/%@/lab_panels/", self.record_id]],
+		@"get_lab_panels": @[[SMLabPanel class], [NSString stringWithFormat:@"/records/%@/lab_panels/", self.record_id]],
+		@"get_lab_results": @[[SMLabResult class], [NSString stringWithFormat:@"/records/%@/lab_results/", self.record_id]],
+		@"get_medical_images": @[[SMMedicalImage class], [NSString stringWithFormat:@"/records/%@/medical_images/", self.record_id]],
+		@"get_medications": @[[SMMedication class], [NSString stringWithFormat:@"/records/%@/medications/", self.record_id]],
+		@"get_photograph": @[[SMPhotograph class], [NSString stringWithFormat:@"/records/%@/photograph", self.record_id]],
+		@"get_problems": @[[SMProblem class], [NSString stringWithFormat:@"/records/%@/problems/", self.record_id]],
+		@"get_procedures": @[[SMProcedure class], [NSString stringWithFormat:@"/records/%@/procedures/", self.record_id]],
+		@"get_social_history": @[[SMSocialHistory class], [NSString stringWithFormat:@"/records/%@/social_history", self.record_id]],
+		@"get_vital_sign_sets": @[[SMVitalSignSet class], [NSString stringWithFormat:@"/records/%@/vital_sign_sets/", self.record_id]],
+	};
+}
+
 
 @end
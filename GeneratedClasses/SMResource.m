@@ -2,8 +2,8 @@
  SMResource.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMResource.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMResource, indexed like its sorted properties
+static RedlandNode *SMResourcePredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMResourcePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMResourceLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMResourcePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#content"];
+		SMResourcePredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hash"];
+		SMResourcePredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#location"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMResourcePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMResourcePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMResourcePredicate(NSUInteger idx)
+{
+	SMResourceLoadPredicates();
+	return SMResourcePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMResourcePredicateIndex(RedlandNode *predicate)
+{
+	SMResourceLoadPredicates();
+	NSNumber *idx = SMResourcePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMResource
 
 
@@ -34,117 +81,155 @@
 
 - (SMContent *)content
 {
-	if (!_content) {
-		
-		// get the "content" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#content"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMContent *obj = [SMContent newWithSubject:rslt.object inModel:self.inModel];
-		_content = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _content) {
-		return nil;
-	}
-	
-	return _content;
+	return [self objectOfClass:[SMContent class] forPredicate:SMResourcePredicate(0) cache:(id __strong *)&_content];
 }
 
 - (void)setContent:(SMContent *)content
 {
-	if (content != _content) {
-		RedlandNode *predicate = (content || _content) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#content"] : nil;
-		if (_content) {
-			[self.inModel removeSubmodel:_content.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_content = content;
-		
-		if (_content) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_content.subject]];
-			[self.inModel addSubmodel:_content.model];
-		}
-	}
+	[self setObject:content forPredicate:SMResourcePredicate(0) cache:(id __strong *)&_content];
 }
 
 @synthesize hash = _hash;
 
 - (SMHash *)hash
 {
-	if (!_hash) {
-		
-		// get the "hash" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hash"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMHash *obj = [SMHash newWithSubject:rslt.object inModel:self.inModel];
-		_hash = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _hash) {
-		return nil;
-	}
-	
-	return _hash;
+	return [self objectOfClass:[SMHash class] forPredicate:SMResourcePredicate(1) cache:(id __strong *)&_hash];
 }
 
 - (void)setHash:(SMHash *)hash
 {
-	if (hash != _hash) {
-		RedlandNode *predicate = (hash || _hash) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#hash"] : nil;
-		if (_hash) {
-			[self.inModel removeSubmodel:_hash.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_hash = hash;
-		
-		if (_hash) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_hash.subject]];
-			[self.inModel addSubmodel:_hash.model];
-		}
-	}
+	[self setObject:hash forPredicate:SMResourcePredicate(1) cache:(id __strong *)&_hash];
 }
 
 @synthesize location = _location;
 
 - (NSString *)location
 {
-	if (!_location) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#location"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_location = [rslt.object literalValue];
-	}
-	return _location;
+	return [self literalForPredicate:SMResourcePredicate(2) cache:(id __strong *)&_location];
 }
 
 - (void)setLocation:(NSString *)location
 {
-	if (location != _location) {
-		RedlandNode *predicate = (location || _location) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#location"] : nil;
-		if (_location) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:location forPredicate:SMResourcePredicate(2) cache:(id __strong *)&_location];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMContent *content = nil;
+	SMHash *hash = nil;
+	NSString *location = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMResourcePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!content) {
+					content = [SMContent newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!hash) {
+					hash = [SMHash newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!location) {
+					location = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_location = [location copy];
-		
-		if (_location) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_location nodeValue]]];
+	}
+	
+	if (!_content) {
+		_content = content ? content : (id)[NSNull null];
+	}
+	if (!_hash) {
+		_hash = hash ? hash : (id)[NSNull null];
+	}
+	if (!_location) {
+		_location = location ? location : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.content forProperty:0];
+	[snapshot writeObject:self.hash forProperty:1];
+	[snapshot writeString:self.location forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_content = [snapshot readObject];
+				break;
+			case 1:
+				_hash = [snapshot readObject];
+				break;
+			case 2:
+				_location = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_content) {
+		_content = (id)[NSNull null];
+	}
+	if (!_hash) {
+		_hash = (id)[NSNull null];
+	}
+	if (!_location) {
+		_location = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_content = [decoder objectOfClass:[SMContent class] from:values[@"http://smartplatforms.org/terms#content"]];
+	_hash = [decoder objectOfClass:[SMHash class] from:values[@"http://smartplatforms.org/terms#hash"]];
+	_location = [decoder stringFrom:values[@"http://smartplatforms.org/terms#location"]];
+	
+	if (!_content) {
+		_content = (id)[NSNull null];
+	}
+	if (!_hash) {
+		_hash = (id)[NSNull null];
+	}
+	if (!_location) {
+		_location = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMSeries.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2014-05-13.
- Copyright (c) 2014 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMSeries.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMSeries, indexed like its sorted properties
+static RedlandNode *SMSeriesPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMSeriesPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMSeriesLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMSeriesPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#images"];
+		SMSeriesPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"];
+		SMSeriesPredicates[2] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMSeriesPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMSeriesPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMSeriesPredicate(NSUInteger idx)
+{
+	SMSeriesLoadPredicates();
+	return SMSeriesPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMSeriesPredicateIndex(RedlandNode *predicate)
+{
+	SMSeriesLoadPredicates();
+	NSNumber *idx = SMSeriesPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMSeries
 
 
@@ -34,123 +81,157 @@
 
 - (NSArray *)images
 {
-	if (!_images) {
-		
-		// get the "images" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#images"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMImagesList *newItem = [SMImagesList newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_images = [arr copy];
-	}
-	return _images;
+	return [self objectsOfClass:[SMImagesList class] forPredicate:SMSeriesPredicate(0) cache:&_images];
 }
 
 - (void)setImages:(NSArray *)images
 {
-	if (images != _images) {
-		RedlandNode *predicate = (images || _images) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#images"] : nil;
-		if (_images) {
-			for (SMImagesList *item in _images) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_images = [images copy];
-		
-		if (_images) {
-			for (SMImagesList *item in _images) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:images forPredicate:SMSeriesPredicate(0) cache:&_images];
 }
 
 @synthesize modality = _modality;
 
 - (SMCodedValue *)modality
 {
-	if (!_modality) {
-		
-		// get the "modality" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_modality = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _modality) {
-		return nil;
-	}
-	
-	return _modality;
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMSeriesPredicate(1) cache:(id __strong *)&_modality];
 }
 
 - (void)setModality:(SMCodedValue *)modality
 {
-	if (modality != _modality) {
-		RedlandNode *predicate = (modality || _modality) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#modality"] : nil;
-		if (_modality) {
-			[self.inModel removeSubmodel:_modality.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_modality = modality;
-		
-		if (_modality) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_modality.subject]];
-			[self.inModel addSubmodel:_modality.model];
-		}
-	}
+	[self setObject:modality forPredicate:SMSeriesPredicate(1) cache:(id __strong *)&_modality];
 }
 
 @synthesize title = _title;
 
 - (NSString *)title
 {
-	if (!_title) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_title = [rslt.object literalValue];
-	}
-	return _title;
+	return [self literalForPredicate:SMSeriesPredicate(2) cache:(id __strong *)&_title];
 }
 
 - (void)setTitle:(NSString *)title
 {
-	if (title != _title) {
-		RedlandNode *predicate = (title || _title) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/title"] : nil;
-		if (_title) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+	[self setLiteral:title forPredicate:SMSeriesPredicate(2) cache:(id __strong *)&_title];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSMutableArray *images = _images ? nil : [NSMutableArray array];
+	SMCodedValue *modality = nil;
+	NSString *title = nil;
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMSeriesPredicateIndex(rslt.predicate)) {
+			case 0: {
+				SMImagesList *newItem = [SMImagesList newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[images addObject:newItem];
+				}
+				break;
+			}
+			case 1:
+				if (!modality) {
+					modality = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!title) {
+					title = [rslt.object literalValue];
+				}
+				break;
+			default:
+				break;
 		}
-		
-		_title = [title copy];
-		
-		if (_title) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_title nodeValue]]];
+	}
+	
+	if (!_images) {
+		_images = [images copy];
+	}
+	if (!_modality) {
+		_modality = modality ? modality : (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = title ? title : (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObjects:self.images forProperty:0];
+	[snapshot writeObject:self.modality forProperty:1];
+	[snapshot writeString:self.title forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_images = [snapshot readObjects];
+				break;
+			case 1:
+				_modality = [snapshot readObject];
+				break;
+			case 2:
+				_title = [snapshot readString];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_images) {
+		_images = @[];
+	}
+	if (!_modality) {
+		_modality = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_images = [decoder objectsOfClass:[SMImagesList class] from:values[@"http://smartplatforms.org/terms#images"]];
+	_modality = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#modality"]];
+	_title = [decoder stringFrom:values[@"http://purl.org/dc/terms/title"]];
+	
+	if (!_images) {
+		_images = @[];
+	}
+	if (!_modality) {
+		_modality = (id)[NSNull null];
+	}
+	if (!_title) {
+		_title = (id)[NSNull null];
+	}
 }
 
 
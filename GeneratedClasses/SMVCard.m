@@ -2,8 +2,8 @@
  SMVCard.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,60 @@
 
 #import "SMVCard.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMVCard, indexed like its sorted properties
+static RedlandNode *SMVCardPredicates[6];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMVCardPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMVCardLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMVCardPredicates[0] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
+		SMVCardPredicates[1] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
+		SMVCardPredicates[2] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
+		SMVCardPredicates[3] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"];
+		SMVCardPredicates[4] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"];
+		SMVCardPredicates[5] = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:6];
+		for (NSUInteger i = 0; i < 6; i++) {
+			indexes[[[SMVCardPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMVCardPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMVCardPredicate(NSUInteger idx)
+{
+	SMVCardLoadPredicates();
+	return SMVCardPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMVCardPredicateIndex(RedlandNode *predicate)
+{
+	SMVCardLoadPredicates();
+	NSNumber *idx = SMVCardPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMVCard
 
 
@@ -34,244 +84,257 @@
 
 - (NSArray *)adr
 {
-	if (!_adr) {
-		
-		// get the "adr" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMAddress *newItem = [SMAddress newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_adr = [arr copy];
-	}
-	return _adr;
+	return [self objectsOfClass:[SMAddress class] forPredicate:SMVCardPredicate(0) cache:&_adr];
 }
 
 - (void)setAdr:(NSArray *)adr
 {
-	if (adr != _adr) {
-		RedlandNode *predicate = (adr || _adr) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#adr"] : nil;
-		if (_adr) {
-			for (SMAddress *item in _adr) {
-				[self.inModel removeSubmodel:item.model];
-			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_adr = [adr copy];
-		
-		if (_adr) {
-			for (SMAddress *item in _adr) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
-		}
-	}
+	[self setObjects:adr forPredicate:SMVCardPredicate(0) cache:&_adr];
 }
 
 @synthesize bday = _bday;
 
 - (NSString *)bday
 {
-	if (!_bday) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_bday = [rslt.object literalValue];
-	}
-	return _bday;
+	return [self literalForPredicate:SMVCardPredicate(1) cache:(id __strong *)&_bday];
 }
 
 - (void)setBday:(NSString *)bday
 {
-	if (bday != _bday) {
-		RedlandNode *predicate = (bday || _bday) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#bday"] : nil;
-		if (_bday) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bday = [bday copy];
-		
-		if (_bday) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_bday nodeValue]]];
-		}
-	}
+	[self setLiteral:bday forPredicate:SMVCardPredicate(1) cache:(id __strong *)&_bday];
 }
 
 @synthesize deathdate = _deathdate;
 
 - (NSString *)deathdate
 {
-	if (!_deathdate) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_deathdate = [rslt.object literalValue];
-	}
-	return _deathdate;
+	return [self literalForPredicate:SMVCardPredicate(2) cache:(id __strong *)&_deathdate];
 }
 
 - (void)setDeathdate:(NSString *)deathdate
 {
-	if (deathdate != _deathdate) {
-		RedlandNode *predicate = (deathdate || _deathdate) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#deathdate"] : nil;
-		if (_deathdate) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_deathdate = [deathdate copy];
-		
-		if (_deathdate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_deathdate nodeValue]]];
-		}
-	}
+	[self setLiteral:deathdate forPredicate:SMVCardPredicate(2) cache:(id __strong *)&_deathdate];
 }
 
 @synthesize email = _email;
 
 - (NSArray *)email
 {
-	if (!_email) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			NSString *newItem = [rslt.object literalValue];		// only works for NSString for now
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_email = [arr copy];
-	}
-	return _email;
+	return [self literalsForPredicate:SMVCardPredicate(3) cache:&_email];
 }
 
 - (void)setEmail:(NSArray *)email
 {
-	if (email != _email) {
-		RedlandNode *predicate = (email || _email) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#email"] : nil;
-		if (_email) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_email = [email copy];
-		
-		if (_email) {
-			for (NSString *newItem in _email) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[newItem nodeValue]]];
-			}
-		}
-	}
+	[self setLiterals:email forPredicate:SMVCardPredicate(3) cache:&_email];
 }
 
 @synthesize n = _n;
 
 - (SMName *)n
 {
-	if (!_n) {
-		
-		// get the "n" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMName *obj = [SMName newWithSubject:rslt.object inModel:self.inModel];
-		_n = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _n) {
-		return nil;
-	}
-	
-	return _n;
+	return [self objectOfClass:[SMName class] forPredicate:SMVCardPredicate(4) cache:(id __strong *)&_n];
 }
 
 - (void)setN:(SMName *)n
 {
-	if (n != _n) {
-		RedlandNode *predicate = (n || _n) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#n"] : nil;
-		if (_n) {
-			[self.inModel removeSubmodel:_n.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_n = n;
-		
-		if (_n) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_n.subject]];
-			[self.inModel addSubmodel:_n.model];
-		}
-	}
+	[self setObject:n forPredicate:SMVCardPredicate(4) cache:(id __strong *)&_n];
 }
 
 @synthesize tel = _tel;
 
 - (NSArray *)tel
 {
-	if (!_tel) {
-		
-		// get the "tel" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		// loop through the results
-		NSMutableArray *arr = [NSMutableArray array];
-		RedlandStatement *rslt = nil;
-		while ((rslt = [query nextObject])) {
-			
-			// instantiate an item for each object
-			SMTel *newItem = [SMTel newWithSubject:rslt.object inModel:self.inModel];
-			if (newItem) {
-				[arr addObject:newItem];
-			}
-		}
-		_tel = [arr copy];
-	}
-	return _tel;
+	return [self objectsOfClass:[SMTel class] forPredicate:SMVCardPredicate(5) cache:&_tel];
 }
 
 - (void)setTel:(NSArray *)tel
 {
-	if (tel != _tel) {
-		RedlandNode *predicate = (tel || _tel) ? [RedlandNode nodeWithURIString:@"http://www.w3.org/2006/vcard/ns#tel"] : nil;
-		if (_tel) {
-			for (SMTel *item in _tel) {
-				[self.inModel removeSubmodel:item.model];
+	[self setObjects:tel forPredicate:SMVCardPredicate(5) cache:&_tel];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSMutableArray *adr = _adr ? nil : [NSMutableArray array];
+	NSString *bday = nil;
+	NSString *deathdate = nil;
+	NSMutableArray *email = _email ? nil : [NSMutableArray array];
+	SMName *n = nil;
+	NSMutableArray *tel = _tel ? nil : [NSMutableArray array];
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMVCardPredicateIndex(rslt.predicate)) {
+			case 0: {
+				SMAddress *newItem = [SMAddress newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[adr addObject:newItem];
+				}
+				break;
 			}
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+			case 1:
+				if (!bday) {
+					bday = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!deathdate) {
+					deathdate = [rslt.object literalValue];
+				}
+				break;
+			case 3: {
+				NSString *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[email addObject:newItem];
+				}
+				break;
+			}
+			case 4:
+				if (!n) {
+					n = [SMName newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5: {
+				SMTel *newItem = [SMTel newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[tel addObject:newItem];
+				}
+				break;
+			}
+			default:
+				break;
 		}
-		
+	}
+	
+	if (!_adr) {
+		_adr = [adr copy];
+	}
+	if (!_bday) {
+		_bday = bday ? bday : (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = deathdate ? deathdate : (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = [email copy];
+	}
+	if (!_n) {
+		_n = n ? n : (id)[NSNull null];
+	}
+	if (!_tel) {
 		_tel = [tel copy];
-		
-		if (_tel) {
-			for (SMTel *item in _tel) {
-				[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:item.subject]];
-				[self.inModel addSubmodel:item.model];
-			}
+	}
+}
+
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+	[snapshot writeObjects:self.adr forProperty:0];
+	[snapshot writeString:self.bday forProperty:1];
+	[snapshot writeString:self.deathdate forProperty:2];
+	[snapshot writeStrings:self.email forProperty:3];
+	[snapshot writeObject:self.n forProperty:4];
+	[snapshot writeObjects:self.tel forProperty:5];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_adr = [snapshot readObjects];
+				break;
+			case 1:
+				_bday = [snapshot readString];
+				break;
+			case 2:
+				_deathdate = [snapshot readString];
+				break;
+			case 3:
+				_email = [snapshot readStrings];
+				break;
+			case 4:
+				_n = [snapshot readObject];
+				break;
+			case 5:
+				_tel = [snapshot readObjects];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_adr) {
+		_adr = @[];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = @[];
+	}
+	if (!_n) {
+		_n = (id)[NSNull null];
+	}
+	if (!_tel) {
+		_tel = @[];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_adr = [decoder objectsOfClass:[SMAddress class] from:values[@"http://www.w3.org/2006/vcard/ns#adr"]];
+	_bday = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#bday"]];
+	_deathdate = [decoder stringFrom:values[@"http://www.w3.org/2006/vcard/ns#deathdate"]];
+	_email = [decoder stringsFrom:values[@"http://www.w3.org/2006/vcard/ns#email"]];
+	_n = [decoder objectOfClass:[SMName class] from:values[@"http://www.w3.org/2006/vcard/ns#n"]];
+	_tel = [decoder objectsOfClass:[SMTel class] from:values[@"http://www.w3.org/2006/vcard/ns#tel"]];
+	
+	if (!_adr) {
+		_adr = @[];
+	}
+	if (!_bday) {
+		_bday = (id)[NSNull null];
+	}
+	if (!_deathdate) {
+		_deathdate = (id)[NSNull null];
+	}
+	if (!_email) {
+		_email = @[];
+	}
+	if (!_n) {
+		_n = (id)[NSNull null];
+	}
+	if (!_tel) {
+		_tel = @[];
+	}
 }
 
 
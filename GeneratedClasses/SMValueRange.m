@@ -2,8 +2,8 @@
  SMValueRange.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,56 @@
 
 #import "SMValueRange.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMValueRange, indexed like its sorted properties
+static RedlandNode *SMValueRangePredicates[2];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMValueRangePredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMValueRangeLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMValueRangePredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#maximum"];
+		SMValueRangePredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#minimum"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:2];
+		for (NSUInteger i = 0; i < 2; i++) {
+			indexes[[[SMValueRangePredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMValueRangePredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMValueRangePredicate(NSUInteger idx)
+{
+	SMValueRangeLoadPredicates();
+	return SMValueRangePredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMValueRangePredicateIndex(RedlandNode *predicate)
+{
+	SMValueRangeLoadPredicates();
+	NSNumber *idx = SMValueRangePredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMValueRange
 
 
@@ -34,86 +80,123 @@
 
 - (SMValueAndUnit *)maximum
 {
-	if (!_maximum) {
-		
-		// get the "maximum" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#maximum"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_maximum = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _maximum) {
-		return nil;
-	}
-	
-	return _maximum;
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMValueRangePredicate(0) cache:(id __strong *)&_maximum];
 }
 
 - (void)setMaximum:(SMValueAndUnit *)maximum
 {
-	if (maximum != _maximum) {
-		RedlandNode *predicate = (maximum || _maximum) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#maximum"] : nil;
-		if (_maximum) {
-			[self.inModel removeSubmodel:_maximum.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_maximum = maximum;
-		
-		if (_maximum) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_maximum.subject]];
-			[self.inModel addSubmodel:_maximum.model];
-		}
-	}
+	[self setObject:maximum forPredicate:SMValueRangePredicate(0) cache:(id __strong *)&_maximum];
 }
 
 @synthesize minimum = _minimum;
 
 - (SMValueAndUnit *)minimum
 {
-	if (!_minimum) {
-		
-		// get the "minimum" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#minimum"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_minimum = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMValueRangePredicate(1) cache:(id __strong *)&_minimum];
+}
+
+- (void)setMinimum:(SMValueAndUnit *)minimum
+{
+	[self setObject:minimum forPredicate:SMValueRangePredicate(1) cache:(id __strong *)&_minimum];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMValueAndUnit *maximum = nil;
+	SMValueAndUnit *minimum = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _minimum) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMValueRangePredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!maximum) {
+					maximum = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!minimum) {
+					minimum = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _minimum;
+	if (!_maximum) {
+		_maximum = maximum ? maximum : (id)[NSNull null];
+	}
+	if (!_minimum) {
+		_minimum = minimum ? minimum : (id)[NSNull null];
+	}
 }
 
-- (void)setMinimum:(SMValueAndUnit *)minimum
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (minimum != _minimum) {
-		RedlandNode *predicate = (minimum || _minimum) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#minimum"] : nil;
-		if (_minimum) {
-			[self.inModel removeSubmodel:_minimum.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_minimum = minimum;
-		
-		if (_minimum) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_minimum.subject]];
-			[self.inModel addSubmodel:_minimum.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.maximum forProperty:0];
+	[snapshot writeObject:self.minimum forProperty:1];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_maximum = [snapshot readObject];
+				break;
+			case 1:
+				_minimum = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_maximum) {
+		_maximum = (id)[NSNull null];
+	}
+	if (!_minimum) {
+		_minimum = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_maximum = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#maximum"]];
+	_minimum = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#minimum"]];
+	
+	if (!_maximum) {
+		_maximum = (id)[NSNull null];
+	}
+	if (!_minimum) {
+		_minimum = (id)[NSNull null];
+	}
 }
 
 
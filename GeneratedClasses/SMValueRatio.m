@@ -2,8 +2,8 @@
  SMValueRatio.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,56 @@
 
 #import "SMValueRatio.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMValueRatio, indexed like its sorted properties
+static RedlandNode *SMValueRatioPredicates[2];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMValueRatioPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMValueRatioLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMValueRatioPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#denominator"];
+		SMValueRatioPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#numerator"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:2];
+		for (NSUInteger i = 0; i < 2; i++) {
+			indexes[[[SMValueRatioPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMValueRatioPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMValueRatioPredicate(NSUInteger idx)
+{
+	SMValueRatioLoadPredicates();
+	return SMValueRatioPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMValueRatioPredicateIndex(RedlandNode *predicate)
+{
+	SMValueRatioLoadPredicates();
+	NSNumber *idx = SMValueRatioPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMValueRatio
 
 
@@ -34,86 +80,123 @@
 
 - (SMValueAndUnit *)denominator
 {
-	if (!_denominator) {
-		
-		// get the "denominator" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#denominator"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_denominator = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _denominator) {
-		return nil;
-	}
-	
-	return _denominator;
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMValueRatioPredicate(0) cache:(id __strong *)&_denominator];
 }
 
 - (void)setDenominator:(SMValueAndUnit *)denominator
 {
-	if (denominator != _denominator) {
-		RedlandNode *predicate = (denominator || _denominator) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#denominator"] : nil;
-		if (_denominator) {
-			[self.inModel removeSubmodel:_denominator.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_denominator = denominator;
-		
-		if (_denominator) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_denominator.subject]];
-			[self.inModel addSubmodel:_denominator.model];
-		}
-	}
+	[self setObject:denominator forPredicate:SMValueRatioPredicate(0) cache:(id __strong *)&_denominator];
 }
 
 @synthesize numerator = _numerator;
 
 - (SMValueAndUnit *)numerator
 {
-	if (!_numerator) {
-		
-		// get the "numerator" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#numerator"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMValueAndUnit *obj = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel];
-		_numerator = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMValueAndUnit class] forPredicate:SMValueRatioPredicate(1) cache:(id __strong *)&_numerator];
+}
+
+- (void)setNumerator:(SMValueAndUnit *)numerator
+{
+	[self setObject:numerator forPredicate:SMValueRatioPredicate(1) cache:(id __strong *)&_numerator];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMValueAndUnit *denominator = nil;
+	SMValueAndUnit *numerator = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _numerator) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMValueRatioPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!denominator) {
+					denominator = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!numerator) {
+					numerator = [SMValueAndUnit newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _numerator;
+	if (!_denominator) {
+		_denominator = denominator ? denominator : (id)[NSNull null];
+	}
+	if (!_numerator) {
+		_numerator = numerator ? numerator : (id)[NSNull null];
+	}
 }
 
-- (void)setNumerator:(SMValueAndUnit *)numerator
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (numerator != _numerator) {
-		RedlandNode *predicate = (numerator || _numerator) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#numerator"] : nil;
-		if (_numerator) {
-			[self.inModel removeSubmodel:_numerator.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_numerator = numerator;
-		
-		if (_numerator) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_numerator.subject]];
-			[self.inModel addSubmodel:_numerator.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.denominator forProperty:0];
+	[snapshot writeObject:self.numerator forProperty:1];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_denominator = [snapshot readObject];
+				break;
+			case 1:
+				_numerator = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_denominator) {
+		_denominator = (id)[NSNull null];
+	}
+	if (!_numerator) {
+		_numerator = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_denominator = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#denominator"]];
+	_numerator = [decoder objectOfClass:[SMValueAndUnit class] from:values[@"http://smartplatforms.org/terms#numerator"]];
+	
+	if (!_denominator) {
+		_denominator = (id)[NSNull null];
+	}
+	if (!_numerator) {
+		_numerator = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMVitalSign.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,57 @@
 
 #import "SMVitalSign.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMVitalSign, indexed like its sorted properties
+static RedlandNode *SMVitalSignPredicates[3];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMVitalSignPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMVitalSignLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMVitalSignPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#unit"];
+		SMVitalSignPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"];
+		SMVitalSignPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#vitalName"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:3];
+		for (NSUInteger i = 0; i < 3; i++) {
+			indexes[[[SMVitalSignPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMVitalSignPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMVitalSignPredicate(NSUInteger idx)
+{
+	SMVitalSignLoadPredicates();
+	return SMVitalSignPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMVitalSignPredicateIndex(RedlandNode *predicate)
+{
+	SMVitalSignLoadPredicates();
+	NSNumber *idx = SMVitalSignPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMVitalSign
 
 
@@ -34,105 +81,155 @@
 
 - (NSString *)unit
 {
-	if (!_unit) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#unit"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_unit = [rslt.object literalValue];
-	}
-	return _unit;
+	return [self literalForPredicate:SMVitalSignPredicate(0) cache:(id __strong *)&_unit];
 }
 
 - (void)setUnit:(NSString *)unit
 {
-	if (unit != _unit) {
-		RedlandNode *predicate = (unit || _unit) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#unit"] : nil;
-		if (_unit) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_unit = [unit copy];
-		
-		if (_unit) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_unit nodeValue]]];
-		}
-	}
+	[self setLiteral:unit forPredicate:SMVitalSignPredicate(0) cache:(id __strong *)&_unit];
 }
 
 @synthesize value = _value;
 
 - (NSString *)value
 {
-	if (!_value) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_value = [rslt.object literalValue];
-	}
-	return _value;
+	return [self literalForPredicate:SMVitalSignPredicate(1) cache:(id __strong *)&_value];
 }
 
 - (void)setValue:(NSString *)value
 {
-	if (value != _value) {
-		RedlandNode *predicate = (value || _value) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#value"] : nil;
-		if (_value) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_value = [value copy];
-		
-		if (_value) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_value nodeValue]]];
-		}
-	}
+	[self setLiteral:value forPredicate:SMVitalSignPredicate(1) cache:(id __strong *)&_value];
 }
 
 @synthesize vitalName = _vitalName;
 
 - (SMCodedValue *)vitalName
 {
-	if (!_vitalName) {
-		
-		// get the "vitalName" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#vitalName"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMCodedValue *obj = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel];
-		_vitalName = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMCodedValue class] forPredicate:SMVitalSignPredicate(2) cache:(id __strong *)&_vitalName];
+}
+
+- (void)setVitalName:(SMCodedValue *)vitalName
+{
+	[self setObject:vitalName forPredicate:SMVitalSignPredicate(2) cache:(id __strong *)&_vitalName];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	NSString *unit = nil;
+	NSString *value = nil;
+	SMCodedValue *vitalName = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _vitalName) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMVitalSignPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!unit) {
+					unit = [rslt.object literalValue];
+				}
+				break;
+			case 1:
+				if (!value) {
+					value = [rslt.object literalValue];
+				}
+				break;
+			case 2:
+				if (!vitalName) {
+					vitalName = [SMCodedValue newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _vitalName;
+	if (!_unit) {
+		_unit = unit ? unit : (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = value ? value : (id)[NSNull null];
+	}
+	if (!_vitalName) {
+		_vitalName = vitalName ? vitalName : (id)[NSNull null];
+	}
 }
 
-- (void)setVitalName:(SMCodedValue *)vitalName
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (vitalName != _vitalName) {
-		RedlandNode *predicate = (vitalName || _vitalName) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#vitalName"] : nil;
-		if (_vitalName) {
-			[self.inModel removeSubmodel:_vitalName.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_vitalName = vitalName;
-		
-		if (_vitalName) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_vitalName.subject]];
-			[self.inModel addSubmodel:_vitalName.model];
+	[self hydrateAllProperties];
+	[snapshot writeString:self.unit forProperty:0];
+	[snapshot writeString:self.value forProperty:1];
+	[snapshot writeObject:self.vitalName forProperty:2];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_unit = [snapshot readString];
+				break;
+			case 1:
+				_value = [snapshot readString];
+				break;
+			case 2:
+				_vitalName = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_unit) {
+		_unit = (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = (id)[NSNull null];
+	}
+	if (!_vitalName) {
+		_vitalName = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_unit = [decoder stringFrom:values[@"http://smartplatforms.org/terms#unit"]];
+	_value = [decoder stringFrom:values[@"http://smartplatforms.org/terms#value"]];
+	_vitalName = [decoder objectOfClass:[SMCodedValue class] from:values[@"http://smartplatforms.org/terms#vitalName"]];
+	
+	if (!_unit) {
+		_unit = (id)[NSNull null];
+	}
+	if (!_value) {
+		_value = (id)[NSNull null];
+	}
+	if (!_vitalName) {
+		_vitalName = (id)[NSNull null];
+	}
 }
 
 
@@ -2,8 +2,8 @@
  SMVitalSignSet.m
  SMARTFramework
  
- Generated by build-obj-c-classes.py on 2013-06-14.
- Copyright (c) 2013 CHIP, Boston Children's Hospital
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
  
  This library is free software; you can redistribute it and/or
  modify it under the terms of the GNU Lesser General Public
@@ -22,10 +22,66 @@
 
 #import "SMVitalSignSet.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
+/// The predicates of the properties of SMVitalSignSet, indexed like its sorted properties
+static RedlandNode *SMVitalSignSetPredicates[12];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *SMVitalSignSetPredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void SMVitalSignSetLoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		SMVitalSignSetPredicates[0] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
+		SMVitalSignSetPredicates[1] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bloodPressure"];
+		SMVitalSignSetPredicates[2] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyMassIndex"];
+		SMVitalSignSetPredicates[3] = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
+		SMVitalSignSetPredicates[4] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounter"];
+		SMVitalSignSetPredicates[5] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#headCircumference"];
+		SMVitalSignSetPredicates[6] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#heartRate"];
+		SMVitalSignSetPredicates[7] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"];
+		SMVitalSignSetPredicates[8] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#oxygenSaturation"];
+		SMVitalSignSetPredicates[9] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#respiratoryRate"];
+		SMVitalSignSetPredicates[10] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#temperature"];
+		SMVitalSignSetPredicates[11] = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#weight"];
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:12];
+		for (NSUInteger i = 0; i < 12; i++) {
+			indexes[[[SMVitalSignSetPredicates[i] URIValue] stringValue]] = @(i);
+		}
+		SMVitalSignSetPredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *SMVitalSignSetPredicate(NSUInteger idx)
+{
+	SMVitalSignSetLoadPredicates();
+	return SMVitalSignSetPredicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger SMVitalSignSetPredicateIndex(RedlandNode *predicate)
+{
+	SMVitalSignSetLoadPredicates();
+	NSNumber *idx = SMVitalSignSetPredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
 @implementation SMVitalSignSet
 
 
@@ -34,504 +90,443 @@
 
 - (SMMedicalRecord *)belongsTo
 {
-	if (!_belongsTo) {
-		
-		// get the "belongsTo" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMMedicalRecord *obj = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel];
-		_belongsTo = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _belongsTo) {
-		return nil;
-	}
-	
-	return _belongsTo;
+	return [self objectOfClass:[SMMedicalRecord class] forPredicate:SMVitalSignSetPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 - (void)setBelongsTo:(SMMedicalRecord *)belongsTo
 {
-	if (belongsTo != _belongsTo) {
-		RedlandNode *predicate = (belongsTo || _belongsTo) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#belongsTo"] : nil;
-		if (_belongsTo) {
-			[self.inModel removeSubmodel:_belongsTo.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_belongsTo = belongsTo;
-		
-		if (_belongsTo) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_belongsTo.subject]];
-			[self.inModel addSubmodel:_belongsTo.model];
-		}
-	}
+	[self setObject:belongsTo forPredicate:SMVitalSignSetPredicate(0) cache:(id __strong *)&_belongsTo];
 }
 
 @synthesize bloodPressure = _bloodPressure;
 
 - (SMBloodPressure *)bloodPressure
 {
-	if (!_bloodPressure) {
-		
-		// get the "bloodPressure" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bloodPressure"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMBloodPressure *obj = [SMBloodPressure newWithSubject:rslt.object inModel:self.inModel];
-		_bloodPressure = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _bloodPressure) {
-		return nil;
-	}
-	
-	return _bloodPressure;
+	return [self objectOfClass:[SMBloodPressure class] forPredicate:SMVitalSignSetPredicate(1) cache:(id __strong *)&_bloodPressure];
 }
 
 - (void)setBloodPressure:(SMBloodPressure *)bloodPressure
 {
-	if (bloodPressure != _bloodPressure) {
-		RedlandNode *predicate = (bloodPressure || _bloodPressure) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bloodPressure"] : nil;
-		if (_bloodPressure) {
-			[self.inModel removeSubmodel:_bloodPressure.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bloodPressure = bloodPressure;
-		
-		if (_bloodPressure) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_bloodPressure.subject]];
-			[self.inModel addSubmodel:_bloodPressure.model];
-		}
-	}
+	[self setObject:bloodPressure forPredicate:SMVitalSignSetPredicate(1) cache:(id __strong *)&_bloodPressure];
 }
 
 @synthesize bodyMassIndex = _bodyMassIndex;
 
 - (SMVitalSign *)bodyMassIndex
 {
-	if (!_bodyMassIndex) {
-		
-		// get the "bodyMassIndex" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyMassIndex"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_bodyMassIndex = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _bodyMassIndex) {
-		return nil;
-	}
-	
-	return _bodyMassIndex;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(2) cache:(id __strong *)&_bodyMassIndex];
 }
 
 - (void)setBodyMassIndex:(SMVitalSign *)bodyMassIndex
 {
-	if (bodyMassIndex != _bodyMassIndex) {
-		RedlandNode *predicate = (bodyMassIndex || _bodyMassIndex) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#bodyMassIndex"] : nil;
-		if (_bodyMassIndex) {
-			[self.inModel removeSubmodel:_bodyMassIndex.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_bodyMassIndex = bodyMassIndex;
-		
-		if (_bodyMassIndex) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_bodyMassIndex.subject]];
-			[self.inModel addSubmodel:_bodyMassIndex.model];
-		}
-	}
+	[self setObject:bodyMassIndex forPredicate:SMVitalSignSetPredicate(2) cache:(id __strong *)&_bodyMassIndex];
 }
 
 @synthesize date = _date;
 
 - (NSString *)date
 {
-	if (!_date) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		
-		RedlandStatement *rslt = [query nextObject];
-		_date = [rslt.object literalValue];
-	}
-	return _date;
+	return [self literalForPredicate:SMVitalSignSetPredicate(3) cache:(id __strong *)&_date];
 }
 
 - (void)setDate:(NSString *)date
 {
-	if (date != _date) {
-		RedlandNode *predicate = (date || _date) ? [RedlandNode nodeWithURIString:@"http://purl.org/dc/terms/date"] : nil;
-		if (_date) {
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_date = [date copy];
-		
-		if (_date) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_date nodeValue]]];
-		}
-	}
+	[self setLiteral:date forPredicate:SMVitalSignSetPredicate(3) cache:(id __strong *)&_date];
 }
 
 @synthesize encounter = _encounter;
 
 - (SMEncounter *)encounter
 {
-	if (!_encounter) {
-		
-		// get the "encounter" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounter"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMEncounter *obj = [SMEncounter newWithSubject:rslt.object inModel:self.inModel];
-		_encounter = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _encounter) {
-		return nil;
-	}
-	
-	return _encounter;
+	return [self objectOfClass:[SMEncounter class] forPredicate:SMVitalSignSetPredicate(4) cache:(id __strong *)&_encounter];
 }
 
 - (void)setEncounter:(SMEncounter *)encounter
 {
-	if (encounter != _encounter) {
-		RedlandNode *predicate = (encounter || _encounter) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#encounter"] : nil;
-		if (_encounter) {
-			[self.inModel removeSubmodel:_encounter.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_encounter = encounter;
-		
-		if (_encounter) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_encounter.subject]];
-			[self.inModel addSubmodel:_encounter.model];
-		}
-	}
+	[self setObject:encounter forPredicate:SMVitalSignSetPredicate(4) cache:(id __strong *)&_encounter];
 }
 
 @synthesize headCircumference = _headCircumference;
 
 - (SMVitalSign *)headCircumference
 {
-	if (!_headCircumference) {
-		
-		// get the "headCircumference" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#headCircumference"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_headCircumference = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _headCircumference) {
-		return nil;
-	}
-	
-	return _headCircumference;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(5) cache:(id __strong *)&_headCircumference];
 }
 
 - (void)setHeadCircumference:(SMVitalSign *)headCircumference
 {
-	if (headCircumference != _headCircumference) {
-		RedlandNode *predicate = (headCircumference || _headCircumference) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#headCircumference"] : nil;
-		if (_headCircumference) {
-			[self.inModel removeSubmodel:_headCircumference.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_headCircumference = headCircumference;
-		
-		if (_headCircumference) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_headCircumference.subject]];
-			[self.inModel addSubmodel:_headCircumference.model];
-		}
-	}
+	[self setObject:headCircumference forPredicate:SMVitalSignSetPredicate(5) cache:(id __strong *)&_headCircumference];
 }
 
 @synthesize heartRate = _heartRate;
 
 - (SMVitalSign *)heartRate
 {
-	if (!_heartRate) {
-		
-		// get the "heartRate" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#heartRate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_heartRate = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _heartRate) {
-		return nil;
-	}
-	
-	return _heartRate;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(6) cache:(id __strong *)&_heartRate];
 }
 
 - (void)setHeartRate:(SMVitalSign *)heartRate
 {
-	if (heartRate != _heartRate) {
-		RedlandNode *predicate = (heartRate || _heartRate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#heartRate"] : nil;
-		if (_heartRate) {
-			[self.inModel removeSubmodel:_heartRate.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_heartRate = heartRate;
-		
-		if (_heartRate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_heartRate.subject]];
-			[self.inModel addSubmodel:_heartRate.model];
-		}
-	}
+	[self setObject:heartRate forPredicate:SMVitalSignSetPredicate(6) cache:(id __strong *)&_heartRate];
 }
 
 @synthesize height = _height;
 
 - (SMVitalSign *)height
 {
-	if (!_height) {
-		
-		// get the "height" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_height = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _height) {
-		return nil;
-	}
-	
-	return _height;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(7) cache:(id __strong *)&_height];
 }
 
 - (void)setHeight:(SMVitalSign *)height
 {
-	if (height != _height) {
-		RedlandNode *predicate = (height || _height) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#height"] : nil;
-		if (_height) {
-			[self.inModel removeSubmodel:_height.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_height = height;
-		
-		if (_height) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_height.subject]];
-			[self.inModel addSubmodel:_height.model];
-		}
-	}
+	[self setObject:height forPredicate:SMVitalSignSetPredicate(7) cache:(id __strong *)&_height];
 }
 
 @synthesize oxygenSaturation = _oxygenSaturation;
 
 - (SMVitalSign *)oxygenSaturation
 {
-	if (!_oxygenSaturation) {
-		
-		// get the "oxygenSaturation" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#oxygenSaturation"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_oxygenSaturation = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _oxygenSaturation) {
-		return nil;
-	}
-	
-	return _oxygenSaturation;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(8) cache:(id __strong *)&_oxygenSaturation];
 }
 
 - (void)setOxygenSaturation:(SMVitalSign *)oxygenSaturation
 {
-	if (oxygenSaturation != _oxygenSaturation) {
-		RedlandNode *predicate = (oxygenSaturation || _oxygenSaturation) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#oxygenSaturation"] : nil;
-		if (_oxygenSaturation) {
-			[self.inModel removeSubmodel:_oxygenSaturation.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_oxygenSaturation = oxygenSaturation;
-		
-		if (_oxygenSaturation) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_oxygenSaturation.subject]];
-			[self.inModel addSubmodel:_oxygenSaturation.model];
-		}
-	}
+	[self setObject:oxygenSaturation forPredicate:SMVitalSignSetPredicate(8) cache:(id __strong *)&_oxygenSaturation];
 }
 
 @synthesize respiratoryRate = _respiratoryRate;
 
 - (SMVitalSign *)respiratoryRate
 {
-	if (!_respiratoryRate) {
-		
-		// get the "respiratoryRate" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#respiratoryRate"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_respiratoryRate = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _respiratoryRate) {
-		return nil;
-	}
-	
-	return _respiratoryRate;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(9) cache:(id __strong *)&_respiratoryRate];
 }
 
 - (void)setRespiratoryRate:(SMVitalSign *)respiratoryRate
 {
-	if (respiratoryRate != _respiratoryRate) {
-		RedlandNode *predicate = (respiratoryRate || _respiratoryRate) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#respiratoryRate"] : nil;
-		if (_respiratoryRate) {
-			[self.inModel removeSubmodel:_respiratoryRate.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_respiratoryRate = respiratoryRate;
-		
-		if (_respiratoryRate) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_respiratoryRate.subject]];
-			[self.inModel addSubmodel:_respiratoryRate.model];
-		}
-	}
+	[self setObject:respiratoryRate forPredicate:SMVitalSignSetPredicate(9) cache:(id __strong *)&_respiratoryRate];
 }
 
 @synthesize temperature = _temperature;
 
 - (SMVitalSign *)temperature
 {
-	if (!_temperature) {
-		
-		// get the "temperature" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#temperature"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_temperature = obj ? obj : (id)[NSNull null];
-	}
-	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _temperature) {
-		return nil;
-	}
-	
-	return _temperature;
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(10) cache:(id __strong *)&_temperature];
 }
 
 - (void)setTemperature:(SMVitalSign *)temperature
 {
-	if (temperature != _temperature) {
-		RedlandNode *predicate = (temperature || _temperature) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#temperature"] : nil;
-		if (_temperature) {
-			[self.inModel removeSubmodel:_temperature.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_temperature = temperature;
-		
-		if (_temperature) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_temperature.subject]];
-			[self.inModel addSubmodel:_temperature.model];
-		}
-	}
+	[self setObject:temperature forPredicate:SMVitalSignSetPredicate(10) cache:(id __strong *)&_temperature];
 }
 
 @synthesize weight = _weight;
 
 - (SMVitalSign *)weight
 {
-	if (!_weight) {
-		
-		// get the "weight" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#weight"];
-		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
-		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
-		RedlandStatement *rslt = [query nextObject];
-		
-		// create an item for this object
-		SMVitalSign *obj = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel];
-		_weight = obj ? obj : (id)[NSNull null];
-	}
+	return [self objectOfClass:[SMVitalSign class] forPredicate:SMVitalSignSetPredicate(11) cache:(id __strong *)&_weight];
+}
+
+- (void)setWeight:(SMVitalSign *)weight
+{
+	[self setObject:weight forPredicate:SMVitalSignSetPredicate(11) cache:(id __strong *)&_weight];
+}
+
+
+
+#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+	SMMedicalRecord *belongsTo = nil;
+	SMBloodPressure *bloodPressure = nil;
+	SMVitalSign *bodyMassIndex = nil;
+	NSString *date = nil;
+	SMEncounter *encounter = nil;
+	SMVitalSign *headCircumference = nil;
+	SMVitalSign *heartRate = nil;
+	SMVitalSign *height = nil;
+	SMVitalSign *oxygenSaturation = nil;
+	SMVitalSign *respiratoryRate = nil;
+	SMVitalSign *temperature = nil;
+	SMVitalSign *weight = nil;
 	
-	// we use NSNull as a placeholder in case we already searched the graph and haven't found the object. This should help with performance.
-	if ((id)[NSNull null] == _weight) {
-		return nil;
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch (SMVitalSignSetPredicateIndex(rslt.predicate)) {
+			case 0:
+				if (!belongsTo) {
+					belongsTo = [SMMedicalRecord newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 1:
+				if (!bloodPressure) {
+					bloodPressure = [SMBloodPressure newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 2:
+				if (!bodyMassIndex) {
+					bodyMassIndex = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 3:
+				if (!date) {
+					date = [rslt.object literalValue];
+				}
+				break;
+			case 4:
+				if (!encounter) {
+					encounter = [SMEncounter newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 5:
+				if (!headCircumference) {
+					headCircumference = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 6:
+				if (!heartRate) {
+					heartRate = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 7:
+				if (!height) {
+					height = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 8:
+				if (!oxygenSaturation) {
+					oxygenSaturation = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 9:
+				if (!respiratoryRate) {
+					respiratoryRate = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 10:
+				if (!temperature) {
+					temperature = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			case 11:
+				if (!weight) {
+					weight = [SMVitalSign newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;
+			default:
+				break;
+		}
 	}
 	
-	return _weight;
+	if (!_belongsTo) {
+		_belongsTo = belongsTo ? belongsTo : (id)[NSNull null];
+	}
+	if (!_bloodPressure) {
+		_bloodPressure = bloodPressure ? bloodPressure : (id)[NSNull null];
+	}
+	if (!_bodyMassIndex) {
+		_bodyMassIndex = bodyMassIndex ? bodyMassIndex : (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = date ? date : (id)[NSNull null];
+	}
+	if (!_encounter) {
+		_encounter = encounter ? encounter : (id)[NSNull null];
+	}
+	if (!_headCircumference) {
+		_headCircumference = headCircumference ? headCircumference : (id)[NSNull null];
+	}
+	if (!_heartRate) {
+		_heartRate = heartRate ? heartRate : (id)[NSNull null];
+	}
+	if (!_height) {
+		_height = height ? height : (id)[NSNull null];
+	}
+	if (!_oxygenSaturation) {
+		_oxygenSaturation = oxygenSaturation ? oxygenSaturation : (id)[NSNull null];
+	}
+	if (!_respiratoryRate) {
+		_respiratoryRate = respiratoryRate ? respiratoryRate : (id)[NSNull null];
+	}
+	if (!_temperature) {
+		_temperature = temperature ? temperature : (id)[NSNull null];
+	}
+	if (!_weight) {
+		_weight = weight ? weight : (id)[NSNull null];
+	}
 }
 
-- (void)setWeight:(SMVitalSign *)weight
+
+
+#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
 {
-	if (weight != _weight) {
-		RedlandNode *predicate = (weight || _weight) ? [RedlandNode nodeWithURIString:@"http://smartplatforms.org/terms#weight"] : nil;
-		if (_weight) {
-			[self.inModel removeSubmodel:_weight.model];
-			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
-		}
-		
-		_weight = weight;
-		
-		if (_weight) {
-			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:_weight.subject]];
-			[self.inModel addSubmodel:_weight.model];
+	[self hydrateAllProperties];
+	[snapshot writeObject:self.belongsTo forProperty:0];
+	[snapshot writeObject:self.bloodPressure forProperty:1];
+	[snapshot writeObject:self.bodyMassIndex forProperty:2];
+	[snapshot writeString:self.date forProperty:3];
+	[snapshot writeObject:self.encounter forProperty:4];
+	[snapshot writeObject:self.headCircumference forProperty:5];
+	[snapshot writeObject:self.heartRate forProperty:6];
+	[snapshot writeObject:self.height forProperty:7];
+	[snapshot writeObject:self.oxygenSaturation forProperty:8];
+	[snapshot writeObject:self.respiratoryRate forProperty:9];
+	[snapshot writeObject:self.temperature forProperty:10];
+	[snapshot writeObject:self.weight forProperty:11];
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+			case 0:
+				_belongsTo = [snapshot readObject];
+				break;
+			case 1:
+				_bloodPressure = [snapshot readObject];
+				break;
+			case 2:
+				_bodyMassIndex = [snapshot readObject];
+				break;
+			case 3:
+				_date = [snapshot readString];
+				break;
+			case 4:
+				_encounter = [snapshot readObject];
+				break;
+			case 5:
+				_headCircumference = [snapshot readObject];
+				break;
+			case 6:
+				_heartRate = [snapshot readObject];
+				break;
+			case 7:
+				_height = [snapshot readObject];
+				break;
+			case 8:
+				_oxygenSaturation = [snapshot readObject];
+				break;
+			case 9:
+				_respiratoryRate = [snapshot readObject];
+				break;
+			case 10:
+				_temperature = [snapshot readObject];
+				break;
+			case 11:
+				_weight = [snapshot readObject];
+				break;
+			default:
+				[snapshot skipValue];
+				break;
 		}
 	}
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_bloodPressure) {
+		_bloodPressure = (id)[NSNull null];
+	}
+	if (!_bodyMassIndex) {
+		_bodyMassIndex = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_encounter) {
+		_encounter = (id)[NSNull null];
+	}
+	if (!_headCircumference) {
+		_headCircumference = (id)[NSNull null];
+	}
+	if (!_heartRate) {
+		_heartRate = (id)[NSNull null];
+	}
+	if (!_height) {
+		_height = (id)[NSNull null];
+	}
+	if (!_oxygenSaturation) {
+		_oxygenSaturation = (id)[NSNull null];
+	}
+	if (!_respiratoryRate) {
+		_respiratoryRate = (id)[NSNull null];
+	}
+	if (!_temperature) {
+		_temperature = (id)[NSNull null];
+	}
+	if (!_weight) {
+		_weight = (id)[NSNull null];
+	}
+}
+
+
+
+#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+	_belongsTo = [decoder objectOfClass:[SMMedicalRecord class] from:values[@"http://smartplatforms.org/terms#belongsTo"]];
+	_bloodPressure = [decoder objectOfClass:[SMBloodPressure class] from:values[@"http://smartplatforms.org/terms#bloodPressure"]];
+	_bodyMassIndex = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#bodyMassIndex"]];
+	_date = [decoder stringFrom:values[@"http://purl.org/dc/terms/date"]];
+	_encounter = [decoder objectOfClass:[SMEncounter class] from:values[@"http://smartplatforms.org/terms#encounter"]];
+	_headCircumference = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#headCircumference"]];
+	_heartRate = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#heartRate"]];
+	_height = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#height"]];
+	_oxygenSaturation = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#oxygenSaturation"]];
+	_respiratoryRate = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#respiratoryRate"]];
+	_temperature = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#temperature"]];
+	_weight = [decoder objectOfClass:[SMVitalSign class] from:values[@"http://smartplatforms.org/terms#weight"]];
+	
+	if (!_belongsTo) {
+		_belongsTo = (id)[NSNull null];
+	}
+	if (!_bloodPressure) {
+		_bloodPressure = (id)[NSNull null];
+	}
+	if (!_bodyMassIndex) {
+		_bodyMassIndex = (id)[NSNull null];
+	}
+	if (!_date) {
+		_date = (id)[NSNull null];
+	}
+	if (!_encounter) {
+		_encounter = (id)[NSNull null];
+	}
+	if (!_headCircumference) {
+		_headCircumference = (id)[NSNull null];
+	}
+	if (!_heartRate) {
+		_heartRate = (id)[NSNull null];
+	}
+	if (!_height) {
+		_height = (id)[NSNull null];
+	}
+	if (!_oxygenSaturation) {
+		_oxygenSaturation = (id)[NSNull null];
+	}
+	if (!_respiratoryRate) {
+		_respiratoryRate = (id)[NSNull null];
+	}
+	if (!_temperature) {
+		_temperature = (id)[NSNull null];
+	}
+	if (!_weight) {
+		_weight = (id)[NSNull null];
+	}
 }
 
 
@@ -23,8 +23,10 @@
 #import "{{ CATEGORY_CLASS }}+{{ CATEGORY_NAME }}.h"
 #import "SMARTObjects.h"
 
+#import <Redland-ObjC.h>
 
-@implementation {{ CATEGORY_CLASS }}({{ CATEGORY_NAME }})
+
+{{ CATEGORY_STATICS }}@implementation {{ CATEGORY_CLASS }}({{ CATEGORY_NAME }})
 
 
 #pragma mark - Synthesized Methods
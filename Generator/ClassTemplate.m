@@ -22,11 +22,13 @@
 
 #import "{{ CLASS_NAME }}.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 
 #import <Redland-ObjC.h>
 
 
-@implementation {{ CLASS_NAME }}
+{{ CLASS_PREDICATES }}@implementation {{ CLASS_NAME }}
 
 
 #pragma mark - Synthesized Lazy Getter
@@ -34,7 +36,7 @@
 
 
 
-#pragma mark - Class Properties
+{{ CLASS_HYDRATION }}{{ CLASS_SNAPSHOT }}{{ CLASS_DECODING }}#pragma mark - Class Properties
 + (NSString *)rdfType
 {
 	return @"{{ RDF_TYPE }}";
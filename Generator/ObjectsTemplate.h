@@ -0,0 +1,31 @@
+/*
+ SMARTObjects.h
+ SMARTFramework
+ 
+ Generated by {{ AUTHOR }} on {{ DATE }}.
+ Copyright (c) {{ YEAR }} CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+/**
+ *  @file SMARTObjects.h
+ *  This header file includes all our document subclasses. Include this header where you use these classes.
+ */
+{{ IMPORTS }}
+
+// scratchpad data is currently curated by hand
+#import "SMScratchpadData.h"
+
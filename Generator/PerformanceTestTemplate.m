@@ -0,0 +1,188 @@
+/*
+ TestGeneratedPerformance.m
+ SMARTFramework
+ 
+ Generated by {{ AUTHOR }} on {{ DATE }}.
+ Copyright (c) {{ YEAR }} CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+
+#import "TestGeneratedPerformance.h"
+#import "SMARTObjects.h"
+#import "SMObject+Registry.h"
+#import <Redland-ObjC.h>
+
+static const NSUInteger SMPerformanceRepetitions = {{ REPETITIONS }};		// how often every example is parsed on its own
+static const NSUInteger SMPerformanceReplicas = {{ REPLICAS }};			// how many copies of every example are parsed as one document
+static const double SMPerformanceTolerance = 0.25;					// how much slower than its baseline a timing may be
+
+
+@implementation TestGeneratedPerformance
+
+
+/**
+ *  Returns an empty suite unless SMART_PERFORMANCE_TESTS is set in the environment, so the timings don't slow down the regular tests.
+ */
++ (id)defaultTestSuite
+{
+	if (![[NSProcessInfo processInfo] environment][@"SMART_PERFORMANCE_TESTS"]) {
+		return [SenTestSuite testSuiteWithName:NSStringFromClass(self)];
+	}
+	return [super defaultTestSuite];
+}
+
+
+
+#pragma mark - Timing individual classes
+{{ COMPLETE_TEST_METHODS }}
+
+
+#pragma mark - Utilities
+/**
+ *  Returns the example RDF of the given class, bundled as "<class name>.rdf"
+ */
+- (NSString *)exampleRDFForClass:(Class)aClass
+{
+	NSString *rdfPath = [[NSBundle bundleForClass:[self class]] pathForResource:NSStringFromClass(aClass) ofType:@"rdf"];
+	return rdfPath ? [NSString stringWithContentsOfFile:rdfPath encoding:NSUTF8StringEncoding error:nil] : nil;
+}
+
+/**
+ *  Runs the block the given number of times and returns the average number of seconds one run took.
+ */
+- (NSTimeInterval)timeRepetitions:(NSUInteger)repetitions of:(void (^)(void))block
+{
+	CFAbsoluteTime start = CFAbsoluteTimeGetCurrent();
+	for (NSUInteger i = 0; i < repetitions; i++) {
+		@autoreleasepool {
+			block();
+		}
+	}
+	return (CFAbsoluteTimeGetCurrent() - start) / MAX(1, repetitions);
+}
+
+/**
+ *  Returns an RDF+XML document with the given number of copies of the statements in the given RDF.
+ *
+ *  Every node that is the subject of a statement gets a new URI (or blank node ID) in every copy, so the copies describe distinct objects.
+ */
+- (NSString *)replicateRDF:(NSString *)rdf times:(NSUInteger)times
+{
+	RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
+	RedlandModel *model = [RedlandModel new];
+	[parser parseString:rdf intoModel:model withBaseURI:[RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"]];
+	
+	NSMutableArray *statements = [NSMutableArray array];
+	NSMutableSet *subjects = [NSMutableSet set];
+	RedlandStreamEnumerator *query = [model enumeratorOfStatementsLike:[RedlandStatement statementWithSubject:nil predicate:nil object:nil]];
+	RedlandStatement *rslt = nil;
+	while ((rslt = [query nextObject])) {
+		[statements addObject:rslt];
+		[subjects addObject:rslt.subject];
+	}
+	
+	RedlandNode *(^copyOf)(RedlandNode *, NSUInteger) = ^RedlandNode *(RedlandNode *node, NSUInteger copy) {
+		if (![subjects containsObject:node]) {
+			return node;
+		}
+		if ([node isBlank]) {
+			return [RedlandNode nodeWithBlankID:[NSString stringWithFormat:@"%@c%lu", [node blankID], (unsigned long)copy]];
+		}
+		return [RedlandNode nodeWithURIString:[NSString stringWithFormat:@"%@-%lu", [[node URIValue] stringValue], (unsigned long)copy]];
+	};
+	
+	RedlandModel *replicated = [RedlandModel new];
+	for (NSUInteger i = 0; i < times; i++) {
+		for (RedlandStatement *statement in statements) {
+			[replicated addStatement:[RedlandStatement statementWithSubject:copyOf(statement.subject, i) predicate:statement.predicate object:copyOf(statement.object, i)]];
+		}
+	}
+	
+	RedlandSerializer *serializer = [RedlandSerializer serializerWithName:RedlandAbbreviatedRDFXMLSerializer];
+	return [serializer serializedStringFromModel:replicated withBaseURI:nil];
+}
+
+/**
+ *  Parses the RDF and returns the instances of the given class, built by the registry like server responses are.
+ */
+- (NSArray *)objectsOfClass:(Class)aClass inRDF:(NSString *)rdf
+{
+	RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
+	RedlandModel *model = [RedlandModel new];
+	[parser parseString:rdf intoModel:model withBaseURI:[RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"]];
+	
+	NSMutableArray *objects = [NSMutableArray array];
+	for (SMObject *item in [[SMObject objectsInModel:model] allValues]) {
+		if ([item isMemberOfClass:aClass]) {
+			[objects addObject:item];
+		}
+	}
+	return objects;
+}
+
+/**
+ *  Adds the timings (in seconds) of a class to the report and compares them to the baseline.
+ *
+ *  The report is written as JSON, in milliseconds, to the file in SMART_PERFORMANCE_REPORT or to "smart-performance.json" in the temporary directory;
+ *  copy it to "performance-baseline.json" in the test bundle's sources to make it the new baseline. The timings of a class without a baseline entry
+ *  are only reported and logged as such. A timing missing from the entry of its class fails, so an incomplete baseline cannot hide a slowdown; set
+ *  SMART_PERFORMANCE_RECORD in the environment to only report these while recording a new baseline.
+ */
+- (void)checkTimings:(NSDictionary *)timings forClass:(NSString *)className
+{
+	static NSMutableDictionary *report = nil;
+	static NSDictionary *baseline = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		report = [NSMutableDictionary dictionary];
+		NSString *baselinePath = [[NSBundle bundleForClass:[self class]] pathForResource:@"performance-baseline" ofType:@"json"];
+		NSData *baselineData = baselinePath ? [NSData dataWithContentsOfFile:baselinePath] : nil;
+		baseline = baselineData ? [NSJSONSerialization JSONObjectWithData:baselineData options:0 error:nil] : nil;
+	});
+	
+	NSDictionary *environment = [[NSProcessInfo processInfo] environment];
+	BOOL recording = (nil != environment[@"SMART_PERFORMANCE_RECORD"]);
+	NSString *reportPath = environment[@"SMART_PERFORMANCE_REPORT"];
+	if (!reportPath) {
+		reportPath = [NSTemporaryDirectory() stringByAppendingPathComponent:@"smart-performance.json"];
+	}
+	
+	NSDictionary *expectations = baseline[className];
+	if (!expectations) {
+		NSLog(@"WARNING: %@ has no performance baseline, its timings are only reported; run with SMART_PERFORMANCE_RECORD set and copy %@ to performance-baseline.json", className, reportPath);
+	}
+	
+	NSMutableDictionary *milliseconds = [NSMutableDictionary dictionaryWithCapacity:[timings count]];
+	[timings enumerateKeysAndObjectsUsingBlock:^(NSString *name, NSNumber *seconds, BOOL *stop) {
+		double measured = [seconds doubleValue] * 1000.0;
+		milliseconds[name] = @(round(measured * 1000.0) / 1000.0);
+		
+		NSNumber *expected = expectations[name];
+		if (expected) {
+			STAssertTrue(measured <= [expected doubleValue] * (1.0 + SMPerformanceTolerance), @"%@ %@ took %.3f ms, the baseline is %.3f ms", className, name, measured, [expected doubleValue]);
+		}
+		else if (expectations && !recording) {
+			STFail(@"%@ %@ took %.3f ms but has no baseline; run with SMART_PERFORMANCE_RECORD set and copy %@ to performance-baseline.json", className, name, measured, reportPath);
+		}
+	}];
+	report[className] = milliseconds;
+	NSLog(@"%@: %@", className, milliseconds);
+	
+	[[NSJSONSerialization dataWithJSONObject:report options:NSJSONWritingPrettyPrinted error:nil] writeToFile:reportPath atomically:YES];
+}
+
+@end
@@ -0,0 +1,22 @@
+#
+#	__init__.py
+#	SMART objects
+#
+#	Generated by {{ AUTHOR }} on {{ DATE }}.
+#	Copyright (c) {{ YEAR }} CHIP, Boston Children's Hospital
+#
+#	This library is free software; you can redistribute it and/or
+#	modify it under the terms of the GNU Lesser General Public
+#	License as published by the Free Software Foundation; either
+#	version 2.1 of the License, or (at your option) any later version.
+#
+#	Classes generated from the SMART ontology, the Python counterpart of the
+#	framework's Objective-C classes. Use objects_in_graph() to build all objects of
+#	a parsed rdflib graph at once.
+#
+
+from .runtime import SMObject, LiteralProperty, TypedLiteralProperty, ModelProperty, NOT_FOUND
+from .runtime import register, class_for_rdf_type, number_from_literal, date_from_literal, objects_from_triples, objects_in_graph
+
+
+{{ CLASSES }}
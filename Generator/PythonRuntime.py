@@ -0,0 +1,243 @@
+#
+#	runtime.py
+#	SMART objects
+#
+#	Generated by {{ AUTHOR }} on {{ DATE }}.
+#	Copyright (c) {{ YEAR }} CHIP, Boston Children's Hospital
+#
+#	This library is free software; you can redistribute it and/or
+#	modify it under the terms of the GNU Lesser General Public
+#	License as published by the Free Software Foundation; either
+#	version 2.1 of the License, or (at your option) any later version.
+#
+#	The base class, property accessors and registry of the generated SMART classes.
+#	Objects read their properties lazily, either from an rdflib graph or from the
+#	subject index built by objects_from_triples(), and cache them in their slots.
+#
+
+import re
+import datetime
+from decimal import Decimal, InvalidOperation
+
+try:
+	text_type = unicode
+except NameError:
+	text_type = str
+
+RDF_TYPE = u'http://www.w3.org/1999/02/22-rdf-syntax-ns#type'
+
+# placeholder for "already searched the graph and found nothing", like NSNull in the Objective-C classes
+NOT_FOUND = object()
+
+_classes = {}				# { rdf:type: class }
+_classes_by_name = {}		# { class name: class }
+
+
+def register(cls):
+	"""Class decorator adding a generated class to the registry."""
+	_classes[cls.rdf_type] = cls
+	_classes_by_name[cls.__name__] = cls
+	return cls
+
+
+def class_for_rdf_type(rdf_type):
+	"""Returns the generated class that represents objects of the given rdf:type, None if there is none."""
+	return _classes.get(text_type(rdf_type)) if rdf_type is not None else None
+
+
+class SMObject(object):
+	"""The base class of all generated classes, representing a subject in a graph.
+
+	"index" is a dictionary of { subject: { predicate: [objects] } } as built by objects_from_triples(), if it is given the
+	graph is never queried. "objects" is a dictionary of { subject: SMObject } that model properties use before creating new
+	instances.
+	"""
+
+	__slots__ = ('subject', 'graph', 'index', 'objects')
+	rdf_type = None
+	base_path = None
+	property_names = ()
+
+	def __init__(self, subject, graph=None, index=None, objects=None):
+		self.subject = subject
+		self.graph = graph
+		self.index = index
+		self.objects = objects
+
+	def values_for(self, predicate):
+		"""Returns the objects of all statements about our subject with the given predicate."""
+		if self.index is not None:
+			return self.index.get(self.subject, {}).get(predicate, ())
+		if self.graph is None:
+			return ()
+
+		from rdflib import URIRef
+		return list(self.graph.objects(self.subject, URIRef(predicate)))
+
+	def object_for(self, item_class, node):
+		"""Returns the instance of "item_class" for the given node, reusing the one in "objects" if there is one."""
+		if self.objects is not None:
+			existing = self.objects.get(node)
+			if isinstance(existing, item_class):
+				return existing
+		return item_class(node, self.graph, self.index, self.objects)
+
+	def hydrate(self):
+		"""Reads all properties at once."""
+		for name in self.property_names:
+			getattr(self, name)
+
+	def __repr__(self):
+		return '<%s %s>' % (self.__class__.__name__, self.subject)
+
+
+class LiteralProperty(object):
+	"""The literal of the first statement with the predicate, or a tuple with the literals of all of them if "multiple"."""
+
+	__slots__ = ('predicate', 'slot', 'multiple')
+
+	def __init__(self, predicate, slot, multiple=False):
+		self.predicate = predicate
+		self.slot = slot
+		self.multiple = multiple
+
+	def __get__(self, obj, owner):
+		if obj is None:
+			return self
+
+		value = getattr(obj, self.slot, None)
+		if value is None:
+			values = [text_type(v) for v in obj.values_for(self.predicate)]
+			if self.multiple:
+				value = tuple(values)
+			else:
+				value = values[0] if len(values) > 0 else NOT_FOUND
+			setattr(obj, self.slot, value)
+
+		return None if value is NOT_FOUND else value
+
+
+class TypedLiteralProperty(object):
+	"""The value of the literal property named "literal", converted once with "convert"."""
+
+	__slots__ = ('literal', 'slot', 'convert')
+
+	def __init__(self, literal, slot, convert):
+		self.literal = literal
+		self.slot = slot
+		self.convert = convert
+
+	def __get__(self, obj, owner):
+		if obj is None:
+			return self
+
+		value = getattr(obj, self.slot, None)
+		if value is None:
+			literal = getattr(obj, self.literal)
+			value = self.convert(literal) if literal is not None else None
+			if value is None:
+				value = NOT_FOUND
+			setattr(obj, self.slot, value)
+
+		return None if value is NOT_FOUND else value
+
+
+class ModelProperty(object):
+	"""An instance of the class named "class_name" for the object of the first statement with the predicate, or a tuple of
+	instances for all of them if "multiple".
+	"""
+
+	__slots__ = ('predicate', 'slot', 'class_name', 'multiple')
+
+	def __init__(self, predicate, slot, class_name, multiple=False):
+		self.predicate = predicate
+		self.slot = slot
+		self.class_name = class_name
+		self.multiple = multiple
+
+	def __get__(self, obj, owner):
+		if obj is None:
+			return self
+
+		value = getattr(obj, self.slot, None)
+		if value is None:
+			item_class = _classes_by_name[self.class_name]
+			items = [obj.object_for(item_class, node) for node in obj.values_for(self.predicate)]
+			if self.multiple:
+				value = tuple(items)
+			else:
+				value = items[0] if len(items) > 0 else NOT_FOUND
+			setattr(obj, self.slot, value)
+
+		return None if value is NOT_FOUND else value
+
+
+_date_literal = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?)?\s*(Z|[+-]\d{2}:?\d{2})?$')
+
+def number_from_literal(literal):
+	"""Converts an xsd:decimal (or integer, double, ...) literal to a Decimal, None if it is not a number."""
+	try:
+		return Decimal(literal.strip())
+	except (InvalidOperation, ValueError):
+		return None
+
+
+def date_from_literal(literal):
+	"""Converts an xsd:dateTime or xsd:date literal to a naive datetime in UTC, None if it cannot be read. Times without a
+	time zone are taken as UTC.
+	"""
+	match = _date_literal.match(literal.strip())
+	if match is None:
+		return None
+
+	year, month, day, hour, minute, second, fraction, zone = match.groups()
+	try:
+		date = datetime.datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+			int((fraction or '0')[:6].ljust(6, '0')))
+	except ValueError:
+		return None
+
+	if zone and 'Z' != zone:
+		sign = -1 if '-' == zone[0] else 1
+		digits = zone[1:].replace(':', '')
+		date -= sign * datetime.timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+
+	return date
+
+
+def objects_from_triples(triples, graph=None):
+	"""Indexes the (subject, predicate, object) triples by subject in one pass and returns a dictionary of { subject:
+	SMObject } with an instance for every subject whose rdf:type has a generated class.
+
+	The instances read their properties from the index, model properties point to the instances in the returned
+	dictionary.
+	"""
+	index = {}
+	typed = []
+	for subject, predicate, obj in triples:
+		predicate = text_type(predicate)
+		about = index.get(subject)
+		if about is None:
+			about = index[subject] = {}
+		values = about.get(predicate)
+		if values is None:
+			about[predicate] = [obj]
+		else:
+			values.append(obj)
+
+		if RDF_TYPE == predicate:
+			typed.append((subject, obj))
+
+	objects = {}
+	for subject, rdf_type in typed:
+		if subject not in objects:
+			item_class = class_for_rdf_type(rdf_type)
+			if item_class is not None:
+				objects[subject] = item_class(subject, graph, index, objects)
+
+	return objects
+
+
+def objects_in_graph(graph):
+	"""Returns a dictionary of { subject: SMObject } for all typed subjects in the rdflib graph, see objects_from_triples()."""
+	return objects_from_triples(graph.triples((None, None, None)), graph)
@@ -33,6 +33,8 @@ extern NSString *const SMARTResponseContentTypeKey;			/// Dictionaries return th
 extern NSString *const SMARTResponseDataKey;				/// Dictionaries return the server's response as NSData for this key
 extern NSString *const SMARTResponseArrayKey;				/// Dictionaries return an NSArray for this key
 extern NSString *const SMARTResponseImageKey;				/// Dictionaries return a UIImage for this key (e.g. GET /records/{id}/photograph)
+extern NSString *const SMARTResponseModelKey;				/// Dictionaries return the RedlandModel the returned objects live in for this key
+extern NSString *const SMARTResponseCallsKey;				/// Dictionaries return an NSDictionary with an NSArray of objects per call name for this key (e.g. after prefetching)
 
 // Other globals
 extern NSString *const SMARTInternalScheme;					/// The URL scheme we use to identify when the framework should intercept a request
@@ -48,6 +50,12 @@ extern NSString *const SMARTRecordUserInfoKey;						/// For SMARTRecordDocuments
  */
 typedef void (^SMSuccessRetvalueBlock)(BOOL success, NSDictionary * __autoreleasing userInfo);
 
+/**
+ *  A block receiving the objects of one page of a paged call and the user info dictionary of that page's response.
+ *  Return NO to stop fetching further pages.
+ */
+typedef BOOL (^SMPageBlock)(NSArray * __autoreleasing items, NSDictionary * __autoreleasing userInfo);
+
 /**
  *  A block returning a flag whether the user cancelled and an error message on failure, nil otherwise.
  *  If userDidCancel is NO and errorMessage is nil, the operation completed successfully.
@@ -0,0 +1,882 @@
+/*
+ TestGeneratedPerformance.m
+ SMARTFramework
+ 
+ Generated by build-obj-c-classes.py on 2026-10-18.
+ Copyright (c) 2026 CHIP, Boston Children's Hospital
+ 
+ This library is free software; you can redistribute it and/or
+ modify it under the terms of the GNU Lesser General Public
+ License as published by the Free Software Foundation; either
+ version 2.1 of the License, or (at your option) any later version.
+ 
+ This library is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public
+ License along with this library; if not, write to the Free Software
+ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+ */
+
+
+#import "TestGeneratedPerformance.h"
+#import "SMARTObjects.h"
+#import "SMObject+Registry.h"
+#import <Redland-ObjC.h>
+
+static const NSUInteger SMPerformanceRepetitions = 50;		// how often every example is parsed on its own
+static const NSUInteger SMPerformanceReplicas = 100;			// how many copies of every example are parsed as one document
+static const double SMPerformanceTolerance = 0.25;					// how much slower than its baseline a timing may be
+
+
+@implementation TestGeneratedPerformance
+
+
+/**
+ *  Returns an empty suite unless SMART_PERFORMANCE_TESTS is set in the environment, so the timings don't slow down the regular tests.
+ */
++ (id)defaultTestSuite
+{
+	if (![[NSProcessInfo processInfo] environment][@"SMART_PERFORMANCE_TESTS"]) {
+		return [SenTestSuite testSuiteWithName:NSStringFromClass(self)];
+	}
+	return [super defaultTestSuite];
+}
+
+
+
+#pragma mark - Timing individual classes
+/**
+ *  Timing SMAllergy
+ */
+- (void)testPerformanceSMAllergy
+{
+	NSString *rdf = [self exampleRDFForClass:[SMAllergy class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMAllergy");
+	void (^touch)(SMAllergy *) = ^(SMAllergy *item) {
+		(void)item.allergicReaction;
+		(void)item.belongsTo;
+		(void)item.category;
+		(void)item.drugAllergen;
+		(void)item.drugClassAllergen;
+		(void)item.endDate;
+		(void)item.otherAllergen;
+		(void)item.severity;
+		(void)item.startDate;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMAllergy newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMAllergy class] inRDF:replicated];
+		for (SMAllergy *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMAllergy, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMAllergy"];
+}
+
+
+/**
+ *  Timing SMAllergyExclusion
+ */
+- (void)testPerformanceSMAllergyExclusion
+{
+	NSString *rdf = [self exampleRDFForClass:[SMAllergyExclusion class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMAllergyExclusion");
+	void (^touch)(SMAllergyExclusion *) = ^(SMAllergyExclusion *item) {
+		(void)item.allergyExclusionName;
+		(void)item.belongsTo;
+		(void)item.date;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMAllergyExclusion newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMAllergyExclusion class] inRDF:replicated];
+		for (SMAllergyExclusion *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMAllergyExclusion, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMAllergyExclusion"];
+}
+
+
+/**
+ *  Timing SMClinicalNote
+ */
+- (void)testPerformanceSMClinicalNote
+{
+	NSString *rdf = [self exampleRDFForClass:[SMClinicalNote class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMClinicalNote");
+	void (^touch)(SMClinicalNote *) = ^(SMClinicalNote *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.documentType;
+		(void)item.fileName;
+		(void)item.fileSize;
+		(void)item.format;
+		(void)item.provider;
+		(void)item.resource;
+		(void)item.title;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMClinicalNote newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMClinicalNote class] inRDF:replicated];
+		for (SMClinicalNote *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMClinicalNote, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMClinicalNote"];
+}
+
+
+/**
+ *  Timing SMDemographics
+ */
+- (void)testPerformanceSMDemographics
+{
+	NSString *rdf = [self exampleRDFForClass:[SMDemographics class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMDemographics");
+	void (^touch)(SMDemographics *) = ^(SMDemographics *item) {
+		(void)item.adr;
+		(void)item.bday;
+		(void)item.belongsTo;
+		(void)item.deathdate;
+		(void)item.email;
+		(void)item.ethnicity;
+		(void)item.gender;
+		(void)item.gestationalAgeAtBirth;
+		(void)item.medicalRecordNumber;
+		(void)item.n;
+		(void)item.preferredLanguage;
+		(void)item.race;
+		(void)item.tel;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMDemographics newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMDemographics class] inRDF:replicated];
+		for (SMDemographics *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMDemographics, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMDemographics"];
+}
+
+
+/**
+ *  Timing SMDocument
+ */
+- (void)testPerformanceSMDocument
+{
+	NSString *rdf = [self exampleRDFForClass:[SMDocument class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMDocument");
+	void (^touch)(SMDocument *) = ^(SMDocument *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.documentType;
+		(void)item.fileName;
+		(void)item.fileSize;
+		(void)item.format;
+		(void)item.provider;
+		(void)item.resource;
+		(void)item.title;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMDocument newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMDocument class] inRDF:replicated];
+		for (SMDocument *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMDocument, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMDocument"];
+}
+
+
+/**
+ *  Timing SMEncounter
+ */
+- (void)testPerformanceSMEncounter
+{
+	NSString *rdf = [self exampleRDFForClass:[SMEncounter class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMEncounter");
+	void (^touch)(SMEncounter *) = ^(SMEncounter *item) {
+		(void)item.belongsTo;
+		(void)item.encounterType;
+		(void)item.endDate;
+		(void)item.facility;
+		(void)item.provider;
+		(void)item.startDate;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMEncounter newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMEncounter class] inRDF:replicated];
+		for (SMEncounter *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMEncounter, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMEncounter"];
+}
+
+
+/**
+ *  Timing SMFamilyHistoryObservation
+ */
+- (void)testPerformanceSMFamilyHistoryObservation
+{
+	NSString *rdf = [self exampleRDFForClass:[SMFamilyHistoryObservation class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMFamilyHistoryObservation");
+	void (^touch)(SMFamilyHistoryObservation *) = ^(SMFamilyHistoryObservation *item) {
+		(void)item.aboutRelative;
+		(void)item.bday;
+		(void)item.belongsTo;
+		(void)item.deathdate;
+		(void)item.hasProblem;
+		(void)item.height;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMFamilyHistoryObservation newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMFamilyHistoryObservation class] inRDF:replicated];
+		for (SMFamilyHistoryObservation *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMFamilyHistoryObservation, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMFamilyHistoryObservation"];
+}
+
+
+/**
+ *  Timing SMFulfillment
+ */
+- (void)testPerformanceSMFulfillment
+{
+	NSString *rdf = [self exampleRDFForClass:[SMFulfillment class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMFulfillment");
+	void (^touch)(SMFulfillment *) = ^(SMFulfillment *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.dispenseDaysSupply;
+		(void)item.medication;
+		(void)item.pbm;
+		(void)item.pharmacy;
+		(void)item.provider;
+		(void)item.quantityDispensed;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMFulfillment newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMFulfillment class] inRDF:replicated];
+		for (SMFulfillment *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMFulfillment, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMFulfillment"];
+}
+
+
+/**
+ *  Timing SMImagingStudy
+ */
+- (void)testPerformanceSMImagingStudy
+{
+	NSString *rdf = [self exampleRDFForClass:[SMImagingStudy class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMImagingStudy");
+	void (^touch)(SMImagingStudy *) = ^(SMImagingStudy *item) {
+		(void)item.accessionNumber;
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.modality;
+		(void)item.series;
+		(void)item.title;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMImagingStudy newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMImagingStudy class] inRDF:replicated];
+		for (SMImagingStudy *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMImagingStudy, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMImagingStudy"];
+}
+
+
+/**
+ *  Timing SMImmunization
+ */
+- (void)testPerformanceSMImmunization
+{
+	NSString *rdf = [self exampleRDFForClass:[SMImmunization class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMImmunization");
+	void (^touch)(SMImmunization *) = ^(SMImmunization *item) {
+		(void)item.administrationStatus;
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.productClass;
+		(void)item.productName;
+		(void)item.refusalReason;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMImmunization newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMImmunization class] inRDF:replicated];
+		for (SMImmunization *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMImmunization, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMImmunization"];
+}
+
+
+/**
+ *  Timing SMLabPanel
+ */
+- (void)testPerformanceSMLabPanel
+{
+	NSString *rdf = [self exampleRDFForClass:[SMLabPanel class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMLabPanel");
+	void (^touch)(SMLabPanel *) = ^(SMLabPanel *item) {
+		(void)item.belongsTo;
+		(void)item.labName;
+		(void)item.labResult;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMLabPanel newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMLabPanel class] inRDF:replicated];
+		for (SMLabPanel *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMLabPanel, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMLabPanel"];
+}
+
+
+/**
+ *  Timing SMLabResult
+ */
+- (void)testPerformanceSMLabResult
+{
+	NSString *rdf = [self exampleRDFForClass:[SMLabResult class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMLabResult");
+	void (^touch)(SMLabResult *) = ^(SMLabResult *item) {
+		(void)item.abnormalInterpretation;
+		(void)item.accessionNumber;
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.labName;
+		(void)item.labStatus;
+		(void)item.narrativeResult;
+		(void)item.notes;
+		(void)item.quantitativeResult;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMLabResult newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMLabResult class] inRDF:replicated];
+		for (SMLabResult *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMLabResult, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMLabResult"];
+}
+
+
+/**
+ *  Timing SMMedicalImage
+ */
+- (void)testPerformanceSMMedicalImage
+{
+	NSString *rdf = [self exampleRDFForClass:[SMMedicalImage class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMMedicalImage");
+	void (^touch)(SMMedicalImage *) = ^(SMMedicalImage *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.dicomImageUID;
+		(void)item.dicomSeriesUID;
+		(void)item.dicomStudyUID;
+		(void)item.documentType;
+		(void)item.fileName;
+		(void)item.fileSize;
+		(void)item.format;
+		(void)item.imagingStudy;
+		(void)item.provider;
+		(void)item.resource;
+		(void)item.title;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMMedicalImage newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMMedicalImage class] inRDF:replicated];
+		for (SMMedicalImage *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMMedicalImage, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMMedicalImage"];
+}
+
+
+/**
+ *  Timing SMMedication
+ */
+- (void)testPerformanceSMMedication
+{
+	NSString *rdf = [self exampleRDFForClass:[SMMedication class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMMedication");
+	void (^touch)(SMMedication *) = ^(SMMedication *item) {
+		(void)item.belongsTo;
+		(void)item.drugName;
+		(void)item.endDate;
+		(void)item.frequency;
+		(void)item.fulfillment;
+		(void)item.instructions;
+		(void)item.provenance;
+		(void)item.quantity;
+		(void)item.startDate;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMMedication newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMMedication class] inRDF:replicated];
+		for (SMMedication *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMMedication, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMMedication"];
+}
+
+
+/**
+ *  Timing SMPhotograph
+ */
+- (void)testPerformanceSMPhotograph
+{
+	NSString *rdf = [self exampleRDFForClass:[SMPhotograph class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMPhotograph");
+	void (^touch)(SMPhotograph *) = ^(SMPhotograph *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.documentType;
+		(void)item.fileName;
+		(void)item.fileSize;
+		(void)item.format;
+		(void)item.provider;
+		(void)item.resource;
+		(void)item.title;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMPhotograph newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMPhotograph class] inRDF:replicated];
+		for (SMPhotograph *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMPhotograph, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMPhotograph"];
+}
+
+
+/**
+ *  Timing SMProblem
+ */
+- (void)testPerformanceSMProblem
+{
+	NSString *rdf = [self exampleRDFForClass:[SMProblem class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMProblem");
+	void (^touch)(SMProblem *) = ^(SMProblem *item) {
+		(void)item.belongsTo;
+		(void)item.encounters;
+		(void)item.endDate;
+		(void)item.notes;
+		(void)item.problemName;
+		(void)item.problemStatus;
+		(void)item.startDate;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMProblem newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMProblem class] inRDF:replicated];
+		for (SMProblem *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMProblem, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMProblem"];
+}
+
+
+/**
+ *  Timing SMProcedure
+ */
+- (void)testPerformanceSMProcedure
+{
+	NSString *rdf = [self exampleRDFForClass:[SMProcedure class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMProcedure");
+	void (^touch)(SMProcedure *) = ^(SMProcedure *item) {
+		(void)item.belongsTo;
+		(void)item.date;
+		(void)item.notes;
+		(void)item.procedureName;
+		(void)item.procedureStatus;
+		(void)item.provider;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMProcedure newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMProcedure class] inRDF:replicated];
+		for (SMProcedure *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMProcedure, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMProcedure"];
+}
+
+
+/**
+ *  Timing SMSocialHistory
+ */
+- (void)testPerformanceSMSocialHistory
+{
+	NSString *rdf = [self exampleRDFForClass:[SMSocialHistory class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMSocialHistory");
+	void (^touch)(SMSocialHistory *) = ^(SMSocialHistory *item) {
+		(void)item.belongsTo;
+		(void)item.smokingStatus;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMSocialHistory newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMSocialHistory class] inRDF:replicated];
+		for (SMSocialHistory *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMSocialHistory, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMSocialHistory"];
+}
+
+
+/**
+ *  Timing SMVitalSignSet
+ */
+- (void)testPerformanceSMVitalSignSet
+{
+	NSString *rdf = [self exampleRDFForClass:[SMVitalSignSet class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class SMVitalSignSet");
+	void (^touch)(SMVitalSignSet *) = ^(SMVitalSignSet *item) {
+		(void)item.belongsTo;
+		(void)item.bloodPressure;
+		(void)item.bodyMassIndex;
+		(void)item.date;
+		(void)item.encounter;
+		(void)item.headCircumference;
+		(void)item.heartRate;
+		(void)item.height;
+		(void)item.oxygenSaturation;
+		(void)item.respiratoryRate;
+		(void)item.temperature;
+		(void)item.weight;
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([SMVitalSignSet newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[SMVitalSignSet class] inRDF:replicated];
+		for (SMVitalSignSet *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of SMVitalSignSet, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"SMVitalSignSet"];
+}
+
+
+
+#pragma mark - Utilities
+/**
+ *  Returns the example RDF of the given class, bundled as "<class name>.rdf"
+ */
+- (NSString *)exampleRDFForClass:(Class)aClass
+{
+	NSString *rdfPath = [[NSBundle bundleForClass:[self class]] pathForResource:NSStringFromClass(aClass) ofType:@"rdf"];
+	return rdfPath ? [NSString stringWithContentsOfFile:rdfPath encoding:NSUTF8StringEncoding error:nil] : nil;
+}
+
+/**
+ *  Runs the block the given number of times and returns the average number of seconds one run took.
+ */
+- (NSTimeInterval)timeRepetitions:(NSUInteger)repetitions of:(void (^)(void))block
+{
+	CFAbsoluteTime start = CFAbsoluteTimeGetCurrent();
+	for (NSUInteger i = 0; i < repetitions; i++) {
+		@autoreleasepool {
+			block();
+		}
+	}
+	return (CFAbsoluteTimeGetCurrent() - start) / MAX(1, repetitions);
+}
+
+/**
+ *  Returns an RDF+XML document with the given number of copies of the statements in the given RDF.
+ *
+ *  Every node that is the subject of a statement gets a new URI (or blank node ID) in every copy, so the copies describe distinct objects.
+ */
+- (NSString *)replicateRDF:(NSString *)rdf times:(NSUInteger)times
+{
+	RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
+	RedlandModel *model = [RedlandModel new];
+	[parser parseString:rdf intoModel:model withBaseURI:[RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"]];
+	
+	NSMutableArray *statements = [NSMutableArray array];
+	NSMutableSet *subjects = [NSMutableSet set];
+	RedlandStreamEnumerator *query = [model enumeratorOfStatementsLike:[RedlandStatement statementWithSubject:nil predicate:nil object:nil]];
+	RedlandStatement *rslt = nil;
+	while ((rslt = [query nextObject])) {
+		[statements addObject:rslt];
+		[subjects addObject:rslt.subject];
+	}
+	
+	RedlandNode *(^copyOf)(RedlandNode *, NSUInteger) = ^RedlandNode *(RedlandNode *node, NSUInteger copy) {
+		if (![subjects containsObject:node]) {
+			return node;
+		}
+		if ([node isBlank]) {
+			return [RedlandNode nodeWithBlankID:[NSString stringWithFormat:@"%@c%lu", [node blankID], (unsigned long)copy]];
+		}
+		return [RedlandNode nodeWithURIString:[NSString stringWithFormat:@"%@-%lu", [[node URIValue] stringValue], (unsigned long)copy]];
+	};
+	
+	RedlandModel *replicated = [RedlandModel new];
+	for (NSUInteger i = 0; i < times; i++) {
+		for (RedlandStatement *statement in statements) {
+			[replicated addStatement:[RedlandStatement statementWithSubject:copyOf(statement.subject, i) predicate:statement.predicate object:copyOf(statement.object, i)]];
+		}
+	}
+	
+	RedlandSerializer *serializer = [RedlandSerializer serializerWithName:RedlandAbbreviatedRDFXMLSerializer];
+	return [serializer serializedStringFromModel:replicated withBaseURI:nil];
+}
+
+/**
+ *  Parses the RDF and returns the instances of the given class, built by the registry like server responses are.
+ */
+- (NSArray *)objectsOfClass:(Class)aClass inRDF:(NSString *)rdf
+{
+	RedlandParser *parser = [RedlandParser parserWithName:RedlandRDFXMLParserName];
+	RedlandModel *model = [RedlandModel new];
+	[parser parseString:rdf intoModel:model withBaseURI:[RedlandURI URIWithString:@"http://www.smartplatforms.org/terms#"]];
+	
+	NSMutableArray *objects = [NSMutableArray array];
+	for (SMObject *item in [[SMObject objectsInModel:model] allValues]) {
+		if ([item isMemberOfClass:aClass]) {
+			[objects addObject:item];
+		}
+	}
+	return objects;
+}
+
+/**
+ *  Adds the timings (in seconds) of a class to the report and compares them to the baseline.
+ *
+ *  The report is written as JSON, in milliseconds, to the file in SMART_PERFORMANCE_REPORT or to "smart-performance.json" in the temporary directory;
+ *  copy it to "performance-baseline.json" in the test bundle's sources to make it the new baseline. The timings of a class without a baseline entry
+ *  are only reported and logged as such. A timing missing from the entry of its class fails, so an incomplete baseline cannot hide a slowdown; set
+ *  SMART_PERFORMANCE_RECORD in the environment to only report these while recording a new baseline.
+ */
+- (void)checkTimings:(NSDictionary *)timings forClass:(NSString *)className
+{
+	static NSMutableDictionary *report = nil;
+	static NSDictionary *baseline = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		report = [NSMutableDictionary dictionary];
+		NSString *baselinePath = [[NSBundle bundleForClass:[self class]] pathForResource:@"performance-baseline" ofType:@"json"];
+		NSData *baselineData = baselinePath ? [NSData dataWithContentsOfFile:baselinePath] : nil;
+		baseline = baselineData ? [NSJSONSerialization JSONObjectWithData:baselineData options:0 error:nil] : nil;
+	});
+	
+	NSDictionary *environment = [[NSProcessInfo processInfo] environment];
+	BOOL recording = (nil != environment[@"SMART_PERFORMANCE_RECORD"]);
+	NSString *reportPath = environment[@"SMART_PERFORMANCE_REPORT"];
+	if (!reportPath) {
+		reportPath = [NSTemporaryDirectory() stringByAppendingPathComponent:@"smart-performance.json"];
+	}
+	
+	NSDictionary *expectations = baseline[className];
+	if (!expectations) {
+		NSLog(@"WARNING: %@ has no performance baseline, its timings are only reported; run with SMART_PERFORMANCE_RECORD set and copy %@ to performance-baseline.json", className, reportPath);
+	}
+	
+	NSMutableDictionary *milliseconds = [NSMutableDictionary dictionaryWithCapacity:[timings count]];
+	[timings enumerateKeysAndObjectsUsingBlock:^(NSString *name, NSNumber *seconds, BOOL *stop) {
+		double measured = [seconds doubleValue] * 1000.0;
+		milliseconds[name] = @(round(measured * 1000.0) / 1000.0);
+		
+		NSNumber *expected = expectations[name];
+		if (expected) {
+			STAssertTrue(measured <= [expected doubleValue] * (1.0 + SMPerformanceTolerance), @"%@ %@ took %.3f ms, the baseline is %.3f ms", className, name, measured, [expected doubleValue]);
+		}
+		else if (expectations && !recording) {
+			STFail(@"%@ %@ took %.3f ms but has no baseline; run with SMART_PERFORMANCE_RECORD set and copy %@ to performance-baseline.json", className, name, measured, reportPath);
+		}
+	}];
+	report[className] = milliseconds;
+	NSLog(@"%@: %@", className, milliseconds);
+	
+	[[NSJSONSerialization dataWithJSONObject:report options:NSJSONWritingPrettyPrinted error:nil] writeToFile:reportPath atomically:YES];
+}
+
+@end
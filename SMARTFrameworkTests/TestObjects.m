@@ -21,7 +21,11 @@
 
 #import "TestObjects.h"
 #import "SMRecord+Calls.h"
+#import "SMObject+Registry.h"
+#import "SMCodedValue+CodeSystems.h"
 #import "SMARTObjects.h"
+#import "SMSnapshot.h"
+#import "SMStreamDecoder.h"
 #import <Redland-ObjC.h>
 
 @implementation TestObjects
@@ -57,6 +61,187 @@
 	NSLog(@"Model: %d, after: %d, sub: %d", before, after, subsize);
 }
 
+/**
+ *  Test reading all properties at once
+ */
+- (void)testHydration
+{
+	NSURL *url = [[NSBundle bundleForClass:[self class]] URLForResource:@"SMLabResult" withExtension:@"rdf"];
+	NSString *rdfxml = [NSString stringWithContentsOfURL:url encoding:NSUTF8StringEncoding error:nil];
+	SMLabResult *lazy = [SMLabResult newWithRDFXML:rdfxml];
+	SMLabResult *hydrated = [SMLabResult newWithRDFXML:rdfxml];
+	STAssertNotNil(hydrated, nil);
+	[hydrated hydrateAllProperties];
+	
+	STAssertEqualObjects(lazy.accessionNumber, hydrated.accessionNumber, nil);
+	STAssertEqualObjects(lazy.date, hydrated.date, nil);
+	STAssertEqualObjects(lazy.notes, hydrated.notes, nil);
+	STAssertEqualObjects(lazy.labName.title, hydrated.labName.title, nil);
+	STAssertEqualObjects(lazy.quantitativeResult.valueAndUnit.value, hydrated.quantitativeResult.valueAndUnit.value, nil);
+	STAssertNil(hydrated.narrativeResult, nil);
+}
+
+/**
+ *  Test building all objects of a model in one pass
+ */
+- (void)testObjectGraph
+{
+	STAssertEquals([SMLabResult class], [SMObject classForRDFType:[SMLabResult rdfType]], nil);
+	STAssertNil([SMObject classForRDFType:@"http://example.com/no#Type"], nil);
+	
+	NSURL *url = [[NSBundle bundleForClass:[self class]] URLForResource:@"SMLabResult" withExtension:@"rdf"];
+	NSString *rdfxml = [NSString stringWithContentsOfURL:url encoding:NSUTF8StringEncoding error:nil];
+	SMLabResult *lazy = [SMLabResult newWithRDFXML:rdfxml];
+	STAssertNotNil(lazy, nil);
+	
+	SMLabResult *built = [self objectOfClass:[SMLabResult class] inModel:lazy.inModel];
+	STAssertTrue([built isKindOfClass:[SMLabResult class]], nil);
+	STAssertEqualObjects(lazy.accessionNumber, built.accessionNumber, nil);
+	STAssertEqualObjects(lazy.labName.title, built.labName.title, nil);
+	STAssertEqualObjects(lazy.quantitativeResult.valueAndUnit.value, built.quantitativeResult.valueAndUnit.value, nil);
+}
+
+/**
+ *  Test converting typed literals
+ */
+- (void)testTypedLiterals
+{
+	STAssertEqualObjects(@12.5, [SMObject numberFromLiteral:@"12.5"], nil);
+	STAssertEqualObjects(@"12.5", [SMObject literalFromNumber:@12.5], nil);
+	STAssertNil([SMObject numberFromLiteral:@"twelve"], nil);
+	
+	NSDate *date = [SMObject dateFromLiteral:@"2010-05-12T04:00:00Z"];
+	STAssertEqualObjects([NSDate dateWithTimeIntervalSince1970:1273636800], date, nil);
+	STAssertEqualObjects(date, [SMObject dateFromLiteral:[SMObject literalFromDate:date]], nil);
+	STAssertEqualObjects([NSDate dateWithTimeIntervalSince1970:1273622400], [SMObject dateFromLiteral:@"2010-05-12"], nil);
+	STAssertNil([SMObject dateFromLiteral:@"last tuesday"], nil);
+	STAssertEqualObjects(@"2010-05-12", [SMObject literalFromDate:date datatype:@"http://www.w3.org/2001/XMLSchema#date"], nil);
+	STAssertEqualObjects(@"2010-05-12T04:00:00Z", [SMObject literalFromDate:date datatype:@"http://www.w3.org/2001/XMLSchema#dateTime"], nil);
+}
+
+/**
+ *  Test saving objects to a binary snapshot and restoring them
+ */
+- (void)testSnapshot
+{
+	NSURL *url = [[NSBundle bundleForClass:[self class]] URLForResource:@"SMLabResult" withExtension:@"rdf"];
+	NSString *rdfxml = [NSString stringWithContentsOfURL:url encoding:NSUTF8StringEncoding error:nil];
+	SMLabResult *lazy = [SMLabResult newWithRDFXML:rdfxml];
+	SMLabResult *original = [self objectOfClass:[SMLabResult class] inModel:lazy.inModel];
+	STAssertNotNil(original, nil);
+	STAssertNotNil(original.subject, nil);
+	
+	NSData *data = [SMSnapshot dataWithObjects:@[original, original.labName]];
+	STAssertTrue([data length] > 0, nil);
+	NSError *error = nil;
+	NSArray *restored = [SMSnapshot objectsWithData:data error:&error];
+	STAssertNil(error, @"%@", [error localizedDescription]);
+	STAssertEquals((NSUInteger)2, [restored count], nil);
+	
+	SMLabResult *copy = restored[0];
+	STAssertTrue([copy isKindOfClass:[SMLabResult class]], nil);
+	STAssertNil(copy.inModel, nil);
+	STAssertEqualObjects(original.subject, copy.subject, nil);
+	STAssertEqualObjects(original.accessionNumber, copy.accessionNumber, nil);
+	STAssertEqualObjects(original.date, copy.date, nil);
+	STAssertEqualObjects(original.notes, copy.notes, nil);
+	STAssertEqualObjects(original.labName.title, copy.labName.title, nil);
+	STAssertEqualObjects(original.quantitativeResult.valueAndUnit.value, copy.quantitativeResult.valueAndUnit.value, nil);
+	STAssertNil(copy.narrativeResult, nil);
+	STAssertTrue(copy.labName == restored[1], @"Objects appearing twice should be restored once");
+	
+	// broken snapshots
+	STAssertNil([SMSnapshot objectsWithData:[@"not a snapshot" dataUsingEncoding:NSUTF8StringEncoding] error:&error], nil);
+	STAssertEquals((NSInteger)3000, [error code], nil);
+	error = nil;
+	STAssertNil([SMSnapshot objectsWithData:[data subdataWithRange:NSMakeRange(0, [data length] / 2)] error:&error], nil);
+	STAssertEquals((NSInteger)3000, [error code], nil);
+}
+
+/**
+ *  Test decoding objects without a model, they must read like the objects of a parsed model
+ */
+- (void)testStreamDecoder
+{
+	NSURL *url = [[NSBundle bundleForClass:[self class]] URLForResource:@"SMLabResult" withExtension:@"rdf"];
+	NSData *rdfData = [NSData dataWithContentsOfURL:url];
+	NSString *rdfxml = [[NSString alloc] initWithData:rdfData encoding:NSUTF8StringEncoding];
+	SMLabResult *lazy = [SMLabResult newWithRDFXML:rdfxml];
+	SMLabResult *original = [self objectOfClass:[SMLabResult class] inModel:lazy.inModel];
+	STAssertNotNil(original, nil);
+	STAssertNotNil(original.subject, nil);
+	
+	NSArray *decoded = [SMStreamDecoder objectsOfClass:[SMLabResult class] fromData:rdfData contentType:@"application/rdf+xml; charset=utf-8"];
+	STAssertEquals((NSUInteger)1, [decoded count], nil);
+	SMLabResult *result = [decoded lastObject];
+	STAssertTrue([result isKindOfClass:[SMLabResult class]], nil);
+	STAssertNil(result.inModel, nil);
+	STAssertEqualObjects(original.subject, result.subject, nil);
+	STAssertEqualObjects(original.accessionNumber, result.accessionNumber, nil);
+	STAssertEqualObjects(original.date, result.date, nil);
+	STAssertEqualObjects(original.notes, result.notes, nil);
+	STAssertEqualObjects(original.labName.title, result.labName.title, nil);
+	STAssertEqualObjects(original.labName.code.identifier, result.labName.code.identifier, nil);
+	STAssertEqualObjects(original.quantitativeResult.valueAndUnit.value, result.quantitativeResult.valueAndUnit.value, nil);
+	STAssertEqualObjects(original.quantitativeResult.normalRange.maximum.unit, result.quantitativeResult.normalRange.maximum.unit, nil);
+	STAssertNil(result.narrativeResult, nil);
+	
+	// merging the statements into a model, like prefetching does
+	RedlandModel *merged = [RedlandModel new];
+	for (RedlandStatement *statement in [[SMStreamDecoder decoderWithRDF:rdfData] statements]) {
+		[merged addStatement:statement];
+	}
+	STAssertEquals([lazy.inModel size], [merged size], nil);
+	SMLabResult *fromMerged = [self objectOfClass:[SMLabResult class] inModel:merged];
+	STAssertEqualObjects(original.subject, fromMerged.subject, nil);
+	STAssertEqualObjects(original.date, fromMerged.date, nil);
+	STAssertEqualObjects(original.labName.title, fromMerged.labName.title, nil);
+	STAssertEqualObjects(original.quantitativeResult.valueAndUnit.value, fromMerged.quantitativeResult.valueAndUnit.value, nil);
+	
+	// JSON-LD
+	NSString *json = @"{\"@graph\": [{\"@id\": \"http://example.org/labs/1\", \"@type\": \"http://smartplatforms.org/terms#LabResult\", "
+		@"\"http://smartplatforms.org/terms#accessionNumber\": \"AC1\", \"http://smartplatforms.org/terms#labName\": {\"@id\": \"_:name\"}}, "
+		@"{\"@id\": \"_:name\", \"@type\": \"http://smartplatforms.org/terms#CodedValue\", \"http://purl.org/dc/terms/title\": [{\"@value\": \"Sodium\"}]}]}";
+	decoded = [SMStreamDecoder objectsOfClass:[SMLabResult class] fromData:[json dataUsingEncoding:NSUTF8StringEncoding] contentType:@"application/ld+json"];
+	STAssertEquals((NSUInteger)1, [decoded count], nil);
+	result = [decoded lastObject];
+	STAssertEqualObjects(@"AC1", result.accessionNumber, nil);
+	STAssertEqualObjects(@"Sodium", result.labName.title, nil);
+	
+	// shapes the decoder leaves to the RDF parser
+	NSString *rdfID = @"<rdf:RDF xmlns:rdf=\"http://www.w3.org/1999/02/22-rdf-syntax-ns#\" xmlns:sp=\"http://smartplatforms.org/terms#\">"
+		@"<sp:LabResult rdf:ID=\"relative\"/></rdf:RDF>";
+	STAssertNil([SMStreamDecoder objectsOfClass:[SMLabResult class] fromRDF:[rdfID dataUsingEncoding:NSUTF8StringEncoding]], nil);
+	STAssertNil([SMStreamDecoder objectsOfClass:[SMLabResult class] fromData:rdfData contentType:@"text/turtle"], nil);
+}
+
+/**
+ *  Test the generated tables of valid code values
+ */
+- (void)testCodeSystems
+{
+	NSString *verified = @"http://smartplatforms.org/terms/codes/TranslationFidelity#verified";
+	STAssertTrue([SMCodedValue isValidCode:verified], nil);
+	STAssertEqualObjects(@"Verified", [SMCodedValue titleForCode:verified], nil);
+	STAssertFalse([SMCodedValue isValidCode:@"http://smartplatforms.org/terms/codes/TranslationFidelity#guessed"], nil);
+	STAssertFalse([SMCodedValue isValidCode:nil], nil);
+	
+	NSString *system = @"http://smartplatforms.org/terms/codes/TranslationFidelity";
+	STAssertTrue([[SMCodedValue codeSystems] containsObject:system], nil);
+	STAssertTrue([SMCodedValue isValidCode:verified inSystem:system], nil);
+	STAssertEqualObjects(@"Verified", [SMCodedValue titleForCode:verified inSystem:system], nil);
+	STAssertFalse([SMCodedValue isValidCode:verified inSystem:@"http://smartplatforms.org/terms/codes/Nonexistent"], nil);
+	
+	// the translation fidelity of the lab result example
+	NSURL *url = [[NSBundle bundleForClass:[self class]] URLForResource:@"SMLabResult" withExtension:@"rdf"];
+	NSString *rdfxml = [NSString stringWithContentsOfURL:url encoding:NSUTF8StringEncoding error:nil];
+	SMLabResult *lazy = [SMLabResult newWithRDFXML:rdfxml];
+	SMLabResult *result = [self objectOfClass:[SMLabResult class] inModel:lazy.inModel];
+	STAssertNotNil(result, nil);
+	SMCodeProvenance *provenance = [result.labName.provenance lastObject];
+	STAssertTrue([provenance.translationFidelity hasValidCodeInSystem:system], nil);
+}
+
 /**
  *  Test object creation
  */
@@ -81,4 +266,22 @@
 }
 
 
+
+#pragma mark - Utilities
+/**
+ *  Returns the first object of the given class that objectsInModel: builds from the model.
+ *
+ *  Objects created with newWithRDFXML: have no subject, so this is how the tests get at the instance of a parsed example.
+ */
+- (id)objectOfClass:(Class)aClass inModel:(RedlandModel *)model
+{
+	for (SMObject *object in [[SMObject objectsInModel:model] allValues]) {
+		if ([object isKindOfClass:aClass]) {
+			return object;
+		}
+	}
+	return nil;
+}
+
+
 @end
@@ -57,5 +57,67 @@
 	}];
 }
 
+/**
+ *  Test paging into one shared model; the mock server ignores "limit" and "offset" and returns the same 2 allergies for every page
+ */
+- (void)testPagedAllergies
+{
+	NSString *path = [NSString stringWithFormat:@"/records/%@/allergies/", _record.record_id];
+	RedlandModel *model = [RedlandModel new];
+	__block NSUInteger pages = 0;
+	
+	[_record getObjectsOfClass:[SMAllergy class] from:path parameters:nil pageSize:2 intoModel:model pageCallback:^BOOL(NSArray *__autoreleasing items, NSDictionary *__autoreleasing userInfo) {
+		pages++;
+		STAssertTrue(2 == [items count], @"Should have gotten 2 allergies on page %d, but got %d", pages, [items count]);
+		STAssertEquals(model, [[items lastObject] inModel], @"Page items must live in the shared model");
+		return (pages < 2);
+	} callback:^(BOOL success, NSDictionary *__autoreleasing userInfo) {
+		STAssertTrue(success, @"Paging should succeed");
+		STAssertTrue(2 == pages, @"Should have stopped after 2 pages, but fetched %d", pages);
+		STAssertTrue(4 == [userInfo[SMARTResponseArrayKey] count], @"Should have collected 4 allergies, but got %d", [userInfo[SMARTResponseArrayKey] count]);
+		STAssertEquals(model, userInfo[SMARTResponseModelKey], @"Should return the shared model");
+	}];
+	
+	// a short page is the last one
+	pages = 0;
+	[_record getObjectsOfClass:[SMAllergy class] from:path parameters:@[@"loinc=1234"] pageSize:10 intoModel:nil pageCallback:^BOOL(NSArray *__autoreleasing items, NSDictionary *__autoreleasing userInfo) {
+		pages++;
+		return YES;
+	} callback:^(BOOL success, NSDictionary *__autoreleasing userInfo) {
+		STAssertTrue(1 == pages, @"A page with fewer items than the page size must be the last, but fetched %d pages", pages);
+		STAssertNotNil(userInfo[SMARTResponseModelKey], @"Should return a new model");
+	}];
+}
+
+/**
+ *  Test prefetching; responses are read in the background and merged into the record's model on the main thread, where the callback comes too, so we
+ *  spin the run loop until it arrives
+ */
+- (void)testPrefetch
+{
+	__block BOOL done = NO;
+	[_record prefetch:@[@"get_allergies"] callback:^(BOOL success, NSDictionary *__autoreleasing userInfo) {
+		done = YES;
+		STAssertTrue(success, @"Prefetching should succeed, but got %@", userInfo[SMARTErrorKey]);
+		STAssertTrue([NSThread isMainThread], @"The prefetch callback must come on the main thread");
+		
+		NSArray *allergies = userInfo[SMARTResponseCallsKey][@"get_allergies"];
+		STAssertTrue(2 == [allergies count], @"Should have gotten 2 allergies, but got %d", [allergies count]);
+		STAssertEquals(_record.model, userInfo[SMARTResponseModelKey], @"Should return the record's model");
+		STAssertEquals(_record.model, [[allergies lastObject] inModel], @"Prefetched objects must live in the record's model");
+	}];
+	
+	NSDate *timeout = [NSDate dateWithTimeIntervalSinceNow:5.0];
+	while (!done && [timeout timeIntervalSinceNow] > 0) {
+		[[NSRunLoop currentRunLoop] runMode:NSDefaultRunLoopMode beforeDate:[NSDate dateWithTimeIntervalSinceNow:0.05]];
+	}
+	STAssertTrue(done, @"The prefetch callback was not called");
+	
+	// unknown calls
+	[_record prefetch:@[@"get_nothing"] callback:^(BOOL success, NSDictionary *__autoreleasing userInfo) {
+		STAssertFalse(success, @"Prefetching an unknown call must fail");
+	}];
+}
+
 
 @end
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+#
+#	Benchmarks build-obj-c-classes.py on synthetic ontologies.
+#
+#	Ontologies are synthesized at 1x, 10x and 100x the size of the SMART ontology,
+#	with more classes, deeper object property nesting and more code classes,
+#	and each is run through the generator in a fresh process in a scratch directory.
+#	Reported are throughput (classes and properties per second of resolving and
+#	rendering), peak memory and output bytes.
+#
+#	Pass "--scales 1,10" to choose the scales, "--save" to store the results as the
+#	new baseline and "--tolerance 0.25" to fail when throughput drops by more than
+#	that fraction against the baseline.
+#
+
+### config ###
+_generator = 'build-obj-c-classes.py'
+_template_dir = 'Generator'
+_baseline_file = 'benchmark-baseline.json'
+
+# the size of the SMART ontology that scale 1 resembles
+_base_classes = 50
+_base_code_classes = 10
+_base_coded_values = 12
+_base_depth = 4
+_base_data_properties = 6
+_base_object_properties = 3
+
+### there's probably no need to edit anything beyond this line ###
+### ---------------------------------------------------------- ###
+
+import os
+import sys
+import json
+import math
+import random
+import shutil
+import tempfile
+import subprocess
+from xml.sax.saxutils import escape
+
+_arguments = sys.argv[1:] if len(sys.argv) > 1 else []
+
+def argument_value(flag, default=None):
+	"""Returns the value following "flag" on the command line, "default" if the flag is not present."""
+	if flag in _arguments:
+		idx = _arguments.index(flag)
+		if idx + 1 < len(_arguments):
+			return _arguments[idx + 1]
+		print 'xx> Missing value for %s' % flag
+		sys.exit(1)
+	return default
+
+_scales = [int(s) for s in argument_value('--scales', '1,10,100').split(',')]
+_save = '--save' in _arguments
+_tolerance = float(argument_value('--tolerance', 0.25))
+_keep = '--keep' in _arguments
+
+_ns_sp = 'http://smartplatforms.org/terms#'
+_ns_code = 'http://smartplatforms.org/terms/codes/'
+_ns_xsd = 'http://www.w3.org/2001/XMLSchema#'
+
+_owl_header = """<?xml version="1.0" encoding="utf-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+	xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+	xmlns:owl="http://www.w3.org/2002/07/owl#"
+	xmlns:dcterms="http://purl.org/dc/terms/"
+	xmlns:api="http://smartplatforms.org/terms/api#">
+"""
+
+_example = """<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:sp="http://smartplatforms.org/terms#">
+	<sp:%s rdf:about="http://sandbox-api.smartplatforms.org/records/1/things/1">
+		<sp:%s>A value</sp:%s>
+	</sp:%s>
+</rdf:RDF>"""
+
+
+def restriction(prop_uri, to_uri, multiple):
+	"""An rdfs:subClassOf restriction of a class on the given property."""
+	card = '' if multiple else '\n\t\t\t\t<owl:maxCardinality>1</owl:maxCardinality>'
+	return """		<rdfs:subClassOf>
+			<owl:Restriction>
+				<owl:onProperty rdf:resource="%s"/>
+				<owl:allValuesFrom rdf:resource="%s"/>%s
+			</owl:Restriction>
+		</rdfs:subClassOf>""" % (prop_uri, to_uri, card)
+
+
+def synthesize_ontology(scale, seed=1):
+	""" Returns the OWL document of a synthetic ontology "scale" times the size of the SMART ontology, along with the
+	number of classes and properties the generator will create for it.
+
+	Classes are arranged in levels, object properties of a class point to classes of the next level so the nesting depth
+	grows with the number of levels. The last level points to code classes, whose number grows with the scale while each
+	keeps a coded value set of the base size, so that the whole ontology grows linearly. Data properties are restricted to
+	their own range, so typed literals are generated like for the SMART ontology.
+	"""
+	rnd = random.Random(seed)
+	num_classes = _base_classes * scale
+	num_codes = _base_code_classes * scale
+	num_values = _base_coded_values
+	depth = int(round(_base_depth * (1 + math.log10(scale))))
+
+	levels = [[] for i in xrange(depth)]
+	for i in xrange(num_classes):
+		levels[i % depth].append('%sThing%d' % (_ns_sp, i))
+	codes = ['%sCode%d' % (_ns_code, i) for i in xrange(num_codes)]
+
+	parts = [_owl_header]
+	num_properties = 0
+
+	# properties
+	data_props = ['%svalue%d' % (_ns_sp, i) for i in xrange(_base_data_properties * 2)]
+	object_props = ['%slink%d' % (_ns_sp, i) for i in xrange(_base_object_properties * 2)]
+	ranges = [_ns_xsd + 'string', _ns_xsd + 'string', _ns_xsd + 'decimal', _ns_xsd + 'dateTime']
+	data_ranges = {}
+	for uri in data_props:
+		data_ranges[uri] = rnd.choice(ranges)
+		parts.append('	<owl:DatatypeProperty rdf:about="%s"><rdfs:range rdf:resource="%s"/></owl:DatatypeProperty>\n' % (uri, data_ranges[uri]))
+	for uri in object_props:
+		parts.append('	<owl:ObjectProperty rdf:about="%s"/>\n' % uri)
+
+	# classes, level by level
+	for level, uris in enumerate(levels):
+		targets = levels[level + 1] if level + 1 < depth else codes
+		for uri in uris:
+			name = uri[len(_ns_sp):]
+			restrictions = []
+			chosen_data = rnd.sample(data_props, _base_data_properties)
+			for prop in chosen_data:
+				restrictions.append(restriction(prop, data_ranges[prop], rnd.random() < 0.2))
+			for prop in rnd.sample(object_props, _base_object_properties):
+				restrictions.append(restriction(prop, rnd.choice(targets), rnd.random() < 0.3))
+			num_properties += _base_data_properties + _base_object_properties
+
+			extra = ''
+			if 0 == level:
+				path = '/records/{record_id}/%s/' % name.lower()
+				example = _example % (name, chosen_data[0][len(_ns_sp):], chosen_data[0][len(_ns_sp):], name)
+				extra = '\n		<api:base_path>%s{%s_id}</api:base_path>\n		<api:example>%s</api:example>' % (path, name.lower(), escape(example))
+			parts.append('	<owl:Class rdf:about="%s">%s\n%s\n	</owl:Class>\n' % (uri, extra, '\n'.join(restrictions)))
+
+			# record calls for the top level
+			if 0 == level:
+				for call_path in [path, '%s{%s_id}' % (path, name.lower())]:
+					parts.append("""	<api:Call>
+		<api:target rdf:resource="%s"/>
+		<api:method>GET</api:method>
+		<api:path>%s</api:path>
+		<api:category>record_items</api:category>
+		<rdfs:comment>Get %s</rdfs:comment>
+	</api:Call>
+""" % (uri, call_path, name))
+
+	# code classes with their value sets
+	for uri in codes:
+		members = []
+		for i in xrange(num_values):
+			member = '%s#value%d' % (uri, i)
+			members.append('<rdf:Description rdf:about="%s"><dcterms:title>Value %d</dcterms:title></rdf:Description>' % (member, i))
+		parts.append('	<owl:Class rdf:about="%s">\n		<owl:equivalentClass><owl:Class><owl:oneOf rdf:parseType="Collection">\n			%s\n		</owl:oneOf></owl:Class></owl:equivalentClass>\n	</owl:Class>\n' % (uri, '\n			'.join(members)))
+
+	parts.append('</rdf:RDF>\n')
+	return ''.join(parts), num_classes, num_properties
+
+
+def output_bytes(directory):
+	"""Returns the number of bytes of all files below the directory."""
+	total = 0
+	for root, dirs, files in os.walk(directory):
+		for name in files:
+			total += os.path.getsize(os.path.join(root, name))
+	return total
+
+
+def run_scale(scale, here):
+	""" Runs the generator on the synthetic ontology of the given scale in a scratch directory, returns a result dictionary.
+	"""
+	scratch = tempfile.mkdtemp(prefix='generator-benchmark-')
+	try:
+		shutil.copy(os.path.join(here, _generator), scratch)
+		shutil.copytree(os.path.join(here, _template_dir), os.path.join(scratch, _template_dir))
+		os.makedirs(os.path.join(scratch, 'SMARTFrameworkTests', 'ClassTests'))
+		os.makedirs(os.path.join(scratch, 'Classes'))
+
+		owl, num_classes, num_properties = synthesize_ontology(scale)
+		owl_path = os.path.join(scratch, 'benchmark.owl')
+		with open(owl_path, 'w') as handle:
+			handle.write(owl)
+
+		# run the generator, waiting for it ourselves to get its resource usage
+		with open(os.path.join(scratch, 'generator.log'), 'w') as log:
+			args = [sys.executable, _generator, '-f', '--full', '--no-cache', '--profile', '--ontology', owl_path]
+			proc = subprocess.Popen(args, cwd=scratch, stdout=log, stderr=subprocess.STDOUT)
+			pid, status, usage = os.wait4(proc.pid, 0)
+			proc.returncode = status
+		if 0 != status:
+			print 'xx> Generator failed at scale %d, see %s' % (scale, os.path.join(scratch, 'generator.log'))
+			sys.exit(1)
+
+		with open(os.path.join(scratch, 'generator-profile.json')) as handle:
+			profile = json.load(handle)
+		phases = dict((p['name'], p['seconds']) for p in profile['phases'])
+		seconds = phases.get('resolve classes', 0) + phases.get('render classes', 0)
+
+		written = output_bytes(os.path.join(scratch, 'GeneratedClasses')) + output_bytes(os.path.join(scratch, 'SMARTFrameworkTests'))
+		peak = usage.ru_maxrss * (1 if 'darwin' == sys.platform else 1024)			# bytes on OS X, kilobytes on Linux
+
+		return {
+			'scale': scale,
+			'classes': num_classes,
+			'properties': num_properties,
+			'ontology_bytes': len(owl),
+			'load_seconds': round(phases.get('load ontology', 0), 6),
+			'seconds': round(seconds, 6),
+			'total_seconds': round(profile['total'], 6),
+			'classes_per_second': round(num_classes / seconds, 1) if seconds > 0 else None,
+			'properties_per_second': round(num_properties / seconds, 1) if seconds > 0 else None,
+			'peak_memory': peak,
+			'output_bytes': written,
+		}
+	finally:
+		if _keep:
+			print '--> Kept scratch directory %s' % scratch
+		else:
+			shutil.rmtree(scratch, ignore_errors=True)
+
+
+def compare(results, baseline):
+	""" Prints the change in throughput against the baseline, returns False if any scale got slower than the tolerance.
+	"""
+	ok = True
+	for result in results:
+		base = baseline.get(str(result['scale']))
+		if not base or not base.get('classes_per_second') or not result['classes_per_second']:
+			continue
+		change = result['classes_per_second'] / base['classes_per_second'] - 1
+		slower = change < -_tolerance
+		print '%s %4dx  %+6.1f%% classes/sec against the baseline' % ('xx>' if slower else '-->', result['scale'], change * 100)
+		ok = ok and not slower
+	return ok
+
+
+if __name__ == "__main__":
+	"""Benchmarks the generator and compares to the stored baseline
+	"""
+	here = os.path.dirname(os.path.abspath(__file__))
+	baseline_path = os.path.join(here, _baseline_file)
+
+	results = []
+	for scale in sorted(_scales):
+		print '--> Scale %dx' % scale
+		results.append(run_scale(scale, here))
+
+	# summary, per class time relative to the smallest scale shows whether we stay linear
+	print '--> Results'
+	print '    scale  classes  properties   classes/s  properties/s  peak MB  output KB  per class'
+	first = results[0]
+	for r in results:
+		relative = (r['seconds'] / r['classes']) / (first['seconds'] / first['classes']) if first['seconds'] > 0 and r['classes'] > 0 else 0
+		print '    %4dx  %7d  %10d  %10.1f  %12.1f  %7.1f  %9.1f  %8.2fx' % (r['scale'], r['classes'], r['properties'],
+			r['classes_per_second'] or 0, r['properties_per_second'] or 0, r['peak_memory'] / 1048576.0, r['output_bytes'] / 1024.0, relative)
+
+	# baseline
+	baseline = {}
+	if os.path.exists(baseline_path):
+		with open(baseline_path) as handle:
+			baseline = json.load(handle)
+
+	ok = compare(results, baseline)
+
+	if _save:
+		for r in results:
+			baseline[str(r['scale'])] = r
+		with open(baseline_path, 'w') as handle:
+			handle.write(json.dumps(baseline, indent=1, separators=(',', ': '), sort_keys=True) + '\n')
+		print '--> Saved baseline to %s' % _baseline_file
+
+	if not ok:
+		print 'xx> Throughput dropped by more than %d%%' % (_tolerance * 100)
+		sys.exit(1)
+
+	print '-> Done'
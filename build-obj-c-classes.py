@@ -1,7 +1,44 @@
 #
 #	Creates Objective-C classes from our ontology.
 #
-#	Pass in the "-f" flag if you want to overwrite existing classes
+#	Pass in the "-f" flag if you want to overwrite existing classes. Classes whose
+#	ontology input and templates did not change since the last run, as recorded in
+#	the manifest, are skipped; pass "--full" to ignore the manifest.
+#
+#	Pass "-j N" to render and write classes in N worker processes.
+#
+#	Pass "--only SMMedication,SMLabResult" to resolve and render only these classes
+#	and the classes their object properties reach. The unit tests and SMRecord+Calls
+#	are put together from the fresh parts of these classes and the parts of all other
+#	classes remembered by the last run; the other shared files are left alone.
+#
+#	The ontology is parsed by smart_common if it is available, by our own streaming
+#	OWL reader otherwise; pass "--ontology path/to/ontology.owl" to always use our
+#	reader on the given file. The parsed ontology is cached in a snapshot keyed by
+#	the ontology source, pass "--no-cache" to parse the ontology again.
+#
+#	The generator writes SMARTObjects.h, importing all generated classes; pass
+#	"--unity" to also write a unity build that imports all generated implementations.
+#
+#	Pass "--python DIR" to also write a Python package with the same classes to DIR.
+#
+#	Pass "--fixtures" to also write the large RDF fixtures listed below, synthesized
+#	from the class examples; "--fixture-scale 0.1" shrinks them and "--seed N" picks
+#	another deterministic variant.
+#
+#	The record GET calls are also listed in record-calls.json, which is what the
+#	stand-in container (stand-in-container.py) serves.
+#
+#	Property accessors call the shared helpers of SMObject; pass "--inline-accessors"
+#	to expand the complete accessor bodies into every class instead.
+#
+#	Pass "--profile" to time the generator's phases, classes and templates; a summary
+#	is printed at the end and the full report is written as JSON to the profile report.
+#
+#	Pass "--watch" to keep running after the first run, overwriting like "-f": the
+#	resolved ontology and the templates stay in memory and whenever a template file
+#	or the ontology source changes, only the outputs depending on it are rendered
+#	again and the time the regeneration took is printed. Stop with Ctrl-C.
 #
 
 ### config ###
@@ -10,6 +47,25 @@ _template_dir = 'Generator'
 _generated_classes_dir = 'GeneratedClasses'
 _class_examples_dir = 'SMARTFrameworkTests/RDF'
 _class_unittests_dir = 'SMARTFrameworkTests/ClassTests'
+_manifest_file = '.manifest.json'				# lives in _generated_classes_dir
+_slices_file = '.slices.json'					# lives in _generated_classes_dir, the per-class parts of shared files
+_ontology_source = 'smart_common/schema/smart.owl'
+_ontology_snapshot = '.ontology-snapshot'
+_profile_report = 'generator-profile.json'
+_objects_header = 'Classes/SMARTObjects.h'
+_unity_file = 'SMGeneratedClasses.m'			# lives in _generated_classes_dir
+_record_calls_file = 'SMARTFrameworkTests/record-calls.json'
+_performance_repetitions = 50					# how often performance tests parse every example
+_performance_replicas = 100					# how many copies of every example performance tests parse as one document
+_fixtures_dir = 'SMARTFrameworkTests/Fixtures'
+_fixtures = [								# (fixture name, class name, items) written with --fixtures
+	('record-lab-results', 'SMLabResult', 20000),
+	('record-medications', 'SMMedication', 500),
+	('record-encounters', 'SMEncounter', 2000),
+]
+_fixture_fanout = 4							# multiple model properties get up to this many items
+_fixture_depth = 3							# how many levels of model properties are synthesized
+_watch_interval = 0.5						# seconds between looking for changed inputs with --watch
 
 ### there's probably no need to edit anything beyond this line ###
 ### ---------------------------------------------------------- ###
@@ -39,6 +95,10 @@ _classes_to_ignore = [
 ]
 
 _templates = {}
+_compiled_templates = {}		# will be { template name: (literal chunks, placeholder slots) }
+_template_files = ['ClassTemplate.h', 'ClassTemplate.m', 'CategoryTemplate.h', 'CategoryTemplate.m', 'UnitTestTemplate.h', 'UnitTestTemplate.m',
+	'PerformanceTestTemplate.h', 'PerformanceTestTemplate.m', 'ObjectsTemplate.h', 'UnityTemplate.m', 'PythonRuntime.py', 'PythonPackage.py']
+_template_versions = {}			# will be { template file name: digest of its contents }
 
 _templates['property_header'] = """/// Representing {{ uri }} as {{ itemClass }}
 {{ add_comment }}@property (nonatomic, {{ strength }}) {{ useClass }} *{{ name }};"""
@@ -48,20 +108,27 @@ _templates['literal_getter'] = """@synthesize {{ name }} = _{{ name }};
 - ({{ itemClass }} *){{ name }}
 {
 	if (!_{{ name }}) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"{{ uri }}"];
+		RedlandNode *predicate = {{ predicate }};
 		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
 		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
 		
 		RedlandStatement *rslt = [query nextObject];
-		_{{ name }} = [rslt.object literalValue];
+		{{ itemClass }} *value = [rslt.object literalValue];
+		_{{ name }} = value ? value : (id)[NSNull null];
+	}
+	
+	// we use NSNull as a placeholder in case we already searched the graph and haven't found the value
+	if ((id)[NSNull null] == _{{ name }}) {
+		return nil;
 	}
+	
 	return _{{ name }};
 }
 
 - (void){{ setName }}:({{ itemClass }} *){{ name }}
 {
 	if ({{ name }} != _{{ name }}) {
-		RedlandNode *predicate = ({{ name }} || _{{ name }}) ? [RedlandNode nodeWithURIString:@"{{ uri }}"] : nil;
+		RedlandNode *predicate = {{ predicate }};
 		if (_{{ name }}) {
 			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
 		}
@@ -74,12 +141,80 @@ _templates['literal_getter'] = """@synthesize {{ name }} = _{{ name }};
 	}
 }"""
 
+_templates['typed_property_header'] = """/// Representing {{ uri }} as {{ itemClass }}, converted from the literal in "{{ literalName }}"
+{{ add_comment }}@property (nonatomic, strong) {{ itemClass }} *{{ name }};
+
+/// The literal string of {{ uri }}
+@property (nonatomic, copy) NSString *{{ literalName }};"""
+
+_templates['typed_literal_getter'] = """@synthesize {{ literalName }} = _{{ literalName }};
+@synthesize {{ name }} = _{{ name }};
+
+- (NSString *){{ literalName }}
+{
+	if (!_{{ literalName }}) {
+		RedlandNode *predicate = {{ predicate }};
+		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
+		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
+		
+		RedlandStatement *rslt = [query nextObject];
+		NSString *value = [rslt.object literalValue];
+		_{{ literalName }} = value ? value : (id)[NSNull null];
+	}
+	
+	// we use NSNull as a placeholder in case we already searched the graph and haven't found the value
+	if ((id)[NSNull null] == _{{ literalName }}) {
+		return nil;
+	}
+	
+	return _{{ literalName }};
+}
+
+- (void){{ setLiteralName }}:(NSString *){{ literalName }}
+{
+	if ({{ literalName }} != _{{ literalName }}) {
+		RedlandNode *predicate = {{ predicate }};
+		if (_{{ literalName }}) {
+			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
+		}
+		
+		_{{ literalName }} = [{{ literalName }} copy];
+		_{{ name }} = nil;
+		
+		if (_{{ literalName }}) {
+			[self.inModel addStatement:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:[_{{ literalName }} nodeValue]]];
+		}
+	}
+}
+
+- ({{ itemClass }} *){{ name }}
+{
+	// converted only once, the literal setter resets the converted value
+	if (!_{{ name }}) {
+		NSString *literal = self.{{ literalName }};
+		{{ itemClass }} *value = literal ? [SMObject {{ fromLiteral }}:literal] : nil;
+		_{{ name }} = value ? value : (id)[NSNull null];
+	}
+	
+	if ((id)[NSNull null] == _{{ name }}) {
+		return nil;
+	}
+	
+	return _{{ name }};
+}
+
+- (void){{ setName }}:({{ itemClass }} *){{ name }}
+{
+	self.{{ literalName }} = {{ name }} ? [SMObject {{ toLiteral }}:{{ name }}{{ toLiteralDatatype }}] : nil;
+	_{{ name }} = {{ name }};
+}"""
+
 _templates['multi_literal_getter'] = """@synthesize {{ name }} = _{{ name }};
 
 - (NSArray *){{ name }}
 {
 	if (!_{{ name }}) {
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"{{ uri }}"];
+		RedlandNode *predicate = {{ predicate }};
 		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
 		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
 		
@@ -100,7 +235,7 @@ _templates['multi_literal_getter'] = """@synthesize {{ name }} = _{{ name }};
 - (void){{ setName }}:(NSArray *){{ name }}
 {
 	if ({{ name }} != _{{ name }}) {
-		RedlandNode *predicate = ({{ name }} || _{{ name }}) ? [RedlandNode nodeWithURIString:@"{{ uri }}"] : nil;
+		RedlandNode *predicate = {{ predicate }};
 		if (_{{ name }}) {
 			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
 		}
@@ -122,7 +257,7 @@ _templates['model_getter'] = """@synthesize {{ name }} = _{{ name }};
 	if (!_{{ name }}) {
 		
 		// get the "{{ name }}" element
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"{{ uri }}"];
+		RedlandNode *predicate = {{ predicate }};
 		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
 		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
 		RedlandStatement *rslt = [query nextObject];
@@ -143,8 +278,8 @@ _templates['model_getter'] = """@synthesize {{ name }} = _{{ name }};
 - (void){{ setName }}:({{ itemClass }} *){{ name }}
 {
 	if ({{ name }} != _{{ name }}) {
-		RedlandNode *predicate = ({{ name }} || _{{ name }}) ? [RedlandNode nodeWithURIString:@"{{ uri }}"] : nil;
-		if (_{{ name }}) {
+		RedlandNode *predicate = {{ predicate }};
+		if (_{{ name }} && (id)[NSNull null] != _{{ name }}) {
 			[self.inModel removeSubmodel:_{{ name }}.model];
 			[self.inModel removeStatementsLike:[RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil]];
 		}
@@ -165,7 +300,7 @@ _templates['multi_model_getter'] = """@synthesize {{ name }} = _{{ name }};
 	if (!_{{ name }}) {
 		
 		// get the "{{ name }}" elements
-		RedlandNode *predicate = [RedlandNode nodeWithURIString:@"{{ uri }}"];
+		RedlandNode *predicate = {{ predicate }};
 		RedlandStatement *statement = [RedlandStatement statementWithSubject:self.subject predicate:predicate object:nil];
 		RedlandStreamEnumerator *query = [self.inModel enumeratorOfStatementsLike:statement];
 		
@@ -188,7 +323,7 @@ _templates['multi_model_getter'] = """@synthesize {{ name }} = _{{ name }};
 - (void){{ setName }}:(NSArray *){{ name }}
 {
 	if ({{ name }} != _{{ name }}) {
-		RedlandNode *predicate = ({{ name }} || _{{ name }}) ? [RedlandNode nodeWithURIString:@"{{ uri }}"] : nil;
+		RedlandNode *predicate = {{ predicate }};
 		if (_{{ name }}) {
 			for ({{ itemClass }} *item in _{{ name }}) {
 				[self.inModel removeSubmodel:item.model];
@@ -207,6 +342,282 @@ _templates['multi_model_getter'] = """@synthesize {{ name }} = _{{ name }};
 	}
 }"""
 
+_templates['thin_literal_getter'] = """@synthesize {{ name }} = _{{ name }};
+
+- ({{ itemClass }} *){{ name }}
+{
+	return [self literalForPredicate:{{ predicate }} cache:(id __strong *)&_{{ name }}];
+}
+
+- (void){{ setName }}:({{ itemClass }} *){{ name }}
+{
+	[self setLiteral:{{ name }} forPredicate:{{ predicate }} cache:(id __strong *)&_{{ name }}];
+}"""
+
+_templates['thin_multi_literal_getter'] = """@synthesize {{ name }} = _{{ name }};
+
+- (NSArray *){{ name }}
+{
+	return [self literalsForPredicate:{{ predicate }} cache:&_{{ name }}];
+}
+
+- (void){{ setName }}:(NSArray *){{ name }}
+{
+	[self setLiterals:{{ name }} forPredicate:{{ predicate }} cache:&_{{ name }}];
+}"""
+
+_templates['thin_typed_literal_getter'] = """@synthesize {{ literalName }} = _{{ literalName }};
+@synthesize {{ name }} = _{{ name }};
+
+- (NSString *){{ literalName }}
+{
+	return [self literalForPredicate:{{ predicate }} cache:(id __strong *)&_{{ literalName }}];
+}
+
+- (void){{ setLiteralName }}:(NSString *){{ literalName }}
+{
+	[self setLiteral:{{ literalName }} forPredicate:{{ predicate }} cache:(id __strong *)&_{{ literalName }}];
+	_{{ name }} = nil;
+}
+
+- ({{ itemClass }} *){{ name }}
+{
+	if (!_{{ name }}) {
+		NSString *literal = self.{{ literalName }};
+		{{ itemClass }} *value = literal ? [SMObject {{ fromLiteral }}:literal] : nil;
+		_{{ name }} = value ? value : (id)[NSNull null];
+	}
+	return ((id)[NSNull null] == _{{ name }}) ? nil : _{{ name }};
+}
+
+- (void){{ setName }}:({{ itemClass }} *){{ name }}
+{
+	self.{{ literalName }} = {{ name }} ? [SMObject {{ toLiteral }}:{{ name }}{{ toLiteralDatatype }}] : nil;
+	_{{ name }} = {{ name }};
+}"""
+
+_templates['thin_model_getter'] = """@synthesize {{ name }} = _{{ name }};
+
+- ({{ itemClass }} *){{ name }}
+{
+	return [self objectOfClass:[{{ itemClass }} class] forPredicate:{{ predicate }} cache:(id __strong *)&_{{ name }}];
+}
+
+- (void){{ setName }}:({{ itemClass }} *){{ name }}
+{
+	[self setObject:{{ name }} forPredicate:{{ predicate }} cache:(id __strong *)&_{{ name }}];
+}"""
+
+_templates['thin_multi_model_getter'] = """@synthesize {{ name }} = _{{ name }};
+
+- (NSArray *){{ name }}
+{
+	return [self objectsOfClass:[{{ itemClass }} class] forPredicate:{{ predicate }} cache:&_{{ name }}];
+}
+
+- (void){{ setName }}:(NSArray *){{ name }}
+{
+	[self setObjects:{{ name }} forPredicate:{{ predicate }} cache:&_{{ name }}];
+}"""
+
+_templates['predicate_table'] = """/// The predicates of the properties of {{ CLASS_NAME }}, indexed like its sorted properties
+static RedlandNode *{{ CLASS_NAME }}Predicates[{{ count }}];
+
+/// The indexes of the predicates in the predicate table, keyed by predicate URI
+static NSDictionary *{{ CLASS_NAME }}PredicateIndexes;
+
+/**
+ *  Fills the predicate table and the index of its predicate URIs, once.
+ */
+static void {{ CLASS_NAME }}LoadPredicates(void)
+{
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+{{ predicates }}
+		
+		NSMutableDictionary *indexes = [NSMutableDictionary dictionaryWithCapacity:{{ count }}];
+		for (NSUInteger i = 0; i < {{ count }}; i++) {
+			indexes[[[{{ CLASS_NAME }}Predicates[i] URIValue] stringValue]] = @(i);
+		}
+		{{ CLASS_NAME }}PredicateIndexes = [indexes copy];
+	});
+}
+
+/**
+ *  Returns the predicate node with the given index.
+ */
+static RedlandNode *{{ CLASS_NAME }}Predicate(NSUInteger idx)
+{
+	{{ CLASS_NAME }}LoadPredicates();
+	return {{ CLASS_NAME }}Predicates[idx];
+}
+
+/**
+ *  Returns the index of the given predicate in the predicate table, -1 if none of the properties uses it.
+ */
+static NSInteger {{ CLASS_NAME }}PredicateIndex(RedlandNode *predicate)
+{
+	{{ CLASS_NAME }}LoadPredicates();
+	NSNumber *idx = {{ CLASS_NAME }}PredicateIndexes[[[predicate URIValue] stringValue]];
+	return idx ? [idx integerValue] : -1;
+}
+
+
+"""
+
+_templates['hydrate_method'] = """#pragma mark - Hydration
+/**
+ *  Fills all properties that have not yet been read or set from the given statements about the receiver's subject.
+ *  @param statements An enumerator of RedlandStatement objects whose subject is the receiver's subject
+ *  @param objects A dictionary of SMObject instances keyed by subject node, instances in here are used for model properties
+ */
+- (void)hydrateFromStatements:(NSEnumerator *)statements objects:(NSDictionary *)objects
+{
+{{ declarations }}
+	
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		switch ({{ CLASS_NAME }}PredicateIndex(rslt.predicate)) {
+{{ cases }}
+			default:
+				break;
+		}
+	}
+	
+{{ assignments }}
+}
+
+
+
+"""
+
+_templates['hydrate_single_declaration'] = """	{{ itemClass }} *{{ name }} = nil;"""
+
+_templates['hydrate_multi_declaration'] = """	NSMutableArray *{{ name }} = _{{ name }} ? nil : [NSMutableArray array];"""
+
+_templates['literal_hydrate'] = """			case {{ index }}:
+				if (!{{ name }}) {
+					{{ name }} = [rslt.object literalValue];
+				}
+				break;"""
+
+_templates['multi_literal_hydrate'] = """			case {{ index }}: {
+				{{ itemClass }} *newItem = [rslt.object literalValue];
+				if (newItem) {
+					[{{ name }} addObject:newItem];
+				}
+				break;
+			}"""
+
+_templates['model_hydrate'] = """			case {{ index }}:
+				if (!{{ name }}) {
+					{{ name }} = [{{ itemClass }} newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				}
+				break;"""
+
+_templates['multi_model_hydrate'] = """			case {{ index }}: {
+				{{ itemClass }} *newItem = [{{ itemClass }} newWithSubject:rslt.object inModel:self.inModel objects:objects];
+				if (newItem) {
+					[{{ name }} addObject:newItem];
+				}
+				break;
+			}"""
+
+_templates['hydrate_single_assignment'] = """	if (!_{{ name }}) {
+		_{{ name }} = {{ name }} ? {{ name }} : (id)[NSNull null];
+	}"""
+
+_templates['hydrate_multi_assignment'] = """	if (!_{{ name }}) {
+		_{{ name }} = [{{ name }} copy];
+	}"""
+
+_templates['snapshot_methods'] = """#pragma mark - Snapshot
+/**
+ *  Writes all properties to the snapshot by their index, reading them from the model first if necessary.
+ */
+- (void)encodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	[self hydrateAllProperties];
+{{ writes }}
+}
+
+/**
+ *  Reads the properties written by "encodeWithSnapshot:", properties missing from the snapshot are empty.
+ */
+- (void)decodeWithSnapshot:(SMSnapshot *)snapshot
+{
+	NSInteger idx = 0;
+	while ((idx = [snapshot readPropertyIndex]) >= 0) {
+		switch (idx) {
+{{ cases }}
+			default:
+				[snapshot skipValue];
+				break;
+		}
+	}
+	
+{{ assignments }}
+}
+
+
+
+"""
+
+_templates['literal_snapshot'] = """	[snapshot writeString:self.{{ name }} forProperty:{{ index }}];"""
+
+_templates['multi_literal_snapshot'] = """	[snapshot writeStrings:self.{{ name }} forProperty:{{ index }}];"""
+
+_templates['model_snapshot'] = """	[snapshot writeObject:self.{{ name }} forProperty:{{ index }}];"""
+
+_templates['multi_model_snapshot'] = """	[snapshot writeObjects:self.{{ name }} forProperty:{{ index }}];"""
+
+_templates['literal_restore'] = """			case {{ index }}:
+				_{{ name }} = [snapshot readString];
+				break;"""
+
+_templates['multi_literal_restore'] = """			case {{ index }}:
+				_{{ name }} = [snapshot readStrings];
+				break;"""
+
+_templates['model_restore'] = """			case {{ index }}:
+				_{{ name }} = [snapshot readObject];
+				break;"""
+
+_templates['multi_model_restore'] = """			case {{ index }}:
+				_{{ name }} = [snapshot readObjects];
+				break;"""
+
+_templates['restore_single_assignment'] = """	if (!_{{ name }}) {
+		_{{ name }} = (id)[NSNull null];
+	}"""
+
+_templates['restore_multi_assignment'] = """	if (!_{{ name }}) {
+		_{{ name }} = @[];
+	}"""
+
+_templates['decode_method'] = """#pragma mark - Stream Decoding
+/**
+ *  Fills all properties from the values the stream decoder read for the receiver's subject, properties without values are empty.
+ */
+- (void)takeDecodedValues:(NSDictionary *)values decoder:(SMStreamDecoder *)decoder
+{
+{{ takes }}
+	
+{{ assignments }}
+}
+
+
+
+"""
+
+_templates['literal_decode'] = """	_{{ name }} = [decoder stringFrom:values[@"{{ uri }}"]];"""
+
+_templates['multi_literal_decode'] = """	_{{ name }} = [decoder stringsFrom:values[@"{{ uri }}"]];"""
+
+_templates['model_decode'] = """	_{{ name }} = [decoder objectOfClass:[{{ itemClass }} class] from:values[@"{{ uri }}"]];"""
+
+_templates['multi_model_decode'] = """	_{{ name }} = [decoder objectsOfClass:[{{ itemClass }} class] from:values[@"{{ uri }}"]];"""
+
 _templates['class_base_path_getter'] = """+ (NSString *)basePath
 {
 	return @"{{ base_path }}";
@@ -225,54 +636,471 @@ _templates['record_multi_item_getter'] = """/**
 	[self getObjectsOfClass:[{{ item_class }} class] from:path callback:callback];
 }"""
 
-_templates['class_unit_test'] = """/**
- *  Testing {{ CLASS_NAME }}
+_templates['record_filtered_getter'] = """/**
+ *  {{ description }}, filtered.
+ *
+ *  Makes a call to {{ path }}, originally named "{{ orig_name }}", sending the arguments as query parameters. Arguments
+ *  that are nil or 0 are not sent.
+{{ parameter_docs }}
+ *  @param callback A SMSuccessRetvalueBlock block that will have a success flag and a user info dictionary containing
+ *  the desired objects (key: SMARTResponseArrayKey) if successful.
  */
-- (void)test{{ CLASS_NAME }}
+{{ method_signature }}
 {
-	NSString *rdfPath = [[NSBundle bundleForClass:[self class]] pathForResource:@"{{ CLASS_NAME }}" ofType:@"rdf"];
-	STAssertNotNil(rdfPath, @"Expecting an RDF file for the class {{ CLASS_NAME }}");
-	NSString *rdf = [NSString stringWithContentsOfFile:rdfPath encoding:NSUTF8StringEncoding error:nil];
-	{{ CLASS_NAME }} *item = [{{ CLASS_NAME }} newWithRDFXML:rdf];
-	STAssertNotNil(item, @"Failed to parse RDF");
-	
-	if (item) {
-		{{ ITEM_TESTS }};
-	}
-}
-"""
-
+	NSMutableArray *parameters = [NSMutableArray array];
+{{ parameter_assignments }}
+	NSString *path = [NSString stringWithFormat:@"{{ nsstring_path }}", self.record_id];
+	[self getObjectsOfClass:[{{ item_class }} class] from:path parameters:parameters intoModel:nil callback:callback];
+}"""
 
+_templates['record_paged_getter'] = """/**
+ *  {{ description }}, page by page.
+ *
+ *  Makes calls to {{ path }}, originally named "{{ orig_name }}", fetching pageSize objects at a time with the "limit" and
+ *  "offset" query parameters and adding every page to the same model. Arguments that are nil or 0 are not sent.
+{{ parameter_docs }}
+ *  @param pageSize The number of objects per page, 0 fetches all objects at once
+ *  @param model The model to add all pages to, nil to use a new model
+ *  @param pageCallback A SMPageBlock block called with the objects of every page, return NO to stop fetching pages
+ *  @param callback A SMSuccessRetvalueBlock block that will have a success flag and a user info dictionary containing
+ *  the objects of all pages (key: SMARTResponseArrayKey) and the model (key: SMARTResponseModelKey) if successful.
+ */
+{{ method_signature }}
+{
+	NSMutableArray *parameters = [NSMutableArray array];
+{{ parameter_assignments }}
+	NSString *path = [NSString stringWithFormat:@"{{ nsstring_path }}", self.record_id];
+	[self getObjectsOfClass:[{{ item_class }} class] from:path parameters:parameters pageSize:pageSize intoModel:model pageCallback:pageCallback callback:callback];
+}"""
 
+_templates['record_prefetchable_calls'] = """/**
+ *  The record calls prefetch:callback: can fire, keyed by their original name, in the form prefetchCalls:callback: expects.
+ */
+- (NSDictionary *)prefetchableCalls
+{
+	return @{
+{{ entries }}
+	};
+}"""
 
-### ---------------------------------------------------------- ###
+_templates['record_prefetch'] = """/**
+ *  Fetches the given record calls concurrently and merges their objects into the record's model, see prefetchCalls:callback:.
+ *
+ *  Use this instead of calling several getters one after another, for example when a record is opened.
+ *  @param callNames The original names of the calls to prefetch, like "get_allergies", nil to prefetch all calls
+ *  @param callback A SMSuccessRetvalueBlock block that will have a success flag and a user info dictionary containing the objects of every call
+ *  (key: SMARTResponseCallsKey) and the record's model (key: SMARTResponseModelKey).
+ */
+- (void)prefetch:(NSArray *)callNames callback:(SMSuccessRetvalueBlock)callback
+{
+	NSDictionary *known = [self prefetchableCalls];
+	NSMutableDictionary *calls = [NSMutableDictionary dictionaryWithCapacity:[known count]];
+	for (NSString *name in (callNames ? callNames : [known allKeys])) {
+		if (!known[name]) {
+			NSString *errStr = [NSString stringWithFormat:@"There is no record call named \\"%@\\" to prefetch", name];
+			SUCCESS_RETVAL_CALLBACK_OR_LOG_ERR_STRING(callback, errStr, 0)
+			return;
+		}
+		calls[name] = known[name];
+	}
+	
+	[self prefetchCalls:calls callback:callback];
+}"""
 
+_templates['record_parameter_object'] = """	if ({{ argument }}) {
+		[parameters addObject:[NSString stringWithFormat:@"{{ name }}=%@", {{ value }}]];
+	}"""
 
-import os
-import sys
-import re
-import urllib2
-import datetime
+_templates['record_parameter_integer'] = """	if ({{ argument }} > 0) {
+		[parameters addObject:[NSString stringWithFormat:@"{{ name }}=%lu", (unsigned long){{ argument }}]];
+	}"""
 
-print 'Use -v for verbose or -f to force overriding existing classes'
-print '--> Parsing ontology'
-from smart_common.rdf_tools import rdf_ontology
+_templates['registry_class_for_type'] = """/**
+ *  Returns the generated class that represents objects of the given rdf:type, nil if there is none.
+ */
++ (Class)classForRDFType:(NSString *)rdfType
+{
+	static NSDictionary *registry = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		registry = @{
+{{ entries }}
+		};
+	});
+	return rdfType ? registry[rdfType] : nil;
+}"""
 
-_arguments = sys.argv[1:] if len(sys.argv) > 1 else []
-_overwrite = '-f' in _arguments
-_verbose = '-v' in _arguments
+_templates['registry_snapshot_classes'] = """/**
+ *  Returns the generated classes in the order snapshots refer to them by index.
+ */
++ (NSArray *)snapshotClasses
+{
+	static NSArray *classes = nil;
+	static dispatch_once_t once;
+	dispatch_once(&once, ^{
+		classes = @[
+{{ entries }}
+		];
+	});
+	return classes;
+}
 
-_known_classes = {}			# will be { SMART name: Obj-C class name }
-_valid_values = {}			# will be { SMART name: { key: val } }
-_record_calls = []
-_single_item_calls = []
-_classes_written = []
+/**
+ *  Returns a hash over the generated classes and their properties, snapshots are only read by classes with the same hash.
+ */
++ (NSString *)snapshotSchemaHash
+{
+	return @"{{ hash }}";
+}"""
 
+_templates['registry_objects_in_model'] = """/**
+ *  Instantiates every subject in the model whose rdf:type has a generated class, walking the model's statements only once.
+ *
+ *  All properties of the instances are filled from the statements right away, model properties point to the instances of their
+ *  subjects in the returned dictionary.
+ *  @param model The model to read
+ *  @return A dictionary of SMObject instances, keyed by their subject node
+ */
++ (NSDictionary *)objectsInModel:(RedlandModel *)model
+{
+	RedlandStatement *all = [RedlandStatement statementWithSubject:nil predicate:nil object:nil];
+	return [self objectsFromStatements:[model enumeratorOfStatementsLike:all] inModel:model];
+}
 
-def toObjCClassName(name):
-	"""Converts any name into a hopefully acceptable Objective-C class name,
-	prepending the prefix defined in "_obj_c_class_prefix".
-	"""
+/**
+ *  Instantiates every subject of the given statements whose rdf:type has a generated class, like objectsInModel: but only for a
+ *  part of the model, for example the statements of one page that have just been added to it.
+ *  @param statements An enumerator of RedlandStatement instances, all of them must be part of the model
+ *  @param model The model the instances live in
+ *  @return A dictionary of SMObject instances, keyed by their subject node
+ */
++ (NSDictionary *)objectsFromStatements:(NSEnumerator *)statements inModel:(RedlandModel *)model
+{
+	RedlandNode *typeNode = [RedlandNode typeNode];
+	NSMutableDictionary *grouped = [NSMutableDictionary dictionary];
+	NSMutableDictionary *objects = [NSMutableDictionary dictionary];
+	
+	// group statements by subject and instantiate typed subjects
+	RedlandStatement *rslt = nil;
+	while ((rslt = [statements nextObject])) {
+		NSMutableArray *about = grouped[rslt.subject];
+		if (!about) {
+			about = [NSMutableArray array];
+			grouped[rslt.subject] = about;
+		}
+		[about addObject:rslt];
+		
+		if (!objects[rslt.subject] && [typeNode isEqual:rslt.predicate]) {
+			Class itemClass = [self classForRDFType:[[rslt.object URIValue] stringValue]];
+			SMObject *item = [itemClass newWithSubject:rslt.subject inModel:model];
+			if (item) {
+				objects[rslt.subject] = item;
+			}
+		}
+	}
+	
+	// wire up the instances
+	[objects enumerateKeysAndObjectsUsingBlock:^(RedlandNode *subject, SMObject *item, BOOL *stop) {
+		[item hydrateFromStatements:[grouped[subject] objectEnumerator] objects:objects];
+	}];
+	
+	return objects;
+}"""
+
+_templates['code_system_tables'] = """/// The code systems that define valid values, sorted
+static NSString *const SMCodedValueSystems[{{ system_count }}] = {
+{{ systems }}
+};
+
+/// Where the codes of every system start in SMCodedValueCodes, the last entry is the number of codes
+static const NSUInteger SMCodedValueSystemStarts[{{ system_count }} + 1] = { {{ starts }} };
+
+/// The valid codes, grouped by system and sorted within every system
+static NSString *const SMCodedValueCodes[{{ code_count }}] = {
+{{ codes }}
+};
+
+/// The titles of the codes in SMCodedValueCodes
+static NSString *const SMCodedValueTitles[{{ code_count }}] = {
+{{ titles }}
+};
+
+/// The indexes of all codes in SMCodedValueCodes, sorted by code
+static const NSUInteger SMCodedValueCodeOrder[{{ code_count }}] = { {{ order }} };
+
+/**
+ *  Returns the index of the system in SMCodedValueSystems, NSNotFound if it defines no valid values.
+ */
+static NSUInteger SMCodedValueSystemIndex(NSString *system)
+{
+	NSUInteger low = 0;
+	NSUInteger high = {{ system_count }};
+	while (low < high) {
+		NSUInteger mid = (low + high) / 2;
+		NSComparisonResult result = [system compare:SMCodedValueSystems[mid] options:NSLiteralSearch];
+		if (NSOrderedSame == result) {
+			return mid;
+		}
+		if (NSOrderedAscending == result) {
+			high = mid;
+		}
+		else {
+			low = mid + 1;
+		}
+	}
+	return NSNotFound;
+}
+
+/**
+ *  Returns the index of the code in SMCodedValueCodes, NSNotFound if it is not there. Searches the codes from "low" to "high" directly, or all of them
+ *  through SMCodedValueCodeOrder if "ordered" is YES.
+ */
+static NSUInteger SMCodedValueCodeIndex(NSString *code, NSUInteger low, NSUInteger high, BOOL ordered)
+{
+	while (low < high) {
+		NSUInteger mid = (low + high) / 2;
+		NSUInteger idx = ordered ? SMCodedValueCodeOrder[mid] : mid;
+		NSComparisonResult result = [code compare:SMCodedValueCodes[idx] options:NSLiteralSearch];
+		if (NSOrderedSame == result) {
+			return idx;
+		}
+		if (NSOrderedAscending == result) {
+			high = mid;
+		}
+		else {
+			low = mid + 1;
+		}
+	}
+	return NSNotFound;
+}
+
+
+"""
+
+_templates['code_system_methods'] = """/**
+ *  Returns YES if the code is a valid value of any code system of the ontology. Looks the code up in a static table, which needs no setup and
+ *  allocates nothing.
+ *  @param code The URI of the code
+ */
++ (BOOL)isValidCode:(NSString *)code
+{
+	return nil != [self titleForCode:code];
+}
+
+/**
+ *  Returns YES if the code is a valid value of the given code system.
+ *  @param code The URI of the code
+ *  @param system The URI of the code system, for example "http://smartplatforms.org/terms/codes/TranslationFidelity"
+ */
++ (BOOL)isValidCode:(NSString *)code inSystem:(NSString *)system
+{
+	return nil != [self titleForCode:code inSystem:system];
+}
+
+/**
+ *  Returns the title the ontology gives the code, nil if it is not a valid value of any code system.
+ */
++ (NSString *)titleForCode:(NSString *)code
+{
+	NSUInteger idx = code ? SMCodedValueCodeIndex(code, 0, {{ code_count }}, YES) : NSNotFound;
+	return (NSNotFound == idx) ? nil : SMCodedValueTitles[idx];
+}
+
+/**
+ *  Returns the title the ontology gives the code, nil if it is not a valid value of the given code system.
+ */
++ (NSString *)titleForCode:(NSString *)code inSystem:(NSString *)system
+{
+	NSUInteger sys = system ? SMCodedValueSystemIndex(system) : NSNotFound;
+	if (!code || NSNotFound == sys) {
+		return nil;
+	}
+	NSUInteger idx = SMCodedValueCodeIndex(code, SMCodedValueSystemStarts[sys], SMCodedValueSystemStarts[sys + 1], NO);
+	return (NSNotFound == idx) ? nil : SMCodedValueTitles[idx];
+}
+
+/**
+ *  Returns the URIs of the code systems that define valid values.
+ */
++ (NSArray *)codeSystems
+{
+	return [NSArray arrayWithObjects:SMCodedValueSystems count:{{ system_count }}];
+}
+
+/**
+ *  Returns YES if the receiver is a valid value of the given code system, which it is if its subject or the subject of its code is one.
+ */
+- (BOOL)hasValidCodeInSystem:(NSString *)system
+{
+	return [[self class] isValidCode:[[self.subject URIValue] stringValue] inSystem:system]
+		|| [[self class] isValidCode:[[self.code.subject URIValue] stringValue] inSystem:system];
+}"""
+
+_templates['python_class'] = """@register
+class {{ CLASS_NAME }}(SMObject):
+	\"\"\"Representing {{ RDF_TYPE }}.\"\"\"
+	
+	__slots__ = ({{ slots }})
+	rdf_type = u'{{ RDF_TYPE }}'
+	base_path = {{ base_path }}
+	property_names = ({{ property_names }})
+	
+{{ properties }}"""
+
+_templates['python_literal'] = """	{{ name }} = LiteralProperty(u'{{ uri }}', '_{{ name }}'{{ multiple }})"""
+
+_templates['python_typed_literal'] = """	{{ literalName }} = LiteralProperty(u'{{ uri }}', '_{{ literalName }}')
+	{{ name }} = TypedLiteralProperty('{{ literalName }}', '_{{ name }}', {{ convert }})"""
+
+_templates['python_model'] = """	{{ name }} = ModelProperty(u'{{ uri }}', '_{{ name }}', '{{ itemClass }}'{{ multiple }})"""
+
+_templates['class_unit_test'] = """/**
+ *  Testing {{ CLASS_NAME }}
+ */
+- (void)test{{ CLASS_NAME }}
+{
+	NSString *rdfPath = [[NSBundle bundleForClass:[self class]] pathForResource:@"{{ CLASS_NAME }}" ofType:@"rdf"];
+	STAssertNotNil(rdfPath, @"Expecting an RDF file for the class {{ CLASS_NAME }}");
+	NSString *rdf = [NSString stringWithContentsOfFile:rdfPath encoding:NSUTF8StringEncoding error:nil];
+	{{ CLASS_NAME }} *item = [{{ CLASS_NAME }} newWithRDFXML:rdf];
+	STAssertNotNil(item, @"Failed to parse RDF");
+	
+	if (item) {
+		{{ ITEM_TESTS }};
+	}
+}
+"""
+
+_templates['class_performance_test'] = """/**
+ *  Timing {{ CLASS_NAME }}
+ */
+- (void)testPerformance{{ CLASS_NAME }}
+{
+	NSString *rdf = [self exampleRDFForClass:[{{ CLASS_NAME }} class]];
+	STAssertNotNil(rdf, @"Expecting an RDF file for the class {{ CLASS_NAME }}");
+	void (^touch)({{ CLASS_NAME }} *) = ^({{ CLASS_NAME }} *item) {
+		{{ ITEM_TOUCHES }};
+	};
+	
+	NSTimeInterval parse = [self timeRepetitions:SMPerformanceRepetitions of:^{
+		touch([{{ CLASS_NAME }} newWithRDFXML:rdf]);
+	}];
+	
+	NSString *replicated = [self replicateRDF:rdf times:SMPerformanceReplicas];
+	__block NSUInteger found = 0;
+	NSTimeInterval replica = [self timeRepetitions:1 of:^{
+		NSArray *items = [self objectsOfClass:[{{ CLASS_NAME }} class] inRDF:replicated];
+		for ({{ CLASS_NAME }} *item in items) {
+			touch(item);
+		}
+		found = [items count];
+	}];
+	STAssertTrue(found >= SMPerformanceReplicas, @"Expecting at least %lu instances of {{ CLASS_NAME }}, found %lu", (unsigned long)SMPerformanceReplicas, (unsigned long)found);
+	
+	[self checkTimings:@{@"parse": @(parse), @"replicated": @(replica)} forClass:@"{{ CLASS_NAME }}"];
+}
+"""
+
+
+
+
+### ---------------------------------------------------------- ###
+
+
+import os
+import sys
+import re
+import json
+import hashlib
+import cPickle
+import xml.etree.cElementTree as etree
+import copy
+import random
+from StringIO import StringIO
+import urllib2
+import datetime
+import time
+from contextlib import contextmanager
+
+print 'Use -v for verbose or -f to force overriding existing classes, --full to ignore the manifest, -j N to use N processes, --no-cache to ignore the ontology snapshot, --ontology FILE to read the OWL file without smart_common, --profile to time the run, --inline-accessors to expand accessor bodies, --unity to write a unity build, --python DIR to write a Python package, --fixtures to write large RDF fixtures, --only A,B to render only these classes and the classes they use, --watch to render again whenever templates or the ontology change'
+
+_arguments = sys.argv[1:] if len(sys.argv) > 1 else []
+
+def argument_value(flag, default=None):
+	"""Returns the value following "flag" on the command line, "default" if the flag is not present."""
+	if flag in _arguments:
+		idx = _arguments.index(flag)
+		if idx + 1 < len(_arguments):
+			return _arguments[idx + 1]
+		print 'xx> Missing value for %s' % flag
+		sys.exit(1)
+	return default
+
+_watch = '--watch' in _arguments
+_overwrite = '-f' in _arguments or _watch
+_verbose = '-v' in _arguments
+_full = '--full' in _arguments
+_jobs = int(argument_value('-j', 1))
+_use_snapshot = '--no-cache' not in _arguments
+_ontology_file = argument_value('--ontology')
+_profile = '--profile' in _arguments
+_inline_accessors = '--inline-accessors' in _arguments
+_unity = '--unity' in _arguments
+_python_dir = argument_value('--python')
+_write_fixtures = '--fixtures' in _arguments
+_fixture_scale = float(argument_value('--fixture-scale', 1))
+_fixture_seed = int(argument_value('--seed', 1))
+_only = set(argument_value('--only').split(',')) if argument_value('--only') else None
+
+_known_classes = {}			# will be { SMART name: Obj-C class name }
+_valid_values = {}			# will be { SMART name: { key: val } }
+_record_calls = []
+_single_item_calls = []
+_classes_written = []
+_class_dicts = []			# resolved class dictionaries, in the order they were handled, to be rendered
+_generated_categories = []	# names like "SMRecord+Calls" of the categories of this run
+_resolved_classes = set()	# identifiers of classes that went through handle_class()
+
+_manifest_path = os.path.join(_generated_classes_dir, _manifest_file)
+_slices_path = os.path.join(_generated_classes_dir, _slices_file)
+_old_manifest = {}			# will be { output name: input digest } as read from the last run
+_manifest = {}				# will be { output name: input digest } for this run
+_generator_version = None	# digest of this file, which includes the templates defined in it
+
+_timings = {}				# will be { kind: { name: [seconds, calls] } } when profiling
+_phases = []				# phase names in the order they ran
+
+_snapshot_version = 4			# bump when the snapshot layout changes
+
+_ns_rdf = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+_ns_rdfs = 'http://www.w3.org/2000/01/rdf-schema#'
+_ns_owl = 'http://www.w3.org/2002/07/owl#'
+_ns_xsd = 'http://www.w3.org/2001/XMLSchema#'
+_ns_api = 'http://smartplatforms.org/terms/api#'
+_ns_dcterms = 'http://purl.org/dc/terms/'
+_ns_codes = 'http://smartplatforms.org/terms/codes/'
+
+# XML Schema datatypes that get a typed property, with the SMObject methods converting from and to literals
+_typed_literals = {
+	_ns_xsd + 'decimal': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'double': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'float': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'integer': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'int': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'long': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'nonNegativeInteger': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'positiveInteger': ('NSNumber', 'numberFromLiteral', 'literalFromNumber'),
+	_ns_xsd + 'date': ('NSDate', 'dateFromLiteral', 'literalFromDate'),
+	_ns_xsd + 'dateTime': ('NSDate', 'dateFromLiteral', 'literalFromDate'),
+}
+
+_template_placeholder = re.compile(r'\{\{([^\}]+)\}\}')
+
+
+def toObjCClassName(name):
+	"""Converts any name into a hopefully acceptable Objective-C class name,
+	prepending the prefix defined in "_obj_c_class_prefix".
+	"""
 	
 	basename = None
 	if name and len(name) > 1:
@@ -308,45 +1136,580 @@ def toObjCPropertyName(name):
 	return name.lower() if name else None
 
 
-def handle_class(a_class):
-	""" Returns a tuple with the Objective-C class name to use with the given class, or None if we don't want this,
+class OntologyItem(object):
+	"""A plain stand-in for the classes, properties and API calls of smart_common's ontology, holding only the attributes
+	the generator reads.
+	"""
+	
+	def __init__(self, **attributes):
+		self.__dict__.update(attributes)
+	
+	def guess_name(self):
+		return self.name
+
+
+def ontology_digest(source, reader):
+	"""Returns a digest over the ontology source, the reader used and the snapshot version, None if the source cannot be
+	found.
+	"""
+	
+	if not os.path.exists(source):
+		return None
+	
+	digest = hashlib.sha1('%s %s ' % (_snapshot_version, reader))
+	digest.update(open(source, 'rb').read())
+	return digest.hexdigest()
+
+
+def snapshot_ontology(ontology):
+	"""Flattens the api_types and api_calls of the given ontology and all classes reachable from them into plain
+	dictionaries, lists and tuples.
+	"""
+	
+	calls = []
+	call_index = {}
+	def index_call(api):
+		if id(api) not in call_index:
+			call_index[id(api)] = len(calls)
+			calls.append((api.guess_name(), api.category, api.http_method, unicode(api.path), unicode(api.description), call_parameters(api), call_parameter_types(api)))
+		return call_index[id(api)]
+	
+	classes = {}
+	pending = list(ontology.api_types)
+	while len(pending) > 0:
+		a_class = pending.pop()
+		identifier = unicode(a_class.uri)
+		if identifier in classes:
+			continue
+		
+		equivalents = None
+		if a_class.equivalent_classes is not None:
+			equivalents = [[(unicode(eq.uri), unicode(eq.title)) for eq in e.one_of] for e in a_class.equivalent_classes]
+		
+		o_props = []
+		for o_prop in a_class.object_properties:
+			o_props.append((o_prop.name, unicode(o_prop.uri), unicode(o_prop.to_class.uri), bool(o_prop.multiple_cardinality)))
+			pending.append(o_prop.to_class)
+		
+		d_props = []
+		for d_prop in a_class.data_properties:
+			rng = getattr(d_prop, 'range', None)
+			d_props.append((d_prop.name, unicode(d_prop.uri), bool(d_prop.multiple_cardinality), unicode(rng) if rng else None))
+		
+		classes[identifier] = {
+			'name': a_class.name,
+			'base_path': a_class.base_path,
+			'example': a_class.example,
+			'equivalents': equivalents,
+			'object_properties': o_props,
+			'data_properties': d_props,
+			'calls': [index_call(api) for api in (a_class.calls or [])],
+		}
+	
+	return {
+		'classes': classes,
+		'calls': calls,
+		'api_types': [unicode(a_class.uri) for a_class in ontology.api_types],
+		'api_calls': [index_call(api) for api in ontology.api_calls],
+	}
+
+
+def ontology_from_snapshot(snapshot):
+	"""Rebuilds an ontology object with "api_types" and "api_calls" from a snapshot created by snapshot_ontology()."""
+	
+	calls = [OntologyItem(name=c[0], category=c[1], http_method=c[2], path=c[3], description=c[4], parameters=c[5], parameter_types=c[6]) for c in snapshot['calls']]
+	
+	classes = {}
+	for uri, c in snapshot['classes'].iteritems():
+		equivalents = None
+		if c['equivalents'] is not None:
+			equivalents = [OntologyItem(one_of=[OntologyItem(uri=eq[0], title=eq[1]) for eq in e]) for e in c['equivalents']]
+		
+		classes[uri] = OntologyItem(uri=uri, name=c['name'], base_path=c['base_path'], example=c['example'],
+			equivalent_classes=equivalents, calls=[calls[i] for i in c['calls']])
+	
+	# wire up properties once all classes exist
+	for uri, c in snapshot['classes'].iteritems():
+		classes[uri].object_properties = [OntologyItem(name=p[0], uri=p[1], to_class=classes[p[2]], multiple_cardinality=p[3]) for p in c['object_properties']]
+		classes[uri].data_properties = [OntologyItem(name=p[0], uri=p[1], multiple_cardinality=p[2], range=p[3]) for p in c['data_properties']]
+	
+	return OntologyItem(api_types=[classes[uri] for uri in snapshot['api_types']], api_calls=[calls[i] for i in snapshot['api_calls']])
+
+
+def owl_local_name(uri):
+	"""Returns the part of the URI after the last "#" or "/"."""
+	
+	return re.split(r'[#/]', uri.rstrip('#/'))[-1]
+
+
+def owl_guess_call_name(http_method, path):
+	"""Guesses a name like "get_lab_results" for an API call from its HTTP method and path. Paths ending in an item
+	placeholder, like "{lab_result_id}", are named after the placeholder ("get_lab_result").
+	"""
+	
+	segments = [seg for seg in path.strip('/').split('/') if seg]
+	resource = segments[-1] if len(segments) > 0 else 'root'
+	item = re.match(r'\{\s*(\w+?)(_id)?\s*\}$', resource)
+	if item:
+		resource = item.group(1)
+	
+	return '%s_%s' % (http_method.lower(), re.sub(r'\W+', '_', resource))
+
+
+def call_parameter_items(api):
+	"""Returns tuples with the name and the datatype URI (or None) of the query parameters an API call accepts, from its
+	filters and parameter sets, in the order the ontology lists them.
+	
+	Calls read by our own reader or from the snapshot carry the names in "parameters" and the datatypes in
+	"parameter_types"; smart_common's calls refer to filter and parameter objects, whose "clientParameterName" is the name
+	used in the query and whose range is the datatype.
+	"""
+	
+	def name_of(item):
+		if isinstance(item, basestring):
+			return unicode(item)
+		for attr in ['clientParameterName', 'client_parameter_name', 'parameterName', 'name']:
+			value = getattr(item, attr, None)
+			if value:
+				return unicode(value)
+		return owl_local_name(unicode(item.uri)) if getattr(item, 'uri', None) else None
+	
+	def datatype_of(item, name):
+		if isinstance(item, basestring):
+			return (getattr(api, 'parameter_types', None) or {}).get(name)
+		value = getattr(item, 'range', None)
+		return unicode(getattr(value, 'uri', value)) if value else None
+	
+	def listed(item, attrs):
+		found = []
+		for attr in attrs:
+			value = getattr(item, attr, None)
+			if value:
+				found.extend(value if isinstance(value, (list, tuple, set)) else [value])
+		return found
+	
+	items = listed(api, ['parameters', 'filters', 'hasFilter', 'filter'])
+	for param_set in listed(api, ['parameter_sets', 'hasParameterSet', 'parameterSet']):
+		items.extend(listed(param_set, ['parameters', 'hasParameter', 'parameter']))
+	
+	found = []
+	for item in items:
+		name = name_of(item)
+		if name and name not in [f[0] for f in found]:
+			found.append((name, datatype_of(item, name)))
+	return found
+
+
+def call_parameters(api):
+	"""Returns the names of the query parameters an API call accepts, see call_parameter_items()."""
+	return [name for name, datatype in call_parameter_items(api)]
+
+
+def call_parameter_types(api):
+	"""Returns the datatype URIs of the query parameters of an API call that declare one, keyed by parameter name."""
+	return dict((name, datatype) for name, datatype in call_parameter_items(api) if datatype)
+
+
+def read_owl_ontology(path):
+	"""Reads the classes, properties and API calls the generator needs from an OWL ontology in RDF/XML.
+	
+	The file is streamed with iterparse and every top level node is dropped once it has been read, so memory use is
+	bounded by the size of the extracted structures rather than the document. Returns an object with "api_types" and
+	"api_calls" shaped like smart_common's rdf_ontology.
+	"""
+	
+	about = '{%s}about' % _ns_rdf
+	resource = '{%s}resource' % _ns_rdf
+	
+	def ref(elem):
+		"""The URI an element refers to, either as rdf:resource or as a nested node with rdf:about."""
+		uri = elem.get(resource)
+		if uri is None:
+			for child in elem:
+				uri = child.get(about)
+				if uri is not None:
+					break
+		return uri
+	
+	def text(elem, tag):
+		child = elem.find(tag)
+		if child is None:
+			return None
+		if child.text and child.text.strip():
+			return child.text.strip()
+		if len(child) > 0:
+			return ''.join(etree.tostring(sub) for sub in child)
+		return None
+	
+	classes = {}				# { uri: { 'superclasses': [], 'restrictions': [], ... } }
+	kinds = {}					# { property uri: 'object' or 'data' }
+	ranges = {}					# { property uri: range uri }
+	titles = {}					# { uri: title } of every node that has one
+	calls = []
+	parameters = {}				# { uri: client parameter name } of api:Filter and api:Parameter nodes
+	parameter_types = {}		# { uri: datatype uri } of api:Filter and api:Parameter nodes with an rdfs:range
+	parameter_sets = {}			# { uri: [parameter uris] } of api:ParameterSet nodes
+	
+	def read_titles(elem):
+		for node in elem.iter():
+			uri = node.get(about)
+			if uri is not None:
+				title = node.find('{%s}title' % _ns_dcterms)
+				if title is not None and title.text:
+					titles[uri] = title.text.strip()
+	
+	def read_class(uri, elem):
+		c = classes.setdefault(uri, {'superclasses': [], 'restrictions': [], 'one_of': [], 'base_path': None, 'example': None})
+		for sub in elem.findall('{%s}subClassOf' % _ns_rdfs):
+			restriction = sub.find('{%s}Restriction' % _ns_owl)
+			if restriction is None:
+				if ref(sub) is not None:
+					c['superclasses'].append(ref(sub))
+				continue
+			
+			on_prop = restriction.find('{%s}onProperty' % _ns_owl)
+			if on_prop is None:
+				continue
+			r = {'property': ref(on_prop), 'to': None, 'max': None}
+			for tag in ['allValuesFrom', 'someValuesFrom']:
+				values = restriction.find('{%s}%s' % (_ns_owl, tag))
+				if values is not None:
+					r['to'] = ref(values)
+			for tag in ['cardinality', 'maxCardinality']:
+				card = restriction.find('{%s}%s' % (_ns_owl, tag))
+				if card is not None and card.text:
+					r['max'] = int(card.text.strip())
+			c['restrictions'].append(r)
+		
+		for equiv in elem.findall('{%s}equivalentClass' % _ns_owl):
+			for one_of in equiv.iter('{%s}oneOf' % _ns_owl):
+				c['one_of'].append([member.get(about) or member.get(resource) for member in one_of])
+		
+		c['base_path'] = text(elem, '{%s}base_path' % _ns_api) or c['base_path']
+		c['example'] = text(elem, '{%s}example' % _ns_api) or c['example']
+	
+	def read_parameter(uri, elem, kind):
+		if '{%s}ParameterSet' % _ns_api == kind:
+			parameter_sets[uri] = parameter_refs(elem, ['parameter', 'hasParameter'])
+		else:
+			parameters[uri] = text(elem, '{%s}clientParameterName' % _ns_api) or text(elem, '{%s}parameterName' % _ns_api) or owl_local_name(uri)
+			datatype = elem.find('{%s}range' % _ns_rdfs)
+			if datatype is not None and ref(datatype) is not None:
+				parameter_types[uri] = ref(datatype)
+	
+	def parameter_refs(elem, tags):
+		"""The URIs of the filters, parameters or parameter sets the element refers to, reading those described inline."""
+		refs = []
+		for tag in tags:
+			for child in elem.findall('{%s}%s' % (_ns_api, tag)):
+				uri = child.get(resource)
+				if uri is None and len(child) > 0:
+					node = child[0]
+					uri = node.get(about) or node.get('{%s}nodeID' % _ns_rdf) or '_:inline%d' % (len(parameters) + len(parameter_sets))
+					read_parameter(uri, node, node.tag)
+				if uri is not None:
+					refs.append(uri)
+		return refs
+	
+	def read_call(elem):
+		http_method = text(elem, '{%s}method' % _ns_api) or text(elem, '{%s}http_method' % _ns_api) or 'GET'
+		call_path = text(elem, '{%s}path' % _ns_api) or ''
+		category = text(elem, '{%s}category' % _ns_api) or ''
+		target = elem.find('{%s}target' % _ns_api)
+		calls.append({
+			'name': owl_guess_call_name(http_method, call_path),
+			'category': category.split('_')[0],
+			'http_method': http_method,
+			'path': call_path,
+			'description': text(elem, '{%s}description' % _ns_api) or text(elem, '{%s}comment' % _ns_rdfs) or '',
+			'target': ref(target) if target is not None else None,
+			'parameters': parameter_refs(elem, ['filter', 'hasFilter', 'parameter', 'hasParameter']),
+			'parameter_sets': parameter_refs(elem, ['parameterSet', 'hasParameterSet']),
+		})
+	
+	# stream top level nodes
+	depth = 0
+	root = None
+	for event, elem in etree.iterparse(path, events=('start', 'end')):
+		if 'start' == event:
+			if root is None:
+				root = elem
+			depth += 1
+			continue
+		
+		depth -= 1
+		if 1 != depth:
+			continue
+		
+		# what kind of node is this? Either from its tag or from an rdf:type child
+		kind = elem.tag
+		if '{%s}Description' % _ns_rdf == kind:
+			for rdf_type in elem.findall('{%s}type' % _ns_rdf):
+				type_uri = rdf_type.get(resource, '')
+				split = type_uri.rfind('#') + 1
+				if split > 0:
+					kind = '{%s}%s' % (type_uri[:split], type_uri[split:])
+		
+		uri = elem.get(about)
+		if '{%s}Class' % _ns_owl == kind and uri is not None:
+			read_class(uri, elem)
+		elif '{%s}ObjectProperty' % _ns_owl == kind and uri is not None:
+			kinds[uri] = 'object'
+		elif '{%s}DatatypeProperty' % _ns_owl == kind and uri is not None:
+			kinds[uri] = 'data'
+		elif '{%s}Call' % _ns_api == kind:
+			read_call(elem)
+		elif kind in ['{%s}Filter' % _ns_api, '{%s}Parameter' % _ns_api, '{%s}ParameterSet' % _ns_api] and uri is not None:
+			read_parameter(uri, elem, kind)
+		
+		if uri is not None and kind in ['{%s}ObjectProperty' % _ns_owl, '{%s}DatatypeProperty' % _ns_owl]:
+			rng = elem.find('{%s}range' % _ns_rdfs)
+			if rng is not None and ref(rng) is not None:
+				ranges[uri] = ref(rng)
+		
+		read_titles(elem)
+		elem.clear()
+		root.clear()
+	
+	# create class items
+	items = {}
+	def item_for(uri):
+		if uri not in items:
+			items[uri] = OntologyItem(uri=uri, name=owl_local_name(uri), base_path=None, example=None,
+				equivalent_classes=None, object_properties=[], data_properties=[], calls=[])
+		return items[uri]
+	
+	for uri, c in classes.iteritems():
+		item = item_for(uri)
+		item.base_path = c['base_path']
+		item.example = c['example']
+		if len(c['one_of']) > 0:
+			item.equivalent_classes = [OntologyItem(one_of=[OntologyItem(uri=m, title=titles.get(m, owl_local_name(m))) for m in members if m]) for members in c['one_of']]
+	
+	# collect restrictions, including those of superclasses; the class' own restrictions win
+	def restrictions_of(uri, seen):
+		if uri in seen or uri not in classes:
+			return {}
+		seen.add(uri)
+		found = {}
+		for sup in classes[uri]['superclasses']:
+			found.update(restrictions_of(sup, seen))
+		for r in classes[uri]['restrictions']:
+			if r['property'] is None:
+				continue
+			merged = dict(found.get(r['property'], {}))
+			merged.update(dict((k, v) for k, v in r.iteritems() if v is not None))
+			found[r['property']] = merged
+		return found
+	
+	for uri in classes.keys():
+		item = item_for(uri)
+		for prop_uri, r in sorted(restrictions_of(uri, set()).iteritems()):
+			to = r.get('to') or ranges.get(prop_uri)
+			multiple = r.get('max') is None or r['max'] > 1
+			is_data = 'data' == kinds.get(prop_uri) or (prop_uri not in kinds and (to is None or to.startswith(_ns_xsd) or '%sLiteral' % _ns_rdfs == to))
+			if is_data:
+				item.data_properties.append(OntologyItem(name=owl_local_name(prop_uri), uri=prop_uri, multiple_cardinality=multiple, range=to))
+			elif to is not None:
+				item.object_properties.append(OntologyItem(name=owl_local_name(prop_uri), uri=prop_uri, to_class=item_for(to), multiple_cardinality=multiple))
+			elif _verbose:
+				print 'xx> No class for object property %s on %s' % (prop_uri, uri)
+	
+	# API calls, with the names of their parameters now that all filters and parameter sets have been read
+	api_calls = []
+	for c in calls:
+		refs = list(c['parameters'])
+		for set_uri in c['parameter_sets']:
+			refs.extend(parameter_sets.get(set_uri, []))
+		names = []
+		types = {}
+		for uri in refs:
+			name = parameters.get(uri, owl_local_name(uri))
+			if name not in names:
+				names.append(name)
+				if uri in parameter_types:
+					types[name] = parameter_types[uri]
+		
+		call = OntologyItem(name=c['name'], category=c['category'], http_method=c['http_method'], path=c['path'], description=c['description'],
+			parameters=names, parameter_types=types)
+		if c['target'] is not None:
+			item_for(c['target']).calls.append(call)
+		api_calls.append(call)
+	
+	return OntologyItem(api_types=[items[uri] for uri in sorted(classes.keys())], api_calls=api_calls)
+
+
+def load_ontology(use_snapshot=True, owl_file=None):
+	"""Returns the ontology, read from the snapshot if there is one for the current ontology source, otherwise parsed
+	and then written to the snapshot.
+	
+	The ontology is parsed with smart_common unless "owl_file" is given or smart_common cannot be imported, in which case
+	read_owl_ontology() reads "owl_file" or the ontology source.
+	"""
+	
+	reader = 'owl' if owl_file else 'smart_common'
+	if not owl_file:
+		try:
+			import smart_common.rdf_tools
+		except ImportError:
+			reader = 'owl'
+	source = owl_file or _ontology_source
+	
+	digest = ontology_digest(source, reader)
+	if use_snapshot and digest is not None and os.path.exists(_ontology_snapshot):
+		try:
+			with open(_ontology_snapshot, 'rb') as handle:
+				cached = cPickle.load(handle)
+			if digest == cached.get('digest'):
+				print '--> Using ontology snapshot %s' % _ontology_snapshot
+				return ontology_from_snapshot(cached['snapshot'])
+		except Exception as e:
+			print 'xx> Ignoring unreadable ontology snapshot %s: %s' % (_ontology_snapshot, e)
+	
+	if 'owl' == reader:
+		if not os.path.exists(source):
+			print 'xx> No ontology at %s and smart_common is not available' % source
+			sys.exit(1)
+		
+		print '--> Reading ontology %s' % source
+		snapshot = snapshot_ontology(read_owl_ontology(source))
+	else:
+		print '--> Parsing ontology'
+		parsed = 'smart_common.rdf_tools.rdf_ontology' in sys.modules
+		from smart_common.rdf_tools import rdf_ontology
+		if parsed:
+			rdf_ontology = reload(rdf_ontology)		# smart_common parses on import, the ontology changed since
+		snapshot = snapshot_ontology(rdf_ontology)
+	
+	if digest is not None:
+		write_file(_ontology_snapshot, cPickle.dumps({'digest': digest, 'snapshot': snapshot}, cPickle.HIGHEST_PROTOCOL))
+	elif _verbose:
+		print 'xx> No ontology source at %s, not writing a snapshot' % source
+	
+	return ontology_from_snapshot(snapshot)
+
+
+def class_name_for(a_class):
+	""" Returns a tuple with the Objective-C class name to use with the given class, or None if we don't want this
 	class, and a dictionary of valid coded values for the class, if those are defined and is applicable to the class.
 	
+	Only names the class, which does not need any other class, and remembers the name in "_known_classes"; the class
+	itself is resolved by handle_class().
+	"""
+	
+	identifier = str(a_class.uri)
+	
+	# already named?
+	if identifier in _known_classes:
+		valid = _valid_values[identifier] if identifier in _valid_values else None
+		return _known_classes[identifier], valid
+
+	# is this an item we want a class for?
+	if identifier in _classes_to_ignore:
+		if _verbose:
+			print 'IGNORING    %s [%s]' % (a_class.name, a_class.uri)
+		return None, None
+	
+	# special case: all our code types we simplify to coded value
+	if identifier.startswith(_ns_codes):
+		if _verbose:
+			print 'CODED       %s describes a SMART code and will become Coded Value' % a_class.name
+		class_name = 'SMCodedValue'
+		_known_classes[identifier] = class_name
+		
+		# equivalents are our "valid values"
+		equiv = None
+		if a_class.equivalent_classes is not None and len(a_class.equivalent_classes) > 0:
+			equiv = {}
+			for e in a_class.equivalent_classes:
+				for eq in e.one_of:
+					equiv[unicode(eq.uri)] = unicode(eq.title)
+			_valid_values[identifier] = equiv
+		
+		return class_name, equiv
+	
+	class_name = toObjCClassName(a_class.name)
+	_known_classes[identifier] = class_name
+	
+	return class_name, None
+
+
+def classes_to_resolve(api_types, only=None):
+	""" Returns the classes to resolve: all of them, or the ones with the Objective-C class names in "only", from which
+	resolve_class() then reaches the classes they depend on. Exits if a name matches no class.
+	"""
+	if only is None:
+		return api_types
+	
+	roots = []
+	for a_class in api_types:
+		identifier = str(a_class.uri)
+		if identifier not in _classes_to_ignore and not identifier.startswith(_ns_codes) and toObjCClassName(a_class.name) in only:
+			roots.append(a_class)
+	
+	missing = only - set([toObjCClassName(a_class.name) for a_class in roots])
+	if len(missing) > 0:
+		print 'xx> No class named %s in the ontology' % ', '.join(sorted(missing))
+		sys.exit(1)
+	
+	return roots
+
+
+def resolve_class(a_class):
+	""" Resolves the given class and all classes it reaches through object properties, returns the Objective-C class name
+	of the given class or None if we don't want it.
+	
+	Uses an explicit worklist instead of recursion, so the nesting depth of the ontology is not bound by the recursion
+	limit and only one class dictionary is being built at any time. Classes are resolved only once, which also ends
+	cycles in the class graph.
+	"""
+	worklist = [a_class]
+	while len(worklist) > 0:
+		item = worklist.pop()
+		identifier = str(item.uri)
+		if identifier in _resolved_classes:
+			continue
+		
+		_resolved_classes.add(identifier)
+		worklist.extend(reversed(handle_class(item)))
+	
+	return class_name_for(a_class)[0]
+
+
+def handle_class(a_class):
+	""" Resolves one class and returns the classes its object properties point to, which still need to be resolved.
+	
 	Feed it a SMART_Class for which it should create an Objective-C class for, this class then fills a dictionary with
-	the values for template keys. The dictionary can then be used to substitute placeholders in the class template
-	files and contains:
+	the values for template keys and appends it to "_class_dicts", from where render_class() picks it up. The
+	dictionary can then be used to substitute placeholders in the class template files and contains:
 	- CLASS_NAME
 	- CLASS_SUPERCLASS
 	- CLASS_FORWARDS
 	- CLASS_PROPERTIES
+	- CLASS_PREDICATES
 	- CLASS_GETTERS
+	- CLASS_HYDRATION
+	- CLASS_SNAPSHOT
+	- CLASS_DECODING
 	- BASE_PATH
 	- RDF_TYPE
 	- AUTHOR
 	- DATE
 	- YEAR
 	- EXAMPLE
+	
+	Properties are only rendered by render_class(), the dictionary holds them under "_properties". Classes we don't
+	want and code classes, which become SMCodedValue, get no dictionary.
 	"""
 	
-	global _known_classes
-	global _valid_values
 	identifier = str(a_class.uri)
-	
-	# already handled?
-	if identifier in _known_classes:
-		valid = _valid_values[identifier] if identifier in _valid_values else None
-		return _known_classes[identifier], valid
-
-	# is this an item we want a class for?
-	if identifier in _classes_to_ignore:
-		if _verbose:
-			print 'IGNORING    %s [%s]' % (a_class.name, a_class.uri)
-		return None, None
+	class_name = class_name_for(a_class)[0]
+	if class_name is None or identifier.startswith(_ns_codes):
+		return []
 	
 	# start the dictionary
 	now = datetime.date.today()
 	base_path = a_class.base_path
-	class_name = toObjCClassName(a_class.name)
 	myDict = {
 		'CLASS_NAME': class_name,
 		'CLASS_SUPERCLASS': 'SMBaseDocument' if base_path else 'SMObject',
@@ -358,133 +1721,629 @@ def handle_class(a_class):
 		'EXAMPLE': a_class.example,
 	}
 	
-	# special case: all our code types we simplify to coded value
-	if identifier.startswith('http://smartplatforms.org/terms/codes/'):
-		if _verbose:
-			print 'CODED       %s describes a SMART code and will become Coded Value' % a_class.name
-		class_name = 'SMCodedValue'
-		_known_classes[identifier] = class_name
+	
+	c_forwards = set()
+	
+	# get properties that represent other classes (OWL_ObjectProperty instances)
+	my_properties = []
+	for o_prop in a_class.object_properties:
+		# o_prop.multiple_cardinality	  ->  Bool whether the property can have multiple items
+		# o_prop.to_class				  ->  SMART_Class represented by the property
+		# o_prop.to_class.name			  ->  The name of the class
+		# o_prop.to_class.uri	  		  ->  Class URI
 		
-		# equivalents are our "valid values"
-		equiv = None
-		if a_class.equivalent_classes is not None and len(a_class.equivalent_classes) > 0:
-			equiv = {}
-			for e in a_class.equivalent_classes:
-				for eq in e.one_of:
-					equiv[unicode(eq.uri)] = unicode(eq.title)
-			_valid_values[identifier] = equiv
+		# name the property class, it is resolved later
+		itemClass, valid = class_name_for(o_prop.to_class)
+		prop_class_id = str(o_prop.to_class.uri)
 		
-		return class_name, equiv
+		c_forwards.add(itemClass)
+		prop_name = toObjCPropertyName(o_prop.name);
+		prop = {
+			'name': prop_name,
+			'setName': "set%s%s" % (prop_name[0].upper(), prop_name[1:]),
+			'uri': o_prop.uri,
+			'itemClass': itemClass,
+			'useClass': 'NSArray' if o_prop.multiple_cardinality else itemClass,
+			'strength': 'copy' if o_prop.multiple_cardinality else 'strong',
+			'_template': 'multi_model_getter' if o_prop.multiple_cardinality else 'model_getter',
+			'_multiple': o_prop.multiple_cardinality,
+		}
+		
+				
+		# if we have valid values, write a nice comment
+		if prop_class_id in _valid_values:
+			comment = "///\n///  The codes in this property should be:\n///\n"
+			
+			for key, val in _valid_values[prop_class_id].iteritems():
+				comment += "///  - \"%s\": \t%s\n" % (key, val)
+			
+			prop['add_comment'] = comment
+		
+		my_properties.append(prop)
+	
+	# get data properties (OWL_DataProperty instances)
+	for d_prop in a_class.data_properties:
+		primitive = 'NSString'
+		prop_name = toObjCPropertyName(d_prop.name)
+		prop = {
+			'name': prop_name,
+			'setName': "set%s%s" % (prop_name[0].upper(), prop_name[1:]),
+			'uri': d_prop.uri,
+			'itemClass': primitive,
+			'useClass': 'NSArray' if d_prop.multiple_cardinality else primitive,
+			'strength': 'copy',
+			'_template': 'multi_literal_getter' if d_prop.multiple_cardinality else 'literal_getter',
+			'_multiple': d_prop.multiple_cardinality,
+		}
+		
+		# single literals with a numeric or date range get a typed property, the string stays available as "<name>String"
+		typed = _typed_literals.get(getattr(d_prop, 'range', None))
+		if typed and not d_prop.multiple_cardinality:
+			literal_name = '%sString' % prop_name
+			prop['itemClass'] = prop['useClass'] = typed[0]
+			prop['strength'] = 'strong'
+			prop['fromLiteral'] = typed[1]
+			prop['toLiteral'] = typed[2]
+			if 'NSDate' == typed[0]:
+				prop['toLiteralDatatype'] = ' datatype:@"%s"' % d_prop.range		# xsd:date literals have no time
+			prop['literalName'] = literal_name
+			prop['setLiteralName'] = "set%s%s" % (literal_name[0].upper(), literal_name[1:])
+			prop['_header'] = 'typed_property_header'
+			prop['_template'] = 'typed_literal_getter'
+		
+		my_properties.append(prop)
+	
+	# sort property dicts and assign them their slot in the predicate table
+	my_properties = sorted(my_properties, key=lambda k: k['name'])
+	for idx, prop in enumerate(my_properties):
+		prop['index'] = str(idx)
+		prop['predicate'] = '%sPredicate(%d)' % (class_name, idx)
+	
+	# the input of the class files, mark_classes_to_render() compares it to the last run
+	myDict['_digest'] = input_digest(myDict['CLASS_SUPERCLASS'], myDict['RDF_TYPE'], myDict['EXAMPLE'], base_path, sorted(c_forwards), my_properties, _inline_accessors)
+	myDict['_properties'] = my_properties
+	
+	# base path
+	if base_path:
+		# we need to convert "allergy_id", "medication_id" and the like to "uuid"
+		myDict['_base_path'] = re.sub(r'(\{record_id\}/\w+/\{\s*)[a-z]+_id(\})', '\g<1>uuid\g<2>', base_path)
+	
+	# add forwards to our dict
+	myDict['CLASS_FORWARDS'] = '@class %s;' % ', '.join(sorted(c_forwards)) if len(c_forwards) > 0 else ''
+	
+	# calls for this class (SMART_API_Call instances)
+	if a_class.calls and len(a_class.calls) > 0:
+		for api in a_class.calls:
+			handle_class_method(class_name, api)
+	
+	_class_dicts.append(myDict)
+	
+	return [o_prop.to_class for o_prop in a_class.object_properties]
+
+
+def mark_classes_to_render(class_dicts):
+	""" Decides for every class dictionary whether its class files need rendering, from its input digest and the class
+	templates, so a class does not have to be resolved again when only the templates changed.
+	"""
+	version = template_version('ClassTemplate.h', 'ClassTemplate.m')
+	for class_dict in class_dicts:
+		class_name = class_dict['CLASS_NAME']
+		class_paths = [os.path.join(_generated_classes_dir, '%s.%s' % (class_name, ext)) for ext in ['h', 'm']]
+		class_dict['_render'] = needs_rendering(class_name, input_digest(version, class_dict['_digest']), class_paths)
+
+
+def render_class(class_dict):
+	""" Applies the properties of a class dictionary created by handle_class() to the templates, writes the class files
+	and the RDF example and synthesizes the unit test.
+	
+	Only depends on the dictionary and the templates, so it can run in a worker process. Returns a tuple with the class
+	name, the unit test method (or None), the performance test method (or None), whether the example was written, whether
+	the class was rendered and whether class files were written.
+	"""
+	render = class_dict['_render']
+	prop_statements = []
+	prop_getter = []
+	
+	# apply property dicts to the templates
+	my_property_tests = []
+	my_property_touches = []
+	for prop in class_dict['_properties']:
+		if render:
+			stmt = apply_template(prop.get('_header', 'property_header'), prop)
+			prop_statements.append(stmt)
+			
+			getter = apply_template(prop['_template'] if _inline_accessors else 'thin_%s' % prop['_template'], prop)
+			prop_getter.append(getter)
+		
+		# prepare unit test syntax
+		item_prop = 'item.%s' % prop['name']
+		item_comment = '@"Expecting \\\"%s\\\" to be of class %s, but is %%@"' % (prop['name'], prop['useClass'])
+		item_class = 'NSStringFromClass([%s class])' % item_prop
+		item_test = 'STAssertTrue(!%s || [%s isKindOfClass:[%s class]], %s, %s)' % (item_prop, item_prop, prop['useClass'], item_comment, item_class)
+		my_property_tests.append(item_test)
+		
+		# performance tests read every property, typed literals also convert their string
+		my_property_touches.append('(void)item.%s' % prop['name'])
+	
+	# predicate table
+	if render and len(class_dict['_properties']) > 0:
+		predicates = []
+		for idx, prop in enumerate(class_dict['_properties']):
+			predicates.append('\t\t%sPredicates[%d] = [RedlandNode nodeWithURIString:@"%s"];' % (class_dict['CLASS_NAME'], idx, prop['uri']))
+		
+		class_dict['CLASS_PREDICATES'] = apply_template('predicate_table', {
+			'CLASS_NAME': class_dict['CLASS_NAME'],
+			'count': str(len(predicates)),
+			'predicates': "\n".join(predicates),
+		})
+	
+	# hydration method, reading all properties with one query, the snapshot methods writing and reading them by index and
+	# the stream decoding method taking them from the values of a decoded node by predicate
+	if render and len(class_dict['_properties']) > 0:
+		declarations = []
+		cases = []
+		assignments = []
+		writes = []
+		restores = []
+		restore_assignments = []
+		takes = []
+		for prop in class_dict['_properties']:
+			kind = 'multi' if prop['_multiple'] else 'single'
+			
+			# typed literals read their string, it is converted on first access
+			if 'literalName' in prop:
+				prop = dict(prop, name=prop['literalName'], itemClass='NSString', _template='literal_getter')
+			declarations.append(apply_template('hydrate_%s_declaration' % kind, prop))
+			cases.append(apply_template(prop['_template'].replace('_getter', '_hydrate'), prop))
+			assignments.append(apply_template('hydrate_%s_assignment' % kind, prop))
+			writes.append(apply_template(prop['_template'].replace('_getter', '_snapshot'), prop))
+			restores.append(apply_template(prop['_template'].replace('_getter', '_restore'), prop))
+			restore_assignments.append(apply_template('restore_%s_assignment' % kind, prop))
+			takes.append(apply_template(prop['_template'].replace('_getter', '_decode'), prop))
+		
+		class_dict['CLASS_HYDRATION'] = apply_template('hydrate_method', {
+			'CLASS_NAME': class_dict['CLASS_NAME'],
+			'declarations': "\n".join(declarations),
+			'cases': "\n".join(cases),
+			'assignments': "\n".join(assignments),
+		})
+		class_dict['CLASS_SNAPSHOT'] = apply_template('snapshot_methods', {
+			'writes': "\n".join(writes),
+			'cases': "\n".join(restores),
+			'assignments': "\n".join(restore_assignments),
+		})
+		class_dict['CLASS_DECODING'] = apply_template('decode_method', {
+			'takes': "\n".join(takes),
+			'assignments': "\n".join(restore_assignments),
+		})
+	
+	# base path
+	if render and class_dict.get('_base_path'):
+		class_dict['BASE_PATH'] = apply_template('class_base_path_getter', {'base_path': class_dict['_base_path']})
+	
+	# add properties to our dict
+	class_dict['CLASS_PROPERTIES'] = "\n\n".join(prop_statements)
+	class_dict['CLASS_GETTERS'] = "\n\n".join(prop_getter)
+	if len(my_property_tests) > 0:
+		class_dict['ITEM_TESTS'] = ";\n\t\t".join(my_property_tests)
+		class_dict['ITEM_TOUCHES'] = ";\n\t\t".join(my_property_touches)
+	
+	# output the RDF example for the class
+	wrote_example = write_class_example(class_dict, _overwrite)
+	
+	# synthesize unit tests
+	with profiled('step', 'test synthesis'):
+		unit_test = synthesize_class_tests(class_dict)
+		performance_test = synthesize_performance_test(class_dict)
+	
+	# write class files
+	wrote_class = write_class(class_dict, _overwrite) if render else False
+	
+	return class_dict['CLASS_NAME'], unit_test, performance_test, wrote_example, render, wrote_class
+
+
+def render_class_profiled(class_dict):
+	""" Runs render_class() and returns its result along with the timings recorded meanwhile, so that they are not lost
+	when rendering in a worker process.
+	"""
+	global _timings
+	outer = _timings
+	_timings = {}
+	try:
+		with profiled('render', class_dict['CLASS_NAME']):
+			result = render_class(class_dict)
+		return result, _timings
+	finally:
+		_timings = outer
+
+
+def render_classes(class_dicts, jobs=1):
+	""" Renders all given class dictionaries with render_class(), using a pool of "jobs" worker processes if more than one.
+	
+	Results are returned in the order of "class_dicts", so the output does not depend on the number of jobs.
+	"""
+	render = render_class_profiled if _profile else render_class
+	if jobs > 1 and len(class_dicts) > 1:
+		import multiprocessing
+		pool = multiprocessing.Pool(min(jobs, len(class_dicts)))
+		try:
+			results = pool.map(render, class_dicts)
+		finally:
+			pool.close()
+			pool.join()
+	else:
+		results = [render(class_dict) for class_dict in class_dicts]
+	
+	if _profile:
+		for result, timings in results:
+			merge_timings(timings)
+		results = [result for result, timings in results]
+	
+	return results
+
+
+def write_category(category_class, category_name, method_sigs, methods, statics=None):
+	""" Writes the .h and .m file of a category from the given method signatures and methods,
+	returns True if stuff was written. "statics" is put in front of the implementation, for
+	static tables and functions the methods use.
+	"""
+	written = False
+	now = datetime.date.today()
+	d = {
+		'CATEGORY_CLASS': category_class,
+		'CATEGORY_NAME': category_name,
+		'CATEGORY_STATICS': statics,
+		'METHOD_SIGNATURES': "\n".join(method_sigs),
+		'FULL_METHODS': "\n\n".join(methods),
+		'AUTHOR': __file__,
+		'DATE': str(now),
+		'YEAR': str(now.year),
+	}
+	
+	category = '%s+%s' % (category_class, category_name)
+	path_h = os.path.join(_generated_classes_dir, '%s.h' % category)
+	path_m = os.path.join(_generated_classes_dir, '%s.m' % category)
+	version = template_version('CategoryTemplate.h', 'CategoryTemplate.m')
+	if needs_rendering(category, input_digest(version, d['CATEGORY_STATICS'], d['METHOD_SIGNATURES'], d['FULL_METHODS']), [path_h, path_m]):
+		
+		# write the header
+		if _overwrite or not os.path.exists(path_h):
+			header = apply_template('CategoryTemplate.h', d)
+			written = write_file(path_h, header)
+		
+		# finish the implementation
+		if _overwrite or not os.path.exists(path_m):
+			implem = apply_template('CategoryTemplate.m', d)
+			written = write_file(path_m, implem) or written
+	
+	_generated_categories.append(category)
+	if written:
+		print '--> Wrote category %s on %s' % (category_name, category_class)
+	
+	return written
+
+
+def write_umbrella(name, path, template_name, lines):
+	""" Writes a file that consists of the given lines, like the header importing all classes, with the given template.
+	Returns True if the file was written.
+	"""
+	now = datetime.date.today()
+	d = {
+		'IMPORTS': "\n".join(lines),
+		'AUTHOR': __file__,
+		'DATE': str(now),
+		'YEAR': str(now.year),
+	}
+	
+	if needs_rendering(name, input_digest(template_version(template_name), lines), [path]):
+		if _overwrite or not os.path.exists(path):
+			return write_file(path, apply_template(template_name, d))
+	
+	return False
+
+
+def snapshot_schema_hash(class_dicts):
+	""" Returns a digest over what binary snapshots depend on: the order of the classes and the index, name and kind of
+	their properties.
+	"""
+	schema = []
+	for class_dict in sorted(class_dicts, key=lambda d: d['RDF_TYPE']):
+		properties = [(prop.get('literalName', prop['name']), prop['uri'], prop['_template']) for prop in class_dict['_properties']]
+		schema.append((class_dict['CLASS_NAME'], class_dict['RDF_TYPE'], properties))
+	
+	return hashlib.sha1(json.dumps(schema, sort_keys=True)).hexdigest()
+
+
+def objc_string(string):
+	"""Returns an Objective-C string literal for the given string."""
+	escaped = string.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+	return '@"%s"' % escaped
+
+
+def code_system_tables(valid_values):
+	""" Returns the static tables and lookup functions, the method signatures and the methods of the SMCodedValue category
+	that looks up the valid values of the code systems, None if no code system has valid values.
+	
+	The system of a code is the part of its URI before the "#", the URI of the code class it belongs to if it has no
+	fragment; the ontology does not always name the code classes like the systems of their codes.
+	
+	The codes are grouped by system and sorted within every system so they can be found with a binary search. Sorting is by
+	UTF-16 code units, which is the order NSLiteralSearch compares in.
+	"""
+	by_system = {}
+	for identifier, values in valid_values.iteritems():
+		for code, title in (values or {}).iteritems():
+			system = code.split('#', 1)[0] if '#' in code else identifier
+			by_system.setdefault(system, {})[code] = title
+	valid_values = by_system
+	
+	utf16 = lambda s: unicode(s).encode('utf-16-be')
+	systems = sorted(valid_values.keys(), key=utf16)
+	if len(systems) < 1:
+		return None, None, None
+	
+	starts = []
+	codes = []
+	titles = []
+	for system in systems:
+		starts.append(len(codes))
+		for code in sorted(valid_values[system], key=utf16):
+			codes.append(code)
+			titles.append(valid_values[system][code])
+	starts.append(len(codes))
+	order = sorted(range(len(codes)), key=lambda i: (utf16(codes[i]), i))
+	
+	counts = {'system_count': str(len(systems)), 'code_count': str(len(codes))}
+	statics = apply_template('code_system_tables', dict(counts,
+		systems="\n".join(['\t%s,' % objc_string(system) for system in systems]),
+		starts=', '.join([str(start) for start in starts]),
+		codes="\n".join(['\t%s,' % objc_string(code) for code in codes]),
+		titles="\n".join(['\t%s,' % objc_string(title) for title in titles]),
+		order=', '.join([str(i) for i in order]),
+	))
+	sigs = [
+		'+ (BOOL)isValidCode:(NSString *)code;',
+		'+ (BOOL)isValidCode:(NSString *)code inSystem:(NSString *)system;',
+		'+ (NSString *)titleForCode:(NSString *)code;',
+		'+ (NSString *)titleForCode:(NSString *)code inSystem:(NSString *)system;',
+		'+ (NSArray *)codeSystems;',
+		'- (BOOL)hasValidCodeInSystem:(NSString *)system;',
+	]
+	return statics, sigs, [apply_template('code_system_methods', counts)]
+
+
+def write_python_package(directory, class_dicts):
+	""" Writes the Python package with the classes of the given class dictionaries and its runtime to "directory",
+	returns the number of files written.
+	"""
+	if not os.path.exists(directory):
+		os.makedirs(directory)
+	
+	classes = []
+	for class_dict in sorted(class_dicts, key=lambda d: d['CLASS_NAME']):
+		properties = []
+		names = []
+		for prop in class_dict['_properties']:
+			multiple = ', multiple=True' if prop['_multiple'] else ''
+			if 'literalName' in prop:
+				convert = 'number_from_literal' if 'NSNumber' == prop['itemClass'] else 'date_from_literal'
+				properties.append(apply_template('python_typed_literal', dict(prop, convert=convert)))
+				names.extend([prop['literalName'], prop['name']])
+			elif 'model' in prop['_template']:
+				properties.append(apply_template('python_model', dict(prop, multiple=multiple)))
+				names.append(prop['name'])
+			else:
+				properties.append(apply_template('python_literal', dict(prop, multiple=multiple)))
+				names.append(prop['name'])
+		
+		quoted = ["'%s'" % name for name in names]
+		classes.append(apply_template('python_class', {
+			'CLASS_NAME': class_dict['CLASS_NAME'],
+			'RDF_TYPE': class_dict['RDF_TYPE'],
+			'base_path': "u'%s'" % class_dict['_base_path'] if class_dict.get('_base_path') else 'None',
+			'slots': ', '.join(["'_%s'" % name for name in names]) + (',' if len(names) == 1 else ''),
+			'property_names': ', '.join(quoted) + (',' if len(names) == 1 else ''),
+			'properties': "\n".join(properties),
+		}))
+	
+	now = datetime.date.today()
+	d = {
+		'CLASSES': "\n\n\n".join(classes),
+		'AUTHOR': __file__,
+		'DATE': str(now),
+		'YEAR': str(now.year),
+	}
+	
+	written = 0
+	for name, template_name, content in [('__init__.py', 'PythonPackage.py', d['CLASSES']), ('runtime.py', 'PythonRuntime.py', '')]:
+		path = os.path.join(directory, name)
+		if needs_rendering('python/%s' % name, input_digest(template_version(template_name), content), [path]):
+			if _overwrite or not os.path.exists(path):
+				if write_file(path, apply_template(template_name, d)):
+					written += 1
+	
+	return written
+
+
+def write_record_calls(path, calls):
+	""" Writes the given record calls as JSON, with the rdf:type and example RDF file of the class they return, returns
+	True if the file was written.
+	"""
+	classes = dict((d['CLASS_NAME'], d) for d in _class_dicts)
+	listed = []
+	for api in sorted(calls, key=lambda a: a['path']):
+		class_dict = classes.get(api['item_class'], {})
+		listed.append({
+			'name': api['orig_name'],
+			'http_method': api['http_method'],
+			'path': api['path'],
+			'item_class': api['item_class'],
+			'rdf_type': class_dict.get('RDF_TYPE'),
+			'example': '%s.rdf' % api['item_class'] if class_dict.get('EXAMPLE') else None,
+			'parameters': api.get('parameters', []),
+		})
+	
+	content = json.dumps(listed, indent=1, separators=(',', ': '), sort_keys=True) + '\n'
+	if needs_rendering('record-calls', input_digest(content), [path]):
+		if _overwrite or not os.path.exists(path):
+			return write_file(path, content)
+	
+	return False
+
+
+def synthesize_fixture(class_dicts, class_name, items, seed):
+	""" Returns an RDF/XML document with "items" instances of the class, built from the class examples.
+	
+	Every instance is a copy of the example with a new rdf:about, and so are the record-scoped nodes and blank nodes in
+	it, while codes stay shared. Model properties are filled with new instances of their class, linked by rdf:resource, a
+	random number of up to _fixture_fanout of them for multiple properties and down to _fixture_depth levels; classes
+	without an example get a node with made-up literals. References to the example of the linking instance, like a
+	fulfillment's medication, are pointed to the new instance. The same seed always gives the same document.
+	"""
+	about = '{%s}about' % _ns_rdf
+	resource = '{%s}resource' % _ns_rdf
+	node_id = '{%s}nodeID' % _ns_rdf
+	classes = dict((d['CLASS_NAME'], d) for d in class_dicts)
+	examples = {}				# { class name: (example node, namespaces) }
+	rnd = random.Random(seed)
+	root = etree.Element('{%s}RDF' % _ns_rdf)
+	root.text = '\n'
+	counter = [0]
+	
+	def example(name):
+		"""The top level node of the class' type in its example, None if there is no usable example."""
+		if name not in examples:
+			examples[name] = (None, [])
+			class_dict = classes.get(name)
+			rdf = class_dict.get('EXAMPLE') if class_dict else None
+			if rdf:
+				if isinstance(rdf, unicode):
+					rdf = rdf.encode('utf-8')
+				try:
+					namespaces = [ns for event, ns in etree.iterparse(StringIO(rdf), events=('start-ns',))]
+					for node in etree.fromstring(rdf):
+						if node_is_of_type(node, class_dict['RDF_TYPE']):
+							examples[name] = (node, namespaces)
+							break
+				except SyntaxError:
+					pass
+		return examples[name][0]
 	
-	# add our class to the known classes dict
-	_known_classes[identifier] = class_name
+	def skeleton(name):
+		"""A node of the class' type with all its literal properties made up, for classes without an example."""
+		class_dict = classes[name]
+		node = etree.Element(tag_for(class_dict['RDF_TYPE']))
+		node.set(about, 'urn:fixture:%s' % name)
+		for prop in class_dict['_properties']:
+			if 'model' not in prop['_template']:
+				literal = etree.SubElement(node, tag_for(prop['uri']))
+				if 'NSDate' == prop['itemClass']:
+					literal.text = '%04d-%02d-%02dT%02d:00:00Z' % (rnd.randint(1990, 2012), rnd.randint(1, 12), rnd.randint(1, 28), rnd.randint(0, 23))
+				elif 'NSNumber' == prop['itemClass']:
+					literal.text = str(rnd.randint(1, 500))
+				else:
+					literal.text = '%s %d' % (prop['name'], rnd.randint(1, 9999))
+		return node
 	
-	c_forwards = set()
-	prop_statements = []
-	prop_getter = []
+	def template(name):
+		"""The node instances of the class are copied from."""
+		if example(name) is not None:
+			return example(name)
+		return skeleton(name) if name in classes else None
 	
-	# get properties that represent other classes (OWL_ObjectProperty instances)
-	my_properties = []
-	for o_prop in a_class.object_properties:
-		# o_prop.multiple_cardinality	  ->  Bool whether the property can have multiple items
-		# o_prop.to_class				  ->  SMART_Class represented by the property
-		# o_prop.to_class.name			  ->  The name of the class
-		# o_prop.to_class.uri	  		  ->  Class URI
-		
-		# handle the property class
-		itemClass, valid = handle_class(o_prop.to_class)
-		prop_class_id = str(o_prop.to_class.uri)
+	def add_instance(name, linked_from, linked_example, depth):
+		"""Appends a new instance of the class to the document and returns its URI."""
+		node = copy.deepcopy(template(name))
+		counter[0] += 1
+		suffix = '-%d' % counter[0]
+		original = node.get(about)
 		
-		c_forwards.add(itemClass)
-		prop_name = toObjCPropertyName(o_prop.name);
-		prop = {
-			'name': prop_name,
-			'setName': "set%s%s" % (prop_name[0].upper(), prop_name[1:]),
-			'uri': o_prop.uri,
-			'itemClass': itemClass,
-			'useClass': 'NSArray' if o_prop.multiple_cardinality else itemClass,
-			'strength': 'copy' if o_prop.multiple_cardinality else 'strong',
-			'_template': 'multi_model_getter' if o_prop.multiple_cardinality else 'model_getter'
-		}
+		# rename the instance, the record-scoped nodes in it and its blank nodes
+		renamed = {original: (original or 'urn:fixture:%s' % name) + suffix}
+		for elem in node.iter():
+			if elem.get(about) and '/records/' in elem.get(about):
+				renamed.setdefault(elem.get(about), elem.get(about) + suffix)
+		for elem in node.iter():
+			if elem.get(about) in renamed:
+				elem.set(about, renamed[elem.get(about)])
+			if elem.get(node_id) is not None:
+				elem.set(node_id, elem.get(node_id) + suffix)
+			ref = elem.get(resource)
+			if ref is not None:
+				if linked_example is not None and ref == linked_example:
+					elem.set(resource, linked_from)
+				elif ref in renamed:
+					elem.set(resource, renamed[ref])
+		uri = renamed[original]
+		node.tail = '\n'
+		root.append(node)
 		
+		# fill model properties
+		if depth > 0:
+			for prop in classes[name]['_properties']:
+				if 'model' not in prop['_template'] or prop['itemClass'] not in classes:
+					continue
+				tag = tag_for(prop['uri'])
+				if not prop['_multiple'] and node.find(tag) is not None:
+					continue
 				
-		# if we have valid values, write a nice comment
-		if prop_class_id in _valid_values:
-			comment = "///\n///  The codes in this property should be:\n///\n"
-			
-			for key, val in _valid_values[prop_class_id].iteritems():
-				comment += "///  - \"%s\": \t%s\n" % (key, val)
-			
-			prop['add_comment'] = comment
-		
-		my_properties.append(prop)
-	
-	# get data properties (OWL_DataProperty instances)
-	for d_prop in a_class.data_properties:
-		primitive = 'NSString'			# TODO: When to use NSNumber or NSDate?
-		prop_name = toObjCPropertyName(d_prop.name)
-		prop = {
-			'name': prop_name,
-			'setName': "set%s%s" % (prop_name[0].upper(), prop_name[1:]),
-			'uri': d_prop.uri,
-			'itemClass': primitive,
-			'useClass': 'NSArray' if d_prop.multiple_cardinality else primitive,
-			'strength': 'copy',
-			'_template': 'multi_literal_getter' if d_prop.multiple_cardinality else 'literal_getter'
-		}
-		my_properties.append(prop)
-	
-	# sort and apply property dicts to the templates
-	my_properties = sorted(my_properties, key=lambda k: k['name'])
-	my_property_tests = []
-	for prop in my_properties:
-		stmt = apply_template(_templates['property_header'], prop)
-		prop_statements.append(stmt)
-		
-		getter = apply_template(_templates[prop['_template']], prop)
-		prop_getter.append(getter)
+				for i in xrange(rnd.randint(1, _fixture_fanout) if prop['_multiple'] else 1):
+					link = etree.SubElement(node, tag)
+					link.set(resource, add_instance(prop['itemClass'], uri, original, depth - 1))
+					link.tail = '\n'
 		
-		# prepare unit test syntax
-		item_prop = 'item.%s' % prop['name']
-		item_comment = '@"Expecting \\\"%s\\\" to be of class %s, but is %%@"' % (prop['name'], prop['useClass'])
-		item_class = 'NSStringFromClass([%s class])' % item_prop
-		item_test = 'STAssertTrue(!%s || [%s isKindOfClass:[%s class]], %s, %s)' % (item_prop, item_prop, prop['useClass'], item_comment, item_class)
-		my_property_tests.append(item_test)
-	
-	# base path
-	if base_path:
-		# we need to convert "allergy_id", "medication_id" and the like to "uuid"
-		base_path = re.sub(r'(\{record_id\}/\w+/\{\s*)[a-z]+_id(\})', '\g<1>uuid\g<2>', base_path)
-		t_base = apply_template(_templates['class_base_path_getter'], {'base_path': base_path})
-		myDict['BASE_PATH'] = t_base
-	
-	# add properties to our dict
-	myDict['CLASS_FORWARDS'] = '@class %s;' % ', '.join(sorted(c_forwards)) if len(c_forwards) > 0 else ''
-	myDict['CLASS_PROPERTIES'] = "\n\n".join(prop_statements)
-	myDict['CLASS_GETTERS'] = "\n\n".join(prop_getter)
-	if len(my_property_tests) > 0:
-		myDict['ITEM_TESTS'] = ";\n\t\t".join(my_property_tests)
+		return uri
 	
-	# calls for this class (SMART_API_Call instances)
-	if a_class.calls and len(a_class.calls) > 0:
-		for api in a_class.calls:
-			handle_class_method(class_name, api)
+	if example(class_name) is None:
+		return None
 	
-	# output the RDF example for the class
-	if write_class_example(myDict, _overwrite):
-		print '--> Wrote %s example' % class_name
+	for i in xrange(items):
+		add_instance(class_name, None, None, _fixture_depth)
+	for name in sorted(examples.keys()):
+		for prefix, uri in examples[name][1]:
+			etree.register_namespace(prefix, uri)
 	
-	# collect unit tests
-	global class_tests
-	unit_test = synthesize_class_tests(myDict)
-	if unit_test is not None:
-		class_tests.append(unit_test)
+	return '<?xml version="1.0" encoding="utf-8"?>\n%s\n' % etree.tostring(root, encoding='utf-8')
+
+
+def tag_for(uri):
+	""" The ElementTree tag of RDF/XML elements standing for the given class or property URI.
+	"""
+	split = uri.rfind('#') + 1 or uri.rfind('/') + 1
+	return '{%s}%s' % (uri[:split], uri[split:])
+
+
+def node_is_of_type(node, rdf_type):
+	""" Whether the RDF/XML node element is of the given rdf:type, either by its tag or by an rdf:type child.
+	"""
+	if node.tag == tag_for(rdf_type):
+		return True
+	for child in node.findall('{%s}type' % _ns_rdf):
+		if rdf_type == child.get('{%s}resource' % _ns_rdf):
+			return True
+	return False
+
+
+def write_fixtures(directory, class_dicts, scale, seed):
+	""" Writes the fixtures listed in _fixtures, with their number of items multiplied by "scale", to "directory",
+	returns the number of files written.
+	"""
+	if not os.path.exists(directory):
+		os.makedirs(directory)
 	
-	# write class files
-	if write_class(myDict, _overwrite):
-		print '--> Wrote class %s' % class_name
+	written = 0
+	for name, class_name, items in _fixtures:
+		items = max(1, int(round(items * scale)))
+		rdf = synthesize_fixture(class_dicts, class_name, items, seed)
+		if rdf is None:
+			print 'xx> No example for %s, cannot synthesize fixture %s' % (class_name, name)
+			continue
+		
+		if write_file(os.path.join(directory, '%s.rdf' % name), rdf):
+			print '--> Wrote fixture %s with %d %s items' % (name, items, class_name)
+			written += 1
 	
-	return class_name, None
+	return written
 
 
 def write_class(class_dict, overwrite=False):
@@ -496,22 +2355,17 @@ def write_class(class_dict, overwrite=False):
 	filename_h = '%s.h' % class_dict['CLASS_NAME']
 	path_h = os.path.join(_generated_classes_dir, filename_h)
 	if overwrite or not os.path.exists(path_h):
-		header = apply_template(_templates['ClassTemplate.h'], class_dict)
-		if header:
-			handle = open(path_h, 'w')
-			handle.write(header)
+		header = apply_template('ClassTemplate.h', class_dict)
+		if header and write_file(path_h, header):
 			written = True
 	
 	# write the implementation
 	filename_m = '%s.m' % class_dict['CLASS_NAME']
 	path_m = os.path.join(_generated_classes_dir, filename_m)
 	if overwrite or not os.path.exists(path_m):
-		implem = apply_template(_templates['ClassTemplate.m'], class_dict)
-		if implem:
-			handle = open(path_m, 'w')
-			handle.write(implem)
+		implem = apply_template('ClassTemplate.m', class_dict)
+		if implem and write_file(path_m, implem):
 			written = True
-			_classes_written.append(class_dict['CLASS_NAME'])
 	
 	return written
 
@@ -532,9 +2386,7 @@ def write_class_example(class_dict, overwrite=False):
 	# write the RDF
 	path_e = os.path.join(_class_examples_dir, '%s.%s' % (class_dict['CLASS_NAME'], 'rdf'))
 	if overwrite or not os.path.exists(path_e):
-		handle = open(path_e, 'w')
-		handle.write(class_dict['EXAMPLE'])
-		return True
+		return write_file(path_e, class_dict['EXAMPLE'])
 	
 	return False
 
@@ -554,12 +2406,24 @@ def synthesize_class_tests(class_dict):
 	
 	# generate unit tests
 	if 'ITEM_TESTS' in class_dict and len(class_dict['ITEM_TESTS']) > 0:
-		test_method = apply_template(_templates['class_unit_test'], class_dict)
+		test_method = apply_template('class_unit_test', class_dict)
 		#print "----\n%s\n----" % test_method
 	
 	return test_method
 
 
+def synthesize_performance_test(class_dict):
+	""" Generates an Objective-C method timing how long parsing the example and reading all properties takes
+	"""
+	if class_dict is None \
+		or not class_dict.get('EXAMPLE') \
+		or not class_dict.get('ITEM_TOUCHES'):
+		
+		return None
+	
+	return apply_template('class_performance_test', class_dict)
+
+
 def handle_class_method(class_name, api):
 	""" Handles API calls defined on a class.
 	This method just puts them into globals and lets the main exect handle them.
@@ -579,6 +2443,8 @@ def handle_class_method(class_name, api):
 			'path': str(api.path),
 			'nsstring_path': str(re.sub(r'(\{\s*\w+\s*\})', '%@', api.path)),
 			'description': str(api.description),
+			'parameters': call_parameters(api),
+			'parameter_types': call_parameter_types(api),
 		}
 		
 		# synthesize the method name:
@@ -619,6 +2485,190 @@ def handle_class_method(class_name, api):
 				cDict['method_name'] = '%s:%s' % (toObjCPropertyName(orig_name), block_arg)
 
 
+def record_call_variants(call):
+	""" Returns dictionaries for the "record_filtered_getter" and "record_paged_getter" templates of a record-level GET call
+	that accepts query parameters, an empty list if it accepts none.
+	
+	Every parameter becomes an argument: the paging parameters "limit" and "offset" are NSUInteger, parameters whose
+	datatype in the ontology has a typed property take that property's class (NSNumber or NSDate) and are sent as its
+	literal, all others take an NSString. The paged variant is only synthesized if the call takes both "limit" and "offset".
+	"""
+	if len(call.get('parameters', [])) < 1:
+		return []
+	
+	base_name = call['method_signature'][len('- (void)'):].split(':')[0]
+	block_arg = '(SMSuccessRetvalueBlock)callback'
+	types = call.get('parameter_types') or {}
+	
+	def arguments(names):
+		parts = []
+		docs = []
+		assignments = []
+		for name in names:
+			argument = toObjCPropertyName(name)
+			if name in ['limit', 'offset']:
+				arg_type = 'NSUInteger'
+				assignments.append(apply_template('record_parameter_integer', {'name': name, 'argument': argument}))
+			elif types.get(name) in _typed_literals:
+				typed = _typed_literals[types[name]]
+				arg_type = '%s *' % typed[0]
+				datatype = ' datatype:@"%s"' % types[name] if 'NSDate' == typed[0] else ''
+				value = '[SMObject %s:%s%s]' % (typed[2], argument, datatype)
+				assignments.append(apply_template('record_parameter_object', {'name': name, 'argument': argument, 'value': value}))
+			else:
+				arg_type = 'NSString *'
+				assignments.append(apply_template('record_parameter_object', {'name': name, 'argument': argument, 'value': argument}))
+			
+			label = '%sWith%s%s' % (base_name, argument[0].upper(), argument[1:]) if len(parts) < 1 else argument
+			parts.append('%s:(%s)%s' % (label, arg_type, argument))
+			docs.append(' *  @param %s Sent as "%s"' % (argument, name))
+		return parts, docs, assignments
+	
+	variants = []
+	parts, docs, assignments = arguments(call['parameters'])
+	filtered = dict(call)
+	filtered.update({
+		'template': 'record_filtered_getter',
+		'method_signature': '- (void)%s callback:%s' % (' '.join(parts), block_arg),
+		'parameter_docs': "\n".join(docs),
+		'parameter_assignments': "\n".join(assignments),
+	})
+	variants.append(filtered)
+	
+	if 'limit' in call['parameters'] and 'offset' in call['parameters']:
+		parts, docs, assignments = arguments([name for name in call['parameters'] if name not in ['limit', 'offset']])
+		page_label = 'pageSize' if len(parts) > 0 else '%sWithPageSize' % base_name
+		parts.append('%s:(NSUInteger)pageSize intoModel:(RedlandModel *)model pageCallback:(SMPageBlock)pageCallback' % page_label)
+		paged = dict(call)
+		paged.update({
+			'template': 'record_paged_getter',
+			'method_signature': '- (void)%s callback:%s' % (' '.join(parts), block_arg),
+			'parameter_docs': "\n".join(docs) if len(docs) > 0 else ' *',
+			'parameter_assignments': "\n".join(assignments),
+		})
+		variants.append(paged)
+	
+	return variants
+
+
+def write_file(path, content):
+	""" Writes content to the file at path if the file's bytes differ from it,
+	returns True if the file was written.
+	
+	Unchanged files are not touched so their modification date stays stable, changed files are written to a temporary file
+	first and then moved into place.
+	"""
+	with profiled('step', 'file I/O'):
+		if isinstance(content, unicode):
+			content = content.encode('utf-8')
+		
+		if os.path.exists(path):
+			with open(path, 'rb') as handle:
+				if handle.read() == content:
+					return False
+		
+		tmp_path = '%s.tmp' % path
+		with open(tmp_path, 'wb') as handle:
+			handle.write(content)
+		os.rename(tmp_path, path)
+		
+		return True
+
+
+def read_manifest():
+	""" Returns the manifest dictionary written by the last run, an empty dictionary if there is none.
+	"""
+	if not os.path.exists(_manifest_path):
+		return {}
+	
+	try:
+		with open(_manifest_path) as handle:
+			return json.load(handle)
+	except ValueError as e:
+		print 'xx> Ignoring unreadable manifest %s: %s' % (_manifest_path, e)
+	
+	return {}
+
+
+def write_manifest():
+	""" Writes the manifest for this run, returns True if it changed. With "--only" the entries of the outputs that were
+	left alone are kept.
+	"""
+	manifest = _manifest
+	if _only is not None:
+		manifest = dict(_old_manifest)
+		manifest.update(_manifest)
+	
+	return write_file(_manifest_path, json.dumps(manifest, indent=1, separators=(',', ': '), sort_keys=True) + '\n')
+
+
+def read_slices():
+	""" Returns the per-class parts of the shared files as written by the last run, an empty dictionary if there are none.
+	"""
+	if not os.path.exists(_slices_path):
+		return {}
+	
+	try:
+		with open(_slices_path) as handle:
+			return json.load(handle)
+	except ValueError as e:
+		print 'xx> Ignoring unreadable slices %s: %s' % (_slices_path, e)
+	
+	return {}
+
+
+def write_slices(slices):
+	""" Writes the per-class parts of the shared files, returns True if they changed.
+	"""
+	return write_file(_slices_path, json.dumps(slices, indent=1, separators=(',', ': '), sort_keys=True) + '\n')
+
+
+def template_version(*names):
+	""" Returns a digest over the template files with the given names, to be included in the input digest of the outputs
+	rendered with them; a change to one of these template files then only renders these outputs again.
+	"""
+	digest = hashlib.sha1()
+	for name in names:
+		digest.update(name)
+		digest.update(_template_versions.get(name, ''))
+	
+	return digest.hexdigest()
+
+
+def input_digest(*parts):
+	""" Returns a digest over the generator itself and the given JSON-serializable parts that make up the input of an output
+	file; any change to the generator, including the templates defined in it, may change every output file. Never include
+	the date here or every file changes every day.
+	"""
+	digest = hashlib.sha1(_generator_version or '')
+	digest.update(json.dumps(parts, sort_keys=True))
+	
+	return digest.hexdigest()
+
+
+def needs_rendering(name, digest, paths, overwrite=None):
+	""" Decides whether the output files for "name" at "paths" need to be rendered and records the input digest in the new
+	manifest.
+	
+	Outputs that are missing are always rendered. Existing outputs are only rendered when overwriting and if their input digest
+	differs from the one recorded in the manifest by the last run (or if "--full" is given).
+	"""
+	if overwrite is None:
+		overwrite = _overwrite
+	
+	missing = [p for p in paths if not os.path.exists(p)]
+	if not overwrite and len(missing) < len(paths):
+		if name in _old_manifest:
+			_manifest[name] = _old_manifest[name]
+		return len(missing) > 0
+	
+	_manifest[name] = digest
+	if len(missing) > 0 or _full:
+		return True
+	
+	return digest != _old_manifest.get(name)
+
+
 def read_template(template_name):
 	"""Looks for a template with the given filename and returns its contents"""
 	
@@ -630,41 +2680,450 @@ def read_template(template_name):
 	return open(template_path).read()
 
 
-def apply_template(template, subst):
-	"""Substitutes all values of the "subst" dictionary in the template with its
-	values
+def load_templates(names):
+	"""Reads the template files with the given names into "_templates", returns the names of those whose contents changed or
+	None if a template could not be read, in which case no template is replaced.
 	"""
 	
-	if not template:
-		print 'xx> No template given'
-		return None
+	templates = {}
+	for name in names:
+		template = read_template(name)
+		if template is None:
+			print 'xx> Failed to load template %s' % name
+			return None
+		templates[name] = template
+	
+	changed = []
+	for name in names:
+		if templates[name] != _templates.get(name):
+			_templates[name] = templates[name]
+			_template_versions[name] = hashlib.sha1(templates[name]).hexdigest()
+			_compiled_templates.pop(name, None)
+			changed.append(name)
+	
+	return changed
+
+
+def compile_template(template):
+	"""Splits a template into its literal chunks and placeholder slots.
+	
+	Returns a tuple with a list of n + 1 literal chunks and a list of the n placeholder names found between them, so that rendering
+	becomes a single join over the chunks and their substituted slots.
+	"""
+	
+	chunks = []
+	slots = []
+	pos = 0
+	for match in _template_placeholder.finditer(template):
+		chunks.append(template[pos:match.start()])
+		slots.append(match.group(1).strip())
+		pos = match.end()
+	chunks.append(template[pos:])
+	
+	return chunks, slots
+
+
+def apply_template(template_name, subst):
+	"""Substitutes all values of the "subst" dictionary in the template with
+	the given name, placeholders without a value are removed.
+	
+	Templates are compiled on first use and cached in "_compiled_templates".
+	"""
+	
+	start = time.time() if _profile else None
+	compiled = _compiled_templates.get(template_name)
+	if compiled is None:
+		template = _templates.get(template_name)
+		if not template:
+			print 'xx> No template given'
+			return None
+		
+		compiled = compile_template(template)
+		_compiled_templates[template_name] = compiled
 	
-	# apply the known items
-	applied = template
-	for k, v in subst.iteritems():
-		applied = re.sub('\{\{\s*' + k + '\s*\}\}', v if v else '', applied)
+	# join literal chunks and substituted slots
+	chunks, slots = compiled
+	applied = [chunks[0]]
+	for i, slot in enumerate(slots):
+		val = subst.get(slot)
+		if val:
+			applied.append(val)
+		applied.append(chunks[i + 1])
 	
-	# remove unknown items
-	matches = re.findall('\{\{[^\}]+\}\}', applied)
-	if matches is not None:
-		for match in matches:
-			applied = applied.replace(match, '')
+	applied = ''.join(applied)
+	if start is not None:
+		record_timing('template', template_name, time.time() - start)
 	
 	return applied
 
 
+def record_timing(kind, name, seconds):
+	"""Adds "seconds" and one call to the timing of "name" of the given kind."""
+	timing = _timings.setdefault(kind, {}).setdefault(name, [0.0, 0])
+	timing[0] += seconds
+	timing[1] += 1
+
+
+def merge_timings(timings):
+	"""Adds timings recorded elsewhere, e.g. in a worker process, to ours."""
+	for kind, named in timings.iteritems():
+		for name, (seconds, calls) in named.iteritems():
+			timing = _timings.setdefault(kind, {}).setdefault(name, [0.0, 0])
+			timing[0] += seconds
+			timing[1] += calls
+
+
+@contextmanager
+def profiled(kind, name):
+	"""Records the wall time of the enclosed block under "name" of the given kind, if we are profiling."""
+	if not _profile:
+		yield
+		return
+	
+	if 'phase' == kind and name not in _phases:
+		_phases.append(name)
+	start = time.time()
+	try:
+		yield
+	finally:
+		record_timing(kind, name, time.time() - start)
+
+
+def profile_report(total, top=10):
+	"""Returns the profiling report dictionary and prints its summary, showing the "top" slowest classes and templates."""
+	def ranked(kind):
+		named = _timings.get(kind, {})
+		items = [{'name': name, 'seconds': round(t[0], 6), 'calls': t[1]} for name, t in named.iteritems()]
+		return sorted(items, key=lambda i: (-i['seconds'], i['name']))
+	
+	# combine resolving and rendering per class
+	classes = {}
+	for step in ['resolve', 'render']:
+		for name, t in _timings.get(step, {}).iteritems():
+			classes.setdefault(name, {'name': name, 'resolve': 0.0, 'render': 0.0, 'seconds': 0.0})
+			classes[name][step] = round(t[0], 6)
+			classes[name]['seconds'] = round(classes[name]['seconds'] + t[0], 6)
+	
+	phases = dict((p['name'], p) for p in ranked('phase'))
+	report = {
+		'total': round(total, 6),
+		'jobs': _jobs,
+		'phases': [phases[name] for name in _phases if name in phases],
+		'steps': ranked('step'),
+		'classes': sorted(classes.values(), key=lambda c: (-c['seconds'], c['name'])),
+		'templates': ranked('template'),
+	}
+	
+	print '--> Profile, %.3f s total' % total
+	for p in report['phases']:
+		print '    %-28s %8.3f s' % (p['name'], p['seconds'])
+	for s in report['steps']:
+		print '    %-28s %8.3f s  %6d calls' % (s['name'], s['seconds'], s['calls'])
+	print '--> Slowest classes (resolve + render)'
+	for c in report['classes'][:top]:
+		print '    %-28s %8.3f s' % (c['name'], c['seconds'])
+	print '--> Slowest templates'
+	for t in report['templates'][:top]:
+		print '    %-28s %8.3f s  %6d calls' % (t['name'], t['seconds'], t['calls'])
+	
+	return report
+
+
+def resolve_classes(rdf_ontology):
+	""" Resolves the classes of the ontology into "_class_dicts", or the classes given with "--only" and the classes they
+	reach, after forgetting the classes resolved before. Returns the number of classes resolved.
+	"""
+	_known_classes.clear()
+	_valid_values.clear()
+	_resolved_classes.clear()
+	del _record_calls[:]
+	del _single_item_calls[:]
+	del _class_dicts[:]
+	num_classes = 0
+	
+	# loop all SMART_Class instances, the time of a class includes the classes it reaches that were not resolved before
+	with profiled('phase', 'resolve classes'):
+		for a_class in classes_to_resolve(rdf_ontology.api_types, _only):
+			resolve_start = time.time()
+			class_name = resolve_class(a_class)
+			if class_name is not None:
+				num_classes += 1
+				if _profile:
+					record_timing('resolve', class_name, time.time() - resolve_start)
+	
+	return num_classes
+
+
+def generate(rdf_ontology):
+	""" Renders and writes the resolved classes, their unit tests and the shared files, then the manifest; outputs whose
+	input did not change since the last run are not rendered. Returns the number of categories written.
+	"""
+	del _classes_written[:]
+	del _generated_categories[:]
+	_manifest.clear()
+	_old_manifest.clear()
+	_old_manifest.update(read_manifest())
+	
+	class_tests = []
+	performance_tests = []
+	calls = list(_record_calls)
+	num_calls = 0
+	mark_classes_to_render(_class_dicts)
+	
+	# render and write classes
+	with profiled('phase', 'render classes'):
+		rendered_classes = render_classes(_class_dicts, _jobs)
+	
+	slices = {}
+	for class_name, unit_test, performance_test, wrote_example, rendered, wrote_class in rendered_classes:
+		slices[class_name] = {
+			'unit_test': unit_test,
+			'performance_test': performance_test,
+			'record_calls': [api for api in _record_calls if class_name == api['item_class']],
+		}
+		if wrote_example:
+			print '--> Wrote %s example' % class_name
+		if unit_test is not None:
+			class_tests.append(unit_test)
+		if performance_test is not None:
+			performance_tests.append(performance_test)
+		if not rendered:
+			if _verbose:
+				print 'UNCHANGED   %s' % class_name
+		elif wrote_class:
+			print '--> Wrote class %s' % class_name
+			_classes_written.append(class_name)
+	
+	# with "--only" the other classes contribute the parts of the shared files remembered by the last run
+	shared = True
+	if _only is not None:
+		old_slices = read_slices()
+		if len(old_slices) < 1:
+			print 'xx> No parts of other classes in %s, run once without --only to write the unit tests and SMRecord+Calls' % _slices_path
+			shared = False
+		
+		for class_name, old in old_slices.iteritems():
+			if class_name not in slices:
+				slices[class_name] = old
+				if old.get('unit_test') is not None:
+					class_tests.append(old['unit_test'])
+				if old.get('performance_test') is not None:
+					performance_tests.append(old['performance_test'])
+				calls.extend(old.get('record_calls', []))
+		print '--> Rendered %d classes for %s' % (len(rendered_classes), ', '.join(sorted(_only)))
+	
+	# write unit tests
+	with profiled('phase', 'unit tests'):
+		class_tests = sorted(class_tests)
+		complete_tests = "\n\n".join(class_tests) if shared and len(class_tests) > 0 else None
+		if complete_tests is not None:
+			path_h = os.path.join(_class_unittests_dir, 'TestGeneratedClasses.h')
+			path_m = os.path.join(_class_unittests_dir, 'TestGeneratedClasses.m')
+			
+			if needs_rendering('TestGeneratedClasses', input_digest(template_version('UnitTestTemplate.h', 'UnitTestTemplate.m'), complete_tests), [path_h, path_m], True):
+				now = datetime.date.today()
+				test_dict = {
+					'COMPLETE_TEST_METHODS': complete_tests,
+					'AUTHOR': __file__,
+					'DATE': str(now),
+					'YEAR': str(now.year)
+				}
+				
+				header = apply_template('UnitTestTemplate.h', test_dict)
+				implem = apply_template('UnitTestTemplate.m', test_dict)
+				if write_file(path_h, header) | write_file(path_m, implem):
+					print '--> Wrote %d class unit tests' % len(class_tests)
+		
+		# performance tests of the same examples
+		performance_tests = sorted(performance_tests)
+		complete_tests = "\n\n".join(performance_tests) if shared and len(performance_tests) > 0 else None
+		if complete_tests is not None:
+			path_h = os.path.join(_class_unittests_dir, 'TestGeneratedPerformance.h')
+			path_m = os.path.join(_class_unittests_dir, 'TestGeneratedPerformance.m')
+			
+			if needs_rendering('TestGeneratedPerformance', input_digest(template_version('PerformanceTestTemplate.h', 'PerformanceTestTemplate.m'), complete_tests, _performance_repetitions, _performance_replicas), [path_h, path_m], True):
+				now = datetime.date.today()
+				test_dict = {
+					'COMPLETE_TEST_METHODS': complete_tests,
+					'REPETITIONS': str(_performance_repetitions),
+					'REPLICAS': str(_performance_replicas),
+					'AUTHOR': __file__,
+					'DATE': str(now),
+					'YEAR': str(now.year)
+				}
+				
+				header = apply_template('PerformanceTestTemplate.h', test_dict)
+				implem = apply_template('PerformanceTestTemplate.m', test_dict)
+				if write_file(path_h, header) | write_file(path_m, implem):
+					print '--> Wrote %d class performance tests' % len(performance_tests)
+	
+	# put record-scoped calls into a record category and write the registry (only GET needs synthesized methods)
+	with profiled('phase', 'categories'):
+		used_call_names = list(_single_item_calls)
+		record_sigs = []
+		record_calls = []
+		for api in calls:
+			if 'GET' == api['http_method']:
+				used_call_names.append(api['orig_name'])
+				call = apply_template('record_multi_item_getter', api)
+				
+				record_sigs.append('%s;' % api['method_signature'])
+				record_calls.append(call)
+				
+				# variants taking the call's filters and paging parameters
+				for variant in record_call_variants(api):
+					record_sigs.append('%s;' % variant['method_signature'])
+					record_calls.append(apply_template(variant['template'], variant))
+		
+		# prefetching all record GET calls at once
+		prefetchable = {}
+		for api in calls:
+			if 'GET' == api['http_method'] and api['orig_name'] not in prefetchable:
+				prefetchable[api['orig_name']] = '\t\t@"%s": @[[%s class], [NSString stringWithFormat:@"%s", self.record_id]],' % (api['orig_name'], api['item_class'], api['nsstring_path'])
+		if len(prefetchable) > 0:
+			record_sigs.append('- (NSDictionary *)prefetchableCalls;')
+			record_sigs.append('- (void)prefetch:(NSArray *)callNames callback:(SMSuccessRetvalueBlock)callback;')
+			record_calls.append(apply_template('record_prefetchable_calls', {'entries': "\n".join([prefetchable[name] for name in sorted(prefetchable)])}))
+			record_calls.append(apply_template('record_prefetch', {}))
+		
+		# warn about the api calls that we did ignore
+		if _verbose and _only is None:
+			for api in rdf_ontology.api_calls:
+				orig_name = api.guess_name()
+				if orig_name not in used_call_names:
+					print 'IGNORED API call: %s (level: %s)' % (orig_name, api.category)
+		
+		# write to SMRecord category
+		if shared and len(record_sigs) > 0:
+			if write_category('SMRecord', 'Calls', sorted(record_sigs), sorted(record_calls)):
+				num_calls += 1
+		
+		# list the record calls with their example RDF for the stand-in container
+		if _only is None and write_record_calls(_record_calls_file, [api for api in calls if 'GET' == api['http_method']]):
+			print '--> Wrote record calls to %s' % _record_calls_file
+		
+		# write the rdf:type registry to an SMObject category
+		registry = ['\t\t\t@"%s": [%s class],' % (d['RDF_TYPE'], d['CLASS_NAME']) for d in sorted(_class_dicts, key=lambda d: d['RDF_TYPE'])]
+		snapshot_classes = ['\t\t\t[%s class],' % d['CLASS_NAME'] for d in sorted(_class_dicts, key=lambda d: d['RDF_TYPE'])]
+		if _only is None and len(registry) > 0:
+			registry_sigs = [
+				'+ (Class)classForRDFType:(NSString *)rdfType;',
+				'+ (NSDictionary *)objectsInModel:(RedlandModel *)model;',
+				'+ (NSDictionary *)objectsFromStatements:(NSEnumerator *)statements inModel:(RedlandModel *)model;',
+				'+ (NSArray *)snapshotClasses;',
+				'+ (NSString *)snapshotSchemaHash;',
+			]
+			registry_methods = [
+				apply_template('registry_class_for_type', {'entries': "\n".join(registry)}),
+				apply_template('registry_objects_in_model', {}),
+				apply_template('registry_snapshot_classes', {'entries': "\n".join(snapshot_classes), 'hash': snapshot_schema_hash(_class_dicts)}),
+			]
+			if write_category('SMObject', 'Registry', registry_sigs, registry_methods):
+				num_calls += 1
+		
+		# static lookup tables of the valid values of the code systems
+		code_statics, code_sigs, code_methods = code_system_tables(_valid_values)
+		if _only is None and code_statics is not None:
+			if write_category('SMCodedValue', 'CodeSystems', code_sigs, code_methods, code_statics):
+				num_calls += 1
+	
+	# write the header importing all classes and the unity build
+	with profiled('phase', 'umbrella files'):
+		classnames = sorted(set(_known_classes.values()), key=lambda s: s.lower())
+		if _only is None and write_umbrella('SMARTObjects', _objects_header, 'ObjectsTemplate.h', ['#import "%s.h"' % name for name in classnames]):
+			print '--> Wrote %s' % _objects_header
+		
+		if _unity and _only is None:
+			implementations = sorted([d['CLASS_NAME'] for d in _class_dicts] + _generated_categories, key=lambda s: s.lower())
+			unity_path = os.path.join(_generated_classes_dir, _unity_file)
+			if write_umbrella('SMGeneratedClasses', unity_path, 'UnityTemplate.m', ['#import "%s.m"' % name for name in implementations]):
+				print '--> Wrote unity build %s' % unity_path
+	
+	# the Python package
+	if _python_dir is not None and _only is None:
+		with profiled('phase', 'python package'):
+			if write_python_package(_python_dir, _class_dicts) > 0:
+				print '--> Wrote Python package %s' % _python_dir
+	
+	# large RDF fixtures
+	if _write_fixtures and _only is None:
+		with profiled('phase', 'fixtures'):
+			write_fixtures(_fixtures_dir, _class_dicts, _fixture_scale, _fixture_seed)
+	
+	# remember what we rendered, and the parts of the shared files for later runs with "--only"
+	if shared:
+		write_slices(slices)
+	if write_manifest() and _verbose:
+		print '--> Wrote manifest %s' % _manifest_path
+	
+	return num_calls
+
+
+def input_mtimes(paths):
+	""" Returns a dictionary with the modification times of the files at the given paths, None for missing files.
+	"""
+	return dict((path, os.path.getmtime(path) if os.path.exists(path) else None) for path in paths)
+
+
+def watch(rdf_ontology, num_classes):
+	""" Renders again whenever a template file or the ontology source changes, until interrupted.
+	
+	Changed templates only render the outputs that use them again, the resolved classes are kept. A changed ontology is
+	loaded again, through the snapshot, and its classes resolved again; outputs whose input did not change are still not
+	rendered. A failing regeneration is reported and retried with the next change.
+	"""
+	ontology_path = _ontology_file or _ontology_source
+	template_names = dict((os.path.join(_template_dir, name), name) for name in _template_files)
+	mtimes = input_mtimes(template_names.keys() + [ontology_path])
+	resolved = True
+	
+	print '--> Watching %s and %s, stop with Ctrl-C' % (_template_dir, ontology_path)
+	try:
+		while True:
+			time.sleep(_watch_interval)
+			
+			# files being saved may be missing for a moment, we look at them again once they are back
+			current = input_mtimes(mtimes.keys())
+			changed = [path for path, mtime in current.iteritems() if mtime is not None and mtime != mtimes[path]]
+			if len(changed) < 1:
+				continue
+			
+			mtimes.update((path, current[path]) for path in changed)
+			started = time.time()
+			templates = load_templates([template_names[path] for path in changed if path in template_names])
+			if templates is None:
+				continue
+			
+			ontology_changed = ontology_path in changed
+			if len(templates) < 1 and not ontology_changed and resolved:
+				continue
+			
+			print '--> Changed %s' % ', '.join(sorted(templates + ([ontology_path] if ontology_changed else [])))
+			try:
+				if ontology_changed or not resolved:
+					resolved = False
+					rdf_ontology = load_ontology(_use_snapshot, _ontology_file)
+					num_classes = resolve_classes(rdf_ontology)
+					resolved = True
+				
+				num_calls = generate(rdf_ontology)
+				print '--> Regenerated in %.3f seconds: %d classes and %d categories processed, %d classes written.' % (time.time() - started, num_classes, num_calls, len(_classes_written))
+			except Exception as e:
+				print 'xx> Regeneration failed, waiting for the next change: %s' % e
+	except KeyboardInterrupt:
+		print '-> Stopped watching'
+
+
 if __name__ == "__main__":
 	"""Outputs Objective-C classes to be used in our iOS framework
 	"""
+	started = time.time()
 	
 	# grab the template files
-	for f in ['ClassTemplate.h', 'ClassTemplate.m', 'CategoryTemplate.h', 'CategoryTemplate.m', 'UnitTestTemplate.h', 'UnitTestTemplate.m']:
-		template = read_template(f)
-		if template is None:
-			print 'xx> Failed to load template %s' % f
-			sys.exit(1)
-		
-		_templates[f] = template
+	if load_templates(_template_files) is None:
+		sys.exit(1)
+	
+	_generator_version = hashlib.sha1(open(__file__).read()).hexdigest()
 	
 	# prepare to grab classes
 	if not os.path.exists(_generated_classes_dir):
@@ -685,106 +3144,23 @@ if __name__ == "__main__":
 		print "xx> Can't write unit tests to %s" % _class_unittests_dir
 		sys.exit(1)
 	
-	print '--> Processing classes'
-	class_tests = []
-	num_classes = 0
-	num_calls = 0
+	with profiled('phase', 'load ontology'):
+		rdf_ontology = load_ontology(_use_snapshot, _ontology_file)
 	
-	# loop all SMART_Class instances
-	for a_class in rdf_ontology.api_types:
-		if handle_class(a_class)[0] is not None:
-			num_classes += 1
+	print '--> Processing classes'
+	num_classes = resolve_classes(rdf_ontology)
+	num_calls = generate(rdf_ontology)
 	
-	# write unit tests
-	class_tests = sorted(class_tests)
-	complete_tests = "\n\n".join(class_tests) if len(class_tests) > 0 else None
-	if complete_tests is not None:
-		now = datetime.date.today()
-		test_dict = {
-			'COMPLETE_TEST_METHODS': complete_tests,
-			'AUTHOR': __file__,
-			'DATE': str(now),
-			'YEAR': str(now.year)
-		}
-		
-		path_h = os.path.join(_class_unittests_dir, 'TestGeneratedClasses.h')
-		path_m = os.path.join(_class_unittests_dir, 'TestGeneratedClasses.m')
-		
-		header = apply_template(_templates['UnitTestTemplate.h'], test_dict)
-		handle = open(path_h, 'w')
-		handle.write(header)
-		
-		implem = apply_template(_templates['UnitTestTemplate.m'], test_dict)
-		handle = open(path_m, 'w')
-		handle.write(implem)
-		print '--> Wrote %d class unit tests' % len(class_tests)
-	
-	# put record-scoped calls into a record category (only GET needs synthesized methods)
-	used_call_names = _single_item_calls
-	record_sigs = []
-	record_calls = []
-	for api in _record_calls:
-		if 'GET' == api['http_method']:
-			used_call_names.append(api['orig_name'])
-			call = apply_template(_templates['record_multi_item_getter'], api)
-			
-			record_sigs.append('%s;' % api['method_signature'])
-			record_calls.append(call)
-	
-	# warn about the api calls that we did ignore
-	if _verbose:
-		for api in rdf_ontology.api_calls:
-			orig_name = api.guess_name()
-			if orig_name not in used_call_names:
-				print 'IGNORED API call: %s (level: %s)' % (orig_name, api.category)
-	
-	# write to SMRecord category
-	if len(record_sigs) > 0:
-		written = False
-		record_sigs = sorted(record_sigs)
-		record_calls = sorted(record_calls)
-		now = datetime.date.today()
-		d = {
-			'CATEGORY_CLASS': 'SMRecord',
-			'CATEGORY_NAME': 'Calls',
-			'METHOD_SIGNATURES': "\n".join(record_sigs),
-			'FULL_METHODS': "\n\n".join(record_calls),
-			'AUTHOR': __file__,
-			'DATE': str(now),
-			'YEAR': str(now.year),
-		}
-		
-		# write the header
-		filename_h = '%s+%s.h' % (d['CATEGORY_CLASS'], d['CATEGORY_NAME'])
-		path_h = os.path.join(_generated_classes_dir, filename_h)
-		if _overwrite or not os.path.exists(path_h):
-			header = apply_template(_templates['CategoryTemplate.h'], d)
-			handle = open(path_h, 'w')
-			handle.write(header)
-			written = True
-		
-		# finish the implementation
-		filename_m = '%s+%s.m' % (d['CATEGORY_CLASS'], d['CATEGORY_NAME'])
-		path_m = os.path.join(_generated_classes_dir, filename_m)
-		if _overwrite or not os.path.exists(path_m):
-			implem = apply_template(_templates['CategoryTemplate.m'], d)
-			handle = open(path_m, 'w')
-			handle.write(implem)
-			written = True
-		
-		if written:
-			print '--> Wrote category %s on %s' % (d['CATEGORY_NAME'], d['CATEGORY_CLASS'])	
-			num_calls += 1
+	# report where the time went
+	if _profile:
+		report = profile_report(time.time() - started)
+		write_file(_profile_report, json.dumps(report, indent=1, separators=(',', ': '), sort_keys=True) + '\n')
+		print '--> Wrote profile report %s' % _profile_report
 	
 	# all classes are done
 	print '--> %d classes and %d categories processed, %d classes written.' % (num_classes, num_calls, len(_classes_written))
-	print '--> SMARTObjects.h'
-	
-	# output class imports
-	classnames = sorted(set(_known_classes.values()), key=lambda s: s.lower())
-	for name in classnames:
-		print '#import "%s.h"' % name
-	
 	print '-> Done'
-
-
+	
+	# keep going until interrupted
+	if _watch:
+		watch(rdf_ontology, num_classes)
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+#
+#	A stand-in for a SMART container, and a load generator to run against it.
+#
+#	"serve" answers every record-scoped GET call listed in record-calls.json, which
+#	build-obj-c-classes.py writes, with the example RDF of the class the call returns.
+#	Items are repeated to the requested record size: a record id like "items-500"
+#	returns 500 items, any other record id returns the number given by "--items".
+#	The "limit" and "offset" query parameters page through those items.
+#	A record id like "fixture-record-lab-results" instead serves the items of the
+#	fixture of that name, as written by "build-obj-c-classes.py --fixtures", along
+#	with the nodes they link to.
+#
+#		./stand-in-container.py serve --port 7000 --items 10
+#
+#	"load" requests all those calls from a running stand-in (or a real container)
+#	with concurrent keep-alive connections and reports latency percentiles and
+#	throughput per endpoint; "--sizes 1,100" requests every call at those record sizes.
+#
+#		./stand-in-container.py load --url http://127.0.0.1:7000 --concurrency 32 --duration 10
+#
+#	Requires Python 3.7 or later, but nothing beyond the standard library.
+#
+
+### config ###
+_record_calls_file = 'SMARTFrameworkTests/record-calls.json'
+_examples_dir = 'SMARTFrameworkTests/RDF'
+_fixtures_dir = 'SMARTFrameworkTests/Fixtures'
+_manifest_file = 'SMARTFrameworkTests/test-server-manifest.json'
+
+### there's probably no need to edit anything beyond this line ###
+### ---------------------------------------------------------- ###
+
+import os
+import re
+import sys
+import copy
+import json
+import time
+import random
+import asyncio
+import argparse
+import xml.etree.ElementTree as etree
+from urllib.parse import urlsplit, parse_qs
+
+_ns_rdf = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+_here = os.path.dirname(os.path.abspath(__file__))
+
+
+def read_record_calls(path):
+	"""Returns the record calls listed in the JSON file written by the generator, with a regex matching their path."""
+	with open(path) as handle:
+		calls = json.load(handle)
+	for call in calls:
+		pattern = re.sub(r'\\\{\s*record_id\s*\\\}', r'(?P<record_id>[^/]+)', re.escape(call['path']))
+		call['regex'] = re.compile('^%s$' % pattern)
+	return calls
+
+
+class Payloads(object):
+	"""Renders the example RDF of a call repeated to a number of items, or the items of a fixture, caching the rendered bytes."""
+
+	def __init__(self, examples_dir, fixtures_dir=None):
+		self.examples_dir = examples_dir
+		self.fixtures_dir = fixtures_dir
+		self.documents = {}			# { example file: (root element, namespaces) }
+		self.fixtures = {}			# { fixture name: (root element, namespaces, { rdf:about: top level node }) }
+		self.typed = {}				# { (fixture name, rdf:type): [top level nodes of the type] }
+		self.rendered = {}			# { (example file or fixture name, rdf:type, first item, items): bytes }
+
+	def document(self, example):
+		if example not in self.documents:
+			path = os.path.join(self.examples_dir, example)
+			try:
+				self.documents[example] = parse_document(path)
+			except (etree.ParseError, IOError):
+				print('xx> No usable example RDF in %s, serving an empty graph' % path)		# the generator writes "No example yet."
+				self.documents[example] = (None, [])
+		return self.documents[example]
+
+	def fixture(self, name):
+		"""The parsed fixture of the given name, None if there is no such fixture."""
+		if name not in self.fixtures:
+			self.fixtures[name] = None
+			path = os.path.join(self.fixtures_dir, '%s.rdf' % name) if self.fixtures_dir else None
+			if path and os.path.exists(path):
+				root, namespaces = parse_document(path)
+				about = '{%s}about' % _ns_rdf
+				self.fixtures[name] = (root, namespaces, dict((node.get(about), node) for node in root if node.get(about)))
+		return self.fixtures[name]
+
+	def fixture_items(self, call, name):
+		"""The top level nodes of the call's type in the fixture, None if there is no such fixture."""
+		if self.fixture(name) is None:
+			return None
+		key = (name, call['rdf_type'])
+		if key not in self.typed:
+			self.typed[key] = [node for node in self.fixture(name)[0] if is_of_type(node, call['rdf_type'])]
+		return self.typed[key]
+
+	def render_fixture(self, call, name, items, first=0):
+		key = ('fixture-%s' % name, call['rdf_type'], first, items)
+		if key not in self.rendered:
+			self.rendered[key] = self._render_fixture(call, name, items, first)
+		return self.rendered[key]
+
+	def _render_fixture(self, call, name, items, first):
+		template, namespaces, index = self.fixture(name)
+		for prefix, uri in namespaces:
+			etree.register_namespace(prefix, uri)
+
+		# the requested items, then all nodes they link to
+		resource = '{%s}resource' % _ns_rdf
+		root = etree.Element('{%s}RDF' % _ns_rdf)
+		queue = list(self.fixture_items(call, name)[first:first + items])
+		seen = set(id(node) for node in queue)
+		while queue:
+			node = queue.pop(0)
+			root.append(node)
+			for element in node.iter():
+				linked = index.get(element.get(resource))
+				if linked is not None and id(linked) not in seen:
+					seen.add(id(linked))
+					queue.append(linked)
+
+		return etree.tostring(root, encoding='utf-8')
+
+	def render(self, call, items, first=0):
+		key = (call['example'], call['rdf_type'], first, items)
+		if key not in self.rendered:
+			self.rendered[key] = self._render(call, items, first)
+		return self.rendered[key]
+
+	def _render(self, call, items, first):
+		root = etree.Element('{%s}RDF' % _ns_rdf)
+		template, namespaces = self.document(call['example']) if call['example'] else (None, [])
+		if template is not None:
+			for prefix, uri in namespaces:
+				etree.register_namespace(prefix, uri)
+
+			# repeat the nodes of the call's type with new URIs, along with the top level blank nodes they link to so their
+			# renamed references resolve; copy all other top level nodes once
+			typed = [node for node in template if is_of_type(node, call['rdf_type'])]
+			linked = linked_blank_nodes(template, typed)
+			for node in template:
+				if is_of_type(node, call['rdf_type']):
+					for i in range(first, first + items):
+						root.append(renamed_copy(node, '-%d' % i))
+						for blank in linked:
+							root.append(renamed_copy(blank, '-%d' % i, rename_about=False))
+				elif not any(node is blank for blank in linked):
+					root.append(copy.deepcopy(node))
+
+		return etree.tostring(root, encoding='utf-8')
+
+
+def parse_document(path):
+	"""Parses the RDF/XML file, returns its root element and the namespaces it declares."""
+	namespaces = [item for event, item in etree.iterparse(path, events=('start-ns',))]
+	return etree.parse(path).getroot(), namespaces
+
+
+def renamed_copy(node, suffix, rename_about=True):
+	"""Copies the node, appending the suffix to its own rdf:about and to all blank node ids so the copies stay distinct."""
+	about = '{%s}about' % _ns_rdf
+	node_id = '{%s}nodeID' % _ns_rdf
+	item = copy.deepcopy(node)
+	if rename_about:
+		item.set(about, (node.get(about) or 'urn:stand-in:item') + suffix)
+	for element in item.iter():
+		if element.get(node_id) is not None:
+			element.set(node_id, element.get(node_id) + suffix)
+	return item
+
+
+def linked_blank_nodes(root, nodes):
+	"""The top level blank nodes of the document that the given nodes link to by rdf:nodeID, directly or through other blank
+	nodes, in document order."""
+	node_id = '{%s}nodeID' % _ns_rdf
+	blanks = dict((node.get(node_id), node) for node in root if node.get(node_id) is not None and not any(node is n for n in nodes))
+	linked = set()
+	queue = list(nodes)
+	while queue:
+		for element in queue.pop(0).iter():
+			ref = element.get(node_id)
+			if ref in blanks and ref not in linked:
+				linked.add(ref)
+				queue.append(blanks[ref])
+	return [node for node in root if node.get(node_id) in linked and blanks[node.get(node_id)] is node]
+
+
+def is_of_type(node, rdf_type):
+	"""Whether the node is a typed node of the given rdf:type, either by its tag or by an rdf:type child."""
+	if rdf_type is None:
+		return False
+	split = rdf_type.rfind('#') + 1 or rdf_type.rfind('/') + 1
+	if node.tag == '{%s}%s' % (rdf_type[:split], rdf_type[split:]):
+		return True
+	for child in node.findall('{%s}type' % _ns_rdf):
+		if rdf_type == child.get('{%s}resource' % _ns_rdf):
+			return True
+	return False
+
+
+### serving ###
+
+async def read_request(reader):
+	"""Reads one HTTP request, returns its method, path and headers or None if the connection was closed."""
+	line = await reader.readline()
+	if not line:
+		return None
+	parts = line.decode('latin-1').split()
+	if len(parts) < 2:
+		return None
+
+	headers = {}
+	while True:
+		line = await reader.readline()
+		if not line or line in (b'\r\n', b'\n'):
+			break
+		name, _, value = line.decode('latin-1').partition(':')
+		headers[name.strip().lower()] = value.strip()
+
+	length = int(headers.get('content-length', 0))
+	if length > 0:
+		await reader.readexactly(length)
+	return parts[0], parts[1], headers
+
+
+def respond(writer, status, content_type, body, keep_alive=True):
+	head = 'HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\nConnection: %s\r\n\r\n' % (status, content_type, len(body), 'keep-alive' if keep_alive else 'close')
+	writer.write(head.encode('latin-1') + body)
+
+
+def make_handler(calls, payloads, default_items, manifest):
+	async def handle(reader, writer):
+		try:
+			while True:
+				request = await read_request(reader)
+				if request is None:
+					break
+				method, target, headers = request
+				parts = urlsplit(target)
+				path = parts.path
+				query = parse_qs(parts.query)
+				keep_alive = 'close' != headers.get('connection', '').lower()
+
+				if 'GET' != method:
+					respond(writer, '405 Method Not Allowed', 'text/plain', b'Only GET is supported\n', keep_alive)
+				elif path in ('/manifest', '/manifest/') and manifest is not None:
+					respond(writer, '200 OK', 'application/json', manifest, keep_alive)
+				else:
+					for call in calls:
+						match = call['regex'].match(path)
+						if match:
+							record_id = match.group('record_id')
+							fixture = re.match(r'^fixture-(.+)$', record_id)
+							sized = re.match(r'^items-(\d+)$', record_id)
+							try:
+								if fixture:
+									nodes = payloads.fixture_items(call, fixture.group(1))
+									if nodes is None:
+										respond(writer, '404 Not Found', 'text/plain', ('No fixture %s\n' % fixture.group(1)).encode('utf-8'), keep_alive)
+										break
+									items = len(nodes)
+								else:
+									items = int(sized.group(1)) if sized else default_items
+								offset = min(items, int(query.get('offset', ['0'])[0]))
+								limit = int(query.get('limit', [str(items)])[0])
+								count = max(0, min(limit, items - offset))
+								body = payloads.render_fixture(call, fixture.group(1), count, offset) if fixture else payloads.render(call, count, offset)
+							except Exception as e:
+								respond(writer, '500 Internal Server Error', 'text/plain', ('%s\n' % e).encode('utf-8'), keep_alive)
+							else:
+								respond(writer, '200 OK', 'application/rdf+xml', body, keep_alive)
+							break
+					else:
+						respond(writer, '404 Not Found', 'text/plain', b'No record call for this path\n', keep_alive)
+
+				await writer.drain()
+				if not keep_alive:
+					break
+		except (ConnectionError, asyncio.IncompleteReadError):
+			pass
+		finally:
+			writer.close()
+	return handle
+
+
+async def serve(args):
+	calls = read_record_calls(args.calls)
+	payloads = Payloads(args.examples, args.fixtures)
+	manifest = None
+	if os.path.exists(args.manifest):
+		with open(args.manifest, 'rb') as handle:
+			manifest = handle.read()
+
+	server = await asyncio.start_server(make_handler(calls, payloads, args.items, manifest), args.host, args.port)
+	print('--> Serving %d record calls on http://%s:%d, %d items per record' % (len(calls), args.host, args.port, args.items))
+	for call in calls:
+		print('    %s' % call['path'])
+	async with server:
+		await server.serve_forever()
+
+
+### load generation ###
+
+class Endpoint(object):
+	"""The measurements of one path."""
+
+	def __init__(self, name, path):
+		self.name = name
+		self.path = path
+		self.latencies = []
+		self.bytes = 0
+		self.errors = 0
+
+	def report(self, seconds):
+		latencies = sorted(self.latencies)
+		def percentile(p):
+			if len(latencies) < 1:
+				return None
+			return round(latencies[min(len(latencies) - 1, int(p / 100.0 * len(latencies)))] * 1000, 3)
+		return {
+			'name': self.name,
+			'path': self.path,
+			'requests': len(latencies),
+			'errors': self.errors,
+			'requests_per_second': round(len(latencies) / seconds, 1) if seconds > 0 else None,
+			'bytes_per_request': self.bytes // len(latencies) if len(latencies) > 0 else None,
+			'p50_ms': percentile(50),
+			'p90_ms': percentile(90),
+			'p99_ms': percentile(99),
+			'max_ms': round(latencies[-1] * 1000, 3) if len(latencies) > 0 else None,
+		}
+
+
+async def fetch(reader, writer, host, path):
+	"""Sends one GET over the keep-alive connection and returns the status code and the body."""
+	writer.write(('GET %s HTTP/1.1\r\nHost: %s\r\nAccept: application/rdf+xml\r\n\r\n' % (path, host)).encode('latin-1'))
+	await writer.drain()
+
+	status_line = await reader.readline()
+	if not status_line:
+		raise ConnectionError('Connection closed')
+	status = int(status_line.split()[1])
+	headers = {}
+	while True:
+		line = await reader.readline()
+		if line in (b'\r\n', b'\n', b''):
+			break
+		name, _, value = line.decode('latin-1').partition(':')
+		headers[name.strip().lower()] = value.strip()
+	body = await reader.readexactly(int(headers.get('content-length', 0)))
+	return status, body
+
+
+async def worker(url, endpoints, deadline, remaining):
+	parts = urlsplit(url)
+	host, port = parts.hostname, parts.port or 80
+	base = parts.path.rstrip('/')
+	reader, writer = await asyncio.open_connection(host, port)
+	rnd = random.Random()
+	try:
+		while time.monotonic() < deadline and remaining[0] != 0:
+			remaining[0] -= 1
+			endpoint = rnd.choice(endpoints)
+			start = time.monotonic()
+			try:
+				status, body = await fetch(reader, writer, parts.netloc, base + endpoint.path)
+			except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+				endpoint.errors += 1
+				writer.close()
+				reader, writer = await asyncio.open_connection(host, port)
+				continue
+			if 200 != status:
+				endpoint.errors += 1
+				continue
+			endpoint.latencies.append(time.monotonic() - start)
+			endpoint.bytes += len(body)
+	finally:
+		writer.close()
+
+
+async def load(args):
+	calls = read_record_calls(args.calls)
+	endpoints = []
+	for size in [int(s) for s in args.sizes.split(',')] if args.sizes else [None]:
+		record_id = 'items-%d' % size if size is not None else args.record
+		for call in calls:
+			name = '%s (%d)' % (call['name'], size) if size is not None else call['name']
+			endpoints.append(Endpoint(name, re.sub(r'\{\s*record_id\s*\}', record_id, call['path'])))
+
+	print('--> %d endpoints, %d connections, %s' % (len(endpoints), args.concurrency, '%d requests' % args.requests if args.requests else '%d seconds' % args.duration))
+	remaining = [args.requests or -1]
+	started = time.monotonic()
+	deadline = started + (args.duration if not args.requests else 1e9)
+	await asyncio.gather(*[worker(args.url, endpoints, deadline, remaining) for i in range(args.concurrency)])
+	seconds = time.monotonic() - started
+
+	reports = [e.report(seconds) for e in endpoints]
+	total = sum(r['requests'] for r in reports)
+	print('--> %d requests in %.2f s, %.1f requests/s' % (total, seconds, total / seconds if seconds > 0 else 0))
+	print('    %-40s %8s %7s %9s %9s %9s %9s %10s' % ('endpoint', 'requests', 'errors', 'req/s', 'p50 ms', 'p90 ms', 'p99 ms', 'bytes'))
+	for r in sorted(reports, key=lambda r: r['name']):
+		print('    %-40s %8d %7d %9.1f %9s %9s %9s %10s' % (r['name'][:40], r['requests'], r['errors'], r['requests_per_second'] or 0,
+			r['p50_ms'], r['p90_ms'], r['p99_ms'], r['bytes_per_request']))
+
+	if args.json:
+		with open(args.json, 'w') as handle:
+			json.dump({'seconds': round(seconds, 3), 'concurrency': args.concurrency, 'requests': total, 'endpoints': reports}, handle, indent=1, sort_keys=True)
+		print('--> Wrote report to %s' % args.json)
+
+	return 0 if all(r['errors'] == 0 for r in reports) else 1
+
+
+if __name__ == "__main__":
+	"""Runs the stand-in container or the load generator
+	"""
+	parser = argparse.ArgumentParser(description='A SMART container stand-in and a load generator for record calls')
+	parser.add_argument('--calls', default=os.path.join(_here, _record_calls_file), help='the record calls JSON written by the generator')
+	commands = parser.add_subparsers(dest='command')
+	commands.required = True
+
+	serve_cmd = commands.add_parser('serve', help='serve record calls with example RDF')
+	serve_cmd.add_argument('--host', default='127.0.0.1')
+	serve_cmd.add_argument('--port', type=int, default=7000)
+	serve_cmd.add_argument('--items', type=int, default=10, help='items per record unless the record id is "items-N"')
+	serve_cmd.add_argument('--examples', default=os.path.join(_here, _examples_dir), help='directory with the example RDF')
+	serve_cmd.add_argument('--fixtures', default=os.path.join(_here, _fixtures_dir), help='directory with the fixtures served for "fixture-NAME" records')
+	serve_cmd.add_argument('--manifest', default=os.path.join(_here, _manifest_file), help='container manifest to serve at /manifest')
+
+	load_cmd = commands.add_parser('load', help='request record calls concurrently and report latencies')
+	load_cmd.add_argument('--url', default='http://127.0.0.1:7000')
+	load_cmd.add_argument('--record', default='stand-in', help='the record id to request')
+	load_cmd.add_argument('--sizes', help='comma separated record sizes to request as "items-N" records, instead of --record')
+	load_cmd.add_argument('--concurrency', type=int, default=16)
+	load_cmd.add_argument('--duration', type=float, default=10)
+	load_cmd.add_argument('--requests', type=int, help='stop after this many requests instead of after --duration')
+	load_cmd.add_argument('--json', help='also write the report as JSON to this file')
+
+	args = parser.parse_args()
+	try:
+		if 'serve' == args.command:
+			asyncio.run(serve(args))
+		else:
+			sys.exit(asyncio.run(load(args)))
+	except KeyboardInterrupt:
+		pass